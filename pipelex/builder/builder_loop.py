@@ -92,7 +92,8 @@ class BuilderLoop:
             save_text_to_path(text=plx_content_after_fix, path=first_iteration_after_fix_path)
 
         try:
-            await validate_bundle_spec(bundle_spec=pipelex_bundle_spec)
+            # the pipes left unchanged since a previous iteration are not dry run again
+            await validate_bundle_spec(bundle_spec=pipelex_bundle_spec, is_incremental=True)
         except PipelexBundleError as bundle_error:
             pipelex_bundle_spec = self._fix_bundle_error(
                 bundle_error=bundle_error,
@@ -165,7 +165,7 @@ def fix_inputs_consistency(bundle_spec: PipelexBundleSpec) -> PipelexBundleSpec:
     return bundle_spec
 
 
-async def validate_bundle_spec(bundle_spec: PipelexBundleSpec):
+async def validate_bundle_spec(bundle_spec: PipelexBundleSpec, is_incremental: bool = False):
     try:
         bundle_blueprint = bundle_spec.to_blueprint()
     except ConceptSpecError as concept_spec_error:
@@ -176,7 +176,7 @@ async def validate_bundle_spec(bundle_spec: PipelexBundleSpec):
         raise PipelexBundleError(message=pipe_spec_error.message, pipe_failures=pipe_failures) from pipe_spec_error
 
     library_manager = get_library_manager()
-    dry_run_result = await dry_run_bundle_blueprint(bundle_blueprint=bundle_blueprint)
+    dry_run_result = await dry_run_bundle_blueprint(bundle_blueprint=bundle_blueprint, is_incremental=is_incremental)
     library_manager.remove_from_blueprint(blueprint=bundle_blueprint)
 
     dry_run_pipe_failures = extract_pipe_failures_from_dry_run_result(bundle_spec=bundle_spec, dry_run_result=dry_run_result)
@@ -236,11 +236,11 @@ def document_pipe_failures_from_dry_run_blueprint(
     return dry_run_pipe_failures
 
 
-async def dry_run_bundle_blueprint(bundle_blueprint: PipelexBundleBlueprint) -> dict[str, DryRunOutput]:
+async def dry_run_bundle_blueprint(bundle_blueprint: PipelexBundleBlueprint, is_incremental: bool = False) -> dict[str, DryRunOutput]:
     library_manager = get_library_manager()
     try:
         pipes = library_manager.load_from_blueprint(blueprint=bundle_blueprint)
-        dry_run_result = await dry_run_pipes(pipes=pipes, raise_on_failure=True)
+        dry_run_result = await dry_run_pipes(pipes=pipes, raise_on_failure=True, is_incremental=is_incremental)
     except StaticValidationError as static_validation_error:
         static_validation_error_data = StaticValidationErrorData(
             error_type=static_validation_error.error_type,
@@ -293,8 +293,8 @@ async def dry_run_bundle_blueprint(bundle_blueprint: PipelexBundleBlueprint) ->
     return dry_run_result
 
 
-async def validate_dry_run_bundle_blueprint(bundle_blueprint: PipelexBundleBlueprint):
-    dry_run_result = await dry_run_bundle_blueprint(bundle_blueprint=bundle_blueprint)
+async def validate_dry_run_bundle_blueprint(bundle_blueprint: PipelexBundleBlueprint, is_incremental: bool = False):
+    dry_run_result = await dry_run_bundle_blueprint(bundle_blueprint=bundle_blueprint, is_incremental=is_incremental)
     pipe_failures = document_pipe_failures_from_dry_run_blueprint(bundle_blueprint=bundle_blueprint, dry_run_result=dry_run_result)
     if pipe_failures:
         msg = "Dry run failed for bundle"
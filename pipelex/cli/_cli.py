@@ -88,9 +88,10 @@ def init_command(
 @app.command(name="doctor", help="Check Pipelex configuration health and suggest fixes")
 def doctor_command(
     fix: Annotated[bool, typer.Option("--fix", "-f", help="Offer to fix detected issues interactively")] = False,
+    timing: Annotated[bool, typer.Option("--timing", "-t", help="Measure the cold and warm library loading time")] = False,
 ) -> None:
     """Check Pipelex configuration health."""
-    doctor_cmd(fix=fix)
+    doctor_cmd(fix=fix, timing=timing)
 
 
 app.add_typer(kit_app, name="kit", help="Manage kit assets: agent rules, migration rules")
@@ -5,11 +5,15 @@ from __future__ import annotations
 import contextlib
 import io
 import sys
+import tempfile
+from pathlib import Path
+from typing import TYPE_CHECKING
 
 from pydantic import ValidationError
 from rich.console import Console
 from rich.panel import Panel
 from rich.prompt import Confirm
+from rich.table import Table
 from rich.text import Text
 
 from pipelex import log
@@ -21,9 +25,11 @@ from pipelex.cogt.model_backends.backend_library import BackendCredentialsReport
 from pipelex.cogt.models.model_manager import ModelManager
 from pipelex.config import PipelexConfig, get_config
 from pipelex.core.validation import report_validation_error
-from pipelex.hub import PipelexHub, set_pipelex_hub
+from pipelex.hub import PipelexHub, get_library_manager, set_pipelex_hub
+from pipelex.pipelex import Pipelex
 from pipelex.system.configuration.config_loader import config_manager
 from pipelex.system.environment import get_optional_env
+from pipelex.system.runtime import IntegrationMode
 from pipelex.system.telemetry.telemetry_config import TELEMETRY_CONFIG_FILE_NAME, TelemetryConfig
 from pipelex.tools.misc.dict_utils import extract_vars_from_strings_recursive
 from pipelex.tools.misc.file_utils import path_exists
@@ -32,6 +38,9 @@ from pipelex.tools.misc.toml_utils import load_toml_from_path
 from pipelex.tools.secrets.env_secrets_provider import EnvSecretsProvider
 from pipelex.tools.typing.pydantic_utils import format_pydantic_validation_error
 
+if TYPE_CHECKING:
+    from pipelex.libraries.library_load_report import LibraryLoadReport
+
 
 def check_config_files() -> tuple[bool, int, str]:
     """Check if configuration files are present and main config is valid.
@@ -348,18 +357,83 @@ def check_models() -> tuple[bool, str]:
     return True, "Models are valid"
 
 
+def measure_library_load_timing() -> tuple[LibraryLoadReport, LibraryLoadReport]:
+    """Load the libraries twice: once with an empty library index, then once with the index it left.
+
+    Both loads use a temporary library index, so that the user's index is left untouched.
+
+    Returns:
+        Tuple of (cold load report, warm load report)
+    """
+    pipelex_instance = Pipelex.make(integration_mode=IntegrationMode.CLI)
+    try:
+        library_manager = get_library_manager()
+        with tempfile.TemporaryDirectory() as temp_dir:
+            library_index_file_path = str(Path(temp_dir) / "library_index.json")
+
+            library_manager.reset()
+            library_manager.load_libraries(library_index_file_path=library_index_file_path)
+            cold_report = library_manager.get_last_load_report()
+
+            library_manager.reset()
+            library_manager.load_libraries(library_index_file_path=library_index_file_path)
+            warm_report = library_manager.get_last_load_report()
+    finally:
+        pipelex_instance.teardown()
+
+    if cold_report is None or warm_report is None:
+        msg = "The library manager did not report its loading time"
+        raise PipelexConfigError(msg)
+    return cold_report, warm_report
+
+
+def display_library_load_timing(console: Console, cold_report: LibraryLoadReport, warm_report: LibraryLoadReport) -> None:
+    """Display the cold and warm library load times side by side.
+
+    Args:
+        console: Rich Console instance for output
+        cold_report: Report of the load with an emptied library index
+        warm_report: Report of the load reusing the library index
+    """
+    table = Table(title="Library loading time", title_justify="left")
+    table.add_column("Step")
+    table.add_column("Cold start", justify="right")
+    table.add_column("Warm start", justify="right")
+    table.add_row("Files walk", f"{cold_report.file_walk_seconds:.3f}s", f"{warm_report.file_walk_seconds:.3f}s")
+    table.add_row(
+        "Python files scanned",
+        f"{cold_report.nb_python_files_scanned}/{cold_report.nb_python_files}",
+        f"{warm_report.nb_python_files_scanned}/{warm_report.nb_python_files}",
+    )
+    table.add_row(
+        "PLX files parsed",
+        f"{cold_report.nb_plx_files_parsed}/{cold_report.nb_plx_files}",
+        f"{warm_report.nb_plx_files_parsed}/{warm_report.nb_plx_files}",
+    )
+    table.add_row("Scan workers", str(cold_report.nb_scan_workers), str(warm_report.nb_scan_workers))
+    table.add_row("Scanning and parsing", f"{cold_report.file_scan_seconds:.3f}s", f"{warm_report.file_scan_seconds:.3f}s")
+    table.add_row("Modules import", f"{cold_report.module_import_seconds:.3f}s", f"{warm_report.module_import_seconds:.3f}s")
+    table.add_row("Libraries loading", f"{cold_report.library_load_seconds:.3f}s", f"{warm_report.library_load_seconds:.3f}s")
+    table.add_row("[bold]Total[/bold]", f"[bold]{cold_report.total_seconds:.3f}s[/bold]", f"[bold]{warm_report.total_seconds:.3f}s[/bold]")
+    console.print(table)
+    if not warm_report.is_index_enabled:
+        console.print("[dim]The library index is disabled in [cyan]pipelex.library_index_config[/cyan], so both loads scan all the files.[/dim]")
+    console.print()
+
+
 def doctor_cmd(
     fix: bool = False,
+    timing: bool = False,
 ) -> None:
     """Check Pipelex configuration health and suggest fixes.
 
     Args:
         fix: If True, offer to fix detected issues interactively
+        timing: If True, also measure the cold and warm library load times
     """
     console = Console()
-    do_doctor_cmd(console=console, fix=fix)
     try:
-        do_doctor_cmd(console=console, fix=fix)
+        do_doctor_cmd(console=console, fix=fix, timing=timing)
 
     except Exception as exc:
         # Handle unexpected errors gracefully without printing traces
@@ -376,12 +450,14 @@ def doctor_cmd(
 def do_doctor_cmd(
     console: Console,
     fix: bool = False,
+    timing: bool = False,
 ) -> None:
     """Check Pipelex configuration health and suggest fixes.
 
     Args:
         console: Rich Console instance for output
         fix: If True, offer to fix detected issues interactively
+        timing: If True, also measure the cold and warm library load times
     """
     # Run health checks
     config_healthy, config_missing_count, config_message = check_config_files()
@@ -406,6 +482,16 @@ def do_doctor_cmd(
 
     all_healthy = config_healthy and telemetry_healthy and backends_healthy and models_healthy
 
+    if timing:
+        try:
+            cold_report, warm_report = measure_library_load_timing()
+        except Exception as exc:
+            console.print(f"[red]✗ Could not measure the library loading time: {exc!s}[/red]")
+            console.print()
+            all_healthy = False
+        else:
+            display_library_load_timing(console=console, cold_report=cold_report, warm_report=warm_report)
+
     # Exit code: 0 if healthy, 1 if issues found
     if all_healthy:
         sys.exit(0)
@@ -23,6 +23,7 @@ from pipelex.cogt.exceptions import ModelDeckPresetValidatonError
 from pipelex.core.pipes.exceptions import PipeInputError, PipeOperatorModelChoiceError
 from pipelex.hub import get_telemetry_manager
 from pipelex.libraries.exceptions import LibraryLoadingError
+from pipelex.libraries.library_loading_mode import LibraryLoadingMode
 from pipelex.pipe_operators.exceptions import PipeOperatorModelAvailabilityError
 from pipelex.pipelex import Pipelex
 from pipelex.pipeline.exceptions import PipelineExecutionError
@@ -200,7 +201,8 @@ def run_cmd(
 
     # Initialize Pipelex BEFORE telemetry context to ensure proper setup
     try:
-        pipelex_instance = Pipelex.make(integration_mode=IntegrationMode.CLI)
+        # only the pipe to run and its dependencies are loaded
+        pipelex_instance = Pipelex.make(integration_mode=IntegrationMode.CLI, library_loading_mode=LibraryLoadingMode.LAZY)
     except LibraryLoadingError as library_loading_error:
         handle_validation_error(exc=library_loading_error, context=ErrorContext.VALIDATION_BEFORE_PIPE_RUN)
     except ModelDeckPresetValidatonError as model_deck_error:
@@ -219,6 +221,10 @@ def run_cmd(
     except PipeOperatorModelAvailabilityError as exc:
         handle_model_availability_error(exc, context=ErrorContext.PIPE_RUN)
 
+    except LibraryLoadingError as library_loading_error:
+        # in lazy loading mode, the pipe to run is loaded when the pipeline starts
+        handle_validation_error(exc=library_loading_error, context=ErrorContext.VALIDATION_BEFORE_PIPE_RUN)
+
     except typer.Exit:
         raise
 
@@ -26,7 +26,7 @@ from pipelex.core.pipes.exceptions import PipeInputError, PipeOperatorModelChoic
 from pipelex.hub import get_library_manager, get_pipes, get_required_pipe, get_telemetry_manager
 from pipelex.libraries.exceptions import LibraryLoadingError
 from pipelex.pipe_operators.exceptions import PipeOperatorModelAvailabilityError
-from pipelex.pipe_run.dry_run import dry_run_pipe, dry_run_pipes
+from pipelex.pipe_run.dry_run import dry_run_pipes
 from pipelex.pipelex import Pipelex
 from pipelex.system.runtime import IntegrationMode
 from pipelex.system.telemetry.events import EventName, EventProperty
@@ -40,8 +40,8 @@ console = Console()
 COMMAND = "validate"
 
 
-def do_validate_all_libraries_and_dry_run() -> None:
-    """Validate libraries and dry-run all pipes."""
+def do_validate_all_libraries_and_dry_run(is_incremental: bool = True) -> None:
+    """Validate libraries and dry-run all pipes, except the ones unchanged since their last successful dry run if incremental."""
     try:
         pipelex_instance = Pipelex.make(integration_mode=IntegrationMode.CLI)
     except LibraryLoadingError as library_loading_error:
@@ -58,7 +58,7 @@ def do_validate_all_libraries_and_dry_run() -> None:
             pipelex_instance.validate_libraries()
             pipes = get_pipes()
             get_telemetry_manager().track_event(EventName.PIPE_DRY_RUN, properties={EventProperty.NB_PIPES: len(pipes)})
-            asyncio.run(dry_run_pipes(pipes=pipes, raise_on_failure=True))
+            asyncio.run(dry_run_pipes(pipes=pipes, raise_on_failure=True, is_incremental=is_incremental))
             log.info("Setup sequence passed OK, config and pipelines are validated.")
     except PipeOperatorModelAvailabilityError as exc:
         handle_model_availability_error(exc, context=ErrorContext.VALIDATION)
@@ -81,6 +81,10 @@ def validate_cmd(
         str | None,
         typer.Option("--bundle", help="Bundle file path (.plx) - validates all pipes in the bundle"),
     ] = None,
+    full: Annotated[
+        bool,
+        typer.Option("--full", help="Dry run all the pipes, including the ones unchanged since their last successful dry run"),
+    ] = False,
 ) -> None:
     """Validate and dry run a pipe or a bundle or all pipes.
 
@@ -90,10 +94,11 @@ def validate_cmd(
         pipelex validate --bundle my_bundle.plx
         pipelex validate --bundle my_bundle.plx --pipe my_pipe
         pipelex validate all
+        pipelex validate all --full
     """
     # Check for "all" keyword
     if target == "all" and not pipe and not bundle:
-        do_validate_all_libraries_and_dry_run()
+        do_validate_all_libraries_and_dry_run(is_incremental=not full)
         return
 
     # Validate mutual exclusivity
@@ -152,7 +157,7 @@ def validate_cmd(
                 pipes: list[PipeAbstract] = []
                 for the_pipe_code in pipe_codes:
                     pipes.append(get_required_pipe(pipe_code=the_pipe_code))
-                await dry_run_pipes(pipes=pipes, raise_on_failure=True)
+                await dry_run_pipes(pipes=pipes, raise_on_failure=True, is_incremental=not full)
                 typer.secho(f"✅ Successfully validated all pipes in bundle '{bundle_path}'", fg=typer.colors.GREEN)
                 return
             # When validating a bundle, load_pipe_from_bundle validates ALL pipes in the bundle
@@ -162,7 +167,7 @@ def validate_cmd(
                     EventName.BUNDLE_DRY_RUN,
                     properties={EventProperty.NB_PIPES: bundle_blueprint.nb_pipes, EventProperty.NB_CONCEPTS: bundle_blueprint.nb_concepts},
                 )
-                await validate_dry_run_bundle_blueprint(bundle_blueprint=bundle_blueprint)
+                await validate_dry_run_bundle_blueprint(bundle_blueprint=bundle_blueprint, is_incremental=not full)
                 if not pipe_code:
                     typer.secho(f"✅ Successfully validated all pipes in bundle '{bundle_path}'", fg=typer.colors.GREEN)
                 else:
@@ -185,10 +190,7 @@ def validate_cmd(
                 EventName.PIPE_DRY_RUN, properties={EventProperty.PIPE_TYPE: get_required_pipe(pipe_code=pipe_code).type}
             )
             pipelex_instance.validate_libraries()
-            await dry_run_pipe(
-                get_required_pipe(pipe_code=pipe_code),
-                raise_on_failure=True,
-            )
+            await dry_run_pipes(pipes=[get_required_pipe(pipe_code=pipe_code)], raise_on_failure=True, is_incremental=not full)
             typer.secho(f"✅ Successfully validated pipe '{pipe_code}'", fg=typer.colors.GREEN)
         else:
             typer.secho("Failed to validate: no pipe code or bundle specified", fg=typer.colors.RED, err=True)
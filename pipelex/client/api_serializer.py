@@ -1,28 +1,78 @@
-from datetime import datetime
+import types
+import weakref
+from datetime import date, datetime, time, timedelta
 from decimal import Decimal
 from enum import Enum
-from pathlib import Path
-from typing import Any, cast
+from pathlib import PurePath
+from typing import Annotated, Any, Literal, TypeVar, Union, cast, get_args, get_origin
+from uuid import UUID
+
+from pydantic import BaseModel
+from pydantic_core import to_jsonable_python
 
 from pipelex.core.memory.working_memory import WorkingMemory
+from pipelex.core.stuffs.stuff_content import StuffContent
+from pipelex.types import StrEnum
+
+
+class ApiFieldKind(StrEnum):
+    """How a field of a content is serialized for the API, from its annotation."""
+
+    # written as is by pydantic's JSON mode
+    PLAIN = "plain"
+    # holds contents which may have fields to format
+    CONTENT = "content"
+    # may hold datetimes, Decimals or plain models, made JSON-ready in python
+    FORMATTED = "formatted"
+
+
+# Types which pydantic's JSON mode writes in the API shape
+PLAIN_TYPES = (str, int, float, bool, bytes, date, time, timedelta, Enum, PurePath, UUID, type(None))
+COLLECTION_ORIGINS = (Union, types.UnionType, list, tuple, set, frozenset)
 
 
 class ApiSerializer:
-    """Handles API-specific serialization with kajson, datetime formatting, and cleanup."""
+    """Handles API-specific serialization of the working memories.
+
+    Contents are dumped by pydantic in JSON mode, which writes most of the API shape in a single pass: enums become
+    their values, and Paths and the other types which are not native to JSON their JSON representation. The fields
+    which may hold datetimes, Decimals or plain models are then made JSON-ready in python, so that the datetimes
+    are written in API_DATETIME_FORMAT and the Decimals as floats. These fields are found once per content class,
+    from their annotations, so for the contents which pydantic writes entirely in the API shape, like extracted pages,
+    only the nested contents are visited in python. The fields holding contents are resolved from the actual class
+    of the nested content, since with serialize_as_any a subclass is dumped with its own fields.
+    """
 
     # Fixed datetime format for API consistency
     API_DATETIME_FORMAT = "%Y-%m-%dT%H:%M:%S"
-    FIELDS_TO_SKIP = ("__class__", "__module__")
+
+    # The fields of each content class which are not PLAIN
+    _field_kinds_by_class: "weakref.WeakKeyDictionary[type[StuffContent], dict[str, ApiFieldKind]]" = weakref.WeakKeyDictionary()
+
+    @classmethod
+    def serialize_content_for_api(cls, content: StuffContent) -> Any:
+        """Convert a StuffContent to JSON-ready plain dicts and lists.
+
+        Args:
+            content: The StuffContent to serialize, its fields are serialized with their actual type, even if it's a subclass
+
+        Returns:
+            The content as JSON-ready plain data
+
+        """
+        serialized = content.model_dump(mode="json", serialize_as_any=True)
+        cls._format_content_fields(content=content, serialized=serialized)
+        return serialized
 
     @classmethod
     def serialize_working_memory_for_api(cls, working_memory: WorkingMemory | None = None) -> dict[str, dict[str, Any]]:
-        """Convert WorkingMemory to API-ready format using kajson with proper datetime handling.
+        """Convert WorkingMemory to API-ready format.
 
         Args:
             working_memory: The WorkingMemory to serialize
 
         Returns:
-            PipelineInputs ready for API transmission with datetime strings and no __class__/__module__.
+            PipelineInputs ready for API transmission, with JSON-ready contents.
             Returns plain dicts with {"concept": str, "content": dict | list} structure for JSON serialization.
 
         """
@@ -31,48 +81,89 @@ class ApiSerializer:
             return pipeline_inputs
 
         for stuff_name, stuff in working_memory.root.items():
-            content_dict = stuff.content.model_dump(serialize_as_any=True)
-            clean_content = cls._clean_and_format_content(content_dict)
-
             # Create plain dict instead of DictStuff instance for JSON serialization
             pipeline_inputs[stuff_name] = {
                 "concept": stuff.concept.code,
-                "content": clean_content,
+                "content": cls.serialize_content_for_api(content=stuff.content),
             }
 
         return pipeline_inputs
 
     @classmethod
-    def _clean_and_format_content(cls, content: Any) -> Any:
-        """Recursively clean content by removing the fields in FIELDS_TO_SKIP and formatting datetimes.
+    def _format_content_fields(cls, content: Any, serialized: Any):
+        """Replace, in the JSON dump of the content, the fields which pydantic didn't write in the API shape."""
+        if isinstance(content, StuffContent) and isinstance(serialized, dict):
+            serialized_dict = cast("dict[str, Any]", serialized)
+            for field_name, field_kind in cls._get_field_kinds(content_class=type(content)).items():
+                if field_name not in serialized_dict:
+                    continue
+                match field_kind:
+                    case ApiFieldKind.PLAIN:
+                        pass
+                    case ApiFieldKind.CONTENT:
+                        cls._format_content_fields(content=getattr(content, field_name), serialized=serialized_dict[field_name])
+                    case ApiFieldKind.FORMATTED:
+                        serialized_dict[field_name] = cls._make_api_json(getattr(content, field_name))
+        elif isinstance(content, (list, tuple)) and isinstance(serialized, list):
+            for item, serialized_item in zip(cast("list[Any]", content), cast("list[Any]", serialized), strict=False):
+                cls._format_content_fields(content=item, serialized=serialized_item)
 
-        Args:
-            content: Content to clean
+    @classmethod
+    def _get_field_kinds(cls, content_class: type[StuffContent]) -> dict[str, ApiFieldKind]:
+        field_kinds = cls._field_kinds_by_class.get(content_class)
+        if field_kinds is None:
+            field_kinds = {}
+            for field_name, field_info in content_class.model_fields.items():
+                field_kind = cls._get_field_kind(annotation=field_info.annotation)
+                if field_kind != ApiFieldKind.PLAIN:
+                    field_kinds[field_name] = field_kind
+            cls._field_kinds_by_class[content_class] = field_kinds
+        return field_kinds
 
-        Returns:
-            Cleaned content with formatted datetimes
+    @classmethod
+    def _get_field_kind(cls, annotation: Any) -> ApiFieldKind:
+        origin = get_origin(annotation)
+        if origin is Annotated:
+            return cls._get_field_kind(annotation=get_args(annotation)[0])
+        if origin is Literal:
+            return ApiFieldKind.PLAIN
+        if origin in COLLECTION_ORIGINS:
+            arg_kinds = {cls._get_field_kind(annotation=arg) for arg in get_args(annotation) if arg is not Ellipsis}
+            if ApiFieldKind.FORMATTED in arg_kinds:
+                return ApiFieldKind.FORMATTED
+            if ApiFieldKind.CONTENT in arg_kinds:
+                return ApiFieldKind.CONTENT
+            return ApiFieldKind.PLAIN
+        if isinstance(annotation, TypeVar):
+            bound = annotation.__bound__
+            if isinstance(bound, type) and issubclass(bound, StuffContent):
+                return ApiFieldKind.CONTENT
+            return ApiFieldKind.FORMATTED
+        if origin is None and isinstance(annotation, type):
+            if issubclass(annotation, StuffContent):
+                # the field can hold a subclass of its annotation, whose fields are only known from the actual content
+                return ApiFieldKind.CONTENT
+            if issubclass(annotation, PLAIN_TYPES) and not issubclass(annotation, datetime):
+                return ApiFieldKind.PLAIN
+        return ApiFieldKind.FORMATTED
 
-        """
-        if isinstance(content, dict):
-            cleaned: dict[str, Any] = {}
-            content_dict = cast("dict[str, Any]", content)
-            for key in content_dict:
-                if key in cls.FIELDS_TO_SKIP:
-                    continue
-                cleaned[key] = cls._clean_and_format_content(content_dict[key])
-            return cleaned
-        elif isinstance(content, list):
-            cleaned_list: list[Any] = []
-            content_list = cast("list[Any]", content)
-            cleaned_list.extend(cls._clean_and_format_content(content_list[idx]) for idx in range(len(content_list)))
-            return cleaned_list
-        elif isinstance(content, datetime):
-            return content.strftime(cls.API_DATETIME_FORMAT)
-        elif isinstance(content, Enum):
-            return content.value  # Convert enum to its value
-        elif isinstance(content, Decimal):
-            return float(content)  # Convert Decimal to float for JSON compatibility
-        elif isinstance(content, Path):
-            return str(content)  # Convert Path to string representation
-        else:
-            return content
+    @classmethod
+    def _make_api_json(cls, value: Any) -> Any:
+        """Make a python value JSON-ready in the API shape, dumping the models it holds."""
+        match value:
+            case StuffContent():
+                return cls.serialize_content_for_api(content=value)
+            case BaseModel():
+                return cls._make_api_json(value.model_dump(serialize_as_any=True))
+            case dict():
+                return {key: cls._make_api_json(item) for key, item in cast("dict[Any, Any]", value).items()}
+            case list() | tuple() | set() | frozenset():
+                return [cls._make_api_json(item) for item in cast("list[Any]", value)]
+            case datetime():
+                return value.strftime(cls.API_DATETIME_FORMAT)
+            case Decimal():
+                return float(value)
+            case Enum():
+                return value.value
+            case _:
+                return to_jsonable_python(value)
@@ -1,5 +1,6 @@
 from typing import Any
 
+from pipelex.client.api_serializer import ApiSerializer
 from pipelex.client.protocol import PipelineResponse, PipelineState
 from pipelex.core.memory.working_memory import MAIN_STUFF_NAME, DictWorkingMemory, WorkingMemory
 from pipelex.core.pipes.pipe_output import DictPipeOutput, PipeOutput
@@ -13,7 +14,7 @@ class PipelineResponseFactory:
     def _serialize_working_memory_with_dict_stuffs(working_memory: WorkingMemory) -> DictWorkingMemory:
         """Convert WorkingMemory to dict with DictStuff objects (content as dict).
 
-        Keeps the WorkingMemory structure but converts each Stuff.content to dict.
+        Keeps the WorkingMemory structure but converts each Stuff.content to JSON-ready dict.
 
         Args:
             working_memory: The WorkingMemory to serialize
@@ -27,7 +28,7 @@ class PipelineResponseFactory:
         for stuff_name, stuff in working_memory.root.items():
             dict_stuff = DictStuff(
                 concept=stuff.concept.concept_string,
-                content=stuff.content.model_dump(serialize_as_any=True),
+                content=ApiSerializer.serialize_content_for_api(content=stuff.content),
             )
             dict_stuffs_root[stuff_name] = dict_stuff
 
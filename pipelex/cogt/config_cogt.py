@@ -1,3 +1,5 @@
+from pydantic import Field
+
 from pipelex.cogt.exceptions import LLMConfigError
 from pipelex.cogt.img_gen.img_gen_job_components import ImgGenJobConfig, ImgGenJobParams, ImgGenJobParamsDefaults
 from pipelex.cogt.llm.llm_job_components import LLMJobConfig
@@ -27,9 +29,24 @@ class InstructorConfig(ConfigModel):
     is_dump_error_enabled: bool
 
 
+class LLMResponseCacheConfig(ConfigModel):
+    is_enabled: bool
+    db_path: str
+    ttl_seconds: int = Field(ge=0)
+    max_entries: int = Field(ge=1)
+    max_bytes: int = Field(ge=0)
+
+
+class PromptImageCacheConfig(ConfigModel):
+    is_enabled: bool
+    max_memory_bytes: int = Field(ge=0)
+
+
 class LLMConfig(ConfigModel):
     instructor_config: InstructorConfig
     llm_job_config: LLMJobConfig
+    response_cache_config: LLMResponseCacheConfig
+    prompt_image_cache_config: PromptImageCacheConfig
     is_structure_prompt_enabled: bool
     default_max_images: int
     is_dump_text_prompts_enabled: bool
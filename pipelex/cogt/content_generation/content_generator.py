@@ -1,3 +1,4 @@
+from collections.abc import AsyncIterator
 from typing import Any, cast
 
 from typing_extensions import override
@@ -15,7 +16,7 @@ from pipelex.cogt.content_generation.assignment_models import (
 from pipelex.cogt.content_generation.content_generator_protocol import ContentGeneratorProtocol, update_job_metadata
 from pipelex.cogt.content_generation.extract_generate import extract_gen_pages
 from pipelex.cogt.content_generation.img_gen_generate import img_gen_image_list, img_gen_single_image
-from pipelex.cogt.content_generation.llm_generate import llm_gen_object, llm_gen_object_list, llm_gen_text
+from pipelex.cogt.content_generation.llm_generate import llm_gen_object, llm_gen_object_list, llm_gen_text, llm_gen_text_stream
 from pipelex.cogt.content_generation.templating_generate import templating_gen_text
 from pipelex.cogt.extract.extract_input import ExtractInput
 from pipelex.cogt.extract.extract_job_components import ExtractJobConfig, ExtractJobParams
@@ -55,6 +56,24 @@ class ContentGenerator(ContentGeneratorProtocol):
         log.verbose(f"{self.__class__.__name__} generated text: {generated_text}")
         return generated_text
 
+    @override
+    async def make_llm_text_stream(
+        self,
+        job_metadata: JobMetadata,
+        llm_setting_main: LLMSetting,
+        llm_prompt_for_text: LLMPrompt,
+    ) -> AsyncIterator[str]:
+        # update_job_metadata only wraps coroutines, so the metadata is updated here
+        job_metadata.update(updated_metadata=JobMetadata(content_generation_job_id="make_llm_text_stream"))
+        log.verbose(f"{self.__class__.__name__} make_llm_text_stream: {llm_prompt_for_text}")
+        llm_assignment = LLMAssignment.make_from_prompt(
+            job_metadata=job_metadata,
+            llm_setting=llm_setting_main,
+            llm_prompt=llm_prompt_for_text,
+        )
+        async for text_chunk in llm_gen_text_stream(llm_assignment=llm_assignment):
+            yield text_chunk
+
     @override
     @update_job_metadata
     async def make_object_direct(
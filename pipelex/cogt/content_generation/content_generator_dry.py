@@ -1,3 +1,4 @@
+from collections.abc import AsyncIterator
 from typing import Any
 
 from polyfactory.factories.pydantic_factory import ModelFactory
@@ -46,6 +47,18 @@ class ContentGeneratorDry(ContentGeneratorProtocol):
         prompt_truncated = llm_prompt_for_text.desc(truncate_text_length=self._text_gen_truncate_length)
         return f"DRY RUN: {func_name} • llm_setting={llm_setting_main.desc()} • prompt={prompt_truncated}"
 
+    @override
+    async def make_llm_text_stream(
+        self,
+        job_metadata: JobMetadata,
+        llm_setting_main: LLMSetting,
+        llm_prompt_for_text: LLMPrompt,
+    ) -> AsyncIterator[str]:
+        func_name = "make_llm_text_stream"
+        log.verbose(f"🤡 DRY RUN: {self.__class__.__name__}.{func_name}")
+        prompt_truncated = llm_prompt_for_text.desc(truncate_text_length=self._text_gen_truncate_length)
+        yield f"DRY RUN: {func_name} • llm_setting={llm_setting_main.desc()} • prompt={prompt_truncated}"
+
     @override
     @update_job_metadata
     async def make_object_direct(
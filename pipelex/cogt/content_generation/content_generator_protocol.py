@@ -1,4 +1,4 @@
-from collections.abc import Awaitable, Callable, Coroutine
+from collections.abc import AsyncIterator, Awaitable, Callable, Coroutine
 from functools import wraps
 from typing import Any, ParamSpec, Protocol, TypeVar
 
@@ -52,6 +52,13 @@ class ContentGeneratorProtocol(Protocol):
         llm_prompt_for_text: LLMPrompt,
     ) -> Coroutine[Any, Any, str]: ...
 
+    def make_llm_text_stream(
+        self,
+        job_metadata: JobMetadata,
+        llm_setting_main: LLMSetting,
+        llm_prompt_for_text: LLMPrompt,
+    ) -> AsyncIterator[str]: ...
+
     def make_object_direct(
         self,
         job_metadata: JobMetadata,
@@ -1,11 +1,48 @@
+from collections.abc import AsyncIterator
 from typing import cast
 
 from pydantic import BaseModel
 
 from pipelex import log
 from pipelex.cogt.content_generation.assignment_models import LLMAssignment, ObjectAssignment
+from pipelex.cogt.llm.llm_job import LLMJob
 from pipelex.cogt.llm.llm_job_factory import LLMJobFactory
-from pipelex.hub import get_class_registry, get_llm_worker
+from pipelex.cogt.llm.llm_response_cache import LLMCachedResponse, LLMResponseKind, llm_response_cache, make_llm_response_cache_key
+from pipelex.hub import get_class_registry, get_llm_worker, get_report_delegate
+
+
+async def _make_cache_key(llm_assignment: LLMAssignment, kind: LLMResponseKind, schema: type[BaseModel] | None = None) -> str | None:
+    """Make the response cache key of the assignment, or None if the cache is not enabled for this call."""
+    if not llm_response_cache.is_enabled:
+        return None
+    return await make_llm_response_cache_key(
+        kind=kind,
+        llm_handle=llm_assignment.llm_handle,
+        llm_job_params=llm_assignment.llm_job_params,
+        llm_prompt=llm_assignment.llm_prompt,
+        schema=schema,
+    )
+
+
+async def _get_cached_response(cache_key: str | None, llm_job: LLMJob) -> str | None:
+    if cache_key is None:
+        return None
+    cached_response = await llm_response_cache.get(cache_key=cache_key, job_metadata=llm_job.job_metadata)
+    if cached_response is None:
+        return None
+    log.verbose(f"LLM response cache hit for pipeline '{llm_job.job_metadata.pipeline_run_id}'")
+    if cached_response.llm_tokens_usage:
+        get_report_delegate().report_cached_llm_usage(llm_tokens_usage=cached_response.llm_tokens_usage)
+    return cached_response.response
+
+
+async def _set_cached_response(cache_key: str | None, llm_job: LLMJob, response: str):
+    if cache_key is None:
+        return
+    await llm_response_cache.set(
+        cache_key=cache_key,
+        cached_response=LLMCachedResponse(response=response, llm_tokens_usage=llm_job.job_report.llm_tokens_usage),
+    )
 
 
 async def llm_gen_text(llm_assignment: LLMAssignment) -> str:
@@ -15,11 +52,33 @@ async def llm_gen_text(llm_assignment: LLMAssignment) -> str:
         llm_prompt=llm_assignment.llm_prompt,
         llm_job_params=llm_assignment.llm_job_params,
     )
+    cache_key = await _make_cache_key(llm_assignment=llm_assignment, kind=LLMResponseKind.TEXT)
+    if (cached_text := await _get_cached_response(cache_key=cache_key, llm_job=llm_job)) is not None:
+        return cached_text
     generated_text = await llm_worker.gen_text(llm_job=llm_job)
+    await _set_cached_response(cache_key=cache_key, llm_job=llm_job, response=generated_text)
     log.verbose(generated_text, title="llm_gen_text")
     return generated_text
 
 
+async def llm_gen_text_stream(llm_assignment: LLMAssignment) -> AsyncIterator[str]:
+    llm_worker = get_llm_worker(llm_handle=llm_assignment.llm_handle)
+    llm_job = LLMJobFactory.make_llm_job(
+        job_metadata=llm_assignment.job_metadata,
+        llm_prompt=llm_assignment.llm_prompt,
+        llm_job_params=llm_assignment.llm_job_params,
+    )
+    cache_key = await _make_cache_key(llm_assignment=llm_assignment, kind=LLMResponseKind.TEXT)
+    if (cached_text := await _get_cached_response(cache_key=cache_key, llm_job=llm_job)) is not None:
+        yield cached_text
+        return
+    text_chunks: list[str] = []
+    async for text_chunk in llm_worker.gen_text_stream(llm_job=llm_job):
+        text_chunks.append(text_chunk)
+        yield text_chunk
+    await _set_cached_response(cache_key=cache_key, llm_job=llm_job, response="".join(text_chunks))
+
+
 async def llm_gen_object(object_assignment: ObjectAssignment) -> BaseModel:
     llm_assignment = object_assignment.llm_assignment_for_object
     llm_worker = get_llm_worker(llm_handle=llm_assignment.llm_handle)
@@ -30,10 +89,14 @@ async def llm_gen_object(object_assignment: ObjectAssignment) -> BaseModel:
     )
     content_class_name = object_assignment.object_class_name
     content_class = get_class_registry().get_required_base_model(name=content_class_name)
+    cache_key = await _make_cache_key(llm_assignment=llm_assignment, kind=LLMResponseKind.OBJECT, schema=content_class)
+    if (cached_json := await _get_cached_response(cache_key=cache_key, llm_job=llm_job)) is not None:
+        return content_class.model_validate_json(cached_json)
     generated_object: BaseModel = await llm_worker.gen_object(
         llm_job=llm_job,
         schema=content_class,
     )
+    await _set_cached_response(cache_key=cache_key, llm_job=llm_job, response=generated_object.model_dump_json())
     return generated_object
 
 
@@ -59,9 +122,15 @@ async def llm_gen_object_list(object_assignment: ObjectAssignment) -> list[BaseM
     else:
         ListSchema.__doc__ = f"A list of {item_class_name}."
 
-    wrapped_list: ListSchema = await llm_worker.gen_object(
-        llm_job=llm_job,
-        schema=ListSchema,
-    )
+    wrapped_list: ListSchema
+    cache_key = await _make_cache_key(llm_assignment=llm_assignment, kind=LLMResponseKind.OBJECT_LIST, schema=ListSchema)
+    if (cached_json := await _get_cached_response(cache_key=cache_key, llm_job=llm_job)) is not None:
+        wrapped_list = ListSchema.model_validate_json(cached_json)
+    else:
+        wrapped_list = await llm_worker.gen_object(
+            llm_job=llm_job,
+            schema=ListSchema,
+        )
+        await _set_cached_response(cache_key=cache_key, llm_job=llm_job, response=wrapped_list.model_dump_json())
     generated_list: list[BaseModel] = cast("list[BaseModel]", wrapped_list.items)  # pyright: ignore[reportUnknownMemberType]
     return generated_list
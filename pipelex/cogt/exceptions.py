@@ -26,6 +26,10 @@ class ReportingManagerError(CogtError):
     pass
 
 
+class LLMResponseCacheError(CogtError):
+    pass
+
+
 class SdkTypeError(CogtError):
     pass
 
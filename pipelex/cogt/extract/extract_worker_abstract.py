@@ -56,7 +56,8 @@ class ExtractWorkerAbstract(InferenceWorkerAbstract):
         extract_job.extract_job_before_start()
 
         # Execute job
-        result = await self._extract_pages(extract_job=extract_job)
+        async with self._governed():
+            result = await self._extract_pages(extract_job=extract_job)
 
         # Report job
         extract_job.extract_job_after_complete()
@@ -20,6 +20,11 @@ class PromptImageTypedBase64(CustomBaseModel):
     file_type: FileType
 
 
+class PromptImageTypedBinary(CustomBaseModel):
+    binary: bytes
+    file_type: FileType
+
+
 PromptImageTypedUrlOrBase64 = Union[str, PromptImageTypedBase64]
 
 
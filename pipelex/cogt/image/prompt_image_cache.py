@@ -0,0 +1,405 @@
+import asyncio
+import base64
+import hashlib
+import math
+import weakref
+from collections import OrderedDict
+from io import BytesIO
+from pathlib import Path
+from typing import NamedTuple, Union
+
+from PIL import Image, UnidentifiedImageError
+from pydantic import BaseModel
+
+from pipelex import log
+from pipelex.cogt.config_cogt import PromptImageCacheConfig
+from pipelex.cogt.exceptions import PromptImageFormatError
+from pipelex.cogt.image.prompt_image import (
+    PromptImage,
+    PromptImageBase64,
+    PromptImageBinary,
+    PromptImagePath,
+    PromptImageTypedBase64,
+    PromptImageTypedBinary,
+    PromptImageUrl,
+)
+from pipelex.cogt.model_backends.prompt_image_policy import PromptImagePolicy
+from pipelex.tools.misc.base_64_utils import load_binary_async
+from pipelex.tools.misc.file_fetch_utils import fetch_file_from_url_httpx_async
+from pipelex.tools.misc.filetype_utils import detect_file_type_from_base64, detect_file_type_from_bytes
+from pipelex.types import StrEnum
+
+
+class PromptImagePayloadFormat(StrEnum):
+    DATA_URL = "data_url"
+    TYPED_BASE64 = "typed_base64"
+    TYPED_BINARY = "typed_binary"
+    POLICY_APPLIED = "policy_applied"
+
+
+class PromptImagePolicyOutcome(NamedTuple):
+    """The image prepared according to an image policy, or None when the original image already complies with it."""
+
+    prompt_image: PromptImageBinary | None
+
+
+PromptImagePayload = Union[str, PromptImageTypedBase64, PromptImageTypedBinary, PromptImagePolicyOutcome]
+
+# Successive downscaling steps applied to an image until it fits within the max_bytes of its policy
+MAX_BYTES_DOWNSCALE_FACTOR = 0.75
+MAX_BYTES_NB_ATTEMPTS = 8
+
+# The source of a prompt image, identifying its content without reading it when possible:
+# the path with its modification time and size, the URL, or the digest of the in-memory image content
+SourceKey = tuple[str, ...]
+
+# The digests of the image files, keyed by their source, are kept for the most recently used files only
+MAX_NB_PATH_DIGESTS = 10_000
+
+# The kind of a payload: its format, along with the image policy applied for PromptImagePayloadFormat.POLICY_APPLIED
+PayloadKind = tuple[PromptImagePayloadFormat, str | None]
+
+
+class PromptImageSource(NamedTuple):
+    """The content of a prompt image, either raw or already base64-encoded, with its digest."""
+
+    digest: str
+    raw_bytes: bytes | None = None
+    base_64: bytes | None = None
+
+
+class PromptImageCacheStats(BaseModel):
+    hits: int
+    encodings: int
+    memory_bytes: int
+    nb_digests: int
+
+    @property
+    def desc(self) -> str:
+        return f"{self.hits} hits, {self.encodings} encodings, {self.memory_bytes:,} bytes in memory, {self.nb_digests} digests"
+
+
+class PromptImageCache:
+    """Cache of the prompt images prepared for the LLM APIs, shared by all the plugins.
+
+    Payloads are keyed by the digest of the raw image content, whether it comes from a file, a URL, base64 or bytes,
+    and by their format: a base64 data URL, a typed base64 (e.g. for an Anthropic source block) or typed binary bytes,
+    and kept within a byte budget with LRU eviction. Files and URLs are read asynchronously, and digesting and encoding
+    run in a worker thread, so the event loop is never blocked. The digests of in-memory images are remembered for as
+    long as the images live, and concurrent preparations of the same image share a single encoding: sending the same
+    image to all the items of a batch costs one encoding per format.
+    """
+
+    def __init__(self):
+        self._config: PromptImageCacheConfig | None = None
+        self._path_digests: OrderedDict[SourceKey, str] = OrderedDict()
+        self._in_memory_digests: dict[int, tuple[weakref.ref[PromptImage], int, str]] = {}
+        self._payloads: OrderedDict[tuple[str, PayloadKind], PromptImagePayload] = OrderedDict()
+        self._memory_bytes = 0
+        self._in_flight: dict[tuple[asyncio.AbstractEventLoop, SourceKey, PayloadKind], asyncio.Task[PromptImagePayload]] = {}
+        self._hits = 0
+        self._encodings = 0
+
+    def setup(self, config: PromptImageCacheConfig):
+        self._config = config
+
+    def teardown(self):
+        if self._hits or self._encodings:
+            log.verbose(f"Prompt image cache: {self.stats.desc}")
+        self._config = None
+        self.clear()
+        self._hits = 0
+        self._encodings = 0
+
+    def clear(self):
+        self._path_digests.clear()
+        self._in_memory_digests.clear()
+        self._payloads.clear()
+        self._memory_bytes = 0
+
+    @property
+    def stats(self) -> PromptImageCacheStats:
+        return PromptImageCacheStats(
+            hits=self._hits,
+            encodings=self._encodings,
+            memory_bytes=self._memory_bytes,
+            nb_digests=len(self._path_digests) + len(self._in_memory_digests),
+        )
+
+    @property
+    def is_enabled(self) -> bool:
+        return self._config is not None and self._config.is_enabled
+
+    async def get_data_url(self, prompt_image: PromptImage) -> str:
+        """Get the image as a 'data:{mime};base64,...' URL, as expected by the OpenAI-compatible APIs."""
+        payload = await self._get_payload(prompt_image=prompt_image, payload_kind=(PromptImagePayloadFormat.DATA_URL, None))
+        if not isinstance(payload, str):
+            msg = f"Expected a data URL, got a '{type(payload).__name__}'"
+            raise PromptImageFormatError(msg)
+        return payload
+
+    async def get_typed_base64(self, prompt_image: PromptImage) -> PromptImageTypedBase64:
+        payload = await self._get_payload(prompt_image=prompt_image, payload_kind=(PromptImagePayloadFormat.TYPED_BASE64, None))
+        if not isinstance(payload, PromptImageTypedBase64):
+            msg = f"Expected a typed base64, got a '{type(payload).__name__}'"
+            raise PromptImageFormatError(msg)
+        return payload
+
+    async def get_typed_binary(self, prompt_image: PromptImage) -> PromptImageTypedBinary:
+        payload = await self._get_payload(prompt_image=prompt_image, payload_kind=(PromptImagePayloadFormat.TYPED_BINARY, None))
+        if not isinstance(payload, PromptImageTypedBinary):
+            msg = f"Expected a typed binary, got a '{type(payload).__name__}'"
+            raise PromptImageFormatError(msg)
+        return payload
+
+    async def apply_image_policy(self, prompt_image: PromptImage, image_policy: PromptImagePolicy) -> PromptImage:
+        """Get the image downscaled and re-encoded according to the image policy, or the image itself if it already complies with it."""
+        if not image_policy.is_active or (isinstance(prompt_image, PromptImageUrl) and not image_policy.is_applied_to_urls):
+            return prompt_image
+        payload_kind = (PromptImagePayloadFormat.POLICY_APPLIED, image_policy.model_dump_json())
+        payload = await self._get_payload(prompt_image=prompt_image, payload_kind=payload_kind)
+        if not isinstance(payload, PromptImagePolicyOutcome):
+            msg = f"Expected an image policy outcome, got a '{type(payload).__name__}'"
+            raise PromptImageFormatError(msg)
+        return payload.prompt_image or prompt_image
+
+    async def _get_payload(self, prompt_image: PromptImage, payload_kind: PayloadKind) -> PromptImagePayload:
+        source_key = await self._get_source_key(prompt_image=prompt_image)
+        if (digest := self._get_known_digest(source_key=source_key)) and (
+            payload := self._get_memory_payload(digest=digest, payload_kind=payload_kind)
+        ):
+            self._hits += 1
+            return payload
+
+        in_flight_key = (asyncio.get_running_loop(), source_key, payload_kind)
+        prepare_task = self._in_flight.get(in_flight_key)
+        if prepare_task is None:
+            prepare_task = asyncio.create_task(
+                self._prepare_and_store(prompt_image=prompt_image, source_key=source_key, payload_kind=payload_kind),
+            )
+            self._in_flight[in_flight_key] = prepare_task
+            prepare_task.add_done_callback(lambda _: self._in_flight.pop(in_flight_key, None))
+        # shielded so that a cancelled caller doesn't cancel the preparation shared with the other callers
+        return await asyncio.shield(prepare_task)
+
+    async def _prepare_and_store(self, prompt_image: PromptImage, source_key: SourceKey, payload_kind: PayloadKind) -> PromptImagePayload:
+        source = await self._load_source(prompt_image=prompt_image, source_key=source_key)
+        if payload := self._get_memory_payload(digest=source.digest, payload_kind=payload_kind):
+            self._hits += 1
+            return payload
+
+        self._encodings += 1
+        payload = await asyncio.to_thread(_make_payload, source, payload_kind)
+        if self.is_enabled:
+            self._set_memory_payload(digest=source.digest, payload_kind=payload_kind, payload=payload)
+        return payload
+
+    ############################################################
+    # Sources
+    ############################################################
+
+    async def _get_source_key(self, prompt_image: PromptImage) -> SourceKey:
+        match prompt_image:
+            case PromptImagePath():
+                return await asyncio.to_thread(_make_path_source_key, prompt_image.file_path)
+            case PromptImageUrl():
+                return ("url", prompt_image.url)
+            case PromptImageBase64() | PromptImageBinary():
+                return ("content", await self._get_in_memory_digest(prompt_image=prompt_image))
+            case _:
+                msg = f"Unsupported PromptImage type: '{type(prompt_image).__name__}'"
+                raise PromptImageFormatError(msg)
+
+    def _get_known_digest(self, source_key: SourceKey) -> str | None:
+        if source_key[0] == "content":
+            return source_key[1]
+        if (digest := self._path_digests.get(source_key)) is not None:
+            self._path_digests.move_to_end(source_key)
+        return digest
+
+    async def _get_in_memory_digest(self, prompt_image: PromptImageBase64 | PromptImageBinary) -> str:
+        """Get the digest of the raw content of an in-memory image, remembered by identity for as long as the image lives."""
+        in_memory_bytes = prompt_image.base_64 if isinstance(prompt_image, PromptImageBase64) else prompt_image.binary
+        prompt_image_id = id(prompt_image)
+        if known_digest := self._in_memory_digests.get(prompt_image_id):
+            prompt_image_ref, in_memory_bytes_id, digest = known_digest
+            if prompt_image_ref() is prompt_image and in_memory_bytes_id == id(in_memory_bytes):
+                return digest
+
+        if isinstance(prompt_image, PromptImageBase64):
+            digest = await asyncio.to_thread(_digest_base64, prompt_image.base_64)
+        else:
+            digest = await asyncio.to_thread(_digest, prompt_image.binary)
+        if self.is_enabled:
+            self._in_memory_digests[prompt_image_id] = (
+                weakref.ref(prompt_image, lambda _: self._in_memory_digests.pop(prompt_image_id, None)),
+                id(in_memory_bytes),
+                digest,
+            )
+        return digest
+
+    async def _load_source(self, prompt_image: PromptImage, source_key: SourceKey) -> PromptImageSource:
+        match prompt_image:
+            case PromptImagePath():
+                raw_bytes = await load_binary_async(prompt_image.file_path)
+                source = PromptImageSource(digest=await asyncio.to_thread(_digest, raw_bytes), raw_bytes=raw_bytes)
+                if self.is_enabled:
+                    self._path_digests[source_key] = source.digest
+                    self._path_digests.move_to_end(source_key)
+                    if len(self._path_digests) > MAX_NB_PATH_DIGESTS:
+                        self._path_digests.popitem(last=False)
+                return source
+            case PromptImageUrl():
+                # the content of a URL can change, so it's always fetched (through the fetch cache, which handles its revalidation)
+                # and digested again
+                raw_bytes = await fetch_file_from_url_httpx_async(prompt_image.url)
+                return PromptImageSource(digest=await asyncio.to_thread(_digest, raw_bytes), raw_bytes=raw_bytes)
+            case PromptImageBase64():
+                return PromptImageSource(digest=source_key[1], base_64=prompt_image.base_64)
+            case PromptImageBinary():
+                return PromptImageSource(digest=source_key[1], raw_bytes=prompt_image.binary)
+            case _:
+                msg = f"Unsupported PromptImage type: '{type(prompt_image).__name__}'"
+                raise PromptImageFormatError(msg)
+
+    ############################################################
+    # Payloads: (digest, kind) -> payload
+    ############################################################
+
+    def _get_memory_payload(self, digest: str, payload_kind: PayloadKind) -> PromptImagePayload | None:
+        payload_key = (digest, payload_kind)
+        if (payload := self._payloads.get(payload_key)) is not None:
+            self._payloads.move_to_end(payload_key)
+        return payload
+
+    def _set_memory_payload(self, digest: str, payload_kind: PayloadKind, payload: PromptImagePayload):
+        if self._config is None:
+            return
+        payload_size = _payload_size(payload)
+        if payload_size > self._config.max_memory_bytes:
+            return
+        payload_key = (digest, payload_kind)
+        if payload_key not in self._payloads:
+            self._payloads[payload_key] = payload
+            self._memory_bytes += payload_size
+        self._payloads.move_to_end(payload_key)
+        while self._memory_bytes > self._config.max_memory_bytes:
+            _, evicted_payload = self._payloads.popitem(last=False)
+            self._memory_bytes -= _payload_size(evicted_payload)
+
+
+def _digest(content: bytes) -> str:
+    return hashlib.sha256(content).hexdigest()
+
+
+def _digest_base64(base_64: bytes) -> str:
+    """Digest the decoded content, so that an image shares its payloads whether it comes as base64 or raw bytes."""
+    return _digest(base64.b64decode(base_64))
+
+
+def _make_path_source_key(file_path: str) -> SourceKey:
+    absolute_file_path = Path(file_path).absolute()
+    file_stat = absolute_file_path.stat()
+    return ("path", str(absolute_file_path), str(file_stat.st_mtime_ns), str(file_stat.st_size))
+
+
+def _payload_size(payload: PromptImagePayload) -> int:
+    match payload:
+        case str():
+            return len(payload)
+        case PromptImageTypedBase64():
+            return len(payload.base_64)
+        case PromptImageTypedBinary():
+            return len(payload.binary)
+        case PromptImagePolicyOutcome():
+            # an image complying with the policy costs its key
+            return len(payload.prompt_image.binary) if payload.prompt_image else 64
+
+
+def _make_payload(source: PromptImageSource, payload_kind: PayloadKind) -> PromptImagePayload:
+    """Encode the image content into the payload kind. This is CPU-bound and meant to run in a worker thread."""
+    payload_format, image_policy_json = payload_kind
+    if payload_format == PromptImagePayloadFormat.POLICY_APPLIED:
+        if image_policy_json is None:
+            msg = "Applying an image policy requires the image policy"
+            raise PromptImageFormatError(msg)
+        raw_bytes = source.raw_bytes if source.raw_bytes is not None else base64.b64decode(source.base_64 or b"")
+        policy_applied_bytes = _apply_image_policy(raw_bytes=raw_bytes, image_policy=PromptImagePolicy.model_validate_json(image_policy_json))
+        if policy_applied_bytes is None:
+            return PromptImagePolicyOutcome(prompt_image=None)
+        return PromptImagePolicyOutcome(prompt_image=PromptImageBinary(binary=policy_applied_bytes))
+
+    if source.raw_bytes is not None:
+        file_type = detect_file_type_from_bytes(buf=source.raw_bytes)
+    elif source.base_64 is not None:
+        file_type = detect_file_type_from_base64(b64=source.base_64)
+    else:
+        msg = "A prompt image source requires either raw bytes or base64"
+        raise PromptImageFormatError(msg)
+
+    match payload_format:
+        case PromptImagePayloadFormat.DATA_URL:
+            base_64 = source.base_64 if source.base_64 is not None else base64.b64encode(source.raw_bytes or b"")
+            return f"data:{file_type.mime};base64,{base_64.decode('utf-8')}"
+        case PromptImagePayloadFormat.TYPED_BASE64:
+            base_64 = source.base_64 if source.base_64 is not None else base64.b64encode(source.raw_bytes or b"")
+            return PromptImageTypedBase64(base_64=base_64, file_type=file_type)
+        case PromptImagePayloadFormat.TYPED_BINARY:
+            raw_bytes = source.raw_bytes if source.raw_bytes is not None else base64.b64decode(source.base_64 or b"")
+            return PromptImageTypedBinary(binary=raw_bytes, file_type=file_type)
+
+
+def _apply_image_policy(raw_bytes: bytes, image_policy: PromptImagePolicy) -> bytes | None:
+    """Downscale and re-encode the image according to the policy, or return None if it already complies with it."""
+    try:
+        opened_image = Image.open(BytesIO(raw_bytes))
+    except UnidentifiedImageError as exc:
+        msg = f"Could not identify the image format to apply the image policy: {exc}"
+        raise PromptImageFormatError(msg) from exc
+    with opened_image as image:
+        width, height = image.size
+        scale = 1.0
+        if image_policy.max_edge is not None:
+            scale = min(scale, image_policy.max_edge / max(width, height))
+        if image_policy.max_megapixels is not None:
+            scale = min(scale, math.sqrt(image_policy.max_megapixels * 1_000_000 / (width * height)))
+        if image_policy.recompress_format is not None:
+            target_format = image_policy.recompress_format.pil_format
+        elif image.format in {"JPEG", "PNG", "WEBP"}:
+            target_format = image.format
+        else:
+            target_format = "PNG"
+        is_too_heavy = image_policy.max_bytes is not None and len(raw_bytes) > image_policy.max_bytes
+        is_recompressed = image_policy.recompress_format is not None and target_format != image.format
+        if scale >= 1 and not is_recompressed and not is_too_heavy:
+            return None
+
+        image.load()
+        if target_format == "JPEG" and image.mode not in {"RGB", "L"}:
+            converted_image = image.convert("RGB")
+        elif image.mode not in {"RGB", "RGBA", "L", "LA"}:
+            converted_image = image.convert("RGBA")
+        else:
+            converted_image = image
+        policy_applied_bytes = _encode_image(image=converted_image, scale=min(scale, 1.0), target_format=target_format, quality=image_policy.quality)
+        for _ in range(MAX_BYTES_NB_ATTEMPTS):
+            if image_policy.max_bytes is None or len(policy_applied_bytes) <= image_policy.max_bytes:
+                break
+            scale = min(scale, 1.0) * MAX_BYTES_DOWNSCALE_FACTOR
+            policy_applied_bytes = _encode_image(image=converted_image, scale=scale, target_format=target_format, quality=image_policy.quality)
+        return policy_applied_bytes
+
+
+def _encode_image(image: Image.Image, scale: float, target_format: str, quality: int) -> bytes:
+    if scale < 1:
+        new_size = (max(1, round(image.width * scale)), max(1, round(image.height * scale)))
+        image = image.resize(new_size, Image.Resampling.LANCZOS)  # pyright: ignore[reportUnknownMemberType]
+    buffer = BytesIO()
+    if target_format in {"JPEG", "WEBP"}:
+        image.save(buffer, format=target_format, quality=quality)
+    else:
+        image.save(buffer, format=target_format, optimize=True)
+    return buffer.getvalue()
+
+
+prompt_image_cache = PromptImageCache()
@@ -52,7 +52,8 @@ class ImgGenWorkerAbstract(InferenceWorkerAbstract):
         img_gen_job.img_gen_job_before_start()
 
         # Execute job
-        result = await self._gen_image(img_gen_job=img_gen_job)
+        async with self._governed():
+            result = await self._gen_image(img_gen_job=img_gen_job)
 
         # Report job
         img_gen_job.img_gen_job_after_complete()
@@ -88,7 +89,8 @@ class ImgGenWorkerAbstract(InferenceWorkerAbstract):
         img_gen_job.img_gen_job_before_start()
 
         # Execute job
-        result = await self._gen_image_list(img_gen_job=img_gen_job, nb_images=nb_images)
+        async with self._governed():
+            result = await self._gen_image_list(img_gen_job=img_gen_job, nb_images=nb_images)
 
         # Report job
         img_gen_job.img_gen_job_after_complete()
@@ -0,0 +1,132 @@
+import asyncio
+import time
+from collections.abc import AsyncGenerator, Callable
+from contextlib import asynccontextmanager
+
+from pipelex import log
+from pipelex.cogt.model_backends.model_spec import InferenceModelSpec
+from pipelex.cogt.model_backends.rate_limits import InferenceRateLimits
+
+SECONDS_PER_MINUTE = 60.0
+
+
+class TokenBucket:
+    """A token bucket refilled continuously at a fixed rate, up to its capacity.
+
+    Waiters are served in FIFO order. A request for more than the capacity is let through once the bucket is full,
+    leaving the bucket in debt, so that oversized requests are slowed down instead of blocked forever.
+    """
+
+    def __init__(self, capacity: float, refill_per_second: float, clock: Callable[[], float] = time.monotonic):
+        self.capacity = capacity
+        self.refill_per_second = refill_per_second
+        self._clock = clock
+        self._level = capacity
+        self._updated_at = clock()
+        self._lock: asyncio.Lock | None = None
+        self._lock_loop: asyncio.AbstractEventLoop | None = None
+
+    @property
+    def level(self) -> float:
+        self._refill()
+        return self._level
+
+    def _refill(self):
+        now = self._clock()
+        self._level = min(self.capacity, self._level + (now - self._updated_at) * self.refill_per_second)
+        self._updated_at = now
+
+    def _get_lock(self) -> asyncio.Lock:
+        # asyncio primitives bind to the event loop which first waits on them, so make one per running loop
+        running_loop = asyncio.get_running_loop()
+        if self._lock is None or self._lock_loop is not running_loop:
+            self._lock = asyncio.Lock()
+            self._lock_loop = running_loop
+        return self._lock
+
+    async def acquire(self, amount: float = 1):
+        async with self._get_lock():
+            while True:
+                self._refill()
+                if self._level >= min(amount, self.capacity):
+                    self._level -= amount
+                    return
+                missing = min(amount, self.capacity) - self._level
+                await asyncio.sleep(missing / self.refill_per_second)
+
+    def adjust(self, amount: float):
+        """Give back (positive amount) or take (negative amount) tokens without waiting."""
+        self._refill()
+        self._level = min(self.capacity, self._level + amount)
+
+
+class InferenceGovernor:
+    """Governs the requests sent to one inference model: in-flight requests, requests per minute and tokens per minute.
+
+    Requests exceeding the limits are queued until they fit, instead of being sent and rejected by the provider.
+    """
+
+    def __init__(self, key: str, rate_limits: InferenceRateLimits):
+        self.key = key
+        self.rate_limits = rate_limits
+        self._in_flight_semaphore: asyncio.Semaphore | None = None
+        self._in_flight_semaphore_loop: asyncio.AbstractEventLoop | None = None
+        self._requests_bucket: TokenBucket | None = None
+        if rate_limits.requests_per_minute:
+            self._requests_bucket = TokenBucket(
+                capacity=rate_limits.requests_per_minute,
+                refill_per_second=rate_limits.requests_per_minute / SECONDS_PER_MINUTE,
+            )
+        self._tokens_bucket: TokenBucket | None = None
+        if rate_limits.tokens_per_minute:
+            self._tokens_bucket = TokenBucket(
+                capacity=rate_limits.tokens_per_minute,
+                refill_per_second=rate_limits.tokens_per_minute / SECONDS_PER_MINUTE,
+            )
+
+    @classmethod
+    def make_key(cls, inference_model: InferenceModelSpec) -> str:
+        """Models with their own rate limits get their own governor, the others share the governor of their backend."""
+        if inference_model.rate_limits:
+            return f"{inference_model.backend_name}/{inference_model.name}"
+        return inference_model.backend_name
+
+    def _get_in_flight_semaphore(self) -> asyncio.Semaphore | None:
+        if not self.rate_limits.max_in_flight:
+            return None
+        # asyncio primitives bind to the event loop which first waits on them, so make one per running loop
+        running_loop = asyncio.get_running_loop()
+        if self._in_flight_semaphore is None or self._in_flight_semaphore_loop is not running_loop:
+            self._in_flight_semaphore = asyncio.Semaphore(self.rate_limits.max_in_flight)
+            self._in_flight_semaphore_loop = running_loop
+        return self._in_flight_semaphore
+
+    @asynccontextmanager
+    async def governed(self, nb_tokens: int = 0) -> AsyncGenerator[None, None]:
+        """Wait for a slot and for enough request and token budget, then hold the slot while the request runs.
+
+        Args:
+            nb_tokens: The estimated number of tokens used by the request, reconciled later with record_tokens_used()
+
+        """
+        started_waiting_at = time.monotonic()
+        in_flight_semaphore = self._get_in_flight_semaphore()
+        if in_flight_semaphore:
+            await in_flight_semaphore.acquire()
+        try:
+            if self._requests_bucket:
+                await self._requests_bucket.acquire()
+            if self._tokens_bucket and nb_tokens:
+                await self._tokens_bucket.acquire(nb_tokens)
+            waited_seconds = time.monotonic() - started_waiting_at
+            if waited_seconds > 1:
+                log.verbose(f"Inference governor '{self.key}' queued a request for {waited_seconds:.1f}s")
+            yield
+        finally:
+            if in_flight_semaphore:
+                in_flight_semaphore.release()
+
+    def record_tokens_used(self, nb_tokens_estimated: int, nb_tokens_used: int):
+        """Reconcile the tokens budget once the actual usage of a request is known."""
+        if self._tokens_bucket:
+            self._tokens_bucket.adjust(nb_tokens_estimated - nb_tokens_used)
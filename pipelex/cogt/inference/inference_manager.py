@@ -5,10 +5,12 @@ from pipelex.cogt.extract.extract_worker_abstract import ExtractWorkerAbstract
 from pipelex.cogt.extract.extract_worker_factory import ExtractWorkerFactory
 from pipelex.cogt.img_gen.img_gen_worker_abstract import ImgGenWorkerAbstract
 from pipelex.cogt.img_gen.img_gen_worker_factory import ImgGenWorkerFactory
+from pipelex.cogt.inference.inference_governor import InferenceGovernor
 from pipelex.cogt.inference.inference_manager_protocol import InferenceManagerProtocol
 from pipelex.cogt.llm.llm_worker_abstract import LLMWorkerAbstract
 from pipelex.cogt.llm.llm_worker_factory import LLMWorkerFactory
 from pipelex.cogt.llm.llm_worker_internal_abstract import LLMWorkerInternalAbstract
+from pipelex.cogt.model_backends.model_spec import InferenceModelSpec
 from pipelex.hub import get_models_manager, get_report_delegate
 
 
@@ -20,6 +22,7 @@ class InferenceManager(InferenceManagerProtocol):
         self.llm_workers: dict[str, LLMWorkerAbstract] = {}
         self.img_gen_workers: dict[str, ImgGenWorkerAbstract] = {}
         self.extract_workers: dict[str, ExtractWorkerAbstract] = {}
+        self.inference_governors: dict[str, InferenceGovernor] = {}
 
     @override
     def teardown(self):
@@ -34,6 +37,7 @@ class InferenceManager(InferenceManagerProtocol):
         for extract_worker in self.extract_workers.values():
             extract_worker.teardown()
         self.extract_workers = {}
+        self.inference_governors = {}
         log.verbose("InferenceManager teardown done")
 
     def print_workers(self):
@@ -50,6 +54,23 @@ class InferenceManager(InferenceManagerProtocol):
             log.verbose(f"  {handle}:")
             log.verbose(extract_worker_async.desc)
 
+    ####################################################################################################
+    # Inference governors
+    ####################################################################################################
+
+    def _get_inference_governor(self, inference_model: InferenceModelSpec) -> InferenceGovernor | None:
+        """Get the governor shared by all the workers of an inference model or of its backend, if it has rate limits."""
+        rate_limits = inference_model.rate_limits or inference_model.backend_rate_limits
+        if rate_limits is None or not rate_limits.is_limited:
+            return None
+        governor_key = InferenceGovernor.make_key(inference_model=inference_model)
+        inference_governor = self.inference_governors.get(governor_key)
+        if inference_governor is None:
+            log.verbose(f"Setting up inference governor for '{governor_key}': {rate_limits}")
+            inference_governor = InferenceGovernor(key=governor_key, rate_limits=rate_limits)
+            self.inference_governors[governor_key] = inference_governor
+        return inference_governor
+
     ####################################################################################################
     # Setup LLM Workers
     ####################################################################################################
@@ -63,6 +84,7 @@ class InferenceManager(InferenceManagerProtocol):
             inference_model=inference_model,
             reporting_delegate=get_report_delegate(),
         )
+        llm_worker.inference_governor = self._get_inference_governor(inference_model=inference_model)
         self.llm_workers[llm_handle] = llm_worker
         return llm_worker
 
@@ -95,6 +117,7 @@ class InferenceManager(InferenceManagerProtocol):
             inference_model=inference_model,
             reporting_delegate=get_report_delegate(),
         )
+        img_gen_worker.inference_governor = self._get_inference_governor(inference_model=inference_model)
         self.img_gen_workers[img_gen_handle] = img_gen_worker
         return img_gen_worker
 
@@ -118,6 +141,7 @@ class InferenceManager(InferenceManagerProtocol):
             inference_model=inference_model,
             reporting_delegate=get_report_delegate(),
         )
+        extract_worker.inference_governor = self._get_inference_governor(inference_model=inference_model)
         self.extract_workers[extract_handle] = extract_worker
         return extract_worker
 
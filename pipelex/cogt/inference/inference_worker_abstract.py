@@ -1,6 +1,12 @@
+from __future__ import annotations
+
 from abc import ABC, abstractmethod
+from contextlib import AbstractAsyncContextManager, nullcontext
+from typing import TYPE_CHECKING
 
-from pipelex.reporting.reporting_protocol import ReportingProtocol
+if TYPE_CHECKING:
+    from pipelex.cogt.inference.inference_governor import InferenceGovernor
+    from pipelex.reporting.reporting_protocol import ReportingProtocol
 
 
 class InferenceWorkerAbstract(ABC):
@@ -9,6 +15,7 @@ class InferenceWorkerAbstract(ABC):
         reporting_delegate: ReportingProtocol | None = None,
     ):
         self.reporting_delegate = reporting_delegate
+        self.inference_governor: InferenceGovernor | None = None
 
     def setup(self):
         pass
@@ -20,3 +27,9 @@ class InferenceWorkerAbstract(ABC):
     @abstractmethod
     def desc(self) -> str:
         pass
+
+    def _governed(self, nb_tokens: int = 0) -> AbstractAsyncContextManager[None]:
+        """Hold a slot of the inference governor, if any, while running a request."""
+        if self.inference_governor is None:
+            return nullcontext()
+        return self.inference_governor.governed(nb_tokens=nb_tokens)
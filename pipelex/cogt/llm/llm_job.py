@@ -8,6 +8,9 @@ from pipelex.cogt.llm.llm_prompt import LLMPrompt
 from pipelex.cogt.llm.llm_report import LLMTokensUsage
 from pipelex.cogt.model_backends.model_spec import InferenceModelSpec
 
+# Rough average for english text, good enough to budget requests before the actual usage is known
+NB_CHARS_PER_TOKEN_ESTIMATE = 4
+
 
 class LLMJob(InferenceJobAbstract):
     llm_prompt: LLMPrompt
@@ -19,6 +22,12 @@ class LLMJob(InferenceJobAbstract):
     def params_desc(self) -> str:
         return f"temp={self.job_params.temperature}, max_tokens={self.job_params.max_tokens}"
 
+    @property
+    def estimated_nb_tokens(self) -> int:
+        """Estimate the tokens used by the job, counting max_tokens for the output like the providers' rate limiters do."""
+        nb_prompt_chars = len(self.llm_prompt.system_text or "") + len(self.llm_prompt.user_text or "")
+        return nb_prompt_chars // NB_CHARS_PER_TOKEN_ESTIMATE + (self.job_params.max_tokens or 0)
+
     @override
     def validate_before_execution(self):
         self.llm_prompt.validate_before_execution()
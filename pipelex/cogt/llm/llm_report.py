@@ -66,3 +66,7 @@ class LLMTokensUsage(BaseModel):
     unit_costs: CostsByCategoryDict
     inference_model_id: str
     nb_tokens_by_category: NbTokensByCategoryDict
+
+    @property
+    def nb_tokens_total(self) -> int:
+        return self.nb_tokens_by_category.get(TokenCategory.INPUT, 0) + self.nb_tokens_by_category.get(TokenCategory.OUTPUT, 0)
@@ -0,0 +1,259 @@
+import asyncio
+import hashlib
+import json
+import os
+import sqlite3
+import threading
+import time
+from collections.abc import Generator
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Any
+
+from pydantic import BaseModel
+
+from pipelex import log
+from pipelex.cogt.config_cogt import LLMResponseCacheConfig
+from pipelex.cogt.exceptions import LLMResponseCacheError
+from pipelex.cogt.image.prompt_image import PromptImage, PromptImageBase64, PromptImageBinary, PromptImagePath, PromptImageUrl
+from pipelex.cogt.llm.llm_job_components import LLMJobParams
+from pipelex.cogt.llm.llm_prompt import LLMPrompt
+from pipelex.cogt.llm.llm_report import LLMTokensUsage
+from pipelex.pipeline.job_metadata import JobMetadata
+from pipelex.tools.misc.base_64_utils import load_binary_async
+from pipelex.tools.misc.file_fetch_utils import fetch_file_from_url_httpx_async
+from pipelex.types import StrEnum
+
+# Bump this version when the key derivation changes, so that stale entries are never hit
+LLM_RESPONSE_CACHE_KEY_VERSION = 2
+
+llm_response_cache_enabled_var: ContextVar[bool | None] = ContextVar("llm_response_cache_enabled", default=None)
+
+
+@contextmanager
+def llm_response_cache_scope(is_enabled: bool | None) -> Generator[None, None, None]:
+    """Enable or disable the LLM response cache for the LLM calls made within the scope.
+
+    Args:
+        is_enabled: Whether to use the cache, or None to keep the enclosing setting (ultimately the config)
+
+    """
+    if is_enabled is None:
+        yield
+        return
+    token = llm_response_cache_enabled_var.set(is_enabled)
+    try:
+        yield
+    finally:
+        llm_response_cache_enabled_var.reset(token)
+
+
+class LLMResponseKind(StrEnum):
+    TEXT = "text"
+    OBJECT = "object"
+    OBJECT_LIST = "object_list"
+
+
+async def digest_prompt_image(prompt_image: PromptImage) -> str:
+    """Digest the content of the image, reading files and URLs asynchronously and hashing in a worker thread."""
+    image_bytes: bytes
+    if isinstance(prompt_image, PromptImagePath):
+        image_bytes = await load_binary_async(prompt_image.file_path)
+    elif isinstance(prompt_image, PromptImageBase64):
+        image_bytes = prompt_image.base_64
+    elif isinstance(prompt_image, PromptImageBinary):
+        image_bytes = prompt_image.binary
+    elif isinstance(prompt_image, PromptImageUrl):
+        # the content behind a URL can change, so it's the fetched content that is digested (the fetch cache revalidates it)
+        image_bytes = await fetch_file_from_url_httpx_async(prompt_image.url)
+    else:
+        msg = f"Cannot digest prompt image of type '{type(prompt_image).__name__}' for the LLM response cache"
+        raise LLMResponseCacheError(msg)
+    return await asyncio.to_thread(_sha256_hexdigest, image_bytes)
+
+
+def _sha256_hexdigest(content: bytes) -> str:
+    return hashlib.sha256(content).hexdigest()
+
+
+async def make_llm_response_cache_key(
+    kind: LLMResponseKind,
+    llm_handle: str,
+    llm_job_params: LLMJobParams,
+    llm_prompt: LLMPrompt,
+    schema: type[BaseModel] | None = None,
+) -> str:
+    """Make the content-addressed key of an LLM call: the hash of everything that can change its response."""
+    user_images_digests = await asyncio.gather(*(digest_prompt_image(prompt_image=prompt_image) for prompt_image in llm_prompt.user_images))
+    key_data: dict[str, Any] = {
+        "version": LLM_RESPONSE_CACHE_KEY_VERSION,
+        "kind": kind,
+        "llm_handle": llm_handle,
+        "llm_job_params": llm_job_params.model_dump(mode="json"),
+        "system_text": llm_prompt.system_text,
+        "user_text": llm_prompt.user_text,
+        "user_images": list(user_images_digests),
+        "schema": schema.model_json_schema() if schema else None,
+    }
+    return hashlib.sha256(json.dumps(key_data, sort_keys=True).encode()).hexdigest()
+
+
+class LLMCachedResponse(BaseModel):
+    response: str
+    llm_tokens_usage: LLMTokensUsage | None = None
+
+
+class LLMResponseCacheStats(BaseModel):
+    hits: int
+    misses: int
+
+    @property
+    def desc(self) -> str:
+        return f"{self.hits} hits, {self.misses} misses"
+
+
+class LLMResponseCache:
+    """Persistent cache of LLM responses, stored in a local SQLite database.
+
+    Entries are keyed by make_llm_response_cache_key(), expire after the configured TTL,
+    and the least recently used ones are evicted beyond the configured max number of entries or max total size
+    of the stored responses, so that a few large structured responses cannot grow the database without limit.
+    The database is only opened on first use, so that runs which never enable the cache don't create it,
+    and it is queried in a worker thread, so that the event loop is never blocked by its I/O.
+    """
+
+    def __init__(self):
+        self._config: LLMResponseCacheConfig | None = None
+        self._connection: sqlite3.Connection | None = None
+        self._lock = threading.Lock()
+        self._hits = 0
+        self._misses = 0
+
+    def setup(self, config: LLMResponseCacheConfig):
+        self._config = config
+
+    def teardown(self):
+        if self._hits or self._misses:
+            log.verbose(f"LLM response cache: {self.stats.desc}")
+        with self._lock:
+            if self._connection is not None:
+                self._connection.close()
+                self._connection = None
+            self._config = None
+            self._hits = 0
+            self._misses = 0
+
+    @property
+    def stats(self) -> LLMResponseCacheStats:
+        return LLMResponseCacheStats(hits=self._hits, misses=self._misses)
+
+    @property
+    def is_enabled(self) -> bool:
+        """Whether the LLM calls made in the current context should use the cache."""
+        if self._config is None:
+            return False
+        is_enabled_in_context = llm_response_cache_enabled_var.get()
+        if is_enabled_in_context is not None:
+            return is_enabled_in_context
+        return self._config.is_enabled
+
+    @property
+    def _required_config(self) -> LLMResponseCacheConfig:
+        if self._config is None:
+            msg = "The LLM response cache is not set up"
+            raise LLMResponseCacheError(msg)
+        return self._config
+
+    def _get_connection(self) -> sqlite3.Connection:
+        if self._connection is None:
+            db_path = self._required_config.db_path
+            if db_dir := os.path.dirname(db_path):
+                os.makedirs(db_dir, exist_ok=True)
+            connection = sqlite3.connect(db_path, check_same_thread=False)
+            connection.execute(
+                "CREATE TABLE IF NOT EXISTS llm_responses ("
+                "cache_key TEXT PRIMARY KEY, "
+                "cached_response TEXT NOT NULL, "
+                "created_at REAL NOT NULL, "
+                "accessed_at REAL NOT NULL, "
+                "response_bytes INTEGER NOT NULL DEFAULT 0)"
+            )
+            column_names = {column_row[1] for column_row in connection.execute("PRAGMA table_info(llm_responses)")}
+            if "response_bytes" not in column_names:
+                # the database was made before the responses were sized: size the entries it holds
+                connection.execute("ALTER TABLE llm_responses ADD COLUMN response_bytes INTEGER NOT NULL DEFAULT 0")
+                connection.execute("UPDATE llm_responses SET response_bytes = length(CAST(cached_response AS BLOB))")
+            connection.execute("CREATE INDEX IF NOT EXISTS llm_responses_accessed_at ON llm_responses (accessed_at)")
+            connection.commit()
+            self._connection = connection
+        return self._connection
+
+    async def get(self, cache_key: str, job_metadata: JobMetadata) -> LLMCachedResponse | None:
+        """Get the cached response, with its original tokens usage re-attributed to the current job."""
+        cached_response_json = await asyncio.to_thread(self._select, cache_key)
+        if cached_response_json is None:
+            return None
+        cached_response = LLMCachedResponse.model_validate_json(cached_response_json)
+        if cached_response.llm_tokens_usage:
+            cached_response.llm_tokens_usage.job_metadata = job_metadata
+        return cached_response
+
+    async def set(self, cache_key: str, cached_response: LLMCachedResponse):
+        await asyncio.to_thread(self._insert, cache_key, cached_response.model_dump_json())
+
+    def _select(self, cache_key: str) -> str | None:
+        config = self._required_config
+        now = time.time()
+        with self._lock:
+            connection = self._get_connection()
+            row = connection.execute(
+                "SELECT cached_response, created_at FROM llm_responses WHERE cache_key = ?",
+                (cache_key,),
+            ).fetchone()
+            if row is None:
+                self._misses += 1
+                return None
+            cached_response_json, created_at = row
+            if config.ttl_seconds and now - created_at > config.ttl_seconds:
+                connection.execute("DELETE FROM llm_responses WHERE cache_key = ?", (cache_key,))
+                connection.commit()
+                self._misses += 1
+                return None
+            connection.execute("UPDATE llm_responses SET accessed_at = ? WHERE cache_key = ?", (now, cache_key))
+            connection.commit()
+            self._hits += 1
+            return str(cached_response_json)
+
+    def _insert(self, cache_key: str, cached_response_json: str):
+        config = self._required_config
+        now = time.time()
+        with self._lock:
+            connection = self._get_connection()
+            connection.execute(
+                "INSERT OR REPLACE INTO llm_responses (cache_key, cached_response, created_at, accessed_at, response_bytes) VALUES (?, ?, ?, ?, ?)",
+                (cache_key, cached_response_json, now, now, len(cached_response_json.encode())),
+            )
+            if config.ttl_seconds:
+                connection.execute("DELETE FROM llm_responses WHERE created_at < ?", (now - config.ttl_seconds,))
+            connection.execute(
+                "DELETE FROM llm_responses WHERE cache_key IN (SELECT cache_key FROM llm_responses ORDER BY accessed_at DESC LIMIT -1 OFFSET ?)",
+                (config.max_entries,),
+            )
+            # keep the most recently used entries whose responses fit in max_bytes
+            connection.execute(
+                "DELETE FROM llm_responses WHERE cache_key IN ("
+                "SELECT cache_key FROM ("
+                "SELECT cache_key, SUM(response_bytes) OVER (ORDER BY accessed_at DESC, cache_key) AS kept_bytes FROM llm_responses"
+                ") WHERE kept_bytes > ?)",
+                (config.max_bytes,),
+            )
+            connection.commit()
+
+    def clear(self):
+        with self._lock:
+            connection = self._get_connection()
+            connection.execute("DELETE FROM llm_responses")
+            connection.commit()
+
+
+llm_response_cache = LLMResponseCache()
@@ -10,6 +10,8 @@ from pipelex.cogt.inference.inference_worker_abstract import InferenceWorkerAbst
 from pipelex.pipeline.job_metadata import UnitJobId
 
 if TYPE_CHECKING:
+    from collections.abc import AsyncIterator
+
     from pipelex.cogt.llm.llm_job import LLMJob
     from pipelex.reporting.reporting_protocol import ReportingProtocol
     from pipelex.tools.typing.pydantic_utils import BaseModelTypeVar
@@ -66,6 +68,15 @@ class LLMWorkerAbstract(InferenceWorkerAbstract, ABC):
         # This can be overridden by subclasses for specific checks
         pass
 
+    def _record_tokens_used(self, llm_job: LLMJob, nb_tokens_estimated: int):
+        if self.inference_governor is None:
+            return
+        if (llm_tokens_usage := llm_job.job_report.llm_tokens_usage) and llm_tokens_usage.nb_tokens_by_category:
+            self.inference_governor.record_tokens_used(
+                nb_tokens_estimated=nb_tokens_estimated,
+                nb_tokens_used=llm_tokens_usage.nb_tokens_total,
+            )
+
     async def gen_text(
         self,
         llm_job: LLMJob,
@@ -78,7 +89,14 @@ class LLMWorkerAbstract(InferenceWorkerAbstract, ABC):
 
         await self._before_job(llm_job=llm_job)
 
-        result = await self._gen_text(llm_job=llm_job)
+        nb_tokens_estimated = llm_job.estimated_nb_tokens
+        async with self._governed(nb_tokens=nb_tokens_estimated):
+            if llm_job.job_config.is_streaming_enabled:
+                # streaming behind the scenes avoids the timeouts of long non-streamed completions
+                result = "".join([text_chunk async for text_chunk in self._gen_text_stream(llm_job=llm_job)])
+            else:
+                result = await self._gen_text(llm_job=llm_job)
+        self._record_tokens_used(llm_job=llm_job, nb_tokens_estimated=nb_tokens_estimated)
 
         await self._after_job(llm_job=llm_job, result=result)
 
@@ -91,6 +109,41 @@ class LLMWorkerAbstract(InferenceWorkerAbstract, ABC):
     ) -> str:
         pass
 
+    async def gen_text_stream(
+        self,
+        llm_job: LLMJob,
+    ) -> AsyncIterator[str]:
+        """Generate text, yielding the chunks of text as soon as the model produces them.
+
+        The job is reported once the stream is exhausted, with the full text.
+        """
+        log.verbose("LLM Worker gen_text_stream")
+        log.verbose(llm_job.llm_prompt.desc(), title="llm_prompt")
+
+        # metadata
+        llm_job.job_metadata.unit_job_id = UnitJobId.LLM_GEN_TEXT
+
+        await self._before_job(llm_job=llm_job)
+
+        text_chunks: list[str] = []
+        nb_tokens_estimated = llm_job.estimated_nb_tokens
+        async with self._governed(nb_tokens=nb_tokens_estimated):
+            async for text_chunk in self._gen_text_stream(llm_job=llm_job):
+                text_chunks.append(text_chunk)
+                yield text_chunk
+        self._record_tokens_used(llm_job=llm_job, nb_tokens_estimated=nb_tokens_estimated)
+
+        await self._after_job(llm_job=llm_job, result="".join(text_chunks))
+
+    async def _gen_text_stream(
+        self,
+        llm_job: LLMJob,
+    ) -> AsyncIterator[str]:
+        """Stream the generated text. Override this in workers whose SDK supports streaming:
+        by default, the whole text is generated by _gen_text() and yielded as a single chunk.
+        """
+        yield await self._gen_text(llm_job=llm_job)
+
     async def gen_object(
         self,
         llm_job: LLMJob,
@@ -105,7 +158,10 @@ class LLMWorkerAbstract(InferenceWorkerAbstract, ABC):
         await self._before_job(llm_job=llm_job)
 
         # Execute job
-        result = await self._gen_object(llm_job=llm_job, schema=schema)
+        nb_tokens_estimated = llm_job.estimated_nb_tokens
+        async with self._governed(nb_tokens=nb_tokens_estimated):
+            result = await self._gen_object(llm_job=llm_job, schema=schema)
+        self._record_tokens_used(llm_job=llm_job, nb_tokens_estimated=nb_tokens_estimated)
 
         # Cleanup result
         if hasattr(result, "_raw_response"):
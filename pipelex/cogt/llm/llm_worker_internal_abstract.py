@@ -1,7 +1,10 @@
+import asyncio
+
 from typing_extensions import override
 
 from pipelex import log
 from pipelex.cogt.exceptions import LLMCapabilityError
+from pipelex.cogt.image.prompt_image_cache import prompt_image_cache
 from pipelex.cogt.llm.llm_job import LLMJob
 from pipelex.cogt.llm.llm_utils import dump_prompt, dump_response_from_text_gen
 from pipelex.cogt.llm.llm_worker_abstract import LLMWorkerAbstract
@@ -52,9 +55,24 @@ class LLMWorkerInternalAbstract(LLMWorkerAbstract):
         log.dev(f"✨ {self.desc} ✨")
         await super()._before_job(llm_job=llm_job)
         llm_job.llm_job_before_start(inference_model=self.inference_model)
+        await self._apply_image_policy(llm_job=llm_job)
         if get_config().cogt.llm_config.is_dump_text_prompts_enabled:
             dump_prompt(llm_prompt=llm_job.llm_prompt)
 
+    async def _apply_image_policy(self, llm_job: LLMJob):
+        """Downscale and re-encode the prompt images according to the image policy of the inference model."""
+        image_policy = self.inference_model.image_policy
+        if not llm_job.llm_prompt.user_images or image_policy is None or not image_policy.is_active:
+            return
+        user_images = await asyncio.gather(
+            *[
+                prompt_image_cache.apply_image_policy(prompt_image=prompt_image, image_policy=image_policy)
+                for prompt_image in llm_job.llm_prompt.user_images
+            ]
+        )
+        # the prompt is copied rather than modified, as it may be shared with the caller
+        llm_job.llm_prompt = llm_job.llm_prompt.model_copy(update={"user_images": user_images})
+
     @override
     async def _after_job(
         self,
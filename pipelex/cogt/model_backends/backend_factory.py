@@ -4,6 +4,7 @@ from pydantic import Field
 
 from pipelex.cogt.model_backends.backend import InferenceBackend
 from pipelex.cogt.model_backends.model_spec import InferenceModelSpec
+from pipelex.cogt.model_backends.rate_limits import InferenceRateLimits
 from pipelex.plugins.openai.vertexai_factory import VertexAIFactory
 from pipelex.system.configuration.config_model import ConfigModel
 
@@ -13,6 +14,7 @@ class InferenceBackendBlueprint(ConfigModel):
     endpoint: str | None = None
     api_key: str | None = None
     extra_config: dict[str, Any] = Field(default_factory=dict)
+    rate_limits: InferenceRateLimits | None = None
 
 
 class InferenceBackendFactory:
@@ -171,6 +171,7 @@ class InferenceBackendLibrary(RootModel[InferenceBackendLibraryRoot]):
                         backend_name=backend_name,
                         name=model_spec_name,
                         blueprint=model_spec_blueprint,
+                        backend_rate_limits=backend_blueprint.rate_limits,
                     )
                     backend_model_specs[model_spec_name] = model_spec
                 except (InferenceModelSpecError, ValidationError) as exc:
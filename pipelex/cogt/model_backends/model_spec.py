@@ -2,7 +2,9 @@ from pydantic import Field
 
 from pipelex.cogt.model_backends.model_constraints import ModelConstraints
 from pipelex.cogt.model_backends.model_type import ModelType
+from pipelex.cogt.model_backends.prompt_image_policy import PromptImagePolicy
 from pipelex.cogt.model_backends.prompting_target import PromptingTarget
+from pipelex.cogt.model_backends.rate_limits import InferenceRateLimits
 from pipelex.cogt.usage.cost_category import CostsByCategoryDict
 from pipelex.system.configuration.config_model import ConfigModel
 from pipelex.tools.typing.pydantic_utils import empty_list_factory_of
@@ -21,6 +23,9 @@ class InferenceModelSpec(ConfigModel):
     max_prompt_images: int | None
     prompting_target: PromptingTarget | None = Field(default=None, strict=False)
     constraints: list[ModelConstraints] = Field(default_factory=empty_list_factory_of(ModelConstraints))
+    rate_limits: InferenceRateLimits | None = None
+    backend_rate_limits: InferenceRateLimits | None = None
+    image_policy: PromptImagePolicy | None = None
 
     @property
     def tag(self) -> str:
@@ -3,7 +3,9 @@ from pydantic import BaseModel, Field, field_validator
 from pipelex.cogt.model_backends.model_constraints import ModelConstraints
 from pipelex.cogt.model_backends.model_spec import InferenceModelSpec
 from pipelex.cogt.model_backends.model_type import ModelType
+from pipelex.cogt.model_backends.prompt_image_policy import PromptImagePolicy
 from pipelex.cogt.model_backends.prompting_target import PromptingTarget
+from pipelex.cogt.model_backends.rate_limits import InferenceRateLimits
 from pipelex.cogt.usage.cost_category import CostCategory, CostsByCategoryDict
 from pipelex.system.configuration.config_model import ConfigModel
 from pipelex.tools.typing.pydantic_utils import empty_list_factory_of
@@ -21,6 +23,8 @@ class InferenceModelSpecBlueprint(ConfigModel):
     max_prompt_images: int | None = None
     prompting_target: PromptingTarget | None = Field(default=None, strict=False)
     constraints: list[ModelConstraints] = Field(default_factory=empty_list_factory_of(ModelConstraints))
+    rate_limits: InferenceRateLimits | None = None
+    image_policy: PromptImagePolicy | None = None
 
     @field_validator("costs", mode="before")
     @staticmethod
@@ -46,6 +50,7 @@ class InferenceModelSpecFactory(BaseModel):
         backend_name: str,
         name: str,
         blueprint: InferenceModelSpecBlueprint,
+        backend_rate_limits: InferenceRateLimits | None = None,
     ) -> InferenceModelSpec:
         return InferenceModelSpec(
             backend_name=backend_name,
@@ -60,4 +65,7 @@ class InferenceModelSpecFactory(BaseModel):
             max_prompt_images=blueprint.max_prompt_images,
             prompting_target=blueprint.prompting_target,
             constraints=blueprint.constraints,
+            rate_limits=blueprint.rate_limits,
+            backend_rate_limits=backend_rate_limits,
+            image_policy=blueprint.image_policy,
         )
@@ -0,0 +1,37 @@
+from pydantic import Field
+
+from pipelex.system.configuration.config_model import ConfigModel
+from pipelex.types import StrEnum
+
+
+class PromptImageRecompressFormat(StrEnum):
+    JPEG = "jpeg"
+    WEBP = "webp"
+
+    @property
+    def pil_format(self) -> str:
+        match self:
+            case PromptImageRecompressFormat.JPEG:
+                return "JPEG"
+            case PromptImageRecompressFormat.WEBP:
+                return "WEBP"
+
+
+class PromptImagePolicy(ConfigModel):
+    """How the prompt images are prepared before being sent to one inference model.
+
+    Images larger than the limits are downscaled, keeping their aspect ratio, and images are re-encoded
+    in recompress_format when it's set. Any limit left to None is not enforced. Image URLs are sent as they are,
+    for the providers that fetch them, unless is_applied_to_urls is set.
+    """
+
+    max_edge: int | None = Field(default=None, ge=1)
+    max_megapixels: float | None = Field(default=None, gt=0)
+    max_bytes: int | None = Field(default=None, ge=1)
+    recompress_format: PromptImageRecompressFormat | None = Field(default=None, strict=False)
+    quality: int = Field(default=85, ge=1, le=100)
+    is_applied_to_urls: bool = False
+
+    @property
+    def is_active(self) -> bool:
+        return self.max_edge is not None or self.max_megapixels is not None or self.max_bytes is not None or self.recompress_format is not None
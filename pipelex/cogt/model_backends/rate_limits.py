@@ -0,0 +1,18 @@
+from pydantic import Field
+
+from pipelex.system.configuration.config_model import ConfigModel
+
+
+class InferenceRateLimits(ConfigModel):
+    """Limits applied to the requests sent to one inference model of a backend.
+
+    Any limit left to None is not enforced.
+    """
+
+    max_in_flight: int | None = Field(default=None, ge=1)
+    requests_per_minute: int | None = Field(default=None, ge=1)
+    tokens_per_minute: int | None = Field(default=None, ge=1)
+
+    @property
+    def is_limited(self) -> bool:
+        return self.max_in_flight is not None or self.requests_per_minute is not None or self.tokens_per_minute is not None
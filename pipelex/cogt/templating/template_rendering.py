@@ -3,7 +3,8 @@ from typing import Any
 from pipelex.cogt.templating.template_category import TemplateCategory
 from pipelex.cogt.templating.template_preprocessor import preprocess_template
 from pipelex.cogt.templating.templating_style import TemplatingStyle
-from pipelex.tools.jinja2.jinja2_rendering import render_jinja2
+from pipelex.tools.jinja2.jinja2_rendering import get_compiled_jinja2_template, render_jinja2
+from pipelex.tools.jinja2.jinja2_template_cache import jinja2_template_cache
 
 
 async def render_template(
@@ -19,3 +20,15 @@ async def render_template(
         temlating_context=context,
         templating_style=templating_style,
     )
+
+
+def precompile_template(template: str, category: TemplateCategory) -> None:
+    """Compile the template into the template cache ahead of its first rendering."""
+    template_source = preprocess_template(template)
+    get_compiled_jinja2_template(template_source=template_source, template_category=category)
+
+
+def get_template_required_variables(template: str, category: TemplateCategory) -> frozenset[str]:
+    """Get the variables required by the template as it is rendered, from the template cache."""
+    template_source = preprocess_template(template)
+    return jinja2_template_cache.get_required_variables(template_source=template_source, template_category=category)
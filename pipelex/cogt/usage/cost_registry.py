@@ -161,6 +161,32 @@ class CostRegistry(RootModel[CostRegistryRoot]):
         if cost_report_file_path:
             cls.save_to_csv(records, cost_report_file_path)
 
+    @classmethod
+    def log_savings(
+        cls,
+        pipeline_run_id: str,
+        saved_llm_tokens_usages: list[LLMTokensUsage],
+        unit_scale: float,
+    ):
+        """Log what the LLM calls served by the response cache would have cost."""
+        if not saved_llm_tokens_usages:
+            return
+        total_saved_cost = 0.0
+        total_saved_nb_tokens = 0
+        for llm_tokens_usage in saved_llm_tokens_usages:
+            cost_report = cls.complete_cost_report(llm_tokens_usage=llm_tokens_usage)
+            total_saved_cost += cls.compute_total_cost(
+                input_non_cached_cost=cost_report.costs_by_token_category.get(CostCategory.INPUT_NON_CACHED, 0),
+                input_cached_cost=cost_report.costs_by_token_category.get(CostCategory.INPUT_CACHED, 0),
+                output_cost=cost_report.costs_by_token_category.get(CostCategory.OUTPUT, 0),
+            )
+            total_saved_nb_tokens += llm_tokens_usage.nb_tokens_total
+        scale_str = "" if unit_scale == 1 else str(unit_scale)
+        log.info(
+            f"LLM response cache saved {len(saved_llm_tokens_usages)} LLM calls for pipeline '{pipeline_run_id}': "
+            f"{total_saved_nb_tokens:,} tokens, {total_saved_cost / unit_scale:.4f} {scale_str}$"
+        )
+
     @staticmethod
     def save_to_csv(records: list[dict[str, Any]], file_path: str) -> None:
         """Save records to CSV file."""
@@ -7,14 +7,19 @@ from pipelex.base_exceptions import PipelexConfigError
 from pipelex.cogt.config_cogt import Cogt
 from pipelex.cogt.model_backends.prompting_target import PromptingTarget
 from pipelex.cogt.templating.templating_style import TemplatingStyle
+from pipelex.core.concepts.structure_code_cache import StructureCodeCacheConfig
 from pipelex.core.pipes.exceptions import StaticValidationErrorType
 from pipelex.hub import get_required_config
 from pipelex.language.plx_config import PlxConfig
+from pipelex.libraries.library_loading_mode import LibraryLoadingMode
+from pipelex.pipe_run.output_verbosity import OutputVerbosity
 from pipelex.pipeline.track.tracker_config import TrackerConfig
 from pipelex.system.configuration.config_model import ConfigModel
 from pipelex.system.configuration.config_root import ConfigRoot
 from pipelex.tools.aws.aws_config import AwsConfig
 from pipelex.tools.log.log_config import LogConfig
+from pipelex.tools.misc.http_client_manager import HttpClientConfig
+from pipelex.tools.pdf.pypdfium2_renderer import PdfRenderConfig
 from pipelex.types import StrEnum
 
 
@@ -61,6 +66,21 @@ class StaticValidationConfig(ConfigModel):
 
 class PipeRunConfig(ConfigModel):
     pipe_stack_limit: int
+    default_batch_max_concurrency: int = Field(ge=1)
+    default_output_verbosity: OutputVerbosity = Field(strict=False)
+
+
+class CompiledBundleCacheConfig(ConfigModel):
+    is_enabled: bool
+    max_size: int = Field(ge=1)
+
+
+class DryRunCacheConfig(ConfigModel):
+    is_enabled: bool
+    max_memory_entries: int = Field(ge=1)
+    is_disk_cache_enabled: bool
+    disk_cache_dir_path: str
+    max_disk_entries: int = Field(ge=1)
 
 
 class DryRunConfig(ConfigModel):
@@ -69,6 +89,8 @@ class DryRunConfig(ConfigModel):
     nb_list_items: int
     nb_extract_pages: int
     image_urls: list[str]
+    max_concurrency: int = Field(ge=1)
+    cache_config: DryRunCacheConfig
     allowed_to_fail_pipes: list[str] = Field(default_factory=list)
 
     @field_validator("image_urls", mode="before")
@@ -80,8 +102,14 @@ class DryRunConfig(ConfigModel):
         return value
 
 
+class TemplatingConfig(ConfigModel):
+    template_cache_max_size: int = Field(ge=1)
+    is_precompile_at_library_load_enabled: bool
+
+
 class StructureConfig(ConfigModel):
     is_default_text_then_structure: bool
+    code_cache_config: StructureCodeCacheConfig
 
 
 class PromptingConfig(ConfigModel):
@@ -123,6 +151,23 @@ class ScanConfig(ConfigModel):
         return frozenset(value)
 
 
+class LibraryIndexConfig(ConfigModel):
+    is_enabled: bool
+    index_file_path: str
+
+
+class LibraryScanEngine(StrEnum):
+    THREAD = "thread"
+    PROCESS_POOL = "process_pool"
+
+
+class LibraryLoadConfig(ConfigModel):
+    loading_mode: LibraryLoadingMode = Field(strict=False)
+    scan_engine: LibraryScanEngine = Field(strict=False)
+    max_scan_workers: int = Field(ge=0)
+    min_files_per_scan_worker: int = Field(ge=1)
+
+
 class BuilderConfig(ConfigModel):
     default_output_dir: str
     default_bundle_file_name: str
@@ -138,13 +183,19 @@ class Pipelex(ConfigModel):
     tracker_config: TrackerConfig
     structure_config: StructureConfig
     prompting_config: PromptingConfig
+    templating_config: TemplatingConfig
+    http_client_config: HttpClientConfig
+    pdf_render_config: PdfRenderConfig
     plx_config: PlxConfig
 
     dry_run_config: DryRunConfig
     pipe_run_config: PipeRunConfig
+    compiled_bundle_cache_config: CompiledBundleCacheConfig
     reporting_config: ReportingConfig
     observer_config: ObserverConfig
     scan_config: ScanConfig
+    library_index_config: LibraryIndexConfig
+    library_load_config: LibraryLoadConfig
     builder_config: BuilderConfig
 
 
@@ -1,6 +1,6 @@
 from typing import Any
 
-from pydantic import Field, RootModel
+from pydantic import Field, PrivateAttr, RootModel
 from typing_extensions import override
 
 from pipelex.core.concepts.concept import Concept
@@ -13,6 +13,7 @@ from pipelex.core.domains.domain import SpecialDomain
 from pipelex.core.stuffs.image_content import ImageContent
 from pipelex.hub import get_class_registry
 from pipelex.libraries.exceptions import ConceptLibraryError
+from pipelex.libraries.lazy_library_loader_protocol import LazyLibraryLoaderProtocol
 from pipelex.types import Self
 
 ConceptLibraryRoot = dict[str, Concept]
@@ -20,6 +21,7 @@ ConceptLibraryRoot = dict[str, Concept]
 
 class ConceptLibrary(RootModel[ConceptLibraryRoot], ConceptLibraryAbstract):
     root: ConceptLibraryRoot = Field(default_factory=dict)
+    _lazy_loader: LazyLibraryLoaderProtocol | None = PrivateAttr(default=None)
 
     def validate_with_libraries(self):
         """Validates that the each refine concept code in the refines array of each concept in the library exists in the library"""
@@ -28,6 +30,10 @@ class ConceptLibrary(RootModel[ConceptLibraryRoot], ConceptLibraryAbstract):
                 msg = f"Concept '{concept.code}' refines '{concept.refines}' but no concept with the code '{concept.refines}' exists"
                 raise ConceptLibraryError(msg)
 
+    def set_lazy_loader(self, lazy_loader: LazyLibraryLoaderProtocol | None):
+        """Set the loader making the concepts missing from the library on demand, in lazy loading mode."""
+        self._lazy_loader = lazy_loader
+
     @override
     def setup(self):
         all_native_concepts = ConceptFactory.make_all_native_concepts()
@@ -48,15 +54,21 @@ class ConceptLibrary(RootModel[ConceptLibraryRoot], ConceptLibraryAbstract):
 
     @override
     def list_concepts(self) -> list[Concept]:
+        if self._lazy_loader:
+            self._lazy_loader.load_all_pending()
         return list(self.root.values())
 
     @override
     def list_concepts_by_domain(self, domain: str) -> list[Concept]:
+        if self._lazy_loader:
+            self._lazy_loader.load_all_pending()
         return [concept for key, concept in self.root.items() if key.startswith(f"{domain}.")]
 
     @override
     def add_new_concept(self, concept: Concept):
-        if concept.concept_string in self.root:
+        if concept.concept_string in self.root or (
+            self._lazy_loader and self._lazy_loader.has_pending_concept(concept_string=concept.concept_string)
+        ):
             msg = f"Concept '{concept.concept_string}' already exists in the library"
             raise ConceptLibraryError(msg)
         self.root[concept.concept_string] = concept
@@ -77,7 +89,10 @@ class ConceptLibrary(RootModel[ConceptLibraryRoot], ConceptLibraryAbstract):
         return Concept.are_concept_compatible(concept_1=tested_concept, concept_2=wanted_concept, strict=strict)
 
     def get_optional_concept(self, concept_string: str) -> Concept | None:
-        return self.root.get(concept_string)
+        the_concept = self.root.get(concept_string)
+        if the_concept is None and self._lazy_loader and self._lazy_loader.load_pending_concept(concept_string=concept_string):
+            the_concept = self.root.get(concept_string)
+        return the_concept
 
     @override
     def get_required_concept(self, concept_string: str) -> Concept:
@@ -135,6 +150,8 @@ class ConceptLibrary(RootModel[ConceptLibraryRoot], ConceptLibraryAbstract):
         else:
             found_concepts: list[Concept] = []
             if search_domains is None:
+                if self._lazy_loader:
+                    self._lazy_loader.load_pending_concepts_with_code(concept_code=concept_string_or_code)
                 for concept in self.root.values():
                     if concept_string_or_code == concept.code:
                         found_concepts.append(concept)
@@ -0,0 +1,145 @@
+import hashlib
+import json
+import marshal
+import sys
+import threading
+from collections import OrderedDict
+from pathlib import Path
+from types import CodeType
+
+from pydantic import BaseModel, Field
+
+from pipelex import log
+from pipelex.core.concepts.concept_structure_blueprint import ConceptStructureBlueprint
+from pipelex.system.configuration.config_model import ConfigModel
+from pipelex.tools.misc.file_utils import save_bytes_atomically
+
+StructureCode = tuple[str, CodeType]
+
+
+class StructureCodeCacheConfig(ConfigModel):
+    is_enabled: bool
+    max_memory_entries: int = Field(ge=1)
+    is_disk_cache_enabled: bool
+    disk_cache_dir_path: str
+
+
+class StructureCodeCacheStats(BaseModel):
+    hits: int
+    disk_hits: int
+    misses: int
+    size: int
+
+    @property
+    def desc(self) -> str:
+        return f"{self.hits} hits ({self.disk_hits} from disk), {self.misses} misses, {self.size} structures in memory"
+
+
+class StructureCodeCache:
+    """Content-addressed cache of the python code generated for the concept structures.
+
+    Entries hold the generated source and its compiled code object, keyed by the hash of the pipelex version,
+    the python bytecode version, the class name and the structure blueprint, so unchanged structures are neither
+    generated nor compiled again, within a process and optionally across runs with the on-disk layer.
+    The code is still executed to create the class each time.
+    """
+
+    def __init__(self):
+        self._config: StructureCodeCacheConfig | None = None
+        self._package_version = ""
+        self._structure_codes: OrderedDict[str, StructureCode] = OrderedDict()
+        self._lock = threading.Lock()
+        self._hits = 0
+        self._disk_hits = 0
+        self._misses = 0
+
+    def setup(self, config: StructureCodeCacheConfig, package_version: str):
+        self._config = config
+        self._package_version = package_version
+
+    def teardown(self):
+        if self._hits or self._misses:
+            log.verbose(f"Structure code cache: {self.stats.desc}")
+        with self._lock:
+            self._structure_codes.clear()
+            self._hits = 0
+            self._disk_hits = 0
+            self._misses = 0
+        self._config = None
+
+    @property
+    def stats(self) -> StructureCodeCacheStats:
+        return StructureCodeCacheStats(hits=self._hits, disk_hits=self._disk_hits, misses=self._misses, size=len(self._structure_codes))
+
+    def make_key(self, class_name: str, structure_blueprint: dict[str, ConceptStructureBlueprint]) -> str:
+        # the fields are hashed in order, as it is the order of the fields of the generated class
+        fields = [[field_name, field_blueprint.model_dump(mode="json")] for field_name, field_blueprint in structure_blueprint.items()]
+        key_source = json.dumps([self._package_version, sys.implementation.cache_tag, class_name, fields])
+        return hashlib.sha256(key_source.encode()).hexdigest()
+
+    def get(self, cache_key: str) -> StructureCode | None:
+        """Get the generated source and compiled code of a structure, from memory or from disk."""
+        if self._config is None or not self._config.is_enabled:
+            return None
+        with self._lock:
+            structure_code = self._structure_codes.get(cache_key)
+            if structure_code is not None:
+                self._structure_codes.move_to_end(cache_key)
+                self._hits += 1
+                return structure_code
+
+        if self._config.is_disk_cache_enabled and (structure_code := self._read_disk_entry(cache_key=cache_key)):
+            with self._lock:
+                self._hits += 1
+                self._disk_hits += 1
+                self._set_memory_entry(cache_key=cache_key, structure_code=structure_code)
+            return structure_code
+
+        with self._lock:
+            self._misses += 1
+        return None
+
+    def set(self, cache_key: str, generated_code: str, compiled_code: CodeType):
+        """Keep the generated source and compiled code of a structure whose class was successfully created."""
+        if self._config is None or not self._config.is_enabled:
+            return
+        structure_code: StructureCode = (generated_code, compiled_code)
+        with self._lock:
+            self._set_memory_entry(cache_key=cache_key, structure_code=structure_code)
+        if self._config.is_disk_cache_enabled:
+            self._write_disk_entry(cache_key=cache_key, structure_code=structure_code)
+
+    def _set_memory_entry(self, cache_key: str, structure_code: StructureCode):
+        assert self._config is not None
+        self._structure_codes[cache_key] = structure_code
+        self._structure_codes.move_to_end(cache_key)
+        while len(self._structure_codes) > self._config.max_memory_entries:
+            self._structure_codes.popitem(last=False)
+
+    def _entry_path(self, cache_key: str) -> Path:
+        assert self._config is not None
+        return Path(self._config.disk_cache_dir_path) / f"{cache_key}.marshal"
+
+    def _read_disk_entry(self, cache_key: str) -> StructureCode | None:
+        try:
+            # the cache is written by pipelex in the project directory, like the .pyc files of __pycache__
+            structure_code = marshal.loads(self._entry_path(cache_key=cache_key).read_bytes())  # noqa: S302
+        except FileNotFoundError:
+            return None
+        except (OSError, EOFError, ValueError, TypeError) as exc:
+            log.verbose(f"Could not read the structure code cache entry '{cache_key}': {exc}")
+            return None
+        match structure_code:
+            case (str() as generated_code, CodeType() as compiled_code):
+                return generated_code, compiled_code
+            case _:
+                return None
+
+    def _write_disk_entry(self, cache_key: str, structure_code: StructureCode):
+        try:
+            save_bytes_atomically(self._entry_path(cache_key=cache_key), marshal.dumps(structure_code))
+        except OSError as exc:
+            log.verbose(f"Could not write the structure code cache entry '{cache_key}': {exc}")
+
+
+structure_code_cache = StructureCodeCache()
@@ -1,12 +1,14 @@
 import ast
 from datetime import datetime
 from enum import Enum
+from types import CodeType
 from typing import Any, Literal, Optional
 
 from pydantic import Field
 
 from pipelex.core.concepts.concept_structure_blueprint import ConceptStructureBlueprint, ConceptStructureBlueprintFieldType
 from pipelex.core.concepts.exceptions import ConceptStructureGeneratorError, ConceptStructureValidationError, SyntaxErrorData
+from pipelex.core.concepts.structure_code_cache import structure_code_cache
 from pipelex.core.stuffs.structured_content import StructuredContent
 
 
@@ -26,6 +28,9 @@ class StructureGenerator:
     def generate_from_structure_blueprint(self, class_name: str, structure_blueprint: dict[str, ConceptStructureBlueprint]) -> tuple[str, type]:
         """Generate Python module content from structure blueprint.
 
+        The generated source and its compiled code are taken from the structure code cache when the same
+        structure was already generated, so only the class creation runs again.
+
         Args:
             class_name: Name of the class to generate
             structure_blueprint: Dictionary mapping field names to their ConceptStructureBlueprint definitions
@@ -37,19 +42,25 @@ class StructureGenerator:
             ConceptStructureGeneratorError: If the generated code is not syntactically correct or does not inherit from the required base class
 
         """
-        # Generate the class
-        class_code = self._generate_class_source_code_from_blueprint(class_name, structure_blueprint)
+        cache_key = structure_code_cache.make_key(class_name=class_name, structure_blueprint=structure_blueprint)
+        compiled_code: CodeType | None = None
+        if cached_structure_code := structure_code_cache.get(cache_key=cache_key):
+            generated_code, compiled_code = cached_structure_code
+        else:
+            # Generate the class
+            class_code = self._generate_class_source_code_from_blueprint(class_name, structure_blueprint)
 
-        # Generate the complete module
-        imports_section = "\n".join(sorted(self.imports))
+            # Generate the complete module
+            imports_section = "\n".join(sorted(self.imports))
 
-        generated_code = f"{imports_section}\n\n\n{class_code}\n"
+            generated_code = f"{imports_section}\n\n\n{class_code}\n"
 
         # Validate the generated code
+        is_cached = compiled_code is not None
         try:
-            the_class = self.validate_generated_code(
-                python_code=generated_code, expected_class_name=class_name, required_base_class=StructuredContent
-            )
+            if compiled_code is None:
+                compiled_code = self._compile_generated_code(python_code=generated_code)
+            the_class = self._validate_execution(python_code=compiled_code, expected_class_name=class_name, required_base_class=StructuredContent)
         except SyntaxError as syntax_error:
             msg = f"Error validating generated code: {syntax_error}"
             syntax_error_data = SyntaxErrorData.from_syntax_error(syntax_error)
@@ -60,6 +71,8 @@ class StructureGenerator:
             msg = f"Error validating generated code: {exc}\nGenerated code:\n```python\n{generated_code}\n```"
             raise ConceptStructureGeneratorError(msg, structure_class_python_code=generated_code) from exc
 
+        if not is_cached:
+            structure_code_cache.set(cache_key=cache_key, generated_code=generated_code, compiled_code=compiled_code)
         return generated_code, the_class
 
     def validate_generated_code(self, python_code: str, expected_class_name: str, required_base_class: type) -> type:
@@ -71,12 +84,8 @@ class StructureGenerator:
             required_base_class: The base class that the generated class should inherit from
 
         """
-        ast.parse(python_code)
-
-        compile(python_code, "<generated>", "exec")
-
         return self._validate_execution(
-            python_code=python_code,
+            python_code=self._compile_generated_code(python_code=python_code),
             expected_class_name=expected_class_name,
             required_base_class=required_base_class,
         )
@@ -85,6 +94,10 @@ class StructureGenerator:
     # Private methods
     ############################################################
 
+    def _compile_generated_code(self, python_code: str) -> CodeType:
+        ast.parse(python_code)
+        return compile(python_code, "<generated>", "exec")
+
     def _escape_string_for_python(self, value: str) -> str:
         """Escape a string value for safe inclusion in generated Python code.
 
@@ -366,7 +379,7 @@ class StructureGenerator:
                 # Unknown FieldType, assume it's a custom type
                 return str(field_type)
 
-    def _validate_execution(self, python_code: str, expected_class_name: str, required_base_class: type) -> type:
+    def _validate_execution(self, python_code: str | CodeType, expected_class_name: str, required_base_class: type) -> type:
         """Validate that the code executes and creates the expected class."""
         # Import necessary modules for the execution context
         from typing import Any  # noqa: PLC0415
@@ -22,7 +22,7 @@ from pipelex.core.stuffs.stuff_artefact import StuffArtefact
 from pipelex.core.stuffs.stuff_content import StuffContentType
 from pipelex.core.stuffs.text_and_images_content import TextAndImagesContent
 from pipelex.core.stuffs.text_content import TextContent
-from pipelex.tools.misc.context_provider_abstract import ContextProviderAbstract
+from pipelex.tools.misc.context_provider_abstract import ContextProviderAbstract, LazyContext
 from pipelex.types import Self
 
 MAIN_STUFF_NAME = "main_stuff"
@@ -68,6 +68,15 @@ class WorkingMemory(BaseModel, ContextProviderAbstract):
     def make_deep_copy(self) -> Self:
         return self.model_copy(deep=True)
 
+    def make_branch_copy(self) -> Self:
+        """Make a copy-on-write copy of the working memory, for use by a branch of a controller.
+
+        The stuffs are shared with this working memory, only the name and alias mappings are copied,
+        so the cost does not depend on the size of the stuffs' contents. Stuffs set or removed in the
+        branch are not seen by this working memory. Shared stuffs must not be mutated in place.
+        """
+        return self.model_copy(update={"root": dict(self.root), "aliases": dict(self.aliases)})
+
     def get_optional_stuff(self, name: str) -> Stuff | None:
         if named_stuff := self.root.get(name):
             return named_stuff
@@ -205,6 +214,13 @@ class WorkingMemory(BaseModel, ContextProviderAbstract):
             artefact_dict[alias] = artefact_dict[target]
         return artefact_dict
 
+    @override
+    def make_lazy_context(self) -> LazyContext:
+        return LazyContext(
+            value_makers={name: stuff.make_artefact for name, stuff in self.root.items()},
+            aliases=dict(self.aliases),
+        )
+
     @override
     def get_typed_object_or_attribute(self, name: str, wanted_type: type[Any] | None = None, accept_list: bool = False) -> Any:
         # TODO: Refactor this method. In the python paradigm, we should not have those ".", but arrays with field names.
@@ -90,6 +90,13 @@ class PipeAbstract(ABC, BaseModel):
         """
         return set()
 
+    def precompile_templates(self) -> None:
+        """Compile the templates of the pipe into the template cache, ahead of its first run.
+        - PipeCompose: The template
+        - PipeCondition: The expression
+        - PipeLLM: The prompt and system prompt
+        """
+
     def concept_dependencies(self) -> list[Concept]:
         required_concepts: list[Concept] = [self.output]
         required_concepts.extend(self.inputs.concepts)
@@ -1,6 +1,6 @@
 from itertools import groupby
 
-from pydantic import RootModel
+from pydantic import PrivateAttr, RootModel
 from rich import box
 from rich.table import Table
 from typing_extensions import override
@@ -11,12 +11,15 @@ from pipelex.core.pipes.pipe_abstract import PipeAbstract
 from pipelex.core.pipes.pipe_library_abstract import PipeLibraryAbstract
 from pipelex.hub import get_concept_library
 from pipelex.libraries.exceptions import PipeLibraryError, PipeLibraryPipeNotFoundError
+from pipelex.libraries.lazy_library_loader_protocol import LazyLibraryLoaderProtocol
 from pipelex.types import Self
 
 PipeLibraryRoot = dict[str, PipeAbstract]
 
 
 class PipeLibrary(RootModel[PipeLibraryRoot], PipeLibraryAbstract):
+    _lazy_loader: LazyLibraryLoaderProtocol | None = PrivateAttr(default=None)
+
     @override
     def validate_with_libraries(self):
         concept_library = get_concept_library()
@@ -36,13 +39,17 @@ class PipeLibrary(RootModel[PipeLibraryRoot], PipeLibraryAbstract):
                 msg = f"Missing dependency for pipe '{pipe.code}': {not_found_error}"
                 raise PipeLibraryError(msg) from not_found_error
 
+    def set_lazy_loader(self, lazy_loader: LazyLibraryLoaderProtocol | None):
+        """Set the loader making the pipes missing from the library on demand, in lazy loading mode."""
+        self._lazy_loader = lazy_loader
+
     @classmethod
     def make_empty(cls) -> Self:
         return cls(root={})
 
     @override
     def add_new_pipe(self, pipe: PipeAbstract):
-        if pipe.code in self.root:
+        if pipe.code in self.root or (self._lazy_loader and self._lazy_loader.has_pending_pipe(pipe_code=pipe.code)):
             msg = (
                 f"Pipe '{pipe.code}' already exists in the library. You might be running the same pipe twice in the same pipeline."
                 "We do not yet handle this case, so please avoid running the same pipe twice in the same pipeline"
@@ -58,7 +65,10 @@ class PipeLibrary(RootModel[PipeLibraryRoot], PipeLibraryAbstract):
 
     @override
     def get_optional_pipe(self, pipe_code: str) -> PipeAbstract | None:
-        return self.root.get(pipe_code)
+        the_pipe = self.root.get(pipe_code)
+        if the_pipe is None and self._lazy_loader and self._lazy_loader.load_pending_pipe(pipe_code=pipe_code):
+            the_pipe = self.root.get(pipe_code)
+        return the_pipe
 
     @override
     def get_required_pipe(self, pipe_code: str) -> PipeAbstract:
@@ -70,10 +80,14 @@ class PipeLibrary(RootModel[PipeLibraryRoot], PipeLibraryAbstract):
 
     @override
     def get_pipes(self) -> list[PipeAbstract]:
+        if self._lazy_loader:
+            self._lazy_loader.load_all_pending()
         return list(self.root.values())
 
     @override
     def get_pipes_dict(self) -> dict[str, PipeAbstract]:
+        if self._lazy_loader:
+            self._lazy_loader.load_all_pending()
         return self.root
 
     @override
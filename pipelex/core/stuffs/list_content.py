@@ -1,4 +1,4 @@
-from typing import Any, Generic
+from typing import Any, Generic, cast
 
 from json2html import json2html
 from rich.pretty import Pretty
@@ -50,8 +50,27 @@ class ListContent(StuffContent, Generic[StuffContentType]):
 
     @override
     def model_dump(self, *args: Any, **kwargs: Any):
-        obj_dict = super().model_dump(*args, **kwargs)
-        obj_dict["items"] = [item.model_dump(*args, **kwargs) for item in self.items]
+        # the items are dumped with their actual class below, so they are excluded from the base dump
+        # and the part of the exclusions which targets them is applied to each item
+        excluded_fields: Any = kwargs.pop("exclude", None)
+        items_exclude: Any = None
+        if isinstance(excluded_fields, dict):
+            excluded_fields = cast("dict[Any, Any]", excluded_fields)
+            items_exclude = excluded_fields.get("items")
+            excluded_fields = {**excluded_fields, "items": True}
+        else:
+            excluded_fields = cast("set[Any]", excluded_fields or set())
+            if "items" in excluded_fields:
+                items_exclude = True
+            excluded_fields = {*excluded_fields, "items"}
+        obj_dict = super().model_dump(*args, exclude=excluded_fields, **kwargs)
+        if items_exclude is True:
+            return obj_dict
+        obj_dict["items"] = [
+            item.model_dump(*args, exclude=item_exclude, **kwargs)
+            for item_index, item in enumerate(self.items)
+            if (item_exclude := _get_item_exclude(items_exclude=items_exclude, item_index=item_index)) is not True
+        ]
         return obj_dict
 
     @override
@@ -106,3 +125,35 @@ class ListContent(StuffContent, Generic[StuffContentType]):
             table.add_row(item_number, item_content)
 
         return table
+
+
+def _get_item_exclude(items_exclude: Any, item_index: int) -> Any:
+    """Get the exclusions of the item at item_index from those of the items, as pydantic applies them to a list.
+
+    Returns:
+        True if the whole item is excluded, otherwise the exclusions of its fields, if any
+
+    """
+    if not items_exclude:
+        return None
+    if not isinstance(items_exclude, dict):
+        # a set of indices of the excluded items
+        return True if item_index in cast("set[int]", items_exclude) else None
+    items_exclude = cast("dict[Any, Any]", items_exclude)
+    return _merge_excludes(items_exclude.get("__all__"), items_exclude.get(item_index))
+
+
+def _merge_excludes(exclude: Any, other_exclude: Any) -> Any:
+    if exclude is None or other_exclude is None:
+        return other_exclude if exclude is None else exclude
+    if exclude is True or other_exclude is True:
+        return True
+    exclude_dict = _exclude_as_dict(exclude)
+    other_exclude_dict = _exclude_as_dict(other_exclude)
+    return {key: _merge_excludes(exclude_dict.get(key), other_exclude_dict.get(key)) for key in {*exclude_dict, *other_exclude_dict}}
+
+
+def _exclude_as_dict(exclude: Any) -> dict[Any, Any]:
+    if isinstance(exclude, dict):
+        return cast("dict[Any, Any]", exclude)
+    return dict.fromkeys(cast("set[Any]", exclude), True)
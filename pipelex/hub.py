@@ -30,6 +30,7 @@ from pipelex.reporting.reporting_protocol import ReportingProtocol
 from pipelex.system.configuration.config_loader import config_manager
 from pipelex.system.configuration.config_root import ConfigRoot
 from pipelex.system.telemetry.telemetry_manager import TelemetryManagerAbstract
+from pipelex.tools.misc.http_client_manager import HttpClientManager
 from pipelex.tools.secrets.secrets_provider_abstract import SecretsProviderAbstract
 from pipelex.tools.storage.storage_provider_abstract import StorageProviderAbstract
 
@@ -49,6 +50,7 @@ class PipelexHub:
         self._class_registry: ClassRegistryAbstract | None = None
         self._storage_provider: StorageProviderAbstract | None = None
         self._telemetry_manager: TelemetryManagerAbstract | None = None
+        self._http_client_manager: HttpClientManager | None = None
 
         # cogt
         self._models_manager: ModelManagerAbstract | None = None
@@ -80,6 +82,10 @@ class PipelexHub:
             raise RuntimeError(msg)
         return cls._instance
 
+    @classmethod
+    def get_optional_instance(cls) -> "PipelexHub | None":
+        return cls._instance
+
     @classmethod
     def set_instance(cls, pipelex_hub: "PipelexHub") -> None:
         cls._instance = pipelex_hub
@@ -122,6 +128,9 @@ class PipelexHub:
     def set_telemetry_manager(self, telemetry_manager: TelemetryManagerAbstract):
         self._telemetry_manager = telemetry_manager
 
+    def set_http_client_manager(self, http_client_manager: HttpClientManager | None):
+        self._http_client_manager = http_client_manager
+
     # cogt
 
     def set_models_manager(self, models_manager: ModelManagerAbstract):
@@ -212,6 +221,15 @@ class PipelexHub:
             raise RuntimeError(msg)
         return self._telemetry_manager
 
+    def get_http_client_manager(self) -> HttpClientManager:
+        if self._http_client_manager is None:
+            msg = "HttpClientManager is not initialized"
+            raise RuntimeError(msg)
+        return self._http_client_manager
+
+    def get_optional_http_client_manager(self) -> HttpClientManager | None:
+        return self._http_client_manager
+
     # cogt
 
     def get_required_models_manager(self) -> ModelManagerAbstract:
@@ -321,6 +339,17 @@ def get_class_registry() -> ClassRegistryAbstract:
     return get_pipelex_hub().get_required_class_registry()
 
 
+def get_http_client_manager() -> HttpClientManager:
+    return get_pipelex_hub().get_http_client_manager()
+
+
+def get_optional_http_client_manager() -> HttpClientManager | None:
+    """Get the HTTP client manager of the Pipelex hub, or None outside of a Pipelex setup."""
+    if pipelex_hub := PipelexHub.get_optional_instance():
+        return pipelex_hub.get_optional_http_client_manager()
+    return None
+
+
 def get_telemetry_manager() -> TelemetryManagerAbstract:
     return get_pipelex_hub().get_telemetry_manager()
 
@@ -0,0 +1,157 @@
+from pydantic import ValidationError
+
+from pipelex import log
+from pipelex.config import get_config
+from pipelex.core.bundles.pipelex_bundle_blueprint import PipelexBundleBlueprint
+from pipelex.core.concepts.concept_factory import ConceptFactory
+from pipelex.core.concepts.concept_library import ConceptLibrary
+from pipelex.core.concepts.exceptions import ConceptDefinitionError
+from pipelex.core.pipe_errors import PipeDefinitionError
+from pipelex.core.pipes.pipe_factory import PipeFactory
+from pipelex.core.pipes.pipe_library import PipeLibrary
+from pipelex.libraries.exceptions import ConceptLibraryError, PipeLibraryError
+from pipelex.libraries.library_loading_errors import make_concepts_loading_error, make_pipes_loading_error
+
+
+class LazyLibraryLoader:
+    """Index of the concepts and pipes of the loaded bundles, which are only made when first requested.
+
+    The concept and pipe libraries call the loader when they miss a concept or a pipe. Making a pipe also makes
+    the pipes it depends on, so requesting a pipe materializes the transitive closure it needs to run.
+    Listing the libraries materializes everything that is still pending.
+    """
+
+    def __init__(self, concept_library: ConceptLibrary, pipe_library: PipeLibrary):
+        self.concept_library = concept_library
+        self.pipe_library = pipe_library
+        # concept string -> (bundle blueprint, concept code)
+        self.pending_concepts: dict[str, tuple[PipelexBundleBlueprint, str]] = {}
+        # pipe code -> bundle blueprint
+        self.pending_pipes: dict[str, PipelexBundleBlueprint] = {}
+        self.nb_concepts_loaded = 0
+        self.nb_pipes_loaded = 0
+
+    def add_blueprints(self, blueprints: list[PipelexBundleBlueprint]):
+        """Index the concepts and pipes of the blueprints, whose domains must already be loaded.
+
+        Raises:
+            ConceptLibraryError: If a concept already exists in the library or in an other bundle
+            PipeLibraryError: If a pipe already exists in the library or in an other bundle
+
+        """
+        for blueprint in blueprints:
+            for concept_code in blueprint.concept or {}:
+                concept_string = ConceptFactory.make_concept_string_with_domain(domain=blueprint.domain, concept_code=concept_code)
+                if concept_string in self.pending_concepts or self.concept_library.get_optional_concept(concept_string=concept_string):
+                    msg = f"Concept '{concept_string}' already exists in the library"
+                    raise ConceptLibraryError(msg)
+                self.pending_concepts[concept_string] = (blueprint, concept_code)
+        for blueprint in blueprints:
+            for pipe_code in blueprint.pipe or {}:
+                if pipe_code in self.pending_pipes or pipe_code in self.pipe_library.root:
+                    msg = (
+                        f"Pipe '{pipe_code}' already exists in the library. You might be running the same pipe twice in the same pipeline."
+                        "We do not yet handle this case, so please avoid running the same pipe twice in the same pipeline"
+                        "Or consider adding for good in the library and call it by its code."
+                    )
+                    raise PipeLibraryError(msg)
+                self.pending_pipes[pipe_code] = blueprint
+        log.verbose(f"Indexed {len(self.pending_concepts)} concepts and {len(self.pending_pipes)} pipes to be loaded on demand")
+
+    def remove_blueprint(self, blueprint: PipelexBundleBlueprint):
+        """Forget the concepts and pipes of the blueprint which were not loaded yet."""
+        for concept_code in blueprint.concept or {}:
+            concept_string = ConceptFactory.make_concept_string_with_domain(domain=blueprint.domain, concept_code=concept_code)
+            self.pending_concepts.pop(concept_string, None)
+        for pipe_code in blueprint.pipe or {}:
+            self.pending_pipes.pop(pipe_code, None)
+
+    def clear(self):
+        self.pending_concepts.clear()
+        self.pending_pipes.clear()
+
+    def has_pending_pipe(self, pipe_code: str) -> bool:
+        return pipe_code in self.pending_pipes
+
+    def has_pending_concept(self, concept_string: str) -> bool:
+        return concept_string in self.pending_concepts
+
+    def load_pending_concept(self, concept_string: str) -> bool:
+        """Make the pending concept and add it to the concept library.
+
+        Returns:
+            Whether the concept was pending
+
+        Raises:
+            LibraryLoadingError: If the concept's blueprint is invalid
+
+        """
+        # popped first, so that a failed concept is not made again
+        pending_concept = self.pending_concepts.pop(concept_string, None)
+        if pending_concept is None:
+            return False
+        blueprint, concept_code = pending_concept
+        assert blueprint.concept is not None
+        try:
+            concept = ConceptFactory.make_from_blueprint_or_description(
+                domain=blueprint.domain,
+                concept_code=concept_code,
+                concept_codes_from_the_same_domain=list(blueprint.concept.keys()),
+                concept_blueprint_or_description=blueprint.concept[concept_code],
+            )
+        except (ConceptDefinitionError, ValidationError) as exc:
+            raise make_concepts_loading_error(blueprint=blueprint, error=exc) from exc
+        self.concept_library.add_new_concept(concept=concept)
+        self.nb_concepts_loaded += 1
+        return True
+
+    def load_pending_concepts_with_code(self, concept_code: str):
+        """Make the pending concepts with the concept code, whatever their domain."""
+        for concept_string, (_, pending_concept_code) in list(self.pending_concepts.items()):
+            if pending_concept_code == concept_code:
+                self.load_pending_concept(concept_string=concept_string)
+
+    def load_pending_pipe(self, pipe_code: str) -> bool:
+        """Make the pending pipe, add it to the pipe library, then load the pipes it depends on.
+
+        The concepts the pipe needs are loaded on demand while it is made.
+
+        Returns:
+            Whether the pipe was pending
+
+        Raises:
+            LibraryLoadingError: If the blueprint of the pipe or of one of its dependencies is invalid
+
+        """
+        # popped first, so that circular dependencies between pipes end
+        blueprint = self.pending_pipes.pop(pipe_code, None)
+        if blueprint is None:
+            return False
+        assert blueprint.pipe is not None
+        try:
+            pipe = PipeFactory.make_from_blueprint(
+                domain=blueprint.domain,
+                pipe_code=pipe_code,
+                blueprint=blueprint.pipe[pipe_code],
+                concept_codes_from_the_same_domain=list(blueprint.concept.keys()) if blueprint.concept else None,
+            )
+        except (PipeDefinitionError, ValidationError) as exc:
+            raise make_pipes_loading_error(blueprint=blueprint, error=exc) from exc
+        self.pipe_library.add_new_pipe(pipe=pipe)
+        if get_config().pipelex.templating_config.is_precompile_at_library_load_enabled:
+            pipe.precompile_templates()
+        self.nb_pipes_loaded += 1
+
+        for dependency_pipe_code in pipe.pipe_dependencies():
+            self.load_pending_pipe(pipe_code=dependency_pipe_code)
+        return True
+
+    def load_all_pending(self):
+        """Make all the pending concepts and pipes."""
+        if not self.pending_concepts and not self.pending_pipes:
+            return
+        while self.pending_concepts:
+            self.load_pending_concept(concept_string=next(iter(self.pending_concepts)))
+        while self.pending_pipes:
+            self.load_pending_pipe(pipe_code=next(iter(self.pending_pipes)))
+        log.verbose(f"Loaded all pending library components: {self.nb_concepts_loaded} concepts and {self.nb_pipes_loaded} pipes")
@@ -0,0 +1,15 @@
+from typing import Protocol
+
+
+class LazyLibraryLoaderProtocol(Protocol):
+    def has_pending_pipe(self, pipe_code: str) -> bool: ...
+
+    def load_pending_pipe(self, pipe_code: str) -> bool: ...
+
+    def has_pending_concept(self, concept_string: str) -> bool: ...
+
+    def load_pending_concept(self, concept_string: str) -> bool: ...
+
+    def load_pending_concepts_with_code(self, concept_code: str) -> None: ...
+
+    def load_all_pending(self) -> None: ...
@@ -0,0 +1,273 @@
+import multiprocessing
+import os
+from collections.abc import Iterable
+from concurrent.futures import Executor, ProcessPoolExecutor, ThreadPoolExecutor
+from functools import partial
+from pathlib import Path
+
+from pydantic import BaseModel, ValidationError
+
+from pipelex import log
+from pipelex.config import LibraryIndexConfig, LibraryLoadConfig, LibraryScanEngine, get_config
+from pipelex.core.bundles.pipelex_bundle_blueprint import PipelexBundleBlueprint
+from pipelex.core.interpreter import PipelexInterpreter
+from pipelex.core.stuffs.structured_content import StructuredContent
+from pipelex.libraries import library_scan_worker
+from pipelex.system.registries.func_registry import pipe_func
+from pipelex.tools.misc.file_utils import save_bytes_atomically
+from pipelex.tools.misc.package_utils import get_package_version
+from pipelex.tools.typing.module_inspector import find_class_and_decorated_function_names_in_file
+from pipelex.types import Self
+
+# bump when the scan results or the way they are stored change
+LIBRARY_INDEX_VERSION = 1
+
+
+class PythonFileScan(BaseModel):
+    class_names: list[str]
+    decorated_function_names: list[str]
+
+    @property
+    def is_relevant(self) -> bool:
+        return bool(self.class_names or self.decorated_function_names)
+
+
+class LibraryIndexEntry(BaseModel):
+    """What the library loading learned about a file, valid as long as the file's modification time and size are unchanged."""
+
+    mtime_ns: int
+    size: int
+    python_file_scan: PythonFileScan | None = None
+    is_pipelex_file: bool | None = None
+    blueprint_json: str | None = None
+
+
+class LibraryIndexManifest(BaseModel):
+    signature: str
+    entries: dict[str, LibraryIndexEntry]
+
+
+class LibraryIndex:
+    """Persistent startup manifest of the files scanned when loading the libraries.
+
+    For each python file, it keeps the AST scan results (StructuredContent subclasses and @pipe_func functions),
+    and for each PLX file, whether it's a Pipelex bundle and its parsed blueprint. Entries are keyed by absolute path
+    and only reused while the file's modification time and size are unchanged, so a warm start only re-scans
+    the files that changed. The whole index is dropped when the Pipelex version or the scanned names change.
+    """
+
+    def __init__(self, config: LibraryIndexConfig, base_class_names: list[str], decorator_names: list[str]):
+        self.config = config
+        self.base_class_names = base_class_names
+        self.decorator_names = decorator_names
+        self.signature = f"{LIBRARY_INDEX_VERSION}:{get_package_version()}:{','.join(base_class_names)}:{','.join(decorator_names)}"
+        self._entries: dict[str, LibraryIndexEntry] = {}
+        self._is_dirty = False
+        self.nb_python_files = 0
+        self.nb_python_files_scanned = 0
+        self.nb_plx_files = 0
+        self.nb_plx_files_parsed = 0
+
+    @classmethod
+    def make_for_libraries(cls, index_file_path: str | None = None) -> Self:
+        """Make the index of the files scanned by LibraryManager.load_libraries.
+
+        Args:
+            index_file_path: The manifest file of the index, or None to use the configured one
+
+        """
+        config = get_config().pipelex.library_index_config
+        if index_file_path is not None:
+            config = config.model_copy(update={"index_file_path": index_file_path})
+        return cls(
+            config=config,
+            base_class_names=[StructuredContent.__name__],
+            decorator_names=[pipe_func.__name__],
+        )
+
+    def load(self):
+        """Load the manifest from its file, if the index is enabled and the manifest is still valid."""
+        if not self.config.is_enabled:
+            return
+        try:
+            manifest_json = Path(self.config.index_file_path).read_bytes()
+        except FileNotFoundError:
+            return
+        except OSError as exc:
+            log.verbose(f"Could not read the library index at '{self.config.index_file_path}': {exc}")
+            return
+        try:
+            manifest = LibraryIndexManifest.model_validate_json(manifest_json)
+        except ValidationError:
+            log.verbose(f"Ignoring the invalid library index at '{self.config.index_file_path}'")
+            return
+        if manifest.signature != self.signature:
+            log.verbose("Ignoring the library index made by another version of Pipelex")
+            return
+        self._entries = manifest.entries
+
+    def save(self):
+        """Save the manifest to its file if it changed, dropping the entries of files that no longer exist."""
+        if not self.config.is_enabled or not self._is_dirty:
+            return
+        entries = {file_key: entry for file_key, entry in self._entries.items() if os.path.exists(file_key)}
+        manifest = LibraryIndexManifest(signature=self.signature, entries=entries)
+        try:
+            save_bytes_atomically(self.config.index_file_path, manifest.model_dump_json().encode())
+        except OSError as exc:
+            log.verbose(f"Could not write the library index at '{self.config.index_file_path}': {exc}")
+            return
+        self._is_dirty = False
+
+    def clear(self):
+        self._entries.clear()
+        self._is_dirty = True
+
+    def scan_files(self, python_file_paths: list[Path], plx_file_paths: list[Path], load_config: LibraryLoadConfig) -> int:
+        """Scan the python files and parse the PLX files that are missing from the index, ahead of their use.
+
+        The files are scanned in a worker pool when there are at least min_files_per_scan_worker of them per worker,
+        otherwise in this process. Files that can't be scanned or parsed are left out, to be scanned again when used,
+        which raises the actual error.
+
+        Returns:
+            The number of workers used, 0 if the files were scanned in this process
+
+        """
+        python_misses = [(file_path, *self._get_entry(file_path=file_path)) for file_path in python_file_paths]
+        python_misses = [(file_path, file_key, entry) for file_path, file_key, entry in python_misses if entry.python_file_scan is None]
+        plx_misses = [(file_path, *self._get_entry(file_path=file_path)) for file_path in plx_file_paths]
+        plx_misses = [
+            (file_path, file_key, entry)
+            for file_path, file_key, entry in plx_misses
+            if entry.is_pipelex_file is None or (entry.is_pipelex_file and entry.blueprint_json is None)
+        ]
+        nb_misses = len(python_misses) + len(plx_misses)
+        max_workers = load_config.max_scan_workers or os.cpu_count() or 1
+        nb_workers = min(max_workers, nb_misses // load_config.min_files_per_scan_worker)
+        scan_python_file = partial(
+            library_scan_worker.scan_python_file,
+            base_class_names=self.base_class_names,
+            decorator_names=self.decorator_names,
+        )
+        python_file_names = [str(file_path) for file_path, _, _ in python_misses]
+        plx_file_names = [str(file_path) for file_path, _, _ in plx_misses]
+
+        if nb_workers < 2:
+            nb_workers = 0
+            self._store_scans(
+                python_misses=python_misses,
+                python_file_scans=map(scan_python_file, python_file_names),
+                plx_misses=plx_misses,
+                plx_file_parses=map(library_scan_worker.parse_plx_file, plx_file_names),
+            )
+            return nb_workers
+
+        executor: Executor
+        match load_config.scan_engine:
+            case LibraryScanEngine.THREAD:
+                executor = ThreadPoolExecutor(max_workers=nb_workers)
+            case LibraryScanEngine.PROCESS_POOL:
+                executor = ProcessPoolExecutor(max_workers=nb_workers, mp_context=multiprocessing.get_context("spawn"))
+        chunk_size = max(1, nb_misses // (4 * nb_workers))
+        with executor:
+            self._store_scans(
+                python_misses=python_misses,
+                python_file_scans=executor.map(scan_python_file, python_file_names, chunksize=chunk_size),
+                plx_misses=plx_misses,
+                plx_file_parses=executor.map(library_scan_worker.parse_plx_file, plx_file_names, chunksize=chunk_size),
+            )
+        return nb_workers
+
+    def _store_scans(
+        self,
+        python_misses: list[tuple[Path, str, LibraryIndexEntry]],
+        python_file_scans: Iterable[tuple[list[str], list[str]] | None],
+        plx_misses: list[tuple[Path, str, LibraryIndexEntry]],
+        plx_file_parses: Iterable[tuple[bool, str | None]],
+    ):
+        for (_, file_key, entry), python_file_scan in zip(python_misses, python_file_scans, strict=True):
+            if python_file_scan is None:
+                continue
+            class_names, decorated_function_names = python_file_scan
+            entry.python_file_scan = PythonFileScan(class_names=class_names, decorated_function_names=decorated_function_names)
+            self._set_entry(file_key=file_key, entry=entry)
+            self.nb_python_files_scanned += 1
+        for (_, file_key, entry), (is_pipelex_file, blueprint_json) in zip(plx_misses, plx_file_parses, strict=True):
+            entry.is_pipelex_file = is_pipelex_file
+            if blueprint_json is not None:
+                entry.blueprint_json = blueprint_json
+                self.nb_plx_files_parsed += 1
+            self._set_entry(file_key=file_key, entry=entry)
+
+    def scan_python_file(self, file_path: Path) -> PythonFileScan:
+        """Get the classes inheriting from base_class_names and the functions decorated with decorator_names in the file.
+
+        Raises:
+            ModuleFileError: If the file cannot be read or parsed
+
+        """
+        self.nb_python_files += 1
+        file_key, entry = self._get_entry(file_path=file_path)
+        if entry.python_file_scan is not None:
+            return entry.python_file_scan
+
+        self.nb_python_files_scanned += 1
+        class_names, decorated_function_names = find_class_and_decorated_function_names_in_file(
+            file_path=str(file_path),
+            base_class_names=self.base_class_names,
+            decorator_names=self.decorator_names,
+        )
+        entry.python_file_scan = PythonFileScan(class_names=class_names, decorated_function_names=decorated_function_names)
+        self._set_entry(file_key=file_key, entry=entry)
+        return entry.python_file_scan
+
+    def is_pipelex_file(self, file_path: Path) -> bool:
+        file_key, entry = self._get_entry(file_path=file_path)
+        if entry.is_pipelex_file is not None:
+            return entry.is_pipelex_file
+
+        entry.is_pipelex_file = PipelexInterpreter.is_pipelex_file(file_path)
+        self._set_entry(file_key=file_key, entry=entry)
+        return entry.is_pipelex_file
+
+    def get_blueprint(self, file_path: Path) -> PipelexBundleBlueprint:
+        """Get the bundle blueprint of the PLX file.
+
+        Raises:
+            FileNotFoundError: If the file doesn't exist
+            PipeDefinitionError, ValidationError: If the PLX file is invalid
+
+        """
+        self.nb_plx_files += 1
+        file_key, entry = self._get_entry(file_path=file_path)
+        if entry.blueprint_json is not None:
+            try:
+                return PipelexBundleBlueprint.model_validate_json(entry.blueprint_json)
+            except ValidationError:
+                log.verbose(f"Ignoring the invalid indexed blueprint of '{file_path}'")
+
+        self.nb_plx_files_parsed += 1
+        blueprint = PipelexInterpreter(file_path=file_path).make_pipelex_bundle_blueprint()
+        entry.blueprint_json = blueprint.model_dump_json()
+        self._set_entry(file_key=file_key, entry=entry)
+        return blueprint
+
+    def _get_entry(self, file_path: Path) -> tuple[str, LibraryIndexEntry]:
+        """Get the entry of the file if it's still valid, or a fresh one."""
+        file_key = os.path.abspath(file_path)
+        try:
+            file_stat = Path(file_key).stat()
+        except OSError:
+            # nothing to index, the actual read will report the error
+            return file_key, LibraryIndexEntry(mtime_ns=0, size=-1)
+        entry = self._entries.get(file_key)
+        if entry is not None and entry.mtime_ns == file_stat.st_mtime_ns and entry.size == file_stat.st_size:
+            return file_key, entry
+        return file_key, LibraryIndexEntry(mtime_ns=file_stat.st_mtime_ns, size=file_stat.st_size)
+
+    def _set_entry(self, file_key: str, entry: LibraryIndexEntry):
+        if entry.size < 0:
+            return
+        self._entries[file_key] = entry
+        self._is_dirty = True
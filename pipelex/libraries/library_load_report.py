@@ -0,0 +1,33 @@
+from pydantic import BaseModel
+
+
+class LibraryLoadReport(BaseModel):
+    is_index_enabled: bool
+    nb_python_files: int
+    nb_python_files_scanned: int
+    nb_plx_files: int
+    nb_plx_files_parsed: int
+    nb_scan_workers: int
+    file_walk_seconds: float
+    file_scan_seconds: float
+    module_import_seconds: float
+    library_load_seconds: float
+    total_seconds: float
+
+    @property
+    def is_warm(self) -> bool:
+        """Whether all the files were known to the index, so none was scanned or parsed again."""
+        return self.is_index_enabled and self.nb_python_files_scanned == 0 and self.nb_plx_files_parsed == 0
+
+    @property
+    def desc(self) -> str:
+        start_kind = "warm" if self.is_warm else "cold"
+        scan_location = f"{self.nb_scan_workers} workers" if self.nb_scan_workers else "process"
+        return (
+            f"{start_kind} start in {self.total_seconds:.2f}s: "
+            f"files found in {self.file_walk_seconds:.2f}s, "
+            f"{self.nb_python_files_scanned}/{self.nb_python_files} python files scanned and "
+            f"{self.nb_plx_files_parsed}/{self.nb_plx_files} PLX files parsed in {self.file_scan_seconds:.2f}s (in {scan_location}), "
+            f"modules imported in {self.module_import_seconds:.2f}s, "
+            f"libraries loaded in {self.library_load_seconds:.2f}s"
+        )
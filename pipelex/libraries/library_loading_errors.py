@@ -0,0 +1,42 @@
+from pydantic import ValidationError
+
+from pipelex.core.bundles.pipelex_bundle_blueprint import PipelexBundleBlueprint
+from pipelex.core.concepts.exceptions import ConceptDefinitionError
+from pipelex.core.pipe_errors import PipeDefinitionError
+from pipelex.core.pipes.exceptions import PipeDefinitionErrorData
+from pipelex.core.validation import report_validation_error
+from pipelex.libraries.exceptions import LibraryLoadingError
+
+
+def make_concepts_loading_error(blueprint: PipelexBundleBlueprint, error: ConceptDefinitionError | ValidationError) -> LibraryLoadingError:
+    """Make the error raised when the concepts of a blueprint cannot be made."""
+    if isinstance(error, ValidationError):
+        validation_error_msg = report_validation_error(category="plx", validation_error=error)
+        msg = f"Could not load concepts from PLX blueprint at '{blueprint.source}', domain code: '{blueprint.domain}': {validation_error_msg}"
+        return LibraryLoadingError(msg)
+    msg = f"Could not load concepts from PLX blueprint at '{blueprint.source}', domain code: '{blueprint.domain}': {error}"
+    return LibraryLoadingError(
+        msg,
+        concept_definition_errors=[error.as_structured_content()],
+    )
+
+
+def make_pipes_loading_error(blueprint: PipelexBundleBlueprint, error: PipeDefinitionError | ValidationError) -> LibraryLoadingError:
+    """Make the error raised when the pipes of a blueprint cannot be made."""
+    if isinstance(error, ValidationError):
+        validation_error_msg = report_validation_error(category="plx", validation_error=error)
+        msg = f"Could not load pipes from PLX blueprint at '{blueprint.source}', domain code: '{blueprint.domain}': {validation_error_msg}"
+        return LibraryLoadingError(msg)
+    msg = f"Could not load pipes from PLX blueprint at '{blueprint.source}', domain code: '{blueprint.domain}': {error}"
+    return LibraryLoadingError(
+        msg,
+        pipe_definition_errors=[
+            PipeDefinitionErrorData(
+                message=error.message,
+                domain_code=error.domain_code,
+                pipe_code=error.pipe_code,
+                description=error.description,
+                source=error.source,
+            )
+        ],
+    )
@@ -0,0 +1,6 @@
+from pipelex.types import StrEnum
+
+
+class LibraryLoadingMode(StrEnum):
+    EAGER = "eager"
+    LAZY = "lazy"
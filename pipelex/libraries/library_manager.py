@@ -1,3 +1,4 @@
+import time
 from pathlib import Path
 from typing import ClassVar
 
@@ -5,6 +6,7 @@ from pydantic import ValidationError
 from typing_extensions import override
 
 from pipelex import log
+from pipelex.config import get_config
 from pipelex.core.bundles.pipelex_bundle_blueprint import PipelexBundleBlueprint
 from pipelex.core.concepts.concept import Concept
 from pipelex.core.concepts.concept_factory import ConceptFactory
@@ -15,7 +17,6 @@ from pipelex.core.domains.domain_blueprint import DomainBlueprint
 from pipelex.core.domains.domain_factory import DomainFactory
 from pipelex.core.domains.domain_library import DomainLibrary
 from pipelex.core.domains.exceptions import DomainDefinitionError
-from pipelex.core.interpreter import PipelexInterpreter
 from pipelex.core.pipe_errors import PipeDefinitionError
 from pipelex.core.pipes.exceptions import PipeDefinitionErrorData
 from pipelex.core.pipes.pipe_abstract import PipeAbstract
@@ -32,15 +33,21 @@ from pipelex.libraries.exceptions import (
     PipeLibraryError,
     PipeLoadingError,
 )
+from pipelex.libraries.lazy_library_loader import LazyLibraryLoader
+from pipelex.libraries.library_index import LibraryIndex
+from pipelex.libraries.library_load_report import LibraryLoadReport
+from pipelex.libraries.library_loading_errors import make_concepts_loading_error, make_pipes_loading_error
+from pipelex.libraries.library_loading_mode import LibraryLoadingMode
 from pipelex.libraries.library_manager_abstract import LibraryManagerAbstract
 from pipelex.libraries.library_utils import (
-    find_plx_files_in_dir,
+    find_library_files_in_dirs,
     get_pipelex_package_dir_for_imports,
     get_pipelex_plx_files_from_package,
 )
 from pipelex.system.configuration.config_loader import config_manager
 from pipelex.system.registries.class_registry_utils import ClassRegistryUtils
 from pipelex.system.registries.func_registry_utils import FuncRegistryUtils
+from pipelex.tools.typing.module_inspector import ModuleFileError, import_module_from_file
 from pipelex.types import StrEnum
 
 
@@ -74,10 +81,14 @@ class LibraryManager(LibraryManagerAbstract):
         self.concept_library = concept_library
         self.pipe_library = pipe_library
         self.loaded_plx_paths: list[str] = []
+        self.last_load_report: LibraryLoadReport | None = None
+        self.lazy_loader: LazyLibraryLoader | None = None
 
     @override
     def validate_libraries(self):
         log.verbose("LibraryManager validating libraries")
+        if self.lazy_loader:
+            self.lazy_loader.load_all_pending()
 
         self.concept_library.validate_with_libraries()
         self.pipe_library.validate_with_libraries()
@@ -89,6 +100,11 @@ class LibraryManager(LibraryManagerAbstract):
 
     @override
     def teardown(self) -> None:
+        if self.lazy_loader:
+            self.lazy_loader.clear()
+            self.lazy_loader = None
+            self.pipe_library.set_lazy_loader(lazy_loader=None)
+            self.concept_library.set_lazy_loader(lazy_loader=None)
         self.pipe_library.teardown()
         self.concept_library.teardown()
         self.domain_library.teardown()
@@ -102,37 +118,32 @@ class LibraryManager(LibraryManagerAbstract):
     def get_loaded_plx_paths(self) -> list[str]:
         return self.loaded_plx_paths
 
-    def _get_pipelex_plx_files_from_dirs(self, dirs: set[Path]) -> list[Path]:
-        """Get all valid Pipelex PLX files from the given directories."""
+    @override
+    def get_last_load_report(self) -> LibraryLoadReport | None:
+        return self.last_load_report
+
+    def _get_pipelex_plx_files(self, plx_file_paths: list[Path], library_index: LibraryIndex) -> list[Path]:
+        """Get the valid Pipelex PLX files among the given ones, without duplicates."""
         all_plx_paths: list[Path] = []
         seen_files: set[str] = set()  # Track by absolute path to avoid duplicates
 
-        for dir_path in dirs:
-            if not dir_path.exists():
-                log.verbose(f"Directory does not exist, skipping: {dir_path}")
-                continue
-
-            # Find all .plx files in the directory, excluding problematic directories
-            plx_files = find_plx_files_in_dir(
-                dir_path=str(dir_path),
-                pattern="*.plx",
-                is_recursive=True,
-            )
-
-            # Filter to only include valid Pipelex files
-            for plx_file in plx_files:
+        for plx_file in plx_file_paths:
+            try:
                 absolute_path = str(plx_file.resolve())
+            except (OSError, RuntimeError):
+                # For paths that can't be resolved (e.g., in zipped packages), use string representation
+                absolute_path = str(plx_file)
 
-                # Skip if already seen
-                if absolute_path in seen_files:
-                    log.verbose(f"Skipping duplicate PLX file: {plx_file}")
-                    continue
+            # Skip if already seen
+            if absolute_path in seen_files:
+                log.verbose(f"Skipping duplicate PLX file: {plx_file}")
+                continue
 
-                if PipelexInterpreter.is_pipelex_file(plx_file):
-                    all_plx_paths.append(plx_file)
-                    seen_files.add(absolute_path)
-                else:
-                    log.verbose(f"Skipping non-Pipelex PLX file: {plx_file}")
+            if library_index.is_pipelex_file(plx_file):
+                all_plx_paths.append(plx_file)
+                seen_files.add(absolute_path)
+            else:
+                log.verbose(f"Skipping non-Pipelex PLX file: {plx_file}")
 
         return all_plx_paths
 
@@ -182,11 +193,14 @@ class LibraryManager(LibraryManagerAbstract):
                 source=pipe_def_error.source,
             ) from pipe_def_error
         self.pipe_library.add_pipes(pipes=pipes)
+        self._precompile_templates(pipes=pipes)
 
         return pipes
 
     @override
     def remove_from_blueprint(self, blueprint: PipelexBundleBlueprint) -> None:
+        if self.lazy_loader:
+            self.lazy_loader.remove_blueprint(blueprint=blueprint)
         if blueprint.pipe is not None:
             self.pipe_library.remove_pipes_by_codes(pipe_codes=list(blueprint.pipe.keys()))
 
@@ -200,6 +214,35 @@ class LibraryManager(LibraryManagerAbstract):
 
         self.domain_library.remove_domain_by_code(domain_code=blueprint.domain)
 
+    def _load_concepts_and_pipes(self, blueprints: list[PipelexBundleBlueprint]) -> None:
+        # Load all concepts second
+        all_concepts: list[Concept] = []
+        for blueprint in blueprints:
+            try:
+                concepts = self._load_concepts_from_blueprint(blueprint)
+            except (ConceptDefinitionError, ValidationError) as exc:
+                raise make_concepts_loading_error(blueprint=blueprint, error=exc) from exc
+            all_concepts.extend(concepts)
+        self.concept_library.add_concepts(concepts=all_concepts)
+
+        # Load all pipes third
+        all_pipes: list[PipeAbstract] = []
+        for blueprint in blueprints:
+            try:
+                pipes = self._load_pipes_from_blueprint(blueprint)
+            except (PipeDefinitionError, ValidationError) as exc:
+                raise make_pipes_loading_error(blueprint=blueprint, error=exc) from exc
+            all_pipes.extend(pipes)
+        self.pipe_library.add_pipes(pipes=all_pipes)
+        self._precompile_templates(pipes=all_pipes)
+
+    def _add_blueprints_to_lazy_loader(self, blueprints: list[PipelexBundleBlueprint]) -> None:
+        if self.lazy_loader is None:
+            self.lazy_loader = LazyLibraryLoader(concept_library=self.concept_library, pipe_library=self.pipe_library)
+            self.concept_library.set_lazy_loader(lazy_loader=self.lazy_loader)
+            self.pipe_library.set_lazy_loader(lazy_loader=self.lazy_loader)
+        self.lazy_loader.add_blueprints(blueprints=blueprints)
+
     def _load_domain_from_blueprint(self, blueprint: PipelexBundleBlueprint) -> Domain:
         return DomainFactory.make_from_blueprint(
             blueprint=DomainBlueprint(
@@ -239,6 +282,13 @@ class LibraryManager(LibraryManagerAbstract):
                 pipes.append(pipe)
         return pipes
 
+    def _precompile_templates(self, pipes: list[PipeAbstract]) -> None:
+        if not get_config().pipelex.templating_config.is_precompile_at_library_load_enabled:
+            return
+        for pipe in pipes:
+            pipe.precompile_templates()
+        log.verbose(f"Precompiled the templates of {len(pipes)} pipes")
+
     def _import_pipelex_modules_directly(self) -> None:
         """Import pipelex modules to register @pipe_func decorated functions.
 
@@ -251,57 +301,99 @@ class LibraryManager(LibraryManagerAbstract):
         functions_count = FuncRegistryUtils.register_pipe_funcs_from_package("pipelex.builder", pipelex.builder)
         log.verbose(f"Registered {functions_count} @pipe_func functions from pipelex.builder")
 
+    def _import_python_modules(self, python_file_paths: list[Path], library_index: LibraryIndex) -> None:
+        """Import the modules with StructuredContent subclasses and register their @pipe_func functions, in a single pass.
+
+        The AST scans telling which files are relevant come from the library index, so unchanged files are not parsed again.
+        """
+        for python_file in python_file_paths:
+            try:
+                python_file_scan = library_index.scan_python_file(file_path=python_file)
+                if not python_file_scan.is_relevant:
+                    continue
+                module = import_module_from_file(str(python_file))
+                if python_file_scan.decorated_function_names:
+                    FuncRegistryUtils.register_funcs_in_module(module=module)
+            except ModuleFileError:
+                # Expected: file validation issues (directories with .py extension, etc.)
+                pass
+            except ImportError:
+                # Common: missing dependencies, circular imports, relative imports
+                pass
+            except SyntaxError as exc:
+                # Potentially problematic: invalid Python syntax may indicate broken code
+                log.warning(f"Syntax error in {python_file}: {exc}")
+
     @override
     def load_libraries(
         self,
         library_dirs: list[Path] | None = None,
         library_file_paths: list[Path] | None = None,
+        loading_mode: LibraryLoadingMode | None = None,
+        library_index_file_path: str | None = None,
     ) -> None:
+        load_start_time = time.perf_counter()
+        library_index = LibraryIndex.make_for_libraries(index_file_path=library_index_file_path)
+        library_index.load()
+
         # Collect directories to scan (user project directories)
-        user_dirs: set[Path] = set()
+        user_dirs: list[Path] = []
         if library_dirs:
-            user_dirs.update(library_dirs)
+            user_dirs.extend(library_dirs)
         else:
-            user_dirs.add(Path(config_manager.local_root_dir))
+            user_dirs.append(Path(config_manager.local_root_dir))
 
-        valid_plx_paths: list[Path]
+        # Find the python and PLX files of the user directories and of the pipelex package in a single walk
+        file_walk_start_time = time.perf_counter()
+        pipelex_pkg_dir = get_pipelex_package_dir_for_imports()
+        library_files = find_library_files_in_dirs(dir_paths=user_dirs, package_dir_path=pipelex_pkg_dir)
+        plx_file_paths: list[Path]
         if library_file_paths:
-            valid_plx_paths = library_file_paths
+            plx_file_paths = library_file_paths
+        elif pipelex_pkg_dir:
+            plx_file_paths = library_files.plx_file_paths
         else:
-            # Get PLX files from user directories
-            user_plx_paths: list[Path] = self._get_pipelex_plx_files_from_dirs(user_dirs)
-
-            # Get PLX files from pipelex package using importlib.resources
-            # This works reliably in all installation modes (wheel, source, relative)
-            pipelex_plx_paths: list[Path] = get_pipelex_plx_files_from_package()
-
-            # Combine and deduplicate
-            all_plx_paths = user_plx_paths + pipelex_plx_paths
-            seen_absolute_paths: set[str] = set()
-            valid_plx_paths = []
-            for plx_path in all_plx_paths:
-                try:
-                    absolute_path = str(plx_path.resolve())
-                except (OSError, RuntimeError):
-                    # For paths that can't be resolved (e.g., in zipped packages), use string representation
-                    absolute_path = str(plx_path)
+            # The pipelex package is not on the filesystem (e.g. zipped), get its PLX files using importlib.resources
+            plx_file_paths = library_files.plx_file_paths + get_pipelex_plx_files_from_package()
+        file_walk_seconds = time.perf_counter() - file_walk_start_time
+
+        # Scan and parse the files missing from the library index ahead, in a worker pool if there are many of them
+        file_scan_start_time = time.perf_counter()
+        nb_scan_workers = library_index.scan_files(
+            python_file_paths=library_files.python_file_paths + library_files.package_python_file_paths,
+            plx_file_paths=plx_file_paths,
+            load_config=get_config().pipelex.library_load_config,
+        )
+        valid_plx_paths = library_file_paths or self._get_pipelex_plx_files(plx_file_paths=plx_file_paths, library_index=library_index)
 
-                if absolute_path not in seen_absolute_paths:
-                    valid_plx_paths.append(plx_path)
-                    seen_absolute_paths.add(absolute_path)
+        # Parse all blueprints first
+        blueprints: list[PipelexBundleBlueprint] = []
+        try:
+            for plx_file_path in valid_plx_paths:
+                try:
+                    blueprint = library_index.get_blueprint(file_path=plx_file_path)
+                except FileNotFoundError as file_not_found_error:
+                    msg = f"Could not find PLX bundle at '{plx_file_path}'"
+                    raise LibraryLoadingError(msg) from file_not_found_error
+                except PipeDefinitionError as pipe_def_error:
+                    msg = f"Could not load PLX bundle from '{plx_file_path}' because of: {pipe_def_error}"
+                    raise LibraryLoadingError(msg) from pipe_def_error
+                except ValidationError as validation_error:
+                    validation_error_msg = report_validation_error(category="plx", validation_error=validation_error)
+                    msg = f"Could not load PLX bundle from '{plx_file_path}' because of: {validation_error_msg}"
+                    raise LibraryLoadingError(msg) from validation_error
+                blueprint.source = str(plx_file_path)
+                blueprints.append(blueprint)
+        finally:
+            # keep what was scanned and parsed, even when a bundle is invalid
+            library_index.save()
+        file_scan_seconds = time.perf_counter() - file_scan_start_time
 
         # Import modules to load them into sys.modules (but don't register classes yet)
         # Import from user directories
-        for library_dir in user_dirs:
-            # Only import files that contain StructuredContent subclasses (uses AST pre-check)
-            ClassRegistryUtils.import_modules_in_folder(
-                folder_path=str(library_dir),
-                base_class_names=[StructuredContent.__name__],
-            )
-            # Only import files that contain @pipe_func decorated functions (uses AST pre-check)
-            FuncRegistryUtils.register_funcs_in_folder(
-                folder_path=str(library_dir),
-            )
+        module_import_start_time = time.perf_counter()
+        # Only import files that contain StructuredContent subclasses or @pipe_func decorated functions (uses AST pre-check)
+        self._import_python_modules(python_file_paths=library_files.python_file_paths, library_index=library_index)
 
         # Import from pipelex package
         # Always directly import critical builder modules first (works in all installation modes)
@@ -318,40 +410,17 @@ class LibraryManager(LibraryManagerAbstract):
             else:
                 log.error(f"✗ Function '{func_name}' NOT registered - this will cause errors!")
 
-        # Then try filesystem-based scanning if package is accessible (for completeness)
-        pipelex_pkg_dir = get_pipelex_package_dir_for_imports()
-        if pipelex_pkg_dir:
-            log.verbose(f"Additionally scanning pipelex package filesystem: {pipelex_pkg_dir}")
-            ClassRegistryUtils.import_modules_in_folder(
-                folder_path=str(pipelex_pkg_dir),
-                base_class_names=[StructuredContent.__name__],
-            )
-            FuncRegistryUtils.register_funcs_in_folder(
-                folder_path=str(pipelex_pkg_dir),
-            )
+        # Then import the modules found in the pipelex package filesystem if it's accessible (for completeness)
+        self._import_python_modules(python_file_paths=library_files.package_python_file_paths, library_index=library_index)
 
         # Auto-discover and register all StructuredContent classes from sys.modules
         num_registered = ClassRegistryUtils.auto_register_all_subclasses(base_class=StructuredContent)
         log.verbose(f"Auto-registered {num_registered} StructuredContent classes from loaded modules")
 
-        # Parse all blueprints first
-        blueprints: list[PipelexBundleBlueprint] = []
-        for plx_file_path in valid_plx_paths:
-            try:
-                blueprint = PipelexInterpreter(file_path=plx_file_path).make_pipelex_bundle_blueprint()
-            except FileNotFoundError as file_not_found_error:
-                msg = f"Could not find PLX bundle at '{plx_file_path}'"
-                raise LibraryLoadingError(msg) from file_not_found_error
-            except PipeDefinitionError as pipe_def_error:
-                msg = f"Could not load PLX bundle from '{plx_file_path}' because of: {pipe_def_error}"
-                raise LibraryLoadingError(msg) from pipe_def_error
-            except ValidationError as validation_error:
-                validation_error_msg = report_validation_error(category="plx", validation_error=validation_error)
-                msg = f"Could not load PLX bundle from '{plx_file_path}' because of: {validation_error_msg}"
-                raise LibraryLoadingError(msg) from validation_error
-            blueprint.source = str(plx_file_path)
-            blueprints.append(blueprint)
+        module_import_seconds = time.perf_counter() - module_import_start_time
 
+        # Load domains, concepts and pipes, in dependency order
+        library_load_start_time = time.perf_counter()
         self.loaded_plx_paths.extend([str(plx_file_path) for plx_file_path in valid_plx_paths])
 
         # Load all domains first
@@ -369,46 +438,25 @@ class LibraryManager(LibraryManagerAbstract):
             all_domains.append(domain)
         self.domain_library.add_domains(domains=all_domains)
 
-        # Load all concepts second
-        all_concepts: list[Concept] = []
-        for blueprint in blueprints:
-            try:
-                concepts = self._load_concepts_from_blueprint(blueprint)
-            except ConceptDefinitionError as concept_def_error:
-                msg = f"Could not load concepts from PLX blueprint at '{blueprint.source}', domain code: '{blueprint.domain}': {concept_def_error}"
-                raise LibraryLoadingError(
-                    msg,
-                    concept_definition_errors=[concept_def_error.as_structured_content()],
-                ) from concept_def_error
-            except ValidationError as validation_error:
-                validation_error_msg = report_validation_error(category="plx", validation_error=validation_error)
-                msg = f"Could not load concepts from PLX blueprint at '{blueprint.source}', domain code: '{blueprint.domain}': {validation_error_msg}"
-                raise LibraryLoadingError(msg) from validation_error
-            all_concepts.extend(concepts)
-        self.concept_library.add_concepts(concepts=all_concepts)
-
-        # Load all pipes third
-        all_pipes: list[PipeAbstract] = []
-        for blueprint in blueprints:
-            try:
-                pipes = self._load_pipes_from_blueprint(blueprint)
-            except PipeDefinitionError as pipe_def_error:
-                msg = f"Could not load pipes from PLX blueprint at '{blueprint.source}', domain code: '{blueprint.domain}': {pipe_def_error}"
-                raise LibraryLoadingError(
-                    msg,
-                    pipe_definition_errors=[
-                        PipeDefinitionErrorData(
-                            message=pipe_def_error.message,
-                            domain_code=pipe_def_error.domain_code,
-                            pipe_code=pipe_def_error.pipe_code,
-                            description=pipe_def_error.description,
-                            source=pipe_def_error.source,
-                        )
-                    ],
-                ) from pipe_def_error
-            except ValidationError as validation_error:
-                validation_error_msg = report_validation_error(category="plx", validation_error=validation_error)
-                msg = f"Could not load pipes from PLX blueprint at '{blueprint.source}', domain code: '{blueprint.domain}': {validation_error_msg}"
-                raise LibraryLoadingError(msg) from validation_error
-            all_pipes.extend(pipes)
-        self.pipe_library.add_pipes(pipes=all_pipes)
+        loading_mode = loading_mode or get_config().pipelex.library_load_config.loading_mode
+        if loading_mode == LibraryLoadingMode.LAZY:
+            # Index the concepts and pipes, they are made when first requested
+            self._add_blueprints_to_lazy_loader(blueprints=blueprints)
+        else:
+            self._load_concepts_and_pipes(blueprints=blueprints)
+
+        load_end_time = time.perf_counter()
+        self.last_load_report = LibraryLoadReport(
+            is_index_enabled=library_index.config.is_enabled,
+            nb_python_files=library_index.nb_python_files,
+            nb_python_files_scanned=library_index.nb_python_files_scanned,
+            nb_plx_files=library_index.nb_plx_files,
+            nb_plx_files_parsed=library_index.nb_plx_files_parsed,
+            nb_scan_workers=nb_scan_workers,
+            file_walk_seconds=file_walk_seconds,
+            file_scan_seconds=file_scan_seconds,
+            module_import_seconds=module_import_seconds,
+            library_load_seconds=load_end_time - library_load_start_time,
+            total_seconds=load_end_time - load_start_time,
+        )
+        log.verbose(f"Libraries loaded, {self.last_load_report.desc}")
@@ -1,8 +1,15 @@
+from __future__ import annotations
+
 from abc import ABC, abstractmethod
-from pathlib import Path
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from pathlib import Path
 
-from pipelex.core.bundles.pipelex_bundle_blueprint import PipelexBundleBlueprint
-from pipelex.core.pipes.pipe_abstract import PipeAbstract
+    from pipelex.core.bundles.pipelex_bundle_blueprint import PipelexBundleBlueprint
+    from pipelex.core.pipes.pipe_abstract import PipeAbstract
+    from pipelex.libraries.library_load_report import LibraryLoadReport
+    from pipelex.libraries.library_loading_mode import LibraryLoadingMode
 
 
 class LibraryManagerAbstract(ABC):
@@ -27,7 +34,17 @@ class LibraryManagerAbstract(ABC):
         pass
 
     @abstractmethod
-    def load_libraries(self, library_dirs: list[Path] | None = None, library_file_paths: list[Path] | None = None) -> None:
+    def get_last_load_report(self) -> LibraryLoadReport | None:
+        pass
+
+    @abstractmethod
+    def load_libraries(
+        self,
+        library_dirs: list[Path] | None = None,
+        library_file_paths: list[Path] | None = None,
+        loading_mode: LibraryLoadingMode | None = None,
+        library_index_file_path: str | None = None,
+    ) -> None:
         pass
 
     @abstractmethod
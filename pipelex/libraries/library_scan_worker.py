@@ -0,0 +1,39 @@
+"""Functions run in the worker processes scanning the library files missing from the library index.
+
+Parsing python files into ASTs and PLX files into blueprints is CPU-bound, so on a cold start with many files
+the scanning is spread across processes. The workers only return plain data: when a file can't be scanned or parsed,
+they return None and the main process scans it again to raise the actual error.
+"""
+
+from pathlib import Path
+
+from pipelex.core.interpreter import PipelexInterpreter
+from pipelex.tools.typing.module_inspector import ModuleFileError, find_class_and_decorated_function_names_in_file
+
+
+def scan_python_file(file_path: str, base_class_names: list[str], decorator_names: list[str]) -> tuple[list[str], list[str]] | None:
+    try:
+        return find_class_and_decorated_function_names_in_file(
+            file_path=file_path,
+            base_class_names=base_class_names,
+            decorator_names=decorator_names,
+        )
+    except ModuleFileError:
+        return None
+
+
+def parse_plx_file(file_path: str) -> tuple[bool, str | None]:
+    """Check whether the file is a Pipelex bundle and parse it.
+
+    Returns:
+        Tuple of (is pipelex file, blueprint as JSON or None if it could not be parsed)
+    """
+    plx_path = Path(file_path)
+    is_pipelex_file = PipelexInterpreter.is_pipelex_file(plx_path)
+    if not is_pipelex_file:
+        return False, None
+    try:
+        blueprint = PipelexInterpreter(file_path=plx_path).make_pipelex_bundle_blueprint()
+    except Exception:
+        return is_pipelex_file, None
+    return is_pipelex_file, blueprint.model_dump_json()
@@ -1,9 +1,12 @@
 """Utility functions for library management."""
 
+import os
 from importlib.abc import Traversable
 from importlib.resources import files
 from pathlib import Path
 
+from pydantic import BaseModel
+
 from pipelex import log
 from pipelex.config import get_config
 from pipelex.core.interpreter import PipelexInterpreter
@@ -89,3 +92,73 @@ def find_plx_files_in_dir(dir_path: str, pattern: str, is_recursive: bool) -> li
             filtered_files.append(file_path)
 
     return filtered_files
+
+
+class LibraryFiles(BaseModel):
+    python_file_paths: list[Path]
+    package_python_file_paths: list[Path]
+    plx_file_paths: list[Path]
+
+
+def find_library_files_in_dirs(dir_paths: list[Path], package_dir_path: Path | None = None) -> LibraryFiles:
+    """Find the python and PLX files in directories with a single walk, skipping the excluded directories.
+
+    Directories nested in other ones are only walked once, and each file is returned once.
+    The excluded directories are only skipped below each directory, and the package directory is always walked
+    on its own, so that a package installed in a virtual environment inside a project directory is still found.
+
+    Args:
+        dir_paths: Directory paths to search in, recursively
+        package_dir_path: Optional package directory to search in too, whose python files are returned separately
+
+    Returns:
+        The python and PLX files found, in walk order
+    """
+    excluded_dirs = get_config().pipelex.scan_config.excluded_dirs
+    resolved_package_dir_path: Path | None = None
+    if package_dir_path is not None:
+        if package_dir_path.is_dir():
+            resolved_package_dir_path = package_dir_path.resolve()
+        else:
+            log.verbose(f"Directory does not exist, skipping: {package_dir_path}")
+    # keep the paths as given, which end up in the bundle sources, but compare them resolved
+    dir_paths_by_resolved_path: dict[Path, Path] = {}
+    for dir_path in dir_paths:
+        if not dir_path.is_dir():
+            log.verbose(f"Directory does not exist, skipping: {dir_path}")
+            continue
+        resolved_dir_path = dir_path.resolve()
+        if resolved_package_dir_path is not None and resolved_dir_path.is_relative_to(resolved_package_dir_path):
+            # walked with the package directory
+            continue
+        dir_paths_by_resolved_path.setdefault(resolved_dir_path, dir_path)
+    root_dir_paths = [
+        (resolved_path, dir_path)
+        for resolved_path, dir_path in dir_paths_by_resolved_path.items()
+        if not any(resolved_path != other_path and resolved_path.is_relative_to(other_path) for other_path in dir_paths_by_resolved_path)
+    ]
+
+    library_files = LibraryFiles(python_file_paths=[], package_python_file_paths=[], plx_file_paths=[])
+
+    def _walk_root_dir(resolved_root_dir_path: Path, root_dir_path: Path, is_package: bool) -> None:
+        python_file_paths = library_files.package_python_file_paths if is_package else library_files.python_file_paths
+        for walked_dir_path, dir_names, file_names in os.walk(root_dir_path):
+            # prune the excluded directories in place so that they are not walked, nor the package directory which is walked on its own
+            # os.walk doesn't follow symlinks, so a walked directory resolves to the resolved root joined with its relative path
+            resolved_walked_dir_path = resolved_root_dir_path / os.path.relpath(walked_dir_path, root_dir_path)
+            dir_names[:] = [
+                dir_name
+                for dir_name in dir_names
+                if dir_name not in excluded_dirs and (is_package or resolved_walked_dir_path / dir_name != resolved_package_dir_path)
+            ]
+            for file_name in file_names:
+                if file_name.endswith(".py"):
+                    python_file_paths.append(Path(walked_dir_path, file_name))
+                elif file_name.endswith(".plx"):
+                    library_files.plx_file_paths.append(Path(walked_dir_path, file_name))
+
+    for resolved_root_dir_path, root_dir_path in root_dir_paths:
+        _walk_root_dir(resolved_root_dir_path=resolved_root_dir_path, root_dir_path=root_dir_path, is_package=False)
+    if package_dir_path is not None and resolved_package_dir_path is not None:
+        _walk_root_dir(resolved_root_dir_path=resolved_package_dir_path, root_dir_path=package_dir_path, is_package=True)
+    return library_files
@@ -1,4 +1,3 @@
-import asyncio
 from typing import TYPE_CHECKING, Any, Literal, cast
 
 import shortuuid
@@ -17,6 +16,7 @@ from pipelex.hub import get_pipeline_tracker, get_required_pipe
 from pipelex.pipe_controllers.pipe_controller import PipeController
 from pipelex.pipe_run.pipe_run_params import BatchParams, PipeRunMode, PipeRunParams
 from pipelex.pipeline.job_metadata import JobMetadata
+from pipelex.tools.misc.async_utils import gather_with_max_concurrency
 from pipelex.types import Self
 
 if TYPE_CHECKING:
@@ -142,7 +142,10 @@ class PipeBatch(PipeController):
         # TODO: Make commented code work when inputing images named "a.b.c"
         sub_pipe = get_required_pipe(pipe_code=self.branch_pipe_code)
         nb_history_items_limit = get_config().pipelex.tracker_config.applied_nb_items_limit
+        max_concurrency = batch_params.max_concurrency or get_config().pipelex.pipe_run_config.default_batch_max_concurrency
         batch_output_stuff_code = shortuuid.uuid()
+        pipeline_tracker = get_pipeline_tracker()
+        is_tracking = pipeline_tracker.is_tracking(pipeline_run_id=job_metadata.pipeline_run_id)
         tasks: list[Coroutine[Any, Any, PipeOutput]] = []
         item_stuffs: list[Stuff] = []
         required_stuff_lists: list[list[Stuff]] = []
@@ -161,14 +164,15 @@ class PipeBatch(PipeController):
                 name=input_item_stuff_name,
             )
             item_stuffs.append(item_input_stuff)
-            branch_memory = working_memory.make_deep_copy()
+            branch_memory = working_memory.make_branch_copy()
             branch_memory.set_new_main_stuff(stuff=item_input_stuff, name=input_item_stuff_name)
 
-            required_variables = sub_pipe.required_variables()
-            required_stuffs = branch_memory.get_existing_stuffs(names=required_variables)
-            required_stuffs = [required_stuff for required_stuff in required_stuffs if required_stuff.stuff_code != input_stuff_code]
-            required_stuff_lists.append(required_stuffs)
-            branch_pipe_run_params = pipe_run_params.deep_copy_with_final_stuff_code(final_stuff_code=branch_output_item_code)
+            if is_tracking:
+                required_variables = sub_pipe.required_variables()
+                required_stuffs = branch_memory.get_existing_stuffs(names=required_variables)
+                required_stuffs = [required_stuff for required_stuff in required_stuffs if required_stuff.stuff_code != input_stuff_code]
+                required_stuff_lists.append(required_stuffs)
+            branch_pipe_run_params = pipe_run_params.make_branch_copy(final_stuff_code=branch_output_item_code)
 
             task: Coroutine[Any, Any, PipeOutput]
             if pipe_run_params.run_mode == PipeRunMode.DRY:
@@ -188,7 +192,8 @@ class PipeBatch(PipeController):
                 )
             tasks.append(task)
 
-        pipe_outputs = await asyncio.gather(*tasks)
+        # branches start as slots free up, so that big batches don't hit the inference providers all at once
+        pipe_outputs = await gather_with_max_concurrency(tasks, max_concurrency=max_concurrency)
 
         output_items: list[StuffContent] = []
         output_stuffs: list[Stuff] = []
@@ -206,38 +211,42 @@ class PipeBatch(PipeController):
             name=output_name,
         )
 
-        method_name = "dry_run_pipe" if pipe_run_params.run_mode == PipeRunMode.DRY else "run_pipe"
-        for branch_index, (
-            required_stuff_list,
-            item_input_stuff,
-            item_output_stuff,
-        ) in enumerate(zip(required_stuff_lists, item_stuffs, output_stuffs, strict=False)):
-            get_pipeline_tracker().add_batch_step(
-                from_stuff=input_stuff,
-                to_stuff=item_input_stuff,
-                to_branch_index=branch_index,
-                pipe_layer=pipe_run_params.pipe_layers,
-                comment=f"PipeBatch.{method_name}() in zip",
-            )
-            for required_stuff in required_stuff_list:
-                get_pipeline_tracker().add_pipe_step(
-                    from_stuff=required_stuff,
-                    to_stuff=item_output_stuff,
-                    pipe_code=self.branch_pipe_code,
+        if is_tracking:
+            method_name = "dry_run_pipe" if pipe_run_params.run_mode == PipeRunMode.DRY else "run_pipe"
+            for branch_index, (
+                required_stuff_list,
+                item_input_stuff,
+                item_output_stuff,
+            ) in enumerate(zip(required_stuff_lists, item_stuffs, output_stuffs, strict=False)):
+                pipeline_tracker.add_batch_step(
+                    pipeline_run_id=job_metadata.pipeline_run_id,
+                    from_stuff=input_stuff,
+                    to_stuff=item_input_stuff,
+                    to_branch_index=branch_index,
                     pipe_layer=pipe_run_params.pipe_layers,
-                    comment=f"PipeBatch.{method_name}() on required_stuff_list",
-                    as_item_index=branch_index,
-                    is_with_edge=(required_stuff.stuff_name != MAIN_STUFF_NAME),
+                    comment=f"PipeBatch.{method_name}() in zip",
+                )
+                for required_stuff in required_stuff_list:
+                    pipeline_tracker.add_pipe_step(
+                        pipeline_run_id=job_metadata.pipeline_run_id,
+                        from_stuff=required_stuff,
+                        to_stuff=item_output_stuff,
+                        pipe_code=self.branch_pipe_code,
+                        pipe_layer=pipe_run_params.pipe_layers,
+                        comment=f"PipeBatch.{method_name}() on required_stuff_list",
+                        as_item_index=branch_index,
+                        is_with_edge=(required_stuff.stuff_name != MAIN_STUFF_NAME),
+                    )
+
+            for branch_index, branch_output_stuff in enumerate(output_stuffs):
+                branch_output_item_code = branch_output_item_codes[branch_index]
+                pipeline_tracker.add_aggregate_step(
+                    pipeline_run_id=job_metadata.pipeline_run_id,
+                    from_stuff=branch_output_stuff,
+                    to_stuff=output_stuff,
+                    pipe_layer=pipe_run_params.pipe_layers,
+                    comment=f"PipeBatch.{method_name}() on branch_index of batch",
                 )
-
-        for branch_index, branch_output_stuff in enumerate(output_stuffs):
-            branch_output_item_code = branch_output_item_codes[branch_index]
-            get_pipeline_tracker().add_aggregate_step(
-                from_stuff=branch_output_stuff,
-                to_stuff=output_stuff,
-                pipe_layer=pipe_run_params.pipe_layers,
-                comment=f"PipeBatch.{method_name}() on branch_index of batch",
-            )
 
         working_memory.set_new_main_stuff(
             stuff=output_stuff,
@@ -1,5 +1,6 @@
 from typing import Literal
 
+from pydantic import Field
 from typing_extensions import override
 
 from pipelex.core.pipes.pipe_blueprint import PipeBlueprint
@@ -11,6 +12,7 @@ class PipeBatchBlueprint(PipeBlueprint):
     branch_pipe_code: str
     input_list_name: str
     input_item_name: str
+    max_concurrency: int | None = Field(default=None, ge=1)
 
     @property
     @override
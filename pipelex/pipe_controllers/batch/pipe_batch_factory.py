@@ -47,5 +47,6 @@ class PipeBatchFactory(PipeFactoryProtocol[PipeBatchBlueprint, PipeBatch]):
             batch_params=BatchParams.make_batch_params(
                 input_list_name=blueprint.input_list_name,
                 input_item_name=blueprint.input_item_name,
+                max_concurrency=blueprint.max_concurrency,
             ),
         )
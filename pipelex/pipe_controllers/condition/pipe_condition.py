@@ -6,6 +6,7 @@ from typing_extensions import override
 
 from pipelex import log
 from pipelex.cogt.templating.template_category import TemplateCategory
+from pipelex.cogt.templating.template_rendering import get_template_required_variables, precompile_template
 from pipelex.config import StaticValidationReaction, get_config
 from pipelex.core.concepts.concept_factory import ConceptFactory
 from pipelex.core.concepts.concept_native import NativeConceptCode
@@ -116,6 +117,10 @@ class PipeCondition(PipeController):
             required_variables.update(get_required_pipe(pipe_code=pipe_code).required_variables())
         return required_variables
 
+    @override
+    def precompile_templates(self) -> None:
+        precompile_template(template=self.applied_expression_template, category=TemplateCategory.EXPRESSION)
+
     def _validate_required_variables(self) -> Self:
         for required_variable_name in self.required_variables():
             if required_variable_name not in self.inputs.variables:
@@ -246,8 +251,9 @@ class PipeCondition(PipeController):
         content_generator = get_content_generator()
 
         # Evaluate the expression using templating
+        required_variables = get_template_required_variables(template=self.applied_expression_template, category=TemplateCategory.EXPRESSION)
         evaluated_expression = await content_generator.make_templated_text(
-            context=working_memory.generate_context(),
+            context=working_memory.make_lazy_context().materialize(names=required_variables),
             template=self.applied_expression_template,
             template_category=TemplateCategory.EXPRESSION,
         )
@@ -317,14 +323,18 @@ class PipeCondition(PipeController):
             raise PipeInputError(message=msg, pipe_code=self.code, variable_name=exc.variable_name, concept_code=None) from exc
 
         # Track condition steps
-        for required_stuff in required_stuffs:
-            get_pipeline_tracker().add_condition_step(
-                from_stuff=required_stuff,
-                to_condition=condition_details,
-                condition_expression=self.expression or self.applied_expression_template,
-                pipe_layer=pipe_run_params.pipe_layers,
-                comment="PipeCondition required for condition",
-            )
+        pipeline_tracker = get_pipeline_tracker()
+        is_tracking = pipeline_tracker.is_tracking(pipeline_run_id=job_metadata.pipeline_run_id)
+        if is_tracking:
+            for required_stuff in required_stuffs:
+                pipeline_tracker.add_condition_step(
+                    pipeline_run_id=job_metadata.pipeline_run_id,
+                    from_stuff=required_stuff,
+                    to_condition=condition_details,
+                    condition_expression=self.expression or self.applied_expression_template,
+                    pipe_layer=pipe_run_params.pipe_layers,
+                    comment="PipeCondition required for condition",
+                )
 
         # Execute the chosen pipe
         log.verbose(f"Chosen pipe: {chosen_pipe.code}")
@@ -339,12 +349,14 @@ class PipeCondition(PipeController):
         )
 
         # Track choice step
-        get_pipeline_tracker().add_choice_step(
-            from_condition=condition_details,
-            to_stuff=pipe_output.main_stuff,
-            pipe_layer=pipe_run_params.pipe_layers,
-            comment="PipeCondition chosen pipe",
-        )
+        if is_tracking:
+            pipeline_tracker.add_choice_step(
+                pipeline_run_id=job_metadata.pipeline_run_id,
+                from_condition=condition_details,
+                to_stuff=pipe_output.main_stuff,
+                pipe_layer=pipe_run_params.pipe_layers,
+                comment="PipeCondition chosen pipe",
+            )
         return pipe_output
 
     @override
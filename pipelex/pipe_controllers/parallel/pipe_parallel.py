@@ -191,8 +191,8 @@ class PipeParallel(PipeController):
                 sub_pipe.run_pipe(
                     calling_pipe_code=self.code,
                     job_metadata=job_metadata,
-                    working_memory=working_memory.make_deep_copy(),
-                    sub_pipe_run_params=pipe_run_params.make_deep_copy(),
+                    working_memory=working_memory.make_branch_copy(),
+                    sub_pipe_run_params=pipe_run_params.make_branch_copy(),
                 ),
             )
 
@@ -234,13 +234,16 @@ class PipeParallel(PipeController):
                 stuff=combined_output_stuff,
                 name=output_name,
             )
-            for stuff in output_stuffs.values():
-                get_pipeline_tracker().add_aggregate_step(
-                    from_stuff=stuff,
-                    to_stuff=combined_output_stuff,
-                    pipe_layer=pipe_run_params.pipe_layers,
-                    comment="PipeParallel on output_stuffs",
-                )
+            pipeline_tracker = get_pipeline_tracker()
+            if pipeline_tracker.is_tracking(pipeline_run_id=job_metadata.pipeline_run_id):
+                for stuff in output_stuffs.values():
+                    pipeline_tracker.add_aggregate_step(
+                        pipeline_run_id=job_metadata.pipeline_run_id,
+                        from_stuff=stuff,
+                        to_stuff=combined_output_stuff,
+                        pipe_layer=pipe_run_params.pipe_layers,
+                        comment="PipeParallel on output_stuffs",
+                    )
         return PipeOutput(
             working_memory=working_memory,
             pipeline_run_id=job_metadata.pipeline_run_id,
@@ -295,8 +298,8 @@ class PipeParallel(PipeController):
                 sub_pipe.run_pipe(
                     calling_pipe_code=self.code,
                     job_metadata=job_metadata,
-                    working_memory=working_memory.make_deep_copy(),
-                    sub_pipe_run_params=pipe_run_params.make_deep_copy(),
+                    working_memory=working_memory.make_branch_copy(),
+                    sub_pipe_run_params=pipe_run_params.make_branch_copy(),
                 ),
             )
 
@@ -109,9 +109,13 @@ class SubPipe(BaseModel):
                 pipe_run_params=sub_pipe_run_params,
                 output_name=self.output_name,
             )
+            pipeline_tracker = get_pipeline_tracker()
+            if not pipeline_tracker.is_tracking(pipeline_run_id=job_metadata.pipeline_run_id):
+                return pipe_output
             if new_output_stuff := pipe_output.working_memory.get_optional_main_stuff():
                 for stuff in required_stuffs:
-                    get_pipeline_tracker().add_pipe_step(
+                    pipeline_tracker.add_pipe_step(
+                        pipeline_run_id=job_metadata.pipeline_run_id,
                         from_stuff=stuff,
                         to_stuff=new_output_stuff,
                         pipe_code=self.pipe_code,
@@ -7,6 +7,7 @@ from pipelex import log
 from pipelex.cogt.content_generation.content_generator_dry import ContentGeneratorDry
 from pipelex.cogt.content_generation.content_generator_protocol import ContentGeneratorProtocol
 from pipelex.cogt.templating.template_category import TemplateCategory
+from pipelex.cogt.templating.template_rendering import get_template_required_variables, precompile_template
 from pipelex.cogt.templating.templating_style import TemplatingStyle
 from pipelex.config import get_config
 from pipelex.core.concepts.concept import Concept
@@ -103,6 +104,10 @@ class PipeCompose(PipeOperator[PipeComposeOutput]):
             if not variable_name.startswith("_") and variable_name not in ("preliminary_text", "place_holder")
         }
 
+    @override
+    def precompile_templates(self) -> None:
+        precompile_template(template=self.template, category=self.category)
+
     @override
     async def _run_operator_pipe(
         self,
@@ -117,7 +122,8 @@ class PipeCompose(PipeOperator[PipeComposeOutput]):
             msg = f"PipeCompose does not suppport multiple outputs, got output_multiplicity = {pipe_run_params.output_multiplicity}"
             raise PipeRunParamsError(msg)
 
-        context: dict[str, Any] = working_memory.generate_context()
+        required_variables = get_template_required_variables(template=self.template, category=self.category)
+        context: dict[str, Any] = working_memory.make_lazy_context().materialize(names=required_variables)
         if pipe_run_params:
             context.update(**pipe_run_params.params)
         if self.extra_context:
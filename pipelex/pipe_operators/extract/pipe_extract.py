@@ -215,8 +215,11 @@ class PipeExtract(PipeOperator[PipeExtractOutput]):
                     needs_to_generate_page_views = False
 
                 if needs_to_generate_page_views:
-                    page_views = await pypdfium2_renderer.render_pdf_pages_from_uri(pdf_uri=pdf_uri, dpi=self.page_views_dpi)
-                    page_view_contents = [ImageContent.make_from_image(image=img) for img in page_views]
+                    # encode each page view as soon as it's rendered, while the next pages are still rendering
+                    page_view_contents = [
+                        ImageContent.make_from_image(image=img)
+                        async for img in pypdfium2_renderer.iter_pdf_pages_from_uri(pdf_uri=pdf_uri, dpi=self.page_views_dpi)
+                    ]
             elif image_uri:
                 page_view_contents = [ImageContent(url=image_uri)]
 
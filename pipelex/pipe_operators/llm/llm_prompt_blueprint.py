@@ -8,11 +8,12 @@ from pipelex.cogt.image.prompt_image_factory import PromptImageFactory
 from pipelex.cogt.llm.llm_prompt import LLMPrompt
 from pipelex.cogt.templating.template_blueprint import TemplateBlueprint
 from pipelex.cogt.templating.template_preprocessor import preprocess_template
+from pipelex.cogt.templating.template_rendering import get_template_required_variables, precompile_template
 from pipelex.cogt.templating.templating_style import TemplatingStyle
 from pipelex.core.stuffs.image_content import ImageContent
 from pipelex.hub import get_content_generator
 from pipelex.tools.jinja2.jinja2_required_variables import detect_jinja2_required_variables
-from pipelex.tools.misc.context_provider_abstract import ContextProviderAbstract, ContextProviderException
+from pipelex.tools.misc.context_provider_abstract import ContextProviderAbstract, ContextProviderException, LazyContext
 from pipelex.tools.misc.dict_utils import substitute_nested_in_context
 
 if TYPE_CHECKING:
@@ -28,6 +29,12 @@ class LLMPromptBlueprint(BaseModel):
     def validate_with_libraries(self):
         pass
 
+    def precompile_templates(self):
+        if self.prompt_blueprint:
+            precompile_template(template=self.prompt_blueprint.template, category=self.prompt_blueprint.category)
+        if self.system_prompt_blueprint:
+            precompile_template(template=self.system_prompt_blueprint.template, category=self.system_prompt_blueprint.category)
+
     def required_variables(self) -> set[str]:
         required_variables: set[str] = set()
         if self.user_images:
@@ -127,10 +134,12 @@ class LLMPromptBlueprint(BaseModel):
             for image_index, image_name in enumerate(image_names):
                 # Replacing image variable '{image_name}' with numbered tag '[Image {image_index + 1}]'
                 extra_params[image_name] = f"[Image {image_index + 1}]"
+        # the artefacts of the stuffs are only made for the variables of the templates, once for both prompts
+        lazy_context = context_provider.make_lazy_context()
         user_text: str | None = None
         if self.prompt_blueprint:
             user_text = await self._unravel_text(
-                context_provider=context_provider,
+                lazy_context=lazy_context,
                 jinja2_blueprint=self.prompt_blueprint,
                 extra_params=extra_params,
             )
@@ -149,7 +158,7 @@ class LLMPromptBlueprint(BaseModel):
         system_text: str | None = None
         if self.system_prompt_blueprint:
             system_text = await self._unravel_text(
-                context_provider=context_provider,
+                lazy_context=lazy_context,
                 jinja2_blueprint=self.system_prompt_blueprint,
                 extra_params=extra_params,
             )
@@ -165,7 +174,7 @@ class LLMPromptBlueprint(BaseModel):
 
     async def _unravel_text(
         self,
-        context_provider: ContextProviderAbstract,
+        lazy_context: LazyContext,
         jinja2_blueprint: TemplateBlueprint,
         extra_params: dict[str, Any] | None = None,
     ) -> str:
@@ -173,7 +182,8 @@ class LLMPromptBlueprint(BaseModel):
             jinja2_blueprint.templating_style = templating_style
             log.verbose(f"Setting prompting style to {templating_style}")
 
-        context: dict[str, Any] = context_provider.generate_context()
+        required_variables = get_template_required_variables(template=jinja2_blueprint.template, category=jinja2_blueprint.category)
+        context: dict[str, Any] = lazy_context.materialize(names=required_variables)
         if extra_params:
             context = substitute_nested_in_context(context=context, extra_params=extra_params)
         if jinja2_blueprint.extra_context:
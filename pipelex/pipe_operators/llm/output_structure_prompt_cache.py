@@ -0,0 +1,116 @@
+from typing import Any, NamedTuple
+
+from pydantic import BaseModel
+
+from pipelex import log
+from pipelex.cogt.templating.template_category import TemplateCategory
+from pipelex.cogt.templating.template_rendering import render_template
+from pipelex.config import get_config
+from pipelex.core.concepts.concept import Concept
+from pipelex.core.stuffs.stuff_content import StuffContent
+from pipelex.hub import get_class_registry, get_required_concept
+from pipelex.tools.typing.structure_printer import StructurePrinter
+
+
+class ClassStructureEntry(NamedTuple):
+    concept: Concept
+    output_class: type[Any] | None
+    class_structure_str: str | None
+
+
+class OutputStructurePromptEntry(NamedTuple):
+    concept: Concept
+    output_class: type[Any] | None
+    output_structure_prompt: str | None
+
+
+class OutputStructurePromptCacheStats(BaseModel):
+    hits: int
+    misses: int
+    size: int
+
+    @property
+    def desc(self) -> str:
+        return f"{self.hits} hits, {self.misses} misses, {self.size} output structure prompts"
+
+
+class OutputStructurePromptCache:
+    """Per-concept cache of the output structure prompts of the PipeLLM pipes.
+
+    The prompt only depends on the structure class of the output concept and on whether a preliminary text is generated,
+    so the structure class is walked and the prompt rendered once per concept, instead of on every LLM call.
+    Entries remember the concept and the structure class they were made from: when a concept or its structure class
+    is registered again, its entries are made again on their next lookup.
+    """
+
+    def __init__(self):
+        self._class_structures: dict[str, ClassStructureEntry] = {}
+        self._output_structure_prompts: dict[tuple[str, bool], OutputStructurePromptEntry] = {}
+        self._hits = 0
+        self._misses = 0
+
+    def teardown(self):
+        if self._hits or self._misses:
+            log.verbose(f"Output structure prompt cache: {self.stats.desc}")
+        self._class_structures.clear()
+        self._output_structure_prompts.clear()
+        self._hits = 0
+        self._misses = 0
+
+    @property
+    def stats(self) -> OutputStructurePromptCacheStats:
+        return OutputStructurePromptCacheStats(hits=self._hits, misses=self._misses, size=len(self._output_structure_prompts))
+
+    def get_class_structure_str(self, concept: Concept) -> str | None:
+        """Get the structure of the concept's structure class, as printed in the output structure prompt.
+
+        This is the costly part of the prompt, and it can be computed ahead of the runs, when loading the libraries.
+        """
+        output_class = get_class_registry().get_class(concept.structure_class_name)
+        entry = self._class_structures.get(concept.concept_string)
+        if entry is not None and entry.concept is concept and entry.output_class is output_class:
+            return entry.class_structure_str
+
+        class_structure_str: str | None = None
+        if output_class:
+            if class_structure := StructurePrinter().get_type_structure(tp=output_class, base_class=StuffContent):
+                class_structure_str = "\n".join(class_structure)
+        self._class_structures[concept.concept_string] = ClassStructureEntry(
+            concept=concept,
+            output_class=output_class,
+            class_structure_str=class_structure_str,
+        )
+        return class_structure_str
+
+    async def get_output_structure_prompt(self, concept_string: str, is_with_preliminary_text: bool) -> str | None:
+        concept = get_required_concept(concept_string=concept_string)
+        output_class = get_class_registry().get_class(concept.structure_class_name)
+        prompt_key = (concept_string, is_with_preliminary_text)
+        entry = self._output_structure_prompts.get(prompt_key)
+        if entry is not None and entry.concept is concept and entry.output_class is output_class:
+            self._hits += 1
+            return entry.output_structure_prompt
+        self._misses += 1
+
+        output_structure_prompt: str | None = None
+        if class_structure_str := self.get_class_structure_str(concept=concept):
+            llm_config = get_config().cogt.llm_config
+            if is_with_preliminary_text:
+                template_source = llm_config.get_template(template_name="output_structure_prompt")
+            else:
+                template_source = llm_config.get_template(template_name="output_structure_prompt_no_preliminary_text")
+            # rendered directly rather than by the content generator, so that a dry run doesn't cache a placeholder
+            output_structure_prompt = await render_template(
+                template=template_source,
+                category=TemplateCategory.LLM_PROMPT,
+                context={"class_structure_str": class_structure_str},
+            )
+        self._output_structure_prompts[prompt_key] = OutputStructurePromptEntry(
+            concept=concept,
+            output_class=output_class,
+            output_structure_prompt=output_structure_prompt,
+        )
+        return output_structure_prompt
+
+
+output_structure_prompt_cache = OutputStructurePromptCache()
@@ -10,9 +10,9 @@ from pipelex.cogt.exceptions import LLMCompletionError
 from pipelex.cogt.llm.llm_prompt import LLMPrompt
 from pipelex.cogt.llm.llm_prompt_factory_abstract import LLMPromptFactoryAbstract
 from pipelex.cogt.llm.llm_prompt_template import LLMPromptTemplate
+from pipelex.cogt.llm.llm_response_cache import llm_response_cache_scope
 from pipelex.cogt.llm.llm_setting import LLMModelChoice, LLMSetting, LLMSettingChoices
 from pipelex.cogt.models.model_deck_check import check_llm_choice_with_deck
-from pipelex.cogt.templating.template_category import TemplateCategory
 from pipelex.config import StaticValidationReaction, get_config
 from pipelex.core.concepts.concept_factory import ConceptFactory
 from pipelex.core.concepts.concept_native import NativeConceptCode
@@ -37,6 +37,7 @@ from pipelex.hub import (
     get_required_concept,
 )
 from pipelex.pipe_operators.llm.llm_prompt_blueprint import LLMPromptBlueprint
+from pipelex.pipe_operators.llm.output_structure_prompt_cache import output_structure_prompt_cache
 from pipelex.pipe_operators.llm.pipe_llm_blueprint import StructuringMethod
 from pipelex.pipe_operators.pipe_operator import PipeOperator
 from pipelex.pipe_run.pipe_run_params import (
@@ -46,7 +47,7 @@ from pipelex.pipe_run.pipe_run_params import (
 )
 from pipelex.pipeline.exceptions import PipeRunError
 from pipelex.pipeline.job_metadata import JobMetadata
-from pipelex.tools.typing.structure_printer import StructurePrinter
+from pipelex.pipeline.pipeline_text_stream import PipelineTextChunk, PipelineTextChunkQueue, get_pipeline_text_chunk_queue
 from pipelex.types import Self
 
 
@@ -60,6 +61,7 @@ class PipeLLM(PipeOperator[PipeLLMOutput]):
     llm_choices: LLMSettingChoices | None = None
     structuring_method: StructuringMethod | None = None
     output_multiplicity: VariableMultiplicity | None = None
+    is_response_cache_enabled: bool | None = None
 
     @model_validator(mode="after")
     def _validate_inputs(self) -> Self:
@@ -110,6 +112,12 @@ class PipeLLM(PipeOperator[PipeLLMOutput]):
         """Required variables are the variables that are used in the current prompt template or system prompt"""
         return {variable_name for variable_name in self.llm_prompt_spec.required_variables() if not variable_name.startswith("_")}
 
+    @override
+    def precompile_templates(self) -> None:
+        self.llm_prompt_spec.precompile_templates()
+        if get_config().cogt.llm_config.is_structure_prompt_enabled and self.output.structure_class_name != "TextContent":
+            output_structure_prompt_cache.get_class_structure_str(concept=self.output)
+
     def validate_inputs(self):
         static_validation_config = get_config().pipelex.static_validation_config
         default_reaction = static_validation_config.default_reaction
@@ -240,6 +248,11 @@ class PipeLLM(PipeOperator[PipeLLMOutput]):
             is_with_preliminary_text=is_with_preliminary_text,
         )
 
+        # The setting of this PipeLLM takes precedence over the setting of the run, which takes precedence over the config
+        is_response_cache_enabled = (
+            self.is_response_cache_enabled if self.is_response_cache_enabled is not None else pipe_run_params.is_llm_response_cache_enabled
+        )
+
         # TODO: we need a better solution for structuring_method (text then object), meanwhile,
         # we acknowledge the code here with llm_prompt_1 and llm_prompt_2 is overly complex and should be refactored.
 
@@ -252,11 +265,22 @@ class PipeLLM(PipeOperator[PipeLLMOutput]):
                 extra_params=llm_prompt_run_params.params,
             )
             try:
-                generated_text: str = await content_generator.make_llm_text(
-                    job_metadata=job_metadata,
-                    llm_prompt_for_text=llm_prompt_1_for_text,
-                    llm_setting_main=llm_setting_main,
-                )
+                generated_text: str
+                with llm_response_cache_scope(is_enabled=is_response_cache_enabled):
+                    if text_chunk_queue := get_pipeline_text_chunk_queue():
+                        generated_text = await self._llm_stream_text(
+                            job_metadata=job_metadata,
+                            llm_prompt_for_text=llm_prompt_1_for_text,
+                            llm_setting_main=llm_setting_main,
+                            content_generator=content_generator,
+                            text_chunk_queue=text_chunk_queue,
+                        )
+                    else:
+                        generated_text = await content_generator.make_llm_text(
+                            job_metadata=job_metadata,
+                            llm_prompt_for_text=llm_prompt_1_for_text,
+                            llm_setting_main=llm_setting_main,
+                        )
             except LLMCompletionError as exc:
                 location = self._format_error_location(pipe_run_params=pipe_run_params)
                 msg = f"Error generating text with LLM {location}: {exc}"
@@ -302,18 +326,19 @@ class PipeLLM(PipeOperator[PipeLLMOutput]):
                 output_structure_prompt=output_structure_prompt,
                 extra_params=llm_prompt_run_params.params,
             )
-            the_content = await self._llm_gen_object_stuff_content(
-                job_metadata=job_metadata,
-                pipe_run_params=pipe_run_params,
-                is_multiple_output=is_multiple_output,
-                fixed_nb_output=fixed_nb_output,
-                output_class_name=output_concept.structure_class_name,
-                llm_setting_main=llm_setting_main,
-                llm_setting_for_object=llm_setting_for_object,
-                llm_prompt_1=llm_prompt_1_for_object,
-                llm_prompt_2_factory=llm_prompt_2_factory,
-                content_generator=content_generator,
-            )
+            with llm_response_cache_scope(is_enabled=is_response_cache_enabled):
+                the_content = await self._llm_gen_object_stuff_content(
+                    job_metadata=job_metadata,
+                    pipe_run_params=pipe_run_params,
+                    is_multiple_output=is_multiple_output,
+                    fixed_nb_output=fixed_nb_output,
+                    output_class_name=output_concept.structure_class_name,
+                    llm_setting_main=llm_setting_main,
+                    llm_setting_for_object=llm_setting_for_object,
+                    llm_prompt_1=llm_prompt_1_for_object,
+                    llm_prompt_2_factory=llm_prompt_2_factory,
+                    content_generator=content_generator,
+                )
 
         output_stuff = StuffFactory.make_stuff(
             name=output_name,
@@ -331,6 +356,25 @@ class PipeLLM(PipeOperator[PipeLLMOutput]):
             pipeline_run_id=job_metadata.pipeline_run_id,
         )
 
+    async def _llm_stream_text(
+        self,
+        job_metadata: JobMetadata,
+        llm_prompt_for_text: LLMPrompt,
+        llm_setting_main: LLMSetting,
+        content_generator: ContentGeneratorProtocol,
+        text_chunk_queue: PipelineTextChunkQueue,
+    ) -> str:
+        """Generate the text while forwarding its chunks to the stream of the pipeline run."""
+        text_chunks: list[str] = []
+        async for text_chunk in content_generator.make_llm_text_stream(
+            job_metadata=job_metadata,
+            llm_prompt_for_text=llm_prompt_for_text,
+            llm_setting_main=llm_setting_main,
+        ):
+            text_chunks.append(text_chunk)
+            text_chunk_queue.put_nowait(PipelineTextChunk(pipeline_run_id=job_metadata.pipeline_run_id, pipe_code=self.code, text=text_chunk))
+        return "".join(text_chunks)
+
     async def _llm_gen_object_stuff_content(
         self,
         job_metadata: JobMetadata,
@@ -456,26 +500,7 @@ class PipeLLM(PipeOperator[PipeLLMOutput]):
 
     @staticmethod
     async def get_output_structure_prompt(concept_string: str, is_with_preliminary_text: bool) -> str | None:
-        concept = get_required_concept(concept_string=concept_string)
-        output_class = get_class_registry().get_class(concept.structure_class_name)
-        if not output_class:
-            return None
-
-        class_structure = StructurePrinter().get_type_structure(tp=output_class, base_class=StuffContent)
-
-        if not class_structure:
-            return None
-        class_structure_str = "\n".join(class_structure)
-        llm_config = get_config().cogt.llm_config
-        if is_with_preliminary_text:
-            template_source = llm_config.get_template(template_name="output_structure_prompt")
-        else:
-            template_source = llm_config.get_template(template_name="output_structure_prompt_no_preliminary_text")
-
-        return await get_content_generator().make_templated_text(
-            context={
-                "class_structure_str": class_structure_str,
-            },
-            template=template_source,
-            template_category=TemplateCategory.LLM_PROMPT,
+        return await output_structure_prompt_cache.get_output_structure_prompt(
+            concept_string=concept_string,
+            is_with_preliminary_text=is_with_preliminary_text,
         )
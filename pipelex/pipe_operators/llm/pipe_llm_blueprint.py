@@ -21,3 +21,4 @@ class PipeLLMBlueprint(PipeBlueprint):
     prompt: str | None = None
 
     structuring_method: StructuringMethod | None = None
+    is_response_cache_enabled: bool | None = None
@@ -128,4 +128,5 @@ class PipeLLMFactory(PipeFactoryProtocol[PipeLLMBlueprint, PipeLLM]):
             llm_choices=llm_choices,
             structuring_method=blueprint.structuring_method,
             output_multiplicity=output_multiplicity,
+            is_response_cache_enabled=blueprint.is_response_cache_enabled,
         )
@@ -43,10 +43,9 @@ class PipeOperator(PipeAbstract, Generic[PipeOperatorOutputType]):
         )
         job_metadata.update(updated_metadata=updated_metadata)
 
-        pipe_run_info = self._format_pipe_run_info(pipe_run_params=pipe_run_params)
-        # log.info(pipe_run_info)
-        if pipe_run_params.run_mode == PipeRunMode.LIVE:
-            log.info(pipe_run_info)
+        output_verbosity = pipe_run_params.output_verbosity
+        if pipe_run_params.run_mode == PipeRunMode.LIVE and output_verbosity.is_pipe_run_info_logged:
+            log.info(self._format_pipe_run_info(pipe_run_params=pipe_run_params))
         try:
             match pipe_run_params.run_mode:
                 case PipeRunMode.LIVE:
@@ -56,18 +55,19 @@ class PipeOperator(PipeAbstract, Generic[PipeOperatorOutputType]):
                         pipe_run_params=pipe_run_params,
                         output_name=output_name,
                     )
-                    main_stuff = pipe_output.main_stuff
-                    output_concept_code = self.output.code
-                    output_concept_with_multiplicity = f"[bold green]{output_concept_code}[/bold green]"
-                    if main_stuff.is_list:
-                        list_content: ListContent[StuffContent] = main_stuff.as_list_content()  # pyright: ignore[reportUnknownVariableType, reportUnknownMemberType]
-                        nb_items = len(list_content.items)
-                        if nb_items == 1:
-                            output_concept_with_multiplicity += " [1 item]"
-                        else:
-                            output_concept_with_multiplicity += f" [{nb_items} items]"
-                    title = f"Output of pipe [red]{self.code}[/red] [yellow]→[/yellow] {output_concept_with_multiplicity}"
-                    main_stuff.pretty_print_stuff(title=title)
+                    if output_verbosity.is_output_printed:
+                        main_stuff = pipe_output.main_stuff
+                        output_concept_code = self.output.code
+                        output_concept_with_multiplicity = f"[bold green]{output_concept_code}[/bold green]"
+                        if main_stuff.is_list:
+                            list_content: ListContent[StuffContent] = main_stuff.as_list_content()  # pyright: ignore[reportUnknownVariableType, reportUnknownMemberType]
+                            nb_items = len(list_content.items)
+                            if nb_items == 1:
+                                output_concept_with_multiplicity += " [1 item]"
+                            else:
+                                output_concept_with_multiplicity += f" [{nb_items} items]"
+                        title = f"Output of pipe [red]{self.code}[/red] [yellow]→[/yellow] {output_concept_with_multiplicity}"
+                        main_stuff.pretty_print_stuff(title=title)
                 case PipeRunMode.DRY:
                     pipe_output = await self._dry_run_operator_pipe(
                         job_metadata=job_metadata,
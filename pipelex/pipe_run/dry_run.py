@@ -1,24 +1,28 @@
-import asyncio
-import functools
 import time
-from concurrent.futures import ThreadPoolExecutor
 
 from pydantic import BaseModel
 
 from pipelex import log
 from pipelex.config import get_config
+from pipelex.core.memory.working_memory import WorkingMemory
 from pipelex.core.memory.working_memory_factory import WorkingMemoryFactory
 from pipelex.core.pipes.input_requirements import InputRequirements, TypedNamedInputRequirement
 from pipelex.core.pipes.pipe_abstract import PipeAbstract
+from pipelex.core.pipes.variable_multiplicity import VariableMultiplicity
 from pipelex.core.stuffs.stuff_content import StuffContent
 from pipelex.core.stuffs.text_content import TextContent
 from pipelex.hub import get_class_registry
+from pipelex.pipe_run.dry_run_cache import dry_run_cache
 from pipelex.pipe_run.pipe_run_params import PipeRunMode
 from pipelex.pipe_run.pipe_run_params_factory import PipeRunParamsFactory
 from pipelex.pipeline.exceptions import PipeStackOverflowError
 from pipelex.pipeline.job_metadata import JobMetadata
+from pipelex.pipeline.pipeline_text_stream import pipeline_text_chunk_queue_var
+from pipelex.tools.misc.async_utils import gather_with_max_concurrency
 from pipelex.types import StrEnum
 
+NB_SLOWEST_DRY_RUNS_TO_LOG = 5
+
 
 class DryRunError(Exception):
     """Raised when a dry run fails due to missing inputs or other validation issues."""
@@ -41,16 +45,54 @@ class DryRunOutput(BaseModel):
     pipe_code: str
     status: DryRunStatus
     error_message: str | None = None
+    duration_seconds: float | None = None
+    is_from_cache: bool = False
+
+
+DryRunInputsKey = tuple[tuple[str, str, type[StuffContent], VariableMultiplicity | None], ...]
+
+
+class DryRunWorkingMemories:
+    """Mock working memories of the dry runs, shared between the pipes with the same needed inputs.
+
+    The mock stuffs of each set of needed inputs are made once, and each dry run gets a copy-on-write
+    branch of the working memory holding them, so the pipe's outputs are not seen by the other pipes.
+    """
 
+    def __init__(self):
+        self._working_memories: dict[DryRunInputsKey, WorkingMemory] = {}
 
-async def dry_run_pipe(pipe: PipeAbstract, raise_on_failure: bool = False) -> DryRunOutput:
+    def get_working_memory(self, needed_inputs: list[TypedNamedInputRequirement]) -> WorkingMemory:
+        inputs_key: DryRunInputsKey = tuple(
+            (requirement.variable_name, requirement.concept.concept_string, requirement.structure_class, requirement.multiplicity)
+            for requirement in needed_inputs
+        )
+        working_memory = self._working_memories.get(inputs_key)
+        if working_memory is None:
+            working_memory = WorkingMemoryFactory.make_for_dry_run(needed_inputs=needed_inputs)
+            self._working_memories[inputs_key] = working_memory
+        return working_memory.make_branch_copy()
+
+
+async def dry_run_pipe(
+    pipe: PipeAbstract,
+    raise_on_failure: bool = False,
+    working_memories: DryRunWorkingMemories | None = None,
+) -> DryRunOutput:
     """Dry run a single pipe directly without parallelization."""
+    start_time = time.perf_counter()
     allowed_to_fail_pipes = get_config().pipelex.dry_run_config.allowed_to_fail_pipes
+    # the dry run runs on the caller's event loop: keep it out of the text stream of a pipeline run by the caller
+    queue_token = pipeline_text_chunk_queue_var.set(None)
     # TODO: fail and raise properly
     try:
         needed_inputs_for_factory = _convert_to_working_memory_format(needed_inputs_spec=pipe.needed_inputs())
 
-        working_memory = WorkingMemoryFactory.make_for_dry_run(needed_inputs=needed_inputs_for_factory)
+        working_memory: WorkingMemory
+        if working_memories:
+            working_memory = working_memories.get_working_memory(needed_inputs=needed_inputs_for_factory)
+        else:
+            working_memory = WorkingMemoryFactory.make_for_dry_run(needed_inputs=needed_inputs_for_factory)
         pipe.validate_with_libraries()
         await pipe.run_pipe(
             job_metadata=JobMetadata(job_name=f"dry_run_{pipe.code}"),
@@ -58,33 +100,44 @@ async def dry_run_pipe(pipe: PipeAbstract, raise_on_failure: bool = False) -> Dr
             pipe_run_params=PipeRunParamsFactory.make_run_params(pipe_run_mode=PipeRunMode.DRY),
         )
     except PipeStackOverflowError as exc:
+        duration_seconds = time.perf_counter() - start_time
         if pipe.code in allowed_to_fail_pipes:
             error_message = f"Allowed to fail dry run for pipe '{pipe.code}': {exc}"
-            return DryRunOutput(pipe_code=pipe.code, status=DryRunStatus.FAILURE, error_message=error_message)
+            return DryRunOutput(pipe_code=pipe.code, status=DryRunStatus.FAILURE, error_message=error_message, duration_seconds=duration_seconds)
         elif raise_on_failure:
             raise
 
         error_message = f"Dry run failed for pipe '{pipe.code}': {exc}"
-        return DryRunOutput(pipe_code=pipe.code, status=DryRunStatus.FAILURE, error_message=error_message)
+        return DryRunOutput(pipe_code=pipe.code, status=DryRunStatus.FAILURE, error_message=error_message, duration_seconds=duration_seconds)
+    finally:
+        pipeline_text_chunk_queue_var.reset(queue_token)
     log.dev(f"✅ Pipe '{pipe.code}' dry run completed successfully")
-    return DryRunOutput(pipe_code=pipe.code, status=DryRunStatus.SUCCESS)
+    return DryRunOutput(pipe_code=pipe.code, status=DryRunStatus.SUCCESS, duration_seconds=time.perf_counter() - start_time)
 
 
-async def dry_run_pipes(pipes: list[PipeAbstract], run_in_parallel: bool = True, raise_on_failure: bool = True) -> dict[str, DryRunOutput]:
+async def dry_run_pipes(
+    pipes: list[PipeAbstract],
+    run_in_parallel: bool = True,
+    raise_on_failure: bool = True,
+    is_incremental: bool = False,
+) -> dict[str, DryRunOutput]:
     """Dry run pipes with optional parallelization.
 
     Args:
         pipes: List of pipes to dry run
-        run_in_parallel: If True, run pipes in parallel using ThreadPoolExecutor. If False, run sequentially.
+        run_in_parallel: If True, run pipes concurrently as tasks on the current event loop,
+            at most dry_run_config.max_concurrency at a time. If False, run sequentially.
         raise_on_failure: If True, raise an exception if any pipe fails.
+        is_incremental: If True, the pipes whose definition and dependencies are unchanged since their last
+            successful dry run are only validated with the libraries, and not dry run again (see DryRunCache).
 
     For each pipe, this method:
     1. Gets the pipe's needed inputs
-    2. Creates mock working memory using WorkingMemoryFactory.make_for_dry_run
+    2. Creates mock working memory using WorkingMemoryFactory.make_for_dry_run, shared by the pipes with the same needed inputs
     3. Runs the pipe in dry mode
 
     Returns:
-        Dict mapping pipe codes to their dry run status ("SUCCESS" or error message)
+        Dict mapping pipe codes to their dry run output, with its status and duration
 
     Raises:
         DryRunError: If raise_on_failure is True and any pipe fails.
@@ -92,39 +145,42 @@ async def dry_run_pipes(pipes: list[PipeAbstract], run_in_parallel: bool = True,
     """
     start_time = time.time()
     results: dict[str, DryRunOutput] = {}
-    allowed_to_fail_pipes = get_config().pipelex.dry_run_config.allowed_to_fail_pipes
+    dry_run_config = get_config().pipelex.dry_run_config
+    allowed_to_fail_pipes = dry_run_config.allowed_to_fail_pipes
+    working_memories = DryRunWorkingMemories()
+
+    fingerprints: dict[str, str | None] = {}
+    pipes_to_dry_run: list[PipeAbstract] = pipes
+    if is_incremental and dry_run_cache.is_enabled:
+        fingerprints = dry_run_cache.make_fingerprints(pipes=pipes)
+        pipes_to_dry_run = []
+        for pipe in pipes:
+            fingerprint = fingerprints[pipe.code]
+            if fingerprint and dry_run_cache.is_validated(fingerprint=fingerprint):
+                pipe.validate_with_libraries()
+                results[pipe.code] = DryRunOutput(pipe_code=pipe.code, status=DryRunStatus.SUCCESS, is_from_cache=True)
+            else:
+                pipes_to_dry_run.append(pipe)
+        if results:
+            log.dev(f"{len(results)} pipes unchanged since their last successful dry run, {len(pipes_to_dry_run)} pipes to dry run")
 
+    dry_run_outputs: list[DryRunOutput]
     if run_in_parallel:
-
-        def run_pipe_in_thread(pipe: PipeAbstract) -> DryRunOutput:
-            """Parallel execution using ThreadPoolExecutor"""
-            loop = asyncio.new_event_loop()
-            asyncio.set_event_loop(loop)
-            try:
-                return loop.run_until_complete(dry_run_pipe(pipe, raise_on_failure=raise_on_failure))
-            finally:
-                loop.close()
-
-        with ThreadPoolExecutor() as executor:
-            futures = [asyncio.get_running_loop().run_in_executor(executor, functools.partial(run_pipe_in_thread, pipe)) for pipe in pipes]
-            for future in asyncio.as_completed(futures):
-                try:
-                    output = await future
-                    results[output.pipe_code] = output
-                except Exception as exc:
-                    # If raise_on_failure is True, re-raise the first exception encountered
-                    # Otherwise, this shouldn't happen as dry_run_pipe should return a DryRunOutput
-                    if raise_on_failure:
-                        # Cancel remaining futures
-                        for f in futures:
-                            if not f.done():
-                                f.cancel()
-                        raise
-                    # This path shouldn't normally be reached, but handle it gracefully
-                    log.error(f"Unexpected exception in dry run: {exc}")
+        dry_run_outputs = await gather_with_max_concurrency(
+            [dry_run_pipe(pipe, raise_on_failure=raise_on_failure, working_memories=working_memories) for pipe in pipes_to_dry_run],
+            max_concurrency=dry_run_config.max_concurrency,
+        )
     else:
-        for pipe in pipes:
-            results[pipe.code] = await dry_run_pipe(pipe, raise_on_failure=raise_on_failure)
+        dry_run_outputs = []
+        for pipe in pipes_to_dry_run:
+            dry_run_outputs.append(await dry_run_pipe(pipe, raise_on_failure=raise_on_failure, working_memories=working_memories))
+    for output in dry_run_outputs:
+        results[output.pipe_code] = output
+        if output.status == DryRunStatus.SUCCESS and (fingerprint := fingerprints.get(output.pipe_code)):
+            dry_run_cache.set_validated(fingerprint=fingerprint)
+    if fingerprints and dry_run_outputs:
+        dry_run_cache.evict_disk_entries()
+    results = {pipe.code: results[pipe.code] for pipe in pipes}
 
     successful_pipes: list[str] = []
     failed_pipes: list[str] = []
@@ -141,6 +197,9 @@ async def dry_run_pipes(pipes: list[PipeAbstract], run_in_parallel: bool = True,
         f"Dry run completed: {len(successful_pipes)} successful, {len(failed_pipes)} failed, "
         f"{len(allowed_to_fail_pipes)} allowed to fail, in {time.time() - start_time:.2f} seconds",
     )
+    slowest_outputs = sorted(results.values(), key=lambda output: output.duration_seconds or 0, reverse=True)[:NB_SLOWEST_DRY_RUNS_TO_LOG]
+    if slowest_outputs:
+        log.verbose("Slowest dry runs: " + ", ".join(f"'{output.pipe_code}' ({output.duration_seconds or 0:.2f}s)" for output in slowest_outputs))
     if unexpected_failures:
         unexpected_failures_details = "\n".join([f"'{pipe_code}': {results[pipe_code]}" for pipe_code in unexpected_failures])
         if raise_on_failure:
@@ -0,0 +1,244 @@
+import hashlib
+import inspect
+import json
+import os
+import threading
+from collections import OrderedDict
+from pathlib import Path
+from typing import Any, get_type_hints
+
+from pydantic import BaseModel
+
+from pipelex import log
+from pipelex.config import DryRunCacheConfig
+from pipelex.core.concepts.concept import Concept
+from pipelex.core.pipes.pipe_abstract import PipeAbstract
+from pipelex.hub import get_class_registry, get_models_manager, get_optional_pipe
+from pipelex.pipe_operators.func.pipe_func import PipeFunc
+from pipelex.system.registries.func_registry import func_registry
+
+
+class DryRunCacheStats(BaseModel):
+    hits: int
+    misses: int
+    size: int
+
+    @property
+    def desc(self) -> str:
+        return f"{self.hits} pipes not dry run again, {self.misses} dry run, {self.size} successful dry runs in memory"
+
+
+class DryRunCache:
+    """Cache of the successful dry runs, for the incremental validation.
+
+    Each pipe gets a fingerprint hashing its definition, the concepts it depends on (with the schema of their
+    structure class), the function it runs for a PipeFunc (with its source and return type) and the fingerprints
+    of the pipes it depends on, transitively, along with the pipelex version, the dry run config, the model deck
+    and the specs of its backends. A pipe whose fingerprint has already been dry run successfully is not dry run
+    again, so only the pipes whose definition or dependencies changed are checked again. The pipes that are part
+    of a dependency cycle get no fingerprint and are always dry run.
+    """
+
+    def __init__(self):
+        self._config: DryRunCacheConfig | None = None
+        self._salt = ""
+        self._fingerprints: OrderedDict[str, None] = OrderedDict()
+        self._lock = threading.Lock()
+        self._hits = 0
+        self._misses = 0
+
+    def setup(self, config: DryRunCacheConfig, package_version: str, dry_run_settings: dict[str, Any]):
+        self._config = config
+        self._salt = json.dumps([package_version, dry_run_settings], sort_keys=True)
+
+    def teardown(self):
+        if self._hits or self._misses:
+            log.verbose(f"Dry run cache: {self.stats.desc}")
+        with self._lock:
+            self._fingerprints.clear()
+            self._hits = 0
+            self._misses = 0
+        self._config = None
+
+    @property
+    def is_enabled(self) -> bool:
+        return self._config is not None and self._config.is_enabled
+
+    @property
+    def stats(self) -> DryRunCacheStats:
+        return DryRunCacheStats(hits=self._hits, misses=self._misses, size=len(self._fingerprints))
+
+    def make_fingerprints(self, pipes: list[PipeAbstract]) -> dict[str, str | None]:
+        """Make the fingerprints of the pipes, following their pipe and concept dependencies.
+
+        Returns:
+            Dict mapping the pipe codes to their fingerprint, or None for the pipes that can't be fingerprinted
+            because they are part of a dependency cycle or depend on a missing pipe
+
+        """
+        fingerprints: dict[str, str | None] = {}
+        concept_fingerprints: dict[str, str] = {}
+        visiting: set[str] = set()
+        models_digest = self._make_models_digest()
+
+        def concept_fingerprint(concept: Concept) -> str:
+            fingerprint = concept_fingerprints.get(concept.concept_string)
+            if fingerprint is None:
+                structure_schema: dict[str, Any] | None = None
+                structure_class = get_class_registry().get_class(name=concept.structure_class_name)
+                if isinstance(structure_class, type) and issubclass(structure_class, BaseModel):
+                    structure_schema = structure_class.model_json_schema()
+                fingerprint_source = json.dumps([concept.model_dump(mode="json"), structure_schema], sort_keys=True, default=str)
+                fingerprint = hashlib.sha256(fingerprint_source.encode()).hexdigest()
+                concept_fingerprints[concept.concept_string] = fingerprint
+            return fingerprint
+
+        def make_pipe_fingerprint(pipe: PipeAbstract) -> str | None:
+            dependency_fingerprints: list[str] = []
+            for dependency_code in sorted(pipe.pipe_dependencies()):
+                dependency_pipe = get_optional_pipe(pipe_code=dependency_code)
+                dependency_fingerprint = pipe_fingerprint(dependency_pipe) if dependency_pipe else None
+                if dependency_fingerprint is None:
+                    return None
+                dependency_fingerprints.append(dependency_fingerprint)
+            fingerprint_source = json.dumps(
+                [
+                    self._salt,
+                    models_digest,
+                    pipe.model_dump(mode="json", serialize_as_any=True),
+                    _make_function_fingerprint(function_name=pipe.function_name) if isinstance(pipe, PipeFunc) else None,
+                    sorted({concept_fingerprint(concept) for concept in pipe.concept_dependencies()}),
+                    dependency_fingerprints,
+                ],
+                sort_keys=True,
+                default=str,
+            )
+            return hashlib.sha256(fingerprint_source.encode()).hexdigest()
+
+        def pipe_fingerprint(pipe: PipeAbstract) -> str | None:
+            if pipe.code in fingerprints:
+                return fingerprints[pipe.code]
+            if pipe.code in visiting:
+                # the pipe is part of a dependency cycle: nothing in the cycle can be fingerprinted
+                return None
+            visiting.add(pipe.code)
+            try:
+                fingerprints[pipe.code] = make_pipe_fingerprint(pipe)
+            finally:
+                visiting.discard(pipe.code)
+            return fingerprints[pipe.code]
+
+        for pipe in pipes:
+            pipe_fingerprint(pipe)
+        return {pipe.code: fingerprints[pipe.code] for pipe in pipes}
+
+    @staticmethod
+    def _make_models_digest() -> str:
+        """Digest the model deck and the specs of its backends, against which the model choices of the pipes are validated."""
+        models_manager = get_models_manager()
+        model_deck = models_manager.get_model_deck()
+        backend_names = sorted({inference_model.backend_name for inference_model in model_deck.inference_models.values()})
+        backends = [
+            # the credentials and the extra config are left out, they don't change what the dry runs check
+            models_manager.get_required_inference_backend(backend_name=backend_name).model_dump(mode="json", exclude={"api_key", "extra_config"})
+            for backend_name in backend_names
+        ]
+        models_source = json.dumps([model_deck.model_dump(mode="json"), backends], sort_keys=True, default=str)
+        return hashlib.sha256(models_source.encode()).hexdigest()
+
+    def is_validated(self, fingerprint: str) -> bool:
+        """Tell whether a pipe with this fingerprint was already dry run successfully, in memory or on disk."""
+        if self._config is None or not self._config.is_enabled:
+            return False
+        with self._lock:
+            if fingerprint in self._fingerprints:
+                self._fingerprints.move_to_end(fingerprint)
+                self._hits += 1
+                return True
+
+        if self._config.is_disk_cache_enabled and self._touch_disk_entry(fingerprint=fingerprint):
+            with self._lock:
+                self._hits += 1
+                self._set_memory_entry(fingerprint=fingerprint)
+            return True
+
+        with self._lock:
+            self._misses += 1
+        return False
+
+    def set_validated(self, fingerprint: str):
+        """Record the successful dry run of a pipe with this fingerprint."""
+        if self._config is None or not self._config.is_enabled:
+            return
+        with self._lock:
+            self._set_memory_entry(fingerprint=fingerprint)
+        if self._config.is_disk_cache_enabled:
+            entry_path = self._entry_path(fingerprint=fingerprint)
+            try:
+                entry_path.parent.mkdir(parents=True, exist_ok=True)
+                entry_path.touch()
+            except OSError as exc:
+                log.verbose(f"Could not write the dry run cache entry '{fingerprint}': {exc}")
+
+    def evict_disk_entries(self):
+        """Remove the least recently used records on disk beyond the configured max number of records."""
+        if self._config is None or not self._config.is_enabled or not self._config.is_disk_cache_enabled:
+            return
+        try:
+            entry_files = sorted(os.scandir(self._config.disk_cache_dir_path), key=lambda entry_file: entry_file.stat().st_mtime)
+            nb_evicted_entries = max(0, len(entry_files) - self._config.max_disk_entries)
+            for entry_file in entry_files[:nb_evicted_entries]:
+                os.remove(entry_file.path)
+        except OSError as exc:
+            log.verbose(f"Could not evict the dry run cache entries: {exc}")
+            return
+        if nb_evicted_entries:
+            log.verbose(f"Evicted {nb_evicted_entries} entries from the dry run cache on disk")
+
+    def _touch_disk_entry(self, fingerprint: str) -> bool:
+        """Touch the record on disk, so that it counts as recently used, and tell whether it exists."""
+        try:
+            os.utime(self._entry_path(fingerprint=fingerprint))
+        except OSError:
+            return False
+        return True
+
+    def _set_memory_entry(self, fingerprint: str):
+        assert self._config is not None
+        self._fingerprints[fingerprint] = None
+        self._fingerprints.move_to_end(fingerprint)
+        while len(self._fingerprints) > self._config.max_memory_entries:
+            self._fingerprints.popitem(last=False)
+
+    def _entry_path(self, fingerprint: str) -> Path:
+        assert self._config is not None
+        return Path(self._config.disk_cache_dir_path) / fingerprint
+
+
+def _make_function_fingerprint(function_name: str) -> list[Any] | None:
+    """Identify the function run by a PipeFunc: its qualified name, the hash of its source and its return type."""
+    function = func_registry.get_function(function_name)
+    if function is None:
+        return None
+    try:
+        function_source = inspect.getsource(function)
+    except (OSError, TypeError):
+        function_source = repr(getattr(function, "__code__", function))
+    return_type: Any
+    try:
+        return_type = get_type_hints(function).get("return")
+    except (NameError, TypeError):
+        return_type = inspect.signature(function).return_annotation
+    return_type_repr = repr(return_type)
+    return_schema: dict[str, Any] | None = None
+    if isinstance(return_type, type) and issubclass(return_type, BaseModel):
+        return_schema = return_type.model_json_schema()
+    return [
+        f"{function.__module__}.{function.__qualname__}",
+        hashlib.sha256(function_source.encode()).hexdigest(),
+        return_type_repr,
+        return_schema,
+    ]
+
+
+dry_run_cache = DryRunCache()
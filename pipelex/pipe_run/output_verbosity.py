@@ -0,0 +1,27 @@
+from __future__ import annotations
+
+from pipelex.types import StrEnum
+
+
+class OutputVerbosity(StrEnum):
+    """How much of the pipe runs is printed to the console in live mode."""
+
+    SILENT = "silent"
+    SUMMARY = "summary"
+    FULL = "full"
+
+    @property
+    def is_pipe_run_info_logged(self) -> bool:
+        match self:
+            case OutputVerbosity.SILENT:
+                return False
+            case OutputVerbosity.SUMMARY | OutputVerbosity.FULL:
+                return True
+
+    @property
+    def is_output_printed(self) -> bool:
+        match self:
+            case OutputVerbosity.SILENT | OutputVerbosity.SUMMARY:
+                return False
+            case OutputVerbosity.FULL:
+                return True
@@ -7,6 +7,7 @@ from pydantic import BaseModel, Field, field_validator
 from pipelex import log
 from pipelex.core.memory.working_memory import BATCH_ITEM_STUFF_NAME, MAIN_STUFF_NAME
 from pipelex.core.pipes.variable_multiplicity import VariableMultiplicity, VariableMultiplicityResolution
+from pipelex.pipe_run.output_verbosity import OutputVerbosity
 from pipelex.pipe_run.pipe_run_mode import PipeRunMode
 from pipelex.types import Self, StrEnum
 
@@ -109,16 +110,19 @@ def output_multiplicity_to_apply(
 class BatchParams(BaseModel):
     input_list_stuff_name: str
     input_item_stuff_name: str
+    max_concurrency: int | None = Field(default=None, ge=1)
 
     @classmethod
     def make_batch_params(
         cls,
         input_list_name: str,
         input_item_name: str,
+        max_concurrency: int | None = None,
     ) -> BatchParams:
         return BatchParams(
             input_list_stuff_name=input_list_name,
             input_item_stuff_name=input_item_name,
+            max_concurrency=max_concurrency,
         )
 
     @classmethod
@@ -136,6 +140,8 @@ class PipeRunParams(BaseModel):
     output_multiplicity: VariableMultiplicity | None = None
     dynamic_output_concept_code: str | None = None
     batch_params: BatchParams | None = None
+    is_llm_response_cache_enabled: bool | None = None
+    output_verbosity: OutputVerbosity = OutputVerbosity.FULL
     params: dict[str, Any] = Field(default_factory=dict)
 
     pipe_stack_limit: int
@@ -164,6 +170,19 @@ class PipeRunParams(BaseModel):
     def deep_copy_with_final_stuff_code(self, final_stuff_code: str) -> Self:
         return self.model_copy(deep=True, update={"final_stuff_code": final_stuff_code})
 
+    def make_branch_copy(self, final_stuff_code: str | None = None) -> Self:
+        """Make a copy for a branch of a controller: the mutable containers (params, stack and layers)
+        are copied so that the branch can push/pop without affecting its siblings, but their values are shared.
+        """
+        return self.model_copy(
+            update={
+                "final_stuff_code": final_stuff_code,
+                "params": dict(self.params),
+                "pipe_stack": list(self.pipe_stack),
+                "pipe_layers": list(self.pipe_layers),
+            },
+        )
+
     @classmethod
     def copy_by_injecting_multiplicity(
         cls,
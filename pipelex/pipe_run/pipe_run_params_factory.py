@@ -2,6 +2,7 @@ from typing import Any
 
 from pipelex.config import get_config
 from pipelex.core.pipes.variable_multiplicity import VariableMultiplicity
+from pipelex.pipe_run.output_verbosity import OutputVerbosity
 from pipelex.pipe_run.pipe_run_params import BatchParams, PipeRunMode, PipeRunParams
 
 
@@ -14,14 +15,19 @@ class PipeRunParamsFactory:
         output_multiplicity: VariableMultiplicity | None = None,
         dynamic_output_concept_code: str | None = None,
         batch_params: BatchParams | None = None,
+        is_llm_response_cache_enabled: bool | None = None,
+        output_verbosity: OutputVerbosity | None = None,
         params: dict[str, Any] | None = None,
     ) -> PipeRunParams:
         pipe_stack_limit = pipe_stack_limit or get_config().pipelex.pipe_run_config.pipe_stack_limit
+        output_verbosity = output_verbosity or get_config().pipelex.pipe_run_config.default_output_verbosity
         return PipeRunParams(
             run_mode=pipe_run_mode,
             pipe_stack_limit=pipe_stack_limit,
             output_multiplicity=output_multiplicity,
             dynamic_output_concept_code=dynamic_output_concept_code,
             batch_params=batch_params,
+            is_llm_response_cache_enabled=is_llm_response_cache_enabled,
+            output_verbosity=output_verbosity,
             params=params or {},
         )
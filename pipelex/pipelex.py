@@ -22,28 +22,36 @@ from pipelex.cogt.exceptions import (
     RoutingProfileDisabledBackendError,
     RoutingProfileLibraryNotFoundError,
 )
+from pipelex.cogt.image.prompt_image_cache import prompt_image_cache
 from pipelex.cogt.inference.inference_manager import InferenceManager
+from pipelex.cogt.llm.llm_response_cache import llm_response_cache
 from pipelex.cogt.models.model_manager import ModelManager
 from pipelex.cogt.models.model_manager_abstract import ModelManagerAbstract
 from pipelex.config import ConfigPaths, PipelexConfig, get_config
 from pipelex.core.concepts.concept_library import ConceptLibrary
+from pipelex.core.concepts.structure_code_cache import structure_code_cache
 from pipelex.core.domains.domain_library import DomainLibrary
 from pipelex.core.pipes.pipe_library import PipeLibrary
 from pipelex.core.registry_models import CoreRegistryModels
 from pipelex.core.validation import report_validation_error
 from pipelex.hub import PipelexHub, set_pipelex_hub
+from pipelex.libraries.library_loading_mode import LibraryLoadingMode
 from pipelex.libraries.library_manager_factory import LibraryManagerFactory
 from pipelex.observer.local_observer import LocalObserver
 from pipelex.observer.multi_observer import MultiObserver
 from pipelex.observer.observer_protocol import ObserverProtocol
+from pipelex.pipe_operators.llm.output_structure_prompt_cache import output_structure_prompt_cache
+from pipelex.pipe_run.dry_run_cache import dry_run_cache
 from pipelex.pipe_run.pipe_router import PipeRouter
 from pipelex.pipe_run.pipe_router_protocol import PipeRouterProtocol
+from pipelex.pipeline.bundle_cache import compiled_bundle_cache
 from pipelex.pipeline.pipeline_manager import PipelineManager
 from pipelex.pipeline.track.pipeline_tracker import PipelineTracker
 from pipelex.pipeline.track.pipeline_tracker_protocol import (
     PipelineTrackerNoOp,
     PipelineTrackerProtocol,
 )
+from pipelex.pipeline.track.tracker_config import TrackingMode
 from pipelex.plugins.plugin_manager import PluginManager
 from pipelex.reporting.reporting_manager import ReportingManager
 from pipelex.reporting.reporting_protocol import ReportingNoOp, ReportingProtocol
@@ -67,8 +75,11 @@ from pipelex.system.telemetry.telemetry_manager_abstract import (
     TelemetryManagerNoOp,
 )
 from pipelex.test_extras.registry_test_models import TestRegistryModels
+from pipelex.tools.jinja2.jinja2_template_cache import jinja2_template_cache
+from pipelex.tools.misc.http_client_manager import HttpClientManager
 from pipelex.tools.misc.package_utils import get_package_info
 from pipelex.tools.misc.toml_utils import load_toml_from_path
+from pipelex.tools.pdf.pypdfium2_renderer import pypdfium2_renderer
 from pipelex.tools.secrets.env_secrets_provider import EnvSecretsProvider
 from pipelex.tools.secrets.secrets_provider_abstract import SecretsProviderAbstract
 from pipelex.tools.storage.storage_provider_abstract import StorageProviderAbstract
@@ -123,6 +134,7 @@ class Pipelex(metaclass=MetaSingleton):
 
         self.reporting_delegate: ReportingProtocol | None = None
         self.telemetry_manager: TelemetryManagerAbstract | None = None
+        self.http_client_manager: HttpClientManager | None = None
         # pipeline
         self.pipeline_tracker: PipelineTrackerProtocol | None = None
 
@@ -183,9 +195,22 @@ If you need help, drop by our Discord: we're happy to assist: {URLs.discord}.
         secrets_provider = secrets_provider or EnvSecretsProvider()
         self.pipelex_hub.set_secrets_provider(secrets_provider=secrets_provider)
         self.pipelex_hub.set_storage_provider(storage_provider)
+        self.http_client_manager = HttpClientManager(config=get_config().pipelex.http_client_config)
+        self.pipelex_hub.set_http_client_manager(http_client_manager=self.http_client_manager)
+        jinja2_template_cache.setup(max_size=get_config().pipelex.templating_config.template_cache_max_size)
+        structure_code_cache.setup(config=get_config().pipelex.structure_config.code_cache_config, package_version=PACKAGE_VERSION)
+        dry_run_config = get_config().pipelex.dry_run_config
+        dry_run_cache.setup(
+            config=dry_run_config.cache_config,
+            package_version=PACKAGE_VERSION,
+            dry_run_settings=dry_run_config.model_dump(mode="json", exclude={"cache_config", "max_concurrency"}),
+        )
+        pypdfium2_renderer.setup(config=get_config().pipelex.pdf_render_config)
 
         # cogt
         self.plugin_manager.setup()
+        llm_response_cache.setup(config=get_config().cogt.llm_config.response_cache_config)
+        prompt_image_cache.setup(config=get_config().cogt.llm_config.prompt_image_cache_config)
 
         self.models_manager: ModelManagerAbstract = models_manager or ModelManager()
         self.pipelex_hub.set_models_manager(models_manager=self.models_manager)
@@ -251,7 +276,9 @@ If you need help, drop by our Discord: we're happy to assist: {URLs.discord}.
         # pipeline
         if pipeline_tracker:
             self.pipeline_tracker = pipeline_tracker
-        elif get_config().pipelex.feature_config.is_pipeline_tracking_enabled:
+        elif (
+            get_config().pipelex.feature_config.is_pipeline_tracking_enabled and get_config().pipelex.tracker_config.tracking_mode != TrackingMode.OFF
+        ):
             self.pipeline_tracker = PipelineTracker(tracker_config=get_config().pipelex.tracker_config)
         else:
             self.pipeline_tracker = PipelineTrackerNoOp()
@@ -298,12 +325,13 @@ If you need help, drop by our Discord: we're happy to assist: {URLs.discord}.
         # pipeline
         self.pipeline_tracker.setup()
         self.pipeline_manager.setup()
+        compiled_bundle_cache.setup(config=get_config().pipelex.compiled_bundle_cache_config)
 
         log.verbose(f"{PACKAGE_NAME} version {PACKAGE_VERSION} setup done")
 
-    def setup_libraries(self):
+    def setup_libraries(self, library_loading_mode: LibraryLoadingMode | None = None):
         self.library_manager.setup()
-        self.library_manager.load_libraries()
+        self.library_manager.load_libraries(loading_mode=library_loading_mode)
         log.verbose(f"{PACKAGE_NAME} version {PACKAGE_VERSION} setup libraries done")
 
     def validate_libraries(self):
@@ -317,6 +345,7 @@ If you need help, drop by our Discord: we're happy to assist: {URLs.discord}.
 
     def teardown(self):
         # pipelex
+        compiled_bundle_cache.teardown()
         self.pipeline_manager.teardown()
         if self.pipeline_tracker:
             self.pipeline_tracker.teardown()
@@ -329,12 +358,22 @@ If you need help, drop by our Discord: we're happy to assist: {URLs.discord}.
         if self.reporting_delegate:
             self.reporting_delegate.teardown()
         self.plugin_manager.teardown()
+        llm_response_cache.teardown()
+        prompt_image_cache.teardown()
 
         # tools
         self.kajson_manager.teardown()
         if self.class_registry:
             self.class_registry.teardown()
         func_registry.teardown()
+        jinja2_template_cache.teardown()
+        structure_code_cache.teardown()
+        dry_run_cache.teardown()
+        output_structure_prompt_cache.teardown()
+        pypdfium2_renderer.teardown()
+        if self.http_client_manager:
+            self.http_client_manager.teardown()
+        self.pipelex_hub.set_http_client_manager(http_client_manager=None)
 
         log.verbose(f"{PACKAGE_NAME} version {PACKAGE_VERSION} teardown done (except config & logs)")
         self.pipelex_hub.reset_config()
@@ -360,6 +399,7 @@ If you need help, drop by our Discord: we're happy to assist: {URLs.discord}.
         telemetry_config: TelemetryConfig | None = None,
         telemetry_manager: TelemetryManagerAbstract | None = None,
         observers: dict[str, ObserverProtocol] | None = None,
+        library_loading_mode: LibraryLoadingMode | None = None,
         **kwargs: Any,
     ) -> Self:
         """Create and initialize a Pipelex singleton instance.
@@ -384,6 +424,7 @@ If you need help, drop by our Discord: we're happy to assist: {URLs.discord}.
             telemetry_config: Custom telemetry configuration
             telemetry_manager: Custom telemetry manager
             observers: Custom observers for pipeline events
+            library_loading_mode: Load all the pipes at startup (eager) or only when first requested (lazy), defaults to the config
             **kwargs: Additional configuration options, only supported by your own subclass of Pipelex if you really need one
 
         Returns:
@@ -416,7 +457,7 @@ If you need help, drop by our Discord: we're happy to assist: {URLs.discord}.
             observers=observers,
             **kwargs,
         )
-        pipelex_instance.setup_libraries()
+        pipelex_instance.setup_libraries(library_loading_mode=library_loading_mode)
         pipelex_instance.models_manager.validate_model_deck()
         log.verbose(f"{PACKAGE_NAME} version {PACKAGE_VERSION} ready")
         return pipelex_instance
@@ -0,0 +1,180 @@
+import asyncio
+import hashlib
+from collections import OrderedDict
+
+from pydantic import BaseModel
+
+from pipelex import log
+from pipelex.config import CompiledBundleCacheConfig
+from pipelex.core.bundles.pipelex_bundle_blueprint import PipelexBundleBlueprint
+from pipelex.core.interpreter import PipelexInterpreter
+from pipelex.core.pipes.pipe_abstract import PipeAbstract
+from pipelex.hub import get_library_manager, get_optional_pipe
+from pipelex.pipeline.exceptions import CompiledBundleCacheError
+from pipelex.pipeline.validate_plx import validate_bundle_blueprint, validate_plx
+
+
+class CompiledBundle(BaseModel):
+    """A PLX bundle that was parsed, loaded into the libraries and validated, with the number of runs using it."""
+
+    digest: str
+    blueprint: PipelexBundleBlueprint
+    pipes: list[PipeAbstract]
+    is_cached: bool
+    ref_count: int = 0
+
+    def is_loaded(self) -> bool:
+        """Whether the bundle's pipes are still the ones in the pipe library, which may have been reset since."""
+        return all(get_optional_pipe(pipe_code=pipe.code) is pipe for pipe in self.pipes)
+
+    def conflicts_with(self, blueprint: PipelexBundleBlueprint) -> bool:
+        """Whether loading the blueprint would clash with this bundle's domain or pipes."""
+        if blueprint.domain == self.blueprint.domain:
+            return True
+        return not set(blueprint.pipe or {}).isdisjoint(self.blueprint.pipe or {})
+
+
+class CompiledBundleCacheStats(BaseModel):
+    hits: int
+    misses: int
+    size: int
+
+    @property
+    def desc(self) -> str:
+        return f"{self.hits} hits, {self.misses} misses, {self.size} bundles resident"
+
+
+class CompiledBundleCache:
+    """Cache of the PLX bundles run with execute_pipeline, keyed by the hash of their content.
+
+    A compiled bundle stays loaded in the libraries after its run, so running the same PLX content again
+    skips parsing, loading, validation and dry runs. Bundles are reference counted by the runs using them,
+    and the least recently used idle bundles are removed from the libraries beyond max_size.
+    An idle bundle is also removed when a new bundle with the same domain or pipe codes is loaded.
+    When disabled, which is the default, each bundle is compiled for its run and removed from the libraries after it.
+    """
+
+    def __init__(self):
+        self._config: CompiledBundleCacheConfig | None = None
+        self._bundles: OrderedDict[str, CompiledBundle] = OrderedDict()
+        # compilations load into the shared libraries, so they run one at a time
+        self._compilation_locks: dict[asyncio.AbstractEventLoop, asyncio.Lock] = {}
+        self._hits = 0
+        self._misses = 0
+
+    def setup(self, config: CompiledBundleCacheConfig):
+        self._config = config
+
+    def teardown(self):
+        if self._hits or self._misses:
+            log.verbose(f"Compiled bundle cache: {self.stats.desc}")
+        # the libraries holding the bundles are torn down with Pipelex
+        self._bundles.clear()
+        self._compilation_locks.clear()
+        self._hits = 0
+        self._misses = 0
+        self._config = None
+
+    @property
+    def is_enabled(self) -> bool:
+        return self._config is not None and self._config.is_enabled
+
+    @property
+    def stats(self) -> CompiledBundleCacheStats:
+        return CompiledBundleCacheStats(hits=self._hits, misses=self._misses, size=len(self._bundles))
+
+    def clear(self):
+        """Remove the idle bundles from the libraries and the cache."""
+        for compiled_bundle in [bundle for bundle in self._bundles.values() if bundle.ref_count == 0]:
+            self._evict(compiled_bundle=compiled_bundle)
+
+    async def acquire(self, plx_content: str) -> CompiledBundle:
+        """Get the compiled bundle of the PLX content, compiling it if needed. It must be released after use.
+
+        Raises:
+            CompiledBundleCacheError: If an other bundle in use has the same domain or pipe codes
+            PipelexConfigurationError, PLXDecodeError, ValidationError: If the PLX content can't be parsed
+            DomainLoadingError, ConceptLoadingError, PipeLoadingError, PipeLibraryError, DryRunError: If the bundle is invalid
+
+        """
+        digest = hashlib.sha256(plx_content.encode()).hexdigest()
+        if not self.is_enabled:
+            blueprint, pipes = await validate_plx(plx_content=plx_content, remove_after_validation=False)
+            return CompiledBundle(digest=digest, blueprint=blueprint, pipes=pipes, is_cached=False, ref_count=1)
+
+        if compiled_bundle := self._get_loaded_bundle(digest=digest):
+            self._hits += 1
+        else:
+            async with self._get_compilation_lock():
+                # the same content may have been compiled while waiting for the lock
+                if compiled_bundle := self._get_loaded_bundle(digest=digest):
+                    self._hits += 1
+                else:
+                    compiled_bundle = await self._compile(digest=digest, plx_content=plx_content)
+        compiled_bundle.ref_count += 1
+        return compiled_bundle
+
+    def release(self, compiled_bundle: CompiledBundle):
+        """Release a compiled bundle acquired for a run."""
+        compiled_bundle.ref_count -= 1
+        if compiled_bundle.ref_count > 0:
+            return
+        if compiled_bundle.is_cached:
+            self._evict_beyond_max_size()
+        else:
+            get_library_manager().remove_from_blueprint(blueprint=compiled_bundle.blueprint)
+
+    def _get_loaded_bundle(self, digest: str) -> CompiledBundle | None:
+        compiled_bundle = self._bundles.get(digest)
+        if compiled_bundle is None:
+            return None
+        if not compiled_bundle.is_loaded():
+            del self._bundles[digest]
+            return None
+        self._bundles.move_to_end(digest)
+        return compiled_bundle
+
+    def _get_compilation_lock(self) -> asyncio.Lock:
+        event_loop = asyncio.get_running_loop()
+        compilation_lock = self._compilation_locks.get(event_loop)
+        if compilation_lock is None:
+            self._compilation_locks = {loop: lock for loop, lock in self._compilation_locks.items() if not loop.is_closed()}
+            compilation_lock = asyncio.Lock()
+            self._compilation_locks[event_loop] = compilation_lock
+        return compilation_lock
+
+    async def _compile(self, digest: str, plx_content: str) -> CompiledBundle:
+        self._misses += 1
+        blueprint = PipelexInterpreter(file_content=plx_content).make_pipelex_bundle_blueprint()
+        for conflicting_bundle in [bundle for bundle in self._bundles.values() if bundle.conflicts_with(blueprint=blueprint)]:
+            if conflicting_bundle.ref_count > 0:
+                msg = (
+                    f"Cannot load the PLX bundle of domain '{blueprint.domain}' while an other version of it is running: "
+                    "they share the same domain or pipe codes"
+                )
+                raise CompiledBundleCacheError(msg)
+            self._evict(compiled_bundle=conflicting_bundle)
+
+        pipes = await validate_bundle_blueprint(blueprint=blueprint, remove_after_validation=False)
+        compiled_bundle = CompiledBundle(digest=digest, blueprint=blueprint, pipes=pipes, is_cached=True)
+        self._bundles[digest] = compiled_bundle
+        return compiled_bundle
+
+    def _evict_beyond_max_size(self):
+        if self._config is None:
+            return
+        nb_to_evict = len(self._bundles) - self._config.max_size
+        for compiled_bundle in list(self._bundles.values()):
+            if nb_to_evict <= 0:
+                break
+            if compiled_bundle.ref_count == 0:
+                self._evict(compiled_bundle=compiled_bundle)
+                nb_to_evict -= 1
+
+    def _evict(self, compiled_bundle: CompiledBundle):
+        del self._bundles[compiled_bundle.digest]
+        if compiled_bundle.is_loaded():
+            get_library_manager().remove_from_blueprint(blueprint=compiled_bundle.blueprint)
+
+
+compiled_bundle_cache = CompiledBundleCache()
@@ -24,6 +24,10 @@ class PipelineExecutionError(PipelexException):
         super().__init__(message)
 
 
+class PipelineStreamError(PipelexException):
+    pass
+
+
 class DryRunError(PipeRunError):
     """Raised when a dry run fails due to missing inputs or other validation issues."""
 
@@ -63,3 +67,7 @@ class PipeStackOverflowError(PipelexException):
         self.limit = limit
         self.pipe_stack = pipe_stack
         super().__init__(message)
+
+
+class CompiledBundleCacheError(PipelexException):
+    pass
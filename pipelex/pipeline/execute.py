@@ -1,18 +1,18 @@
-from typing import TYPE_CHECKING
-
 from pipelex.client.protocol import PipelineInputs
 from pipelex.core.memory.working_memory import WorkingMemory
 from pipelex.core.memory.working_memory_factory import WorkingMemoryFactory
+from pipelex.core.pipes.pipe_abstract import PipeAbstract
 from pipelex.core.pipes.pipe_output import PipeOutput
 from pipelex.hub import (
-    get_library_manager,
     get_pipe_router,
     get_pipeline_manager,
+    get_pipeline_tracker,
     get_report_delegate,
     get_required_pipe,
     get_telemetry_manager,
 )
 from pipelex.pipe_run.exceptions import PipeRouterError
+from pipelex.pipe_run.output_verbosity import OutputVerbosity
 from pipelex.pipe_run.pipe_job_factory import PipeJobFactory
 from pipelex.pipe_run.pipe_run_mode import PipeRunMode
 from pipelex.pipe_run.pipe_run_params import (
@@ -20,16 +20,12 @@ from pipelex.pipe_run.pipe_run_params import (
     VariableMultiplicity,
 )
 from pipelex.pipe_run.pipe_run_params_factory import PipeRunParamsFactory
+from pipelex.pipeline.bundle_cache import compiled_bundle_cache
 from pipelex.pipeline.exceptions import PipeExecutionError, PipelineExecutionError
 from pipelex.pipeline.job_metadata import JobMetadata
-from pipelex.pipeline.validate_plx import validate_plx
 from pipelex.system.environment import get_optional_env
 from pipelex.system.telemetry.events import EventName, EventProperty, Outcome
 
-if TYPE_CHECKING:
-    from pipelex.core.bundles.pipelex_bundle_blueprint import PipelexBundleBlueprint
-    from pipelex.core.pipes.pipe_abstract import PipeAbstract
-
 
 async def execute_pipeline(
     pipe_code: str | None = None,
@@ -40,6 +36,8 @@ async def execute_pipeline(
     dynamic_output_concept_code: str | None = None,
     pipe_run_mode: PipeRunMode | None = None,
     search_domains: list[str] | None = None,
+    is_llm_response_cache_enabled: bool | None = None,
+    output_verbosity: OutputVerbosity | None = None,
 ) -> PipeOutput:
     """Execute a pipeline and wait for its completion.
 
@@ -52,7 +50,9 @@ async def execute_pipeline(
     pipe_code:
         The code identifying the pipeline to execute.
     plx_content:
-        Content of the pipeline bundle to execute.
+        Content of the pipeline bundle to execute. It is removed from the libraries after the run, unless
+        the compiled bundle cache is enabled: the bundle is then compiled once and kept loaded in the libraries,
+        so that executing the same content again skips its validation.
     inputs:
         Inputs passed to the pipeline.
     output_name:
@@ -68,6 +68,13 @@ async def execute_pipeline(
         the pipe run mode is ``PipeRunMode.LIVE``.
     search_domains:
         List of domains to search for pipes.
+    is_llm_response_cache_enabled:
+        Whether the LLM calls of the run use the LLM response cache.
+        If not specified, the cache is used according to ``[cogt.llm_config.response_cache_config]``.
+    output_verbosity:
+        What the live run prints for each pipe operator: ``OutputVerbosity.SILENT`` prints nothing,
+        ``OutputVerbosity.SUMMARY`` only logs the pipe being run and ``OutputVerbosity.FULL`` also pretty prints its output.
+        If not specified, ``default_output_verbosity`` from ``[pipelex.pipe_run_config]`` is used.
 
     Returns:
     -------
@@ -79,25 +86,59 @@ async def execute_pipeline(
         msg = "Either pipe_code or plx_content must be provided to the API execute_pipeline."
         raise ValueError(msg)
 
-    pipe: PipeAbstract | None = None
-    blueprint: PipelexBundleBlueprint | None = None
-
     if plx_content:
-        blueprint, _ = await validate_plx(plx_content=plx_content, remove_after_validation=False)
-
-        if pipe_code:
-            pipe = get_required_pipe(pipe_code=pipe_code)
-        elif blueprint.main_pipe:
-            pipe = get_required_pipe(pipe_code=blueprint.main_pipe)
-        else:
-            msg = "No pipe code or main pipe in the PLX content provided to the API execute_pipeline."
-            raise PipeExecutionError(message=msg)
+        compiled_bundle = await compiled_bundle_cache.acquire(plx_content=plx_content)
+        try:
+            if pipe_code:
+                pipe = get_required_pipe(pipe_code=pipe_code)
+            elif compiled_bundle.blueprint.main_pipe:
+                pipe = get_required_pipe(pipe_code=compiled_bundle.blueprint.main_pipe)
+            else:
+                msg = "No pipe code or main pipe in the PLX content provided to the API execute_pipeline."
+                raise PipeExecutionError(message=msg)
+            return await _run_pipe(
+                pipe=pipe,
+                inputs=inputs,
+                output_name=output_name,
+                output_multiplicity=output_multiplicity,
+                dynamic_output_concept_code=dynamic_output_concept_code,
+                pipe_run_mode=pipe_run_mode,
+                search_domains=search_domains,
+                is_llm_response_cache_enabled=is_llm_response_cache_enabled,
+                output_verbosity=output_verbosity,
+            )
+        finally:
+            compiled_bundle_cache.release(compiled_bundle=compiled_bundle)
     elif pipe_code:
         pipe = get_required_pipe(pipe_code=pipe_code)
     else:
         msg = "Either provide pipe_code or plx_content to the API execute_pipeline. 'pipe_code' must be provided when 'plx_content' is None"
         raise PipeExecutionError(message=msg)
 
+    return await _run_pipe(
+        pipe=pipe,
+        inputs=inputs,
+        output_name=output_name,
+        output_multiplicity=output_multiplicity,
+        dynamic_output_concept_code=dynamic_output_concept_code,
+        pipe_run_mode=pipe_run_mode,
+        search_domains=search_domains,
+        is_llm_response_cache_enabled=is_llm_response_cache_enabled,
+        output_verbosity=output_verbosity,
+    )
+
+
+async def _run_pipe(
+    pipe: PipeAbstract,
+    inputs: PipelineInputs | WorkingMemory | None,
+    output_name: str | None,
+    output_multiplicity: VariableMultiplicity | None,
+    dynamic_output_concept_code: str | None,
+    pipe_run_mode: PipeRunMode | None,
+    search_domains: list[str] | None,
+    is_llm_response_cache_enabled: bool | None,
+    output_verbosity: OutputVerbosity | None,
+) -> PipeOutput:
     search_domains = search_domains or []
     if pipe.domain not in search_domains:
         search_domains.insert(0, pipe.domain)
@@ -130,6 +171,8 @@ async def execute_pipeline(
         output_multiplicity=output_multiplicity,
         dynamic_output_concept_code=dynamic_output_concept_code,
         pipe_run_mode=pipe_run_mode,
+        is_llm_response_cache_enabled=is_llm_response_cache_enabled,
+        output_verbosity=output_verbosity,
     )
 
     pipe_job = PipeJobFactory.make_pipe_job(
@@ -157,8 +200,7 @@ async def execute_pipeline(
             pipe_stack=pipe_job.pipe_run_params.pipe_stack,
         ) from exc
     finally:
-        if plx_content and blueprint is not None:
-            get_library_manager().remove_from_blueprint(blueprint=blueprint)
+        get_pipeline_tracker().close_pipeline_run(pipeline_run_id=job_metadata.pipeline_run_id)
     properties = {
         EventProperty.PIPELINE_RUN_ID: job_metadata.pipeline_run_id,
         EventProperty.PIPE_TYPE: pipe.pipe_type,
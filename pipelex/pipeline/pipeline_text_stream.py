@@ -0,0 +1,21 @@
+import asyncio
+from contextvars import ContextVar
+
+from pydantic import BaseModel
+
+
+class PipelineTextChunk(BaseModel):
+    pipeline_run_id: str
+    pipe_code: str
+    text: str
+
+
+# None marks the end of the stream
+PipelineTextChunkQueue = asyncio.Queue[PipelineTextChunk | None]
+
+# Set by stream_pipeline() for the pipeline run it starts: the PipeLLM pipes of that run stream their text into this queue
+pipeline_text_chunk_queue_var: ContextVar[PipelineTextChunkQueue | None] = ContextVar("pipeline_text_chunk_queue", default=None)
+
+
+def get_pipeline_text_chunk_queue() -> PipelineTextChunkQueue | None:
+    return pipeline_text_chunk_queue_var.get()
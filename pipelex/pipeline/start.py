@@ -7,9 +7,11 @@ from pipelex.core.pipes.pipe_output import PipeOutput
 from pipelex.hub import (
     get_pipe_router,
     get_pipeline_manager,
+    get_pipeline_tracker,
     get_report_delegate,
     get_required_pipe,
 )
+from pipelex.pipe_run.output_verbosity import OutputVerbosity
 from pipelex.pipe_run.pipe_job_factory import PipeJobFactory
 from pipelex.pipe_run.pipe_run_mode import PipeRunMode
 from pipelex.pipe_run.pipe_run_params import VariableMultiplicity
@@ -25,6 +27,8 @@ async def start_pipeline(
     dynamic_output_concept_code: str | None = None,
     pipe_run_mode: PipeRunMode = PipeRunMode.LIVE,
     search_domains: list[str] | None = None,
+    is_llm_response_cache_enabled: bool | None = None,
+    output_verbosity: OutputVerbosity | None = None,
 ) -> tuple[str, asyncio.Task[PipeOutput]]:
     """Start a pipeline in the background.
 
@@ -49,6 +53,13 @@ async def start_pipeline(
         Pipe run mode: ``PipeRunMode.LIVE`` or ``PipeRunMode.DRY``.
     search_domains:
         List of domains to search for pipes.
+    is_llm_response_cache_enabled:
+        Whether the LLM calls of the run use the LLM response cache.
+        If not specified, the cache is used according to ``[cogt.llm_config.response_cache_config]``.
+    output_verbosity:
+        What the live run prints for each pipe operator: ``OutputVerbosity.SILENT`` prints nothing,
+        ``OutputVerbosity.SUMMARY`` only logs the pipe being run and ``OutputVerbosity.FULL`` also pretty prints its output.
+        If not specified, ``default_output_verbosity`` from ``[pipelex.pipe_run_config]`` is used.
 
     Returns:
     -------
@@ -85,9 +96,11 @@ async def start_pipeline(
         output_multiplicity=output_multiplicity,
         dynamic_output_concept_code=dynamic_output_concept_code,
         pipe_run_mode=pipe_run_mode,
+        is_llm_response_cache_enabled=is_llm_response_cache_enabled,
+        output_verbosity=output_verbosity,
     )
 
-    if working_memory:
+    if working_memory and pipe_run_params.output_verbosity.is_pipe_run_info_logged:
         working_memory.pretty_print_summary()
 
     pipe_job = PipeJobFactory.make_pipe_job(
@@ -100,5 +113,6 @@ async def start_pipeline(
 
     # Launch execution without awaiting the result.
     task: asyncio.Task[PipeOutput] = asyncio.create_task(get_pipe_router().run(pipe_job))
+    task.add_done_callback(lambda _: get_pipeline_tracker().close_pipeline_run(pipeline_run_id=pipeline.pipeline_run_id))
 
     return pipeline.pipeline_run_id, task
@@ -0,0 +1,150 @@
+import asyncio
+from collections.abc import AsyncIterator
+
+from pipelex.client.protocol import PipelineInputs
+from pipelex.core.memory.working_memory import WorkingMemory
+from pipelex.core.pipes.pipe_output import PipeOutput
+from pipelex.pipe_run.output_verbosity import OutputVerbosity
+from pipelex.pipe_run.pipe_run_mode import PipeRunMode
+from pipelex.pipe_run.pipe_run_params import VariableMultiplicity
+from pipelex.pipeline.exceptions import PipelineStreamError
+from pipelex.pipeline.execute import execute_pipeline
+from pipelex.pipeline.pipeline_text_stream import PipelineTextChunk, PipelineTextChunkQueue, pipeline_text_chunk_queue_var
+
+
+class PipelineStream:
+    """Async iterator over the text generated by the PipeLLM pipes of a pipeline run, chunk by chunk, as the LLMs produce it.
+
+    The pipeline starts when the iteration starts. Once the iteration is over, the pipe output is available in ``pipe_output``.
+    Breaking out of the iteration cancels the pipeline run.
+    """
+
+    def __init__(
+        self,
+        pipe_code: str | None = None,
+        plx_content: str | None = None,
+        inputs: PipelineInputs | WorkingMemory | None = None,
+        output_name: str | None = None,
+        output_multiplicity: VariableMultiplicity | None = None,
+        dynamic_output_concept_code: str | None = None,
+        pipe_run_mode: PipeRunMode | None = None,
+        search_domains: list[str] | None = None,
+        is_llm_response_cache_enabled: bool | None = None,
+        output_verbosity: OutputVerbosity | None = None,
+    ):
+        self.pipe_code = pipe_code
+        self.plx_content = plx_content
+        self.inputs = inputs
+        self.output_name = output_name
+        self.output_multiplicity = output_multiplicity
+        self.dynamic_output_concept_code = dynamic_output_concept_code
+        self.pipe_run_mode = pipe_run_mode
+        self.search_domains = search_domains
+        self.is_llm_response_cache_enabled = is_llm_response_cache_enabled
+        self.output_verbosity = output_verbosity
+        self._pipe_output: PipeOutput | None = None
+
+    @property
+    def pipe_output(self) -> PipeOutput:
+        if self._pipe_output is None:
+            msg = "The pipe output is only available once the pipeline stream has been fully consumed"
+            raise PipelineStreamError(msg)
+        return self._pipe_output
+
+    def __aiter__(self) -> AsyncIterator[PipelineTextChunk]:
+        return self._stream_text_chunks()
+
+    async def _stream_text_chunks(self) -> AsyncIterator[PipelineTextChunk]:
+        text_chunk_queue: PipelineTextChunkQueue = asyncio.Queue()
+        # the task copies the current context when it's created, so only the pipeline run sees the queue
+        queue_token = pipeline_text_chunk_queue_var.set(text_chunk_queue)
+        try:
+            execution_task = asyncio.create_task(
+                execute_pipeline(
+                    pipe_code=self.pipe_code,
+                    plx_content=self.plx_content,
+                    inputs=self.inputs,
+                    output_name=self.output_name,
+                    output_multiplicity=self.output_multiplicity,
+                    dynamic_output_concept_code=self.dynamic_output_concept_code,
+                    pipe_run_mode=self.pipe_run_mode,
+                    search_domains=self.search_domains,
+                    is_llm_response_cache_enabled=self.is_llm_response_cache_enabled,
+                    output_verbosity=self.output_verbosity,
+                )
+            )
+        finally:
+            pipeline_text_chunk_queue_var.reset(queue_token)
+        # None marks the end of the stream, whether the pipeline run succeeded or failed
+        execution_task.add_done_callback(lambda _: text_chunk_queue.put_nowait(None))
+
+        try:
+            while (text_chunk := await text_chunk_queue.get()) is not None:
+                yield text_chunk
+            self._pipe_output = await execution_task
+        finally:
+            if not execution_task.done():
+                execution_task.cancel()
+
+
+def stream_pipeline(
+    pipe_code: str | None = None,
+    plx_content: str | None = None,
+    inputs: PipelineInputs | WorkingMemory | None = None,
+    output_name: str | None = None,
+    output_multiplicity: VariableMultiplicity | None = None,
+    dynamic_output_concept_code: str | None = None,
+    pipe_run_mode: PipeRunMode | None = None,
+    search_domains: list[str] | None = None,
+    is_llm_response_cache_enabled: bool | None = None,
+    output_verbosity: OutputVerbosity | None = None,
+) -> PipelineStream:
+    """Execute a pipeline and stream the text generated by its PipeLLM pipes as it comes.
+
+    This function takes the same parameters as *execute_pipeline*. Iterate over the returned
+    stream to get ``PipelineTextChunk`` objects, tagged with the code of the pipe generating them,
+    as soon as the LLMs produce them. Only the PipeLLM pipes generating a single text are streamed,
+    structured outputs are generated as usual. Once the stream is exhausted, the pipe output is
+    available in ``pipeline_stream.pipe_output``.
+
+    Parameters
+    ----------
+    pipe_code:
+        The code identifying the pipeline to execute.
+    plx_content:
+        Content of the pipeline bundle to execute.
+    inputs:
+        Inputs passed to the pipeline.
+    output_name:
+        Name of the output slot to write to.
+    output_multiplicity:
+        Output multiplicity.
+    dynamic_output_concept_code:
+        Override the dynamic output concept code.
+    pipe_run_mode:
+        Pipe run mode, see *execute_pipeline*.
+    search_domains:
+        List of domains to search for pipes.
+    is_llm_response_cache_enabled:
+        Whether the LLM calls of the run use the LLM response cache, see *execute_pipeline*.
+    output_verbosity:
+        What the live run prints for each pipe operator, see *execute_pipeline*.
+
+    Returns:
+    -------
+    PipelineStream
+        An async iterator over the text chunks, giving access to the pipe output once exhausted.
+
+    """
+    return PipelineStream(
+        pipe_code=pipe_code,
+        plx_content=plx_content,
+        inputs=inputs,
+        output_name=output_name,
+        output_multiplicity=output_multiplicity,
+        dynamic_output_concept_code=dynamic_output_concept_code,
+        pipe_run_mode=pipe_run_mode,
+        search_domains=search_domains,
+        is_llm_response_cache_enabled=is_llm_response_cache_enabled,
+        output_verbosity=output_verbosity,
+    )
@@ -2,6 +2,9 @@
 # pyright: reportUnknownArgumentType=false
 # pyright: reportUnknownMemberType=false
 # pyright: reportMissingTypeArgument=false
+import weakref
+import zlib
+from collections import OrderedDict
 from typing import Any
 
 import networkx as nx
@@ -10,11 +13,13 @@ from typing_extensions import override
 from pipelex import log
 from pipelex.core.concepts.concept import Concept
 from pipelex.core.stuffs.stuff import Stuff
+from pipelex.core.stuffs.stuff_content import StuffContent
 from pipelex.pipe_controllers.condition.pipe_condition_details import PipeConditionDetails
+from pipelex.pipeline.pipeline_models import SpecialPipelineId
 from pipelex.pipeline.track.exceptions import JobHistoryError
 from pipelex.pipeline.track.flow_chart import PipelineFlowChart
 from pipelex.pipeline.track.pipeline_tracker_protocol import PipelineTrackerProtocol
-from pipelex.pipeline.track.tracker_config import TrackerConfig
+from pipelex.pipeline.track.tracker_config import TrackerConfig, TrackingMode
 from pipelex.pipeline.track.tracker_models import (
     EdgeAttributeKey,
     EdgeCategory,
@@ -25,15 +30,34 @@ from pipelex.pipeline.track.tracker_models import (
 from pipelex.tools.misc.mermaid_utils import print_mermaid_url
 
 
-# TODO: manage a separate graph for each pipeline_run_id
+class PipelineRunGraph:
+    """The graph of the steps of a single pipeline run."""
+
+    def __init__(self, pipeline_run_id: str):
+        self.pipeline_run_id = pipeline_run_id
+        self.nx_graph: nx.DiGraph = nx.DiGraph()
+        self.start_node: str | None = None
+        self.nb_dropped_nodes = 0
+
+
 # TODO: restore disabled tracking functionality in PipeBatch
 class PipelineTracker(PipelineTrackerProtocol):
+    """Tracks the steps of the pipeline runs, in a separate graph for each pipeline_run_id.
+
+    The graph of a run is released when the run is closed, except for the last nb_closed_runs_kept runs whose
+    flowchart can still be output. Each graph holds at most max_nodes_per_run nodes, and the stuff contents
+    are only referenced weakly and rendered when a flowchart is output. Depending on the tracking mode, all the
+    runs, a sample of the runs or none of them are tracked. The untitled runs (dry runs and direct pipe runs)
+    are never closed, so they are not tracked.
+    """
+
     def __init__(self, tracker_config: TrackerConfig):
         self._tracker_config = tracker_config
         self._is_debug_mode = tracker_config.is_debug_mode
         self.is_active: bool = False
-        self.nx_graph: nx.DiGraph = nx.DiGraph()
-        self.start_node: str | None = None
+        self._run_graphs: dict[str, PipelineRunGraph] = {}
+        self._closed_run_graphs: OrderedDict[str, PipelineRunGraph] = OrderedDict()
+        self._last_pipeline_run_id: str | None = None
 
     @override
     def setup(self):
@@ -42,33 +66,74 @@ class PipelineTracker(PipelineTrackerProtocol):
     @override
     def teardown(self):
         self.is_active = False
-        self.nx_graph = nx.DiGraph()
-        self.start_node = None
+        self._run_graphs.clear()
+        self._closed_run_graphs.clear()
+        self._last_pipeline_run_id = None
 
     @override
     def reset(self):
         self.teardown()
         self.setup()
 
-    def _get_node_name(self, node: str) -> str | None:
-        node_attributes = self.nx_graph.nodes[node]
-        node_name = node_attributes[NodeAttributeKey.NAME]
-        if isinstance(node_name, str):
-            return node_name
-        msg = f"Node name is not a string: {node_name}"
-        raise JobHistoryError(msg)
+    @override
+    def close_pipeline_run(self, pipeline_run_id: str):
+        run_graph = self._run_graphs.pop(pipeline_run_id, None)
+        if run_graph is None:
+            return
+        if run_graph.nb_dropped_nodes:
+            log.verbose(f"Pipeline run '{pipeline_run_id}' tracking dropped {run_graph.nb_dropped_nodes} nodes")
+        if self._tracker_config.nb_closed_runs_kept == 0:
+            return
+        self._closed_run_graphs[pipeline_run_id] = run_graph
+        while len(self._closed_run_graphs) > self._tracker_config.nb_closed_runs_kept:
+            self._closed_run_graphs.popitem(last=False)
+
+    @override
+    def is_tracking(self, pipeline_run_id: str) -> bool:
+        if not self.is_active or pipeline_run_id == SpecialPipelineId.UNTITLED:
+            return False
+        match self._tracker_config.tracking_mode:
+            case TrackingMode.OFF:
+                return False
+            case TrackingMode.FULL:
+                return True
+            case TrackingMode.SAMPLED:
+                # the draw only depends on the pipeline_run_id: all the steps of a sampled run are tracked, without keeping any state
+                return zlib.crc32(pipeline_run_id.encode()) % 10000 < self._tracker_config.sampling_percentage * 100
+
+    def get_optional_run_graph(self, pipeline_run_id: str) -> PipelineRunGraph | None:
+        return self._run_graphs.get(pipeline_run_id) or self._closed_run_graphs.get(pipeline_run_id)
+
+    def _get_run_graph(self, pipeline_run_id: str) -> PipelineRunGraph:
+        run_graph = self._run_graphs.get(pipeline_run_id)
+        if run_graph is None:
+            run_graph = PipelineRunGraph(pipeline_run_id=pipeline_run_id)
+            self._run_graphs[pipeline_run_id] = run_graph
+        self._last_pipeline_run_id = pipeline_run_id
+        return run_graph
+
+    def _is_node_allowed(self, run_graph: PipelineRunGraph, node: str) -> bool:
+        if run_graph.nx_graph.has_node(node) or run_graph.nx_graph.number_of_nodes() < self._tracker_config.max_nodes_per_run:
+            return True
+        if not run_graph.nb_dropped_nodes:
+            log.warning(
+                f"Pipeline run '{run_graph.pipeline_run_id}' reached the limit of {self._tracker_config.max_nodes_per_run} tracked nodes, "
+                "the next steps are not tracked",
+            )
+        run_graph.nb_dropped_nodes += 1
+        return False
 
     def _pipe_layer_to_subgraph_name(self, pipe_layer: list[str]) -> str:
         return "-".join(pipe_layer)
 
-    def _add_start_node(self) -> str:
+    def _add_start_node(self, run_graph: PipelineRunGraph) -> str:
         node = SpecialNodeName.START
         node_attributes: dict[str, Any] = {
             NodeAttributeKey.CATEGORY: NodeCategory.SPECIAL,
             NodeAttributeKey.TAG: "Start",
             NodeAttributeKey.NAME: "Start",
         }
-        self.nx_graph.add_node(node, **node_attributes)
+        run_graph.nx_graph.add_node(node, **node_attributes)
         return node
 
     def _make_stuff_node_tag(
@@ -90,62 +155,80 @@ class PipelineTracker(PipelineTrackerProtocol):
 
     def _add_stuff_node(
         self,
+        run_graph: PipelineRunGraph,
         stuff: Stuff,
         pipe_layer: list[str],
         comment: str,
         as_item_index: int | None = None,
-    ) -> str:
+    ) -> str | None:
         node = stuff.stuff_code
-        is_existing = self.nx_graph.has_node(node)
-        if is_existing:
+        nx_graph = run_graph.nx_graph
+        if nx_graph.has_node(node):
             if self._is_debug_mode:
-                existing_comment = self.nx_graph.nodes[node][NodeAttributeKey.COMMENT]
+                existing_comment = nx_graph.nodes[node][NodeAttributeKey.COMMENT]
                 comment = f"{existing_comment}<br/>+ {comment}"
-                self.nx_graph.nodes[node][NodeAttributeKey.COMMENT] = comment
+                nx_graph.nodes[node][NodeAttributeKey.COMMENT] = comment
             return node
-
-        stuff_content_rendered = stuff.content.rendered_plain()[:250]
-        stuff_content_type = type(stuff.content).__name__
-        stuff_description = f"{stuff_content_type}"
-        stuff_description += f"<br/><br/>{stuff_content_rendered}…"
+        if not self._is_node_allowed(run_graph=run_graph, node=node):
+            return None
 
         node_tag = self._make_stuff_node_tag(
             stuff=stuff,
             as_item_index=as_item_index,
         )
-        if stuff.is_text and self._tracker_config.is_include_text_preview:
-            node_tag += f"<br/>{stuff_content_rendered[:100]}"
         pipe_layer_str = self._pipe_layer_to_subgraph_name(pipe_layer)
+        # the content is only rendered into the description (and text preview) when a flowchart is output,
+        # and it's referenced weakly so that the graphs of the runs don't keep whole documents alive
         node_attributes: dict[str, Any] = {
             NodeAttributeKey.CATEGORY: NodeCategory.STUFF,
             NodeAttributeKey.TAG: node_tag,
             NodeAttributeKey.NAME: stuff.stuff_name,
-            NodeAttributeKey.DESCRIPTION: stuff_description,
+            NodeAttributeKey.STUFF_CONTENT: weakref.ref(stuff.content),
+            NodeAttributeKey.STUFF_CONTENT_TYPE: type(stuff.content).__name__,
+            NodeAttributeKey.IS_TEXT_PREVIEW: stuff.is_text and self._tracker_config.is_include_text_preview,
             NodeAttributeKey.DEBUG_INFO: stuff.stuff_code,
             NodeAttributeKey.COMMENT: comment,
             NodeAttributeKey.SUBGRAPH: pipe_layer_str,
         }
-        self.nx_graph.add_node(node, **node_attributes)
+        nx_graph.add_node(node, **node_attributes)
         return node
 
+    def _render_stuff_nodes(self, run_graph: PipelineRunGraph):
+        for _, node_attributes in run_graph.nx_graph.nodes(data=True):
+            stuff_content_ref = node_attributes.pop(NodeAttributeKey.STUFF_CONTENT, None)
+            if not isinstance(stuff_content_ref, weakref.ref):
+                continue
+            stuff_content_type = node_attributes.pop(NodeAttributeKey.STUFF_CONTENT_TYPE, "")
+            stuff_content = stuff_content_ref()
+            if not isinstance(stuff_content, StuffContent):
+                node_attributes[NodeAttributeKey.DESCRIPTION] = f"{stuff_content_type}<br/><br/>(content released)"
+                node_attributes.pop(NodeAttributeKey.IS_TEXT_PREVIEW, None)
+                continue
+            stuff_content_rendered = stuff_content.rendered_plain()[:250]
+            node_attributes[NodeAttributeKey.DESCRIPTION] = f"{stuff_content_type}<br/><br/>{stuff_content_rendered}…"
+            if node_attributes.pop(NodeAttributeKey.IS_TEXT_PREVIEW, False):
+                node_attributes[NodeAttributeKey.TAG] += f"<br/>{stuff_content_rendered[:100]}"
+
     def _add_edge(
         self,
+        run_graph: PipelineRunGraph,
         from_node: str,
         to_node: str,
         edge_category: EdgeCategory,
         attributes: dict[str, Any] | None = None,
     ):
+        nx_graph = run_graph.nx_graph
         # Ensure both nodes exist with attributes
-        if not self.nx_graph.has_node(from_node):
+        if not nx_graph.has_node(from_node):
             msg = f"Source node '{from_node}' does not exist"
             raise JobHistoryError(msg)
-        if not self.nx_graph.has_node(to_node):
+        if not nx_graph.has_node(to_node):
             msg = f"Target node '{to_node}' does not exist"
             raise JobHistoryError(msg)
-        if not self.nx_graph.nodes[from_node]:
+        if not nx_graph.nodes[from_node]:
             msg = f"Source node '{from_node}' exists but has no attributes"
             raise JobHistoryError(msg)
-        if not self.nx_graph.nodes[to_node]:
+        if not nx_graph.nodes[to_node]:
             msg = f"Target node '{to_node}' exists but has no attributes"
             raise JobHistoryError(msg)
 
@@ -154,11 +237,12 @@ class PipelineTracker(PipelineTrackerProtocol):
         }
         if attributes:
             edge_attributes.update(attributes)
-        self.nx_graph.add_edge(from_node, to_node, **edge_attributes)
+        nx_graph.add_edge(from_node, to_node, **edge_attributes)
 
     @override
     def add_pipe_step(
         self,
+        pipeline_run_id: str,
         from_stuff: Stuff | None,
         to_stuff: Stuff,
         pipe_code: str,
@@ -167,26 +251,31 @@ class PipelineTracker(PipelineTrackerProtocol):
         as_item_index: int | None = None,
         is_with_edge: bool = True,
     ):
-        if not self.is_active:
+        if not self.is_tracking(pipeline_run_id=pipeline_run_id):
             return
-        from_node: str
+        run_graph = self._get_run_graph(pipeline_run_id=pipeline_run_id)
+        from_node: str | None
         if from_stuff:
             from_node = self._add_stuff_node(
+                run_graph=run_graph,
                 stuff=from_stuff,
                 as_item_index=as_item_index,
                 pipe_layer=pipe_layer,
                 comment=comment,
             )
         else:
-            from_node = self._add_start_node()
-        if self.start_node is None:
-            self.start_node = from_node
+            from_node = self._add_start_node(run_graph=run_graph)
+        if run_graph.start_node is None:
+            run_graph.start_node = from_node
         to_node = self._add_stuff_node(
+            run_graph=run_graph,
             stuff=to_stuff,
             as_item_index=as_item_index,
             pipe_layer=pipe_layer,
             comment=comment,
         )
+        if from_node is None or to_node is None:
+            return
         edge_caption = pipe_code
         if self._is_debug_mode:
             edge_caption += f" ({comment})"
@@ -195,6 +284,7 @@ class PipelineTracker(PipelineTrackerProtocol):
         }
         if is_with_edge:
             self._add_edge(
+                run_graph=run_graph,
                 from_node=from_node,
                 to_node=to_node,
                 edge_category=EdgeCategory.PIPE,
@@ -204,32 +294,39 @@ class PipelineTracker(PipelineTrackerProtocol):
     @override
     def add_batch_step(
         self,
+        pipeline_run_id: str,
         from_stuff: Stuff | None,
         to_stuff: Stuff,
         to_branch_index: int,
         pipe_layer: list[str],
         comment: str,
     ):
-        if not self.is_active:
+        if not self.is_tracking(pipeline_run_id=pipeline_run_id):
             return
-        from_node: str
+        run_graph = self._get_run_graph(pipeline_run_id=pipeline_run_id)
+        from_node: str | None
         if from_stuff:
             from_node = self._add_stuff_node(
+                run_graph=run_graph,
                 stuff=from_stuff,
                 pipe_layer=pipe_layer,
                 comment=comment,
             )
         else:
-            from_node = self._add_start_node()
-        if self.start_node is None:
-            self.start_node = from_node
+            from_node = self._add_start_node(run_graph=run_graph)
+        if run_graph.start_node is None:
+            run_graph.start_node = from_node
         to_node = self._add_stuff_node(
+            run_graph=run_graph,
             stuff=to_stuff,
             as_item_index=to_branch_index,
             pipe_layer=pipe_layer,
             comment=comment,
         )
+        if from_node is None or to_node is None:
+            return
         self._add_edge(
+            run_graph=run_graph,
             from_node=from_node,
             to_node=to_node,
             edge_category=EdgeCategory.BATCH,
@@ -238,31 +335,40 @@ class PipelineTracker(PipelineTrackerProtocol):
     @override
     def add_aggregate_step(
         self,
+        pipeline_run_id: str,
         from_stuff: Stuff,
         to_stuff: Stuff,
         pipe_layer: list[str],
         comment: str,
     ):
-        if not self.is_active:
+        if not self.is_tracking(pipeline_run_id=pipeline_run_id):
             return
+        run_graph = self._get_run_graph(pipeline_run_id=pipeline_run_id)
         from_node = self._add_stuff_node(
+            run_graph=run_graph,
             stuff=from_stuff,
             pipe_layer=pipe_layer,
             comment=comment,
         )
         to_node = self._add_stuff_node(
+            run_graph=run_graph,
             stuff=to_stuff,
             pipe_layer=pipe_layer,
             comment=comment,
         )
+        if from_node is None or to_node is None:
+            return
         self._add_edge(
+            run_graph=run_graph,
             from_node=from_node,
             to_node=to_node,
             edge_category=EdgeCategory.AGGREGATE,
         )
 
-    def _add_condition_node(self, condition: PipeConditionDetails, pipe_layer: list[str]) -> str:
+    def _add_condition_node(self, run_graph: PipelineRunGraph, condition: PipeConditionDetails, pipe_layer: list[str]) -> str | None:
         node = condition.code
+        if not self._is_node_allowed(run_graph=run_graph, node=node):
+            return None
         condition_node_tag = f"Condition:<br>**{condition.test_expression}<br>= {condition.evaluated_expression}**"
         pipe_layer_str = self._pipe_layer_to_subgraph_name(pipe_layer)
         node_attributes: dict[str, Any] = {
@@ -271,30 +377,36 @@ class PipelineTracker(PipelineTrackerProtocol):
             NodeAttributeKey.NAME: condition.code,
             NodeAttributeKey.SUBGRAPH: pipe_layer_str,
         }
-        self.nx_graph.add_node(node, **node_attributes)
+        run_graph.nx_graph.add_node(node, **node_attributes)
         return node
 
     @override
     def add_condition_step(
         self,
+        pipeline_run_id: str,
         from_stuff: Stuff,
         to_condition: PipeConditionDetails,
         condition_expression: str,
         pipe_layer: list[str],
         comment: str,
     ):
-        if not self.is_active:
+        if not self.is_tracking(pipeline_run_id=pipeline_run_id):
             return
+        run_graph = self._get_run_graph(pipeline_run_id=pipeline_run_id)
         from_node = self._add_stuff_node(
+            run_graph=run_graph,
             stuff=from_stuff,
             pipe_layer=pipe_layer,
             comment=comment,
         )
-        to_node = self._add_condition_node(condition=to_condition, pipe_layer=pipe_layer)
+        to_node = self._add_condition_node(run_graph=run_graph, condition=to_condition, pipe_layer=pipe_layer)
+        if from_node is None or to_node is None:
+            return
         edge_attributes: dict[str, Any] = {
             EdgeAttributeKey.CONDITION_EXPRESSION: condition_expression,
         }
         self._add_edge(
+            run_graph=run_graph,
             from_node=from_node,
             to_node=to_node,
             edge_category=EdgeCategory.CONDITION,
@@ -304,36 +416,50 @@ class PipelineTracker(PipelineTrackerProtocol):
     @override
     def add_choice_step(
         self,
+        pipeline_run_id: str,
         from_condition: PipeConditionDetails,
         to_stuff: Stuff,
         pipe_layer: list[str],
         comment: str,
     ):
-        if not self.is_active:
+        if not self.is_tracking(pipeline_run_id=pipeline_run_id):
             return
+        run_graph = self._get_run_graph(pipeline_run_id=pipeline_run_id)
         to_node = self._add_stuff_node(
+            run_graph=run_graph,
             stuff=to_stuff,
             pipe_layer=pipe_layer,
             comment=comment,
         )
+        if to_node is None or not run_graph.nx_graph.has_node(from_condition.code):
+            return
         edge_attributes: dict[str, Any] = {
             EdgeAttributeKey.CHOSEN_PIPE: from_condition.chosen_pipe_code,
         }
         self._add_edge(
+            run_graph=run_graph,
             from_node=from_condition.code,
             to_node=to_node,
             edge_category=EdgeCategory.CHOICE,
             attributes=edge_attributes,
         )
 
-    def _print_mermaid_flowchart_code_and_url(self, title: str | None = None, subtitle: str | None = None):
-        if not self.nx_graph.nodes:
+    def _make_flowchart(self, pipeline_run_id: str | None) -> PipelineFlowChart | None:
+        pipeline_run_id = pipeline_run_id or self._last_pipeline_run_id
+        run_graph = self.get_optional_run_graph(pipeline_run_id=pipeline_run_id) if pipeline_run_id else None
+        if run_graph is None or not run_graph.nx_graph.nodes:
             log.verbose("No nodes in the pipeline tracker")
-            return
-        if self.start_node is None:
+            return None
+        if run_graph.start_node is None:
             msg = "Start node is not set"
             raise JobHistoryError(msg)
-        flowchart = PipelineFlowChart(nx_graph=self.nx_graph, start_node=self.start_node, tracker_config=self._tracker_config)
+        self._render_stuff_nodes(run_graph=run_graph)
+        return PipelineFlowChart(nx_graph=run_graph.nx_graph, start_node=run_graph.start_node, tracker_config=self._tracker_config)
+
+    def _print_mermaid_flowchart_code_and_url(self, pipeline_run_id: str | None, title: str | None = None, subtitle: str | None = None):
+        flowchart = self._make_flowchart(pipeline_run_id=pipeline_run_id)
+        if flowchart is None:
+            return
         mermaid_code, url = flowchart.generate_mermaid_flowchart(title=title, subtitle=subtitle)
         print(mermaid_code)
         title_to_print = "Mermaid flowchart URL"
@@ -341,14 +467,10 @@ class PipelineTracker(PipelineTrackerProtocol):
             title_to_print += f" for {title}"
         print_mermaid_url(url=url, title=title_to_print)
 
-    def _print_mermaid_flowchart_url(self, title: str | None = None, subtitle: str | None = None) -> str | None:
-        if not self.nx_graph.nodes:
-            log.verbose("No nodes in the pipeline tracker")
+    def _print_mermaid_flowchart_url(self, pipeline_run_id: str | None, title: str | None = None, subtitle: str | None = None) -> str | None:
+        flowchart = self._make_flowchart(pipeline_run_id=pipeline_run_id)
+        if flowchart is None:
             return None
-        if self.start_node is None:
-            msg = "Start node is not set"
-            raise JobHistoryError(msg)
-        flowchart = PipelineFlowChart(nx_graph=self.nx_graph, start_node=self.start_node, tracker_config=self._tracker_config)
         _, url = flowchart.generate_mermaid_flowchart(title=title, subtitle=subtitle)
         title_to_print = "Mermaid flowchart URL"
         if title:
@@ -359,12 +481,13 @@ class PipelineTracker(PipelineTrackerProtocol):
     @override
     def output_flowchart(
         self,
+        pipeline_run_id: str | None = None,
         title: str | None = None,
         subtitle: str | None = None,
         is_detailed: bool = False,
     ) -> str | None:
         if is_detailed:
-            self._print_mermaid_flowchart_code_and_url(title=title, subtitle=subtitle)
+            self._print_mermaid_flowchart_code_and_url(pipeline_run_id=pipeline_run_id, title=title, subtitle=subtitle)
         else:
-            return self._print_mermaid_flowchart_url(title=title, subtitle=subtitle)
+            return self._print_mermaid_flowchart_url(pipeline_run_id=pipeline_run_id, title=title, subtitle=subtitle)
         return None
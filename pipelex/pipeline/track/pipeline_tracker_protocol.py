@@ -17,8 +17,15 @@ class PipelineTrackerProtocol(Protocol):
 
     def reset(self): ...
 
+    def close_pipeline_run(self, pipeline_run_id: str): ...
+
+    def is_tracking(self, pipeline_run_id: str) -> bool:
+        """Tell whether the steps of this pipeline run are tracked, so that callers can skip preparing them."""
+        ...
+
     def add_pipe_step(
         self,
+        pipeline_run_id: str,
         from_stuff: Stuff | None,
         to_stuff: Stuff,
         pipe_code: str,
@@ -30,6 +37,7 @@ class PipelineTrackerProtocol(Protocol):
 
     def add_batch_step(
         self,
+        pipeline_run_id: str,
         from_stuff: Stuff | None,
         to_stuff: Stuff,
         to_branch_index: int,
@@ -39,6 +47,7 @@ class PipelineTrackerProtocol(Protocol):
 
     def add_aggregate_step(
         self,
+        pipeline_run_id: str,
         from_stuff: Stuff,
         to_stuff: Stuff,
         pipe_layer: list[str],
@@ -47,6 +56,7 @@ class PipelineTrackerProtocol(Protocol):
 
     def add_condition_step(
         self,
+        pipeline_run_id: str,
         from_stuff: Stuff,
         to_condition: PipeConditionDetails,
         condition_expression: str,
@@ -56,6 +66,7 @@ class PipelineTrackerProtocol(Protocol):
 
     def add_choice_step(
         self,
+        pipeline_run_id: str,
         from_condition: PipeConditionDetails,
         to_stuff: Stuff,
         pipe_layer: list[str],
@@ -64,6 +75,7 @@ class PipelineTrackerProtocol(Protocol):
 
     def output_flowchart(
         self,
+        pipeline_run_id: str | None = None,
         title: str | None = None,
         subtitle: str | None = None,
         is_detailed: bool = False,
@@ -87,9 +99,18 @@ class PipelineTrackerNoOp(PipelineTrackerProtocol):
     def reset(self) -> None:
         pass
 
+    @override
+    def close_pipeline_run(self, pipeline_run_id: str) -> None:
+        pass
+
+    @override
+    def is_tracking(self, pipeline_run_id: str) -> bool:
+        return False
+
     @override
     def add_pipe_step(
         self,
+        pipeline_run_id: str,
         from_stuff: Stuff | None,
         to_stuff: Stuff,
         pipe_code: str,
@@ -103,6 +124,7 @@ class PipelineTrackerNoOp(PipelineTrackerProtocol):
     @override
     def add_batch_step(
         self,
+        pipeline_run_id: str,
         from_stuff: Stuff | None,
         to_stuff: Stuff,
         to_branch_index: int,
@@ -114,6 +136,7 @@ class PipelineTrackerNoOp(PipelineTrackerProtocol):
     @override
     def add_aggregate_step(
         self,
+        pipeline_run_id: str,
         from_stuff: Stuff,
         to_stuff: Stuff,
         pipe_layer: list[str],
@@ -124,6 +147,7 @@ class PipelineTrackerNoOp(PipelineTrackerProtocol):
     @override
     def add_condition_step(
         self,
+        pipeline_run_id: str,
         from_stuff: Stuff,
         to_condition: PipeConditionDetails,
         condition_expression: str,
@@ -135,6 +159,7 @@ class PipelineTrackerNoOp(PipelineTrackerProtocol):
     @override
     def add_choice_step(
         self,
+        pipeline_run_id: str,
         from_condition: PipeConditionDetails,
         to_stuff: Stuff,
         pipe_layer: list[str],
@@ -145,6 +170,7 @@ class PipelineTrackerNoOp(PipelineTrackerProtocol):
     @override
     def output_flowchart(
         self,
+        pipeline_run_id: str | None = None,
         title: str | None = None,
         subtitle: str | None = None,
         is_detailed: bool = False,
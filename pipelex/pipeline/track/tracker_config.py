@@ -1,9 +1,20 @@
 from typing import Literal
 
+from pydantic import Field
+
 from pipelex.system.configuration.config_model import ConfigModel
+from pipelex.types import StrEnum
+
+
+class TrackingMode(StrEnum):
+    OFF = "off"
+    SAMPLED = "sampled"
+    FULL = "full"
 
 
 class TrackerConfig(ConfigModel):
+    tracking_mode: TrackingMode = Field(strict=False)
+    sampling_percentage: float = Field(ge=0, le=100)
     is_debug_mode: bool
     is_include_text_preview: bool
     is_include_interactivity: bool
@@ -11,6 +22,8 @@ class TrackerConfig(ConfigModel):
     layout: str | Literal["auto"]
     wrapping_width: int | Literal["auto"]
     nb_items_limit: int | Literal["unlimited"]
+    max_nodes_per_run: int = Field(ge=1)
+    nb_closed_runs_kept: int = Field(ge=0)
     sub_graph_colors: list[str]
     pipe_edge_style: str
     branch_edge_style: str
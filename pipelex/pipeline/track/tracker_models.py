@@ -17,6 +17,9 @@ class NodeAttributeKey(StrEnum):
     DEBUG_INFO = "debug_info"
     SUBGRAPH = "subgraph"
     COMMENT = "comment"
+    STUFF_CONTENT = "stuff_content"
+    STUFF_CONTENT_TYPE = "stuff_content_type"
+    IS_TEXT_PREVIEW = "is_text_preview"
 
 
 class SpecialNodeName(StrEnum):
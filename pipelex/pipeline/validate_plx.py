@@ -3,7 +3,7 @@ from pydantic import ValidationError
 from pipelex import log
 from pipelex.core.bundles.pipelex_bundle_blueprint import PipelexBundleBlueprint
 from pipelex.core.exceptions import PipelexConfigurationError
-from pipelex.core.interpreter import PipelexInterpreter, PLXDecodeError
+from pipelex.core.interpreter import PipelexInterpreter
 from pipelex.core.pipes.pipe_abstract import PipeAbstract
 from pipelex.hub import get_library_manager
 from pipelex.libraries.exceptions import ConceptLoadingError, DomainLoadingError, PipeLibraryError, PipeLoadingError
@@ -35,25 +35,47 @@ async def validate_plx(plx_content: str, remove_after_validation: bool = True) -
         PipeLibraryError: For pipe library validation errors
         DryRunError: For dry run validation errors
     """
+    converter = PipelexInterpreter(file_content=plx_content)
+    blueprint = converter.make_pipelex_bundle_blueprint()
+    pipes = await validate_bundle_blueprint(blueprint=blueprint, remove_after_validation=remove_after_validation)
+    return blueprint, pipes
+
+
+async def validate_bundle_blueprint(blueprint: PipelexBundleBlueprint, remove_after_validation: bool = True) -> list[PipeAbstract]:
+    """Validate a bundle blueprint.
+
+    This function:
+    1. Loads domain, concepts and pipes from the blueprint
+    2. Runs static validation and dry runs all pipes
+
+    Args:
+        blueprint: The bundle blueprint to validate
+        remove_after_validation: Whether to remove the blueprint from the library manager after validation
+
+    Returns:
+        The loaded pipes
+
+    Raises:
+        DomainLoadingError: For domain loading errors
+        ConceptLoadingError: For concept loading errors
+        PipeLoadingError: For pipe loading errors
+        PipeLibraryError: For pipe library validation errors
+        DryRunError: For dry run validation errors
+    """
     library_manager = get_library_manager()
-    blueprint: PipelexBundleBlueprint | None = None
 
     try:
-        converter = PipelexInterpreter(file_content=plx_content)
-        blueprint = converter.make_pipelex_bundle_blueprint()
-
         pipes = library_manager.load_from_blueprint(blueprint=blueprint)
 
         for pipe in pipes:
             pipe.validate_with_libraries()
-            await dry_run_pipes(pipes=[pipe], raise_on_failure=True)
+        await dry_run_pipes(pipes=pipes, raise_on_failure=True)
 
         if remove_after_validation:
             library_manager.remove_from_blueprint(blueprint=blueprint)
-        return blueprint, pipes
+        return pipes
     except (
         PipelexConfigurationError,
-        PLXDecodeError,
         ValidationError,
         DomainLoadingError,
         ConceptLoadingError,
@@ -61,10 +83,9 @@ async def validate_plx(plx_content: str, remove_after_validation: bool = True) -
         PipeLibraryError,
         DryRunError,
     ):
-        if blueprint is not None:
-            try:
-                library_manager.remove_from_blueprint(blueprint=blueprint)
-            except Exception as cleanup_error:
-                log.error(f"Error during cleanup after validation failure: {cleanup_error}")
+        try:
+            library_manager.remove_from_blueprint(blueprint=blueprint)
+        except Exception as cleanup_error:
+            log.error(f"Error during cleanup after validation failure: {cleanup_error}")
 
         raise
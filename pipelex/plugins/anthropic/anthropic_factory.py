@@ -14,19 +14,18 @@ from pipelex.cogt.exceptions import CogtError
 from pipelex.cogt.image.prompt_image import (
     PromptImage,
     PromptImageBase64,
+    PromptImageBinary,
     PromptImagePath,
     PromptImageTypedBase64,
     PromptImageTypedUrlOrBase64,
     PromptImageUrl,
 )
-from pipelex.cogt.image.prompt_image_factory import PromptImageFactory
+from pipelex.cogt.image.prompt_image_cache import prompt_image_cache
 from pipelex.cogt.llm.llm_job import LLMJob
 from pipelex.cogt.model_backends.backend import InferenceBackend
 from pipelex.cogt.usage.token_category import NbTokensByCategoryDict, TokenCategory
 from pipelex.config import get_config
 from pipelex.plugins.plugin_sdk_registry import Plugin
-from pipelex.tools.misc.base_64_utils import load_binary_as_base64_async
-from pipelex.tools.misc.filetype_utils import detect_file_type_from_base64
 from pipelex.types import StrEnum
 
 if TYPE_CHECKING:
@@ -177,20 +176,10 @@ class AnthropicFactory:
         cls,
         prompt_image: PromptImage,
     ) -> PromptImageTypedUrlOrBase64:
-        typed_bytes_or_url: PromptImageTypedUrlOrBase64
-        if isinstance(prompt_image, PromptImageBase64):
-            typed_bytes_or_url = prompt_image.make_prompt_image_typed_base64()
-        elif isinstance(prompt_image, PromptImageUrl):
-            image_bytes = await PromptImageFactory.make_promptimagebase64_from_url_async(prompt_image)
-            file_type = detect_file_type_from_base64(image_bytes.base_64)
-            typed_bytes_or_url = PromptImageTypedBase64(base_64=image_bytes.base_64, file_type=file_type)
-        elif isinstance(prompt_image, PromptImagePath):
-            b64 = await load_binary_as_base64_async(prompt_image.file_path)
-            typed_bytes_or_url = PromptImageTypedBase64(base_64=b64, file_type=prompt_image.get_file_type())
-        else:
+        if not isinstance(prompt_image, (PromptImageBase64, PromptImageBinary, PromptImageUrl, PromptImagePath)):
             msg = f"Unsupported PromptImage type: '{type(prompt_image).__name__}'"
             raise AnthropicFactoryError(msg)
-        return typed_bytes_or_url
+        return await prompt_image_cache.get_typed_base64(prompt_image=prompt_image)
 
     @classmethod
     async def make_simple_messages(
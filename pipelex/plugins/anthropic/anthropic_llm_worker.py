@@ -1,3 +1,4 @@
+from collections.abc import AsyncIterator
 from typing import Any
 
 import instructor
@@ -101,7 +102,6 @@ class AnthropicLLMWorker(LLMWorkerInternalAbstract):
     # Instance methods
     #########################################################
 
-    # TODO: implement streaming behind the scenes to avoid timeout/streaming errors with Claude 4 and high tokens
     def _adapt_max_tokens(self, max_tokens: int | None) -> int:
         max_tokens = max_tokens or self.default_max_tokens
 
@@ -145,6 +145,27 @@ class AnthropicLLMWorker(LLMWorkerInternalAbstract):
 
         return full_reply_content
 
+    @override
+    async def _gen_text_stream(
+        self,
+        llm_job: LLMJob,
+    ) -> AsyncIterator[str]:
+        message = await AnthropicFactory.make_user_message(llm_job=llm_job)
+        max_tokens = self._adapt_max_tokens(max_tokens=llm_job.job_params.max_tokens)
+        async with self.anthropic_async_client.messages.stream(
+            messages=[message],
+            system=llm_job.llm_prompt.system_text or omit,
+            model=self.inference_model.model_id,
+            temperature=llm_job.job_params.temperature,
+            max_tokens=max_tokens,
+        ) as message_stream:
+            async for text_delta in message_stream.text_stream:
+                yield text_delta
+            final_message = await message_stream.get_final_message()
+
+        if (llm_tokens_usage := llm_job.job_report.llm_tokens_usage) and (usage := final_message.usage):
+            llm_tokens_usage.nb_tokens_by_category = AnthropicFactory.make_nb_tokens_by_category(usage=usage)
+
     @override
     async def _gen_object(
         self,
@@ -1,6 +1,10 @@
-from typing import TYPE_CHECKING, Any, cast
+import asyncio
+from collections.abc import AsyncIterator
+from contextlib import AsyncExitStack
+from typing import TYPE_CHECKING, Any, NamedTuple, cast
 
 import aioboto3
+from aiobotocore.config import AioConfig
 from types_aiobotocore_bedrock_runtime.type_defs import ConverseResponseTypeDef
 from typing_extensions import override
 
@@ -10,14 +14,78 @@ from pipelex.plugins.bedrock.bedrock_client_protocol import BedrockClientProtoco
 from pipelex.plugins.bedrock.bedrock_message import BedrockMessageDictList
 
 if TYPE_CHECKING:
+    from types_aiobotocore_bedrock_runtime import BedrockRuntimeClient
     from types_aiobotocore_bedrock_runtime.type_defs import ConverseResponseTypeDef
 
+DEFAULT_MAX_POOL_CONNECTIONS = 50
+DEFAULT_KEEPALIVE_TIMEOUT = 60.0
+
+
+class PooledRuntimeClient(NamedTuple):
+    runtime_client: "BedrockRuntimeClient"
+    exit_stack: AsyncExitStack
+
 
 class BedrockClientAioboto3(BedrockClientProtocol):
-    def __init__(self, aws_region: str):
+    """Bedrock client based on aioboto3, keeping a long-lived runtime client and its pool of connections.
+
+    Building a botocore client and opening its TLS connections is costly, so the runtime client is created on first use
+    and reused by all the calls. Its aiohttp connection pool is bound to the event loop it was created in,
+    so there is one runtime client per event loop.
+    """
+
+    def __init__(
+        self,
+        aws_region: str,
+        max_pool_connections: int = DEFAULT_MAX_POOL_CONNECTIONS,
+        keepalive_timeout: float = DEFAULT_KEEPALIVE_TIMEOUT,
+    ):
         log.verbose(f"Init BedrockClientAioboto3 with region '{aws_region}'")
         self.aws_region = aws_region
         self.session = aioboto3.Session()
+        self.aio_config = AioConfig(
+            max_pool_connections=max_pool_connections,
+            tcp_keepalive=True,
+            connector_args={"keepalive_timeout": keepalive_timeout},
+        )
+        self._pooled_clients: dict[asyncio.AbstractEventLoop, PooledRuntimeClient] = {}
+
+    async def get_runtime_client(self) -> "BedrockRuntimeClient":
+        event_loop = asyncio.get_running_loop()
+        if pooled_client := self._pooled_clients.get(event_loop):
+            return pooled_client.runtime_client
+
+        # the clients of closed event loops can't be used anymore, nor closed properly
+        for closed_event_loop in [pooled_loop for pooled_loop in self._pooled_clients if pooled_loop.is_closed()]:
+            del self._pooled_clients[closed_event_loop]
+
+        exit_stack = AsyncExitStack()
+        runtime_client: BedrockRuntimeClient = await exit_stack.enter_async_context(
+            self.session.client("bedrock-runtime", region_name=self.aws_region, config=self.aio_config)  # pyright: ignore[reportUnknownMemberType]
+        )
+        if pooled_client := self._pooled_clients.get(event_loop):
+            # another call created the client while we were creating ours
+            await exit_stack.aclose()
+            return pooled_client.runtime_client
+        self._pooled_clients[event_loop] = PooledRuntimeClient(runtime_client=runtime_client, exit_stack=exit_stack)
+        log.verbose(f"Created pooled Bedrock runtime client for region '{self.aws_region}'")
+        return runtime_client
+
+    async def aclose(self):
+        """Close the runtime client of the running event loop, if any."""
+        if pooled_client := self._pooled_clients.pop(asyncio.get_running_loop(), None):
+            await pooled_client.exit_stack.aclose()
+
+    def teardown(self):
+        """Close the pooled runtime clients, as far as their event loops allow it."""
+        for event_loop, pooled_client in self._pooled_clients.items():
+            if event_loop.is_closed():
+                continue
+            if event_loop.is_running():
+                event_loop.create_task(pooled_client.exit_stack.aclose())
+            else:
+                event_loop.run_until_complete(pooled_client.exit_stack.aclose())
+        self._pooled_clients.clear()
 
     @override
     async def chat(
@@ -39,13 +107,46 @@ class BedrockClientAioboto3(BedrockClientProtocol):
         if system_text:
             params["system"] = [{"text": system_text}]
 
-        async with self.session.client("bedrock-runtime", region_name=self.aws_region) as aioboto3_session:  # pyright: ignore[reportUnknownMemberType]
-            conversation_response: ConverseResponseTypeDef = await aioboto3_session.converse(**params)
-            resp_dict: dict[str, Any] = cast("dict[str, Any]", conversation_response)
-            usage_dict: dict[str, Any] = resp_dict["usage"]
-            nb_tokens_by_category: NbTokensByCategoryDict = {
-                TokenCategory.INPUT: usage_dict["inputTokens"],
-                TokenCategory.OUTPUT: usage_dict["outputTokens"],
-            }
-            response_text: str = resp_dict["output"]["message"]["content"][0]["text"]
-            return response_text, nb_tokens_by_category
+        runtime_client = await self.get_runtime_client()
+        conversation_response: ConverseResponseTypeDef = await runtime_client.converse(**params)
+        resp_dict: dict[str, Any] = cast("dict[str, Any]", conversation_response)
+        usage_dict: dict[str, Any] = resp_dict["usage"]
+        nb_tokens_by_category: NbTokensByCategoryDict = {
+            TokenCategory.INPUT: usage_dict["inputTokens"],
+            TokenCategory.OUTPUT: usage_dict["outputTokens"],
+        }
+        response_text: str = resp_dict["output"]["message"]["content"][0]["text"]
+        return response_text, nb_tokens_by_category
+
+    @override
+    async def chat_stream(
+        self,
+        messages: BedrockMessageDictList,
+        system_text: str | None,
+        model: str,
+        temperature: float,
+        nb_tokens_by_category: NbTokensByCategoryDict,
+        max_tokens: int | None = None,
+    ) -> AsyncIterator[str]:
+        params: dict[str, Any] = {
+            "modelId": model,
+            "messages": messages,
+            "inferenceConfig": {
+                "temperature": temperature,
+                "maxTokens": max_tokens,
+            },
+        }
+        if system_text:
+            params["system"] = [{"text": system_text}]
+
+        runtime_client = await self.get_runtime_client()
+        stream_response = cast("dict[str, Any]", await runtime_client.converse_stream(**params))
+        async for stream_event in stream_response["stream"]:
+            event_dict = cast("dict[str, Any]", stream_event)
+            if content_block_delta := event_dict.get("contentBlockDelta"):
+                if text_delta := content_block_delta["delta"].get("text"):
+                    yield text_delta
+            elif metadata := event_dict.get("metadata"):
+                usage_dict: dict[str, Any] = metadata["usage"]
+                nb_tokens_by_category[TokenCategory.INPUT] = usage_dict["inputTokens"]
+                nb_tokens_by_category[TokenCategory.OUTPUT] = usage_dict["outputTokens"]
@@ -1,4 +1,5 @@
 import asyncio
+from collections.abc import AsyncIterator, Iterator
 from typing import Any
 
 import boto3
@@ -45,3 +46,38 @@ class BedrockClientBoto3(BedrockClientProtocol):
         }
         response_text: str = resp_dict["output"]["message"]["content"][0]["text"]
         return response_text, nb_tokens_by_category
+
+    @override
+    async def chat_stream(
+        self,
+        messages: BedrockMessageDictList,
+        system_text: str | None,
+        model: str,
+        temperature: float,
+        nb_tokens_by_category: NbTokensByCategoryDict,
+        max_tokens: int | None = None,
+    ) -> AsyncIterator[str]:
+        params: dict[str, Any] = {
+            "modelId": model,
+            "messages": messages,
+            "inferenceConfig": {
+                "temperature": temperature,
+                "maxTokens": max_tokens,
+            },
+        }
+        if system_text:
+            params["system"] = [{"text": system_text}]
+
+        loop: asyncio.AbstractEventLoop = asyncio.get_event_loop()
+        resp_dict: dict[str, Any] = await loop.run_in_executor(None, lambda: self.boto3_client.converse_stream(**params))  # pyright: ignore[reportUnknownLambdaType, reportUnknownMemberType]
+
+        # the boto3 event stream is blocking, so each event is read in the executor
+        stream_events: Iterator[dict[str, Any]] = iter(resp_dict["stream"])
+        while (event_dict := await loop.run_in_executor(None, next, stream_events, None)) is not None:
+            if content_block_delta := event_dict.get("contentBlockDelta"):
+                if text_delta := content_block_delta["delta"].get("text"):
+                    yield text_delta
+            elif metadata := event_dict.get("metadata"):
+                usage_dict: dict[str, Any] = metadata["usage"]
+                nb_tokens_by_category[TokenCategory.INPUT] = usage_dict["inputTokens"]
+                nb_tokens_by_category[TokenCategory.OUTPUT] = usage_dict["outputTokens"]
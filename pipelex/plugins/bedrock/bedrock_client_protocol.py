@@ -1,3 +1,4 @@
+from collections.abc import AsyncIterator
 from typing import Protocol, runtime_checkable
 
 from pipelex.cogt.usage.token_category import NbTokensByCategoryDict
@@ -14,3 +15,15 @@ class BedrockClientProtocol(Protocol):
         temperature: float,
         max_tokens: int | None = None,
     ) -> tuple[str, NbTokensByCategoryDict]: ...
+
+    def chat_stream(
+        self,
+        messages: BedrockMessageDictList,
+        system_text: str | None,
+        model: str,
+        temperature: float,
+        nb_tokens_by_category: NbTokensByCategoryDict,
+        max_tokens: int | None = None,
+    ) -> AsyncIterator[str]:
+        """Stream the text of the response, and fill nb_tokens_by_category once the stream is over."""
+        ...
@@ -19,6 +19,8 @@ class BedrockSdkVariant(StrEnum):
 
 class BedrockExtraField(StrEnum):
     AWS_REGION = "aws_region"
+    MAX_POOL_CONNECTIONS = "max_pool_connections"
+    KEEPALIVE_TIMEOUT = "keepalive_timeout"
 
 
 class BedrockFactory:
@@ -42,10 +44,16 @@ class BedrockFactory:
         log.verbose(f"Using '{sdk_variant}' for BedrockClient")
         match sdk_variant:
             case BedrockSdkVariant.AIBOTO3:
-                from pipelex.plugins.bedrock.bedrock_client_aioboto3 import BedrockClientAioboto3  # noqa: PLC0415
+                from pipelex.plugins.bedrock.bedrock_client_aioboto3 import (  # noqa: PLC0415
+                    DEFAULT_KEEPALIVE_TIMEOUT,
+                    DEFAULT_MAX_POOL_CONNECTIONS,
+                    BedrockClientAioboto3,
+                )
 
                 bedrock_async_client = BedrockClientAioboto3(
                     aws_region=backend.extra_config[BedrockExtraField.AWS_REGION],
+                    max_pool_connections=backend.extra_config.get(BedrockExtraField.MAX_POOL_CONNECTIONS, DEFAULT_MAX_POOL_CONNECTIONS),
+                    keepalive_timeout=backend.extra_config.get(BedrockExtraField.KEEPALIVE_TIMEOUT, DEFAULT_KEEPALIVE_TIMEOUT),
                 )
             case BedrockSdkVariant.BOTO3:
                 from pipelex.plugins.bedrock.bedrock_client_boto3 import BedrockClientBoto3  # noqa: PLC0415
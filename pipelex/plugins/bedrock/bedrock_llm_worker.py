@@ -1,4 +1,5 @@
-from typing import Any
+from collections.abc import AsyncIterator
+from typing import TYPE_CHECKING, Any
 
 from typing_extensions import override
 
@@ -13,6 +14,9 @@ from pipelex.plugins.bedrock.bedrock_factory import BedrockFactory
 from pipelex.reporting.reporting_protocol import ReportingProtocol
 from pipelex.tools.typing.pydantic_utils import BaseModelTypeVar
 
+if TYPE_CHECKING:
+    from pipelex.cogt.usage.token_category import NbTokensByCategoryDict
+
 
 class BedrockWorkerConfigurationError(CogtError):
     pass
@@ -64,6 +68,26 @@ class BedrockLLMWorker(LLMWorkerInternalAbstract):
             llm_tokens_usage.nb_tokens_by_category = nb_tokens_by_category
         return bedrock_response_text
 
+    @override
+    async def _gen_text_stream(
+        self,
+        llm_job: LLMJob,
+    ) -> AsyncIterator[str]:
+        message = BedrockFactory.make_simple_message(llm_job=llm_job)
+
+        nb_tokens_by_category: NbTokensByCategoryDict = {}
+        async for text_delta in self.bedrock_client_for_text.chat_stream(
+            messages=message.to_dict_list(),
+            system_text=llm_job.llm_prompt.system_text,
+            model=self.inference_model.model_id,
+            temperature=llm_job.job_params.temperature,
+            nb_tokens_by_category=nb_tokens_by_category,
+            max_tokens=llm_job.job_params.max_tokens or self.default_max_tokens,
+        ):
+            yield text_delta
+        if (llm_tokens_usage := llm_job.job_report.llm_tokens_usage) and nb_tokens_by_category:
+            llm_tokens_usage.nb_tokens_by_category = nb_tokens_by_category
+
     @override
     async def _gen_object(
         self,
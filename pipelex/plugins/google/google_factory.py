@@ -7,14 +7,14 @@ from pipelex.cogt.exceptions import CogtError
 from pipelex.cogt.image.prompt_image import (
     PromptImage,
     PromptImageBase64,
+    PromptImageBinary,
     PromptImagePath,
     PromptImageUrl,
 )
-from pipelex.cogt.image.prompt_image_factory import PromptImageFactory
+from pipelex.cogt.image.prompt_image_cache import prompt_image_cache
 from pipelex.cogt.llm.llm_prompt import LLMPrompt
 from pipelex.cogt.model_backends.backend import InferenceBackend
 from pipelex.cogt.usage.token_category import NbTokensByCategoryDict, TokenCategory
-from pipelex.tools.misc.base_64_utils import load_binary_async
 
 
 class GoogleFactoryError(CogtError):
@@ -30,24 +30,11 @@ class GoogleFactory:
     @classmethod
     async def prepare_image_part(cls, prompt_image: PromptImage) -> genai_types.Part:
         """Convert a PromptImage to Google genai Part format."""
-        image_bytes: bytes
-        mime_type: str
-
-        if isinstance(prompt_image, PromptImageBase64):
-            image_bytes = prompt_image.get_decoded_bytes()
-            mime_type = prompt_image.get_mime_type()
-            return genai_types.Part.from_bytes(data=image_bytes, mime_type=mime_type)
-        if isinstance(prompt_image, PromptImagePath):
-            image_bytes = await load_binary_async(prompt_image.file_path)
-            mime_type = prompt_image.get_mime_type()
-            return genai_types.Part.from_bytes(data=image_bytes, mime_type=mime_type)
-        if isinstance(prompt_image, PromptImageUrl):
-            prompt_image_binary = await PromptImageFactory.make_promptimagebinary_from_url_async(prompt_image)
-            image_bytes = prompt_image_binary.binary
-            mime_type = prompt_image_binary.get_mime_type()
-            return genai_types.Part.from_bytes(data=image_bytes, mime_type=mime_type)
-        msg = f"Unsupported PromptImage type: '{type(prompt_image).__name__}'"
-        raise GoogleFactoryError(msg)
+        if not isinstance(prompt_image, (PromptImageBase64, PromptImageBinary, PromptImagePath, PromptImageUrl)):
+            msg = f"Unsupported PromptImage type: '{type(prompt_image).__name__}'"
+            raise GoogleFactoryError(msg)
+        prompt_image_binary = await prompt_image_cache.get_typed_binary(prompt_image=prompt_image)
+        return genai_types.Part.from_bytes(data=prompt_image_binary.binary, mime_type=prompt_image_binary.file_type.mime)
 
     @classmethod
     async def prepare_user_contents(cls, llm_prompt: LLMPrompt) -> genai_types.ContentListUnion:
@@ -1,3 +1,4 @@
+from collections.abc import AsyncIterator
 from typing import TYPE_CHECKING, cast
 
 import instructor
@@ -56,6 +57,18 @@ class GoogleLLMWorker(LLMWorkerInternalAbstract):
         if instructor_config.is_dump_error_enabled:
             self.instructor_for_objects.on(hook_name="completion:error", handler=dump_error)
 
+    def _make_generation_config(self, llm_job: LLMJob) -> types.GenerateContentConfig:
+        generation_config = types.GenerateContentConfig(
+            temperature=llm_job.job_params.temperature,
+            max_output_tokens=llm_job.job_params.max_tokens,
+            candidate_count=1,  # Generate one candidate
+        )
+
+        # Add system instruction if present (as part of config)
+        if llm_job.llm_prompt.system_text:
+            generation_config.system_instruction = llm_job.llm_prompt.system_text
+        return generation_config
+
     @override
     async def _gen_text(
         self,
@@ -66,15 +79,7 @@ class GoogleLLMWorker(LLMWorkerInternalAbstract):
         contents = await GoogleFactory.prepare_user_contents(llm_job.llm_prompt)
 
         # Build generation config
-        generation_config = types.GenerateContentConfig(
-            temperature=llm_job.job_params.temperature,
-            max_output_tokens=llm_job.job_params.max_tokens,
-            candidate_count=1,  # Generate one candidate
-        )
-
-        # Add system instruction if present (as part of config)
-        if llm_job.llm_prompt.system_text:
-            generation_config.system_instruction = llm_job.llm_prompt.system_text
+        generation_config = self._make_generation_config(llm_job=llm_job)
 
         # Generate content using async client
         response = await self.genai_async_client.models.generate_content(
@@ -105,6 +110,25 @@ class GoogleLLMWorker(LLMWorkerInternalAbstract):
 
         return text_content
 
+    @override
+    async def _gen_text_stream(
+        self,
+        llm_job: LLMJob,
+    ) -> AsyncIterator[str]:
+        """Stream text using Google Gemini API."""
+        contents = await GoogleFactory.prepare_user_contents(llm_job.llm_prompt)
+        response_stream = await self.genai_async_client.models.generate_content_stream(
+            model=self.inference_model.model_id,
+            contents=contents,
+            config=self._make_generation_config(llm_job=llm_job),
+        )
+        async for response_chunk in response_stream:
+            if text_delta := response_chunk.text:
+                yield text_delta
+            # the usage metadata is cumulative, so the last chunk holds the usage of the whole completion
+            if llm_job.job_report.llm_tokens_usage and response_chunk.usage_metadata:
+                llm_job.job_report.llm_tokens_usage.nb_tokens_by_category = GoogleFactory.extract_token_usage(response_chunk.usage_metadata)
+
     @override
     async def _gen_object(
         self,
@@ -12,13 +12,13 @@ from openai.types.completion_usage import CompletionUsage
 
 from pipelex import log
 from pipelex.cogt.exceptions import LLMPromptParameterError
-from pipelex.cogt.image.prompt_image import PromptImage, PromptImageBase64, PromptImagePath, PromptImageUrl
+from pipelex.cogt.image.prompt_image import PromptImage, PromptImageBase64, PromptImageBinary, PromptImagePath, PromptImageUrl
+from pipelex.cogt.image.prompt_image_cache import prompt_image_cache
 from pipelex.cogt.llm.llm_job import LLMJob
 from pipelex.cogt.model_backends.backend import InferenceBackend
 from pipelex.cogt.usage.token_category import NbTokensByCategoryDict, TokenCategory
 from pipelex.plugins.groq.groq_exceptions import GroqFactoryError
 from pipelex.plugins.plugin_sdk_registry import Plugin
-from pipelex.tools.misc.base_64_utils import load_binary_as_base64
 from pipelex.types import StrEnum
 
 
@@ -59,7 +59,7 @@ class GroqFactory:
         return the_client
 
     @classmethod
-    def make_simple_messages(
+    async def make_simple_messages(
         cls,
         llm_job: LLMJob,
     ) -> list[ChatCompletionMessageParam]:
@@ -77,7 +77,7 @@ class GroqFactory:
 
         if llm_prompt.user_images:
             for prompt_image in llm_prompt.user_images:
-                groq_image_url = cls.make_groq_image_url(prompt_image=prompt_image)
+                groq_image_url = await cls.make_groq_image_url(prompt_image=prompt_image)
                 image_param = ChatCompletionContentPartImageParam(image_url=groq_image_url, type="image_url")
                 user_contents.append(image_param)
 
@@ -85,7 +85,7 @@ class GroqFactory:
         return messages
 
     @classmethod
-    def make_groq_image_url(cls, prompt_image: PromptImage) -> ImageURL:
+    async def make_groq_image_url(cls, prompt_image: PromptImage) -> ImageURL:
         """Convert PromptImage to Groq-compatible ImageURL format.
 
         Groq supports:
@@ -97,36 +97,14 @@ class GroqFactory:
         if isinstance(prompt_image, PromptImageUrl):
             url = prompt_image.url
             groq_image_url = ImageURL(url=url, detail="high")
-        elif isinstance(prompt_image, PromptImageBase64):
-            # Detect media type from base64 if possible, default to jpeg
-            media_type = cls._detect_image_media_type(prompt_image.base_64) or "jpeg"
-            url_with_bytes: str = f"data:image/{media_type};base64,{prompt_image.base_64.decode('utf-8')}"
+        elif isinstance(prompt_image, (PromptImageBase64, PromptImageBinary, PromptImagePath)):
+            url_with_bytes = await prompt_image_cache.get_data_url(prompt_image=prompt_image)
             groq_image_url = ImageURL(url=url_with_bytes, detail="high")
-        elif isinstance(prompt_image, PromptImagePath):
-            image_bytes = load_binary_as_base64(path=prompt_image.file_path)
-            return cls.make_groq_image_url(PromptImageBase64(base_64=image_bytes))
         else:
             msg = f"prompt_image of type {type(prompt_image)} is not supported"
             raise LLMPromptParameterError(msg)
         return groq_image_url
 
-    @staticmethod
-    def _detect_image_media_type(base64_bytes: bytes) -> str | None:
-        """Detect image media type from base64 bytes header."""
-        try:
-            # Check first few bytes for common image signatures
-            if base64_bytes.startswith(b"\xff\xd8\xff"):
-                return "jpeg"
-            elif base64_bytes.startswith(b"\x89PNG"):
-                return "png"
-            elif base64_bytes.startswith(b"GIF"):
-                return "gif"
-            elif base64_bytes.startswith(b"RIFF") and b"WEBP" in base64_bytes[:12]:
-                return "webp"
-        except Exception as e:
-            log.warning(e)
-        return "jpeg"  # Default to jpeg
-
     @staticmethod
     def make_openai_error_info(exception: Exception) -> str:
         """Map OpenAI exceptions to user-friendly error messages for Groq."""
@@ -1,3 +1,4 @@
+from collections.abc import AsyncIterator
 from typing import TYPE_CHECKING, Any
 
 import instructor
@@ -71,7 +72,7 @@ class GroqLLMWorker(LLMWorkerInternalAbstract):
         self,
         llm_job: LLMJob,
     ) -> str:
-        messages = GroqFactory.make_simple_messages(llm_job=llm_job)
+        messages = await GroqFactory.make_simple_messages(llm_job=llm_job)
 
         try:
             temperature = llm_job.job_params.temperature
@@ -105,13 +106,48 @@ class GroqLLMWorker(LLMWorkerInternalAbstract):
             llm_tokens_usage.nb_tokens_by_category = GroqFactory.make_nb_tokens_by_category(usage=usage)
         return response_text
 
+    @override
+    async def _gen_text_stream(
+        self,
+        llm_job: LLMJob,
+    ) -> AsyncIterator[str]:
+        messages = await GroqFactory.make_simple_messages(llm_job=llm_job)
+
+        try:
+            response_stream = await self.groq_client_for_text.chat.completions.create(
+                model=self.inference_model.model_id,
+                temperature=llm_job.job_params.temperature,
+                max_tokens=llm_job.job_params.max_tokens or omit,
+                seed=llm_job.job_params.seed,
+                messages=messages,
+                stream=True,
+                stream_options={"include_usage": True},
+            )
+            async for chunk in response_stream:
+                if chunk.choices and (text_delta := chunk.choices[0].delta.content):
+                    yield text_delta
+                if (llm_tokens_usage := llm_job.job_report.llm_tokens_usage) and (usage := chunk.usage):
+                    llm_tokens_usage.nb_tokens_by_category = GroqFactory.make_nb_tokens_by_category(usage=usage)
+        except NotFoundError as not_found_error:
+            msg = f"Groq model not found:\n{self.inference_model.desc}\nmodel: {self.inference_model.model_id}\n{not_found_error}"
+            raise LLMModelNotFoundError(msg) from not_found_error
+        except APIConnectionError as api_connection_error:
+            msg = f"Groq API connection error: {api_connection_error}"
+            raise LLMCompletionError(msg) from api_connection_error
+        except BadRequestError as bad_request_error:
+            msg = f"Groq bad request error with model: {self.inference_model.desc}:\n{bad_request_error}"
+            raise LLMCompletionError(msg) from bad_request_error
+        except openai.RateLimitError as rate_limit_error:
+            msg = f"Groq rate limit exceeded: {rate_limit_error}"
+            raise LLMCompletionError(msg) from rate_limit_error
+
     @override
     async def _gen_object(
         self,
         llm_job: LLMJob,
         schema: type[BaseModelTypeVar],
     ) -> BaseModelTypeVar:
-        messages = GroqFactory.make_simple_messages(llm_job=llm_job)
+        messages = await GroqFactory.make_simple_messages(llm_job=llm_job)
         try:
             temperature = llm_job.job_params.temperature
             try:
@@ -23,13 +23,12 @@ from openai.types.chat import (
 
 from pipelex.cogt.exceptions import PromptImageFormatError
 from pipelex.cogt.extract.extract_output import ExtractedImageFromPage, ExtractOutput, Page
-from pipelex.cogt.image.prompt_image import PromptImage, PromptImageBase64, PromptImagePath, PromptImageUrl
+from pipelex.cogt.image.prompt_image import PromptImage, PromptImageBase64, PromptImageBinary, PromptImagePath, PromptImageUrl
+from pipelex.cogt.image.prompt_image_cache import prompt_image_cache
 from pipelex.cogt.llm.llm_job import LLMJob
 from pipelex.cogt.model_backends.backend import InferenceBackend
 from pipelex.cogt.usage.token_category import NbTokensByCategoryDict, TokenCategory
 from pipelex.plugins.openai.openai_factory import OpenAIFactory
-from pipelex.tools.misc.base_64_utils import load_binary_as_base64
-from pipelex.tools.misc.filetype_utils import detect_file_type_from_base64, detect_file_type_from_path
 
 
 class MistralFactory:
@@ -49,14 +48,14 @@ class MistralFactory:
     #########################################################
 
     @classmethod
-    def make_simple_messages(cls, llm_job: LLMJob) -> list[Messages]:
+    async def make_simple_messages(cls, llm_job: LLMJob) -> list[Messages]:
         """Makes a list of messages with a system message (if provided) and followed by a user message."""
         messages: list[Messages] = []
         user_content: list[ContentChunk] = []
         if user_text := llm_job.llm_prompt.user_text:
             user_content.append(TextChunk(text=user_text))
         if user_images := llm_job.llm_prompt.user_images:
-            user_content.extend(cls.make_mistral_image_url(user_image) for user_image in user_images)
+            user_content.extend([await cls.make_mistral_image_url(user_image) for user_image in user_images])
         if user_content:
             messages.append(UserMessage(content=user_content))
 
@@ -66,22 +65,16 @@ class MistralFactory:
         return messages
 
     @classmethod
-    def make_mistral_image_url(cls, prompt_image: PromptImage) -> ImageURLChunk:
+    async def make_mistral_image_url(cls, prompt_image: PromptImage) -> ImageURLChunk:
         if isinstance(prompt_image, PromptImageUrl):
             return ImageURLChunk(image_url=prompt_image.url)
-        if isinstance(prompt_image, PromptImagePath):
-            image_bytes = load_binary_as_base64(prompt_image.file_path).decode("utf-8")
-            file_type = detect_file_type_from_path(prompt_image.file_path)
-            return ImageURLChunk(image_url=f"data:{file_type.mime};base64,{image_bytes}")
-        if isinstance(prompt_image, PromptImageBase64):
-            image_bytes = prompt_image.base_64.decode("utf-8")
-            file_type = detect_file_type_from_base64(prompt_image.base_64)
-            return ImageURLChunk(image_url=f"data:{file_type.mime};base64,{image_bytes}")
+        if isinstance(prompt_image, (PromptImagePath, PromptImageBase64, PromptImageBinary)):
+            return ImageURLChunk(image_url=await prompt_image_cache.get_data_url(prompt_image=prompt_image))
         msg = f"prompt_image of type {type(prompt_image)} is not supported"
         raise PromptImageFormatError(msg)
 
     @classmethod
-    def make_simple_messages_openai_typed(
+    async def make_simple_messages_openai_typed(
         cls,
         llm_job: LLMJob,
     ) -> list[ChatCompletionMessageParam]:
@@ -99,7 +92,7 @@ class MistralFactory:
 
         if user_images := llm_prompt.user_images:
             for prompt_image in user_images:
-                openai_image_url = OpenAIFactory.make_openai_image_url(prompt_image=prompt_image)
+                openai_image_url = await OpenAIFactory.make_openai_image_url(prompt_image=prompt_image)
                 image_param = ChatCompletionContentPartImageParam(image_url=openai_image_url, type="image_url")
                 user_contents.append(image_param)
 
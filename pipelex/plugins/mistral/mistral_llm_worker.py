@@ -1,3 +1,4 @@
+from collections.abc import AsyncIterator
 from typing import TYPE_CHECKING, Any
 
 import instructor
@@ -57,7 +58,7 @@ class MistralLLMWorker(LLMWorkerInternalAbstract):
         self,
         llm_job: LLMJob,
     ) -> str:
-        messages = MistralFactory.make_simple_messages(llm_job=llm_job)
+        messages = await MistralFactory.make_simple_messages(llm_job=llm_job)
         response: ChatCompletionResponse | None = await self.mistral_client_for_text.chat.complete_async(
             messages=messages,
             model=self.inference_model.model_id,
@@ -80,6 +81,26 @@ class MistralLLMWorker(LLMWorkerInternalAbstract):
 
         return mistral_response_content
 
+    @override
+    async def _gen_text_stream(
+        self,
+        llm_job: LLMJob,
+    ) -> AsyncIterator[str]:
+        messages = await MistralFactory.make_simple_messages(llm_job=llm_job)
+        response_stream = await self.mistral_client_for_text.chat.stream_async(
+            messages=messages,
+            model=self.inference_model.model_id,
+            temperature=llm_job.job_params.temperature,
+            max_tokens=llm_job.job_params.max_tokens or self.default_max_tokens,
+        )
+        async with response_stream as completion_events:
+            async for completion_event in completion_events:
+                chunk = completion_event.data
+                if chunk.choices and isinstance(text_delta := chunk.choices[0].delta.content, str) and text_delta:
+                    yield text_delta
+                if (llm_tokens_usage := llm_job.job_report.llm_tokens_usage) and (usage := chunk.usage):
+                    llm_tokens_usage.nb_tokens_by_category = MistralFactory.make_nb_tokens_by_category(usage=usage)
+
     @override
     async def _gen_object(
         self,
@@ -88,7 +109,7 @@ class MistralLLMWorker(LLMWorkerInternalAbstract):
     ) -> BaseModelTypeVar:
         result_object, completion = await self.instructor_for_objects.chat.completions.create_with_completion(
             response_model=schema,
-            messages=MistralFactory.make_simple_messages_openai_typed(llm_job=llm_job),
+            messages=await MistralFactory.make_simple_messages_openai_typed(llm_job=llm_job),
             model=self.inference_model.model_id,
             temperature=llm_job.job_params.temperature,
             max_tokens=llm_job.job_params.max_tokens or self.default_max_tokens,
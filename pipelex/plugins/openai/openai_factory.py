@@ -12,12 +12,12 @@ from openai.types.completion_usage import CompletionUsage
 
 from pipelex import log
 from pipelex.cogt.exceptions import CogtError, LLMPromptParameterError
-from pipelex.cogt.image.prompt_image import PromptImage, PromptImageBase64, PromptImagePath, PromptImageUrl
+from pipelex.cogt.image.prompt_image import PromptImage, PromptImageBase64, PromptImageBinary, PromptImagePath, PromptImageUrl
+from pipelex.cogt.image.prompt_image_cache import prompt_image_cache
 from pipelex.cogt.llm.llm_job import LLMJob
 from pipelex.cogt.model_backends.backend import InferenceBackend
 from pipelex.cogt.usage.token_category import NbTokensByCategoryDict, TokenCategory
 from pipelex.plugins.plugin_sdk_registry import Plugin
-from pipelex.tools.misc.base_64_utils import load_binary_as_base64
 from pipelex.types import StrEnum
 
 
@@ -82,7 +82,7 @@ class OpenAIFactory:
         return the_client
 
     @classmethod
-    def make_simple_messages(
+    async def make_simple_messages(
         cls,
         llm_job: LLMJob,
     ) -> list[ChatCompletionMessageParam]:
@@ -99,7 +99,7 @@ class OpenAIFactory:
             user_contents.append(user_part_text)
         if llm_prompt.user_images:
             for prompt_image in llm_prompt.user_images:
-                openai_image_url = cls.make_openai_image_url(prompt_image=prompt_image)
+                openai_image_url = await cls.make_openai_image_url(prompt_image=prompt_image)
                 image_param = ChatCompletionContentPartImageParam(image_url=openai_image_url, type="image_url")
                 user_contents.append(image_param)
 
@@ -107,17 +107,13 @@ class OpenAIFactory:
         return messages
 
     @classmethod
-    def make_openai_image_url(cls, prompt_image: PromptImage) -> ImageURL:
+    async def make_openai_image_url(cls, prompt_image: PromptImage) -> ImageURL:
         if isinstance(prompt_image, PromptImageUrl):
             url = prompt_image.url
             openai_image_url = ImageURL(url=url, detail="high")
-        elif isinstance(prompt_image, PromptImageBase64):
-            # TODO: manage image type
-            url_with_bytes: str = f"data:image/jpeg;base64,{prompt_image.base_64.decode('utf-8')}"
+        elif isinstance(prompt_image, (PromptImageBase64, PromptImageBinary, PromptImagePath)):
+            url_with_bytes = await prompt_image_cache.get_data_url(prompt_image=prompt_image)
             openai_image_url = ImageURL(url=url_with_bytes, detail="high")
-        elif isinstance(prompt_image, PromptImagePath):
-            image_bytes = load_binary_as_base64(path=prompt_image.file_path)
-            return cls.make_openai_image_url(PromptImageBase64(base_64=image_bytes))
         else:
             msg = f"prompt_image of type {type(prompt_image)} is not supported"
             raise LLMPromptParameterError(msg)
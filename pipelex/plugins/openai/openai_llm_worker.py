@@ -1,3 +1,4 @@
+from collections.abc import AsyncIterator
 from typing import TYPE_CHECKING, Any
 
 import instructor
@@ -67,20 +68,25 @@ class OpenAILLMWorker(LLMWorkerInternalAbstract):
     def teardown(self):
         pass
 
+    def _make_temperature(self, llm_job: LLMJob) -> float:
+        """Adapt the temperature of the job to the constraints of the model."""
+        temperature = llm_job.job_params.temperature
+        if ModelConstraints.TEMPERATURE_MUST_BE_MULTIPLIED_BY_2 in self.inference_model.constraints:
+            temperature *= 2
+        if ModelConstraints.TEMPERATURE_MUST_BE_1 in self.inference_model.constraints and temperature != 1:
+            log.warning(f"OpenAI model {self.inference_model.desc} used with a temperature of {temperature}, but it must be 1 for this model")
+            temperature = 1
+        return temperature
+
     @override
     async def _gen_text(
         self,
         llm_job: LLMJob,
     ) -> str:
-        messages = OpenAIFactory.make_simple_messages(llm_job=llm_job)
+        messages = await OpenAIFactory.make_simple_messages(llm_job=llm_job)
 
         try:
-            temperature = llm_job.job_params.temperature
-            if ModelConstraints.TEMPERATURE_MUST_BE_MULTIPLIED_BY_2 in self.inference_model.constraints:
-                temperature *= 2
-            if ModelConstraints.TEMPERATURE_MUST_BE_1 in self.inference_model.constraints and temperature != 1:
-                log.warning(f"OpenAI model {self.inference_model.desc} used with a temperature of {temperature}, but it must be 1 for this model")
-                temperature = 1
+            temperature = self._make_temperature(llm_job=llm_job)
             response = await self.openai_client_for_text.chat.completions.create(
                 model=self.inference_model.model_id,
                 temperature=temperature,
@@ -109,20 +115,49 @@ class OpenAILLMWorker(LLMWorkerInternalAbstract):
             llm_tokens_usage.nb_tokens_by_category = OpenAIFactory.make_nb_tokens_by_category(usage=usage)
         return response_text
 
+    @override
+    async def _gen_text_stream(
+        self,
+        llm_job: LLMJob,
+    ) -> AsyncIterator[str]:
+        messages = await OpenAIFactory.make_simple_messages(llm_job=llm_job)
+
+        try:
+            temperature = self._make_temperature(llm_job=llm_job)
+            response_stream = await self.openai_client_for_text.chat.completions.create(
+                model=self.inference_model.model_id,
+                temperature=temperature,
+                max_tokens=llm_job.job_params.max_tokens or omit,
+                seed=llm_job.job_params.seed,
+                messages=messages,
+                stream=True,
+                stream_options={"include_usage": True},
+            )
+            async for chunk in response_stream:
+                if chunk.choices and (text_delta := chunk.choices[0].delta.content):
+                    yield text_delta
+                # with include_usage, the last chunk has no choices but carries the usage of the whole completion
+                if (llm_tokens_usage := llm_job.job_report.llm_tokens_usage) and (usage := chunk.usage):
+                    llm_tokens_usage.nb_tokens_by_category = OpenAIFactory.make_nb_tokens_by_category(usage=usage)
+        except NotFoundError as not_found_error:
+            msg = f"OpenAI model or deployment not found:\n{self.inference_model.desc}\nmodel: {self.inference_model.desc}\n{not_found_error}"
+            raise LLMModelNotFoundError(msg) from not_found_error
+        except APIConnectionError as api_connection_error:
+            msg = f"OpenAI API connection error: {api_connection_error}"
+            raise LLMCompletionError(msg) from api_connection_error
+        except BadRequestError as bad_request_error:
+            msg = f"OpenAI bad request error with model: {self.inference_model.desc}:\n{bad_request_error}"
+            raise LLMCompletionError(msg) from bad_request_error
+
     @override
     async def _gen_object(
         self,
         llm_job: LLMJob,
         schema: type[BaseModelTypeVar],
     ) -> BaseModelTypeVar:
-        messages = OpenAIFactory.make_simple_messages(llm_job=llm_job)
+        messages = await OpenAIFactory.make_simple_messages(llm_job=llm_job)
         try:
-            temperature = llm_job.job_params.temperature
-            if ModelConstraints.TEMPERATURE_MUST_BE_MULTIPLIED_BY_2 in self.inference_model.constraints:
-                temperature *= 2
-            if ModelConstraints.TEMPERATURE_MUST_BE_1 in self.inference_model.constraints and temperature != 1:
-                log.warning(f"OpenAI model {self.inference_model.desc} used with a temperature of {temperature}, but it must be 1 for this model")
-                temperature = 1
+            temperature = self._make_temperature(llm_job=llm_job)
             try:
                 result_object, completion = await self.instructor_for_objects.chat.completions.create_with_completion(
                     model=self.inference_model.model_id,
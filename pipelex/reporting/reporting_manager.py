@@ -30,6 +30,8 @@ class ReportingManager(ReportingProtocol):
     def __init__(self):
         self._reporting_config = get_config().pipelex.reporting_config
         self._usage_registries: dict[str, UsageRegistry] = {}
+        # usage of the LLM calls that were served by the response cache, i.e. saved
+        self._saved_usage_registries: dict[str, UsageRegistry] = {}
 
     ############################################################
     # Manager lifecycle
@@ -39,10 +41,13 @@ class ReportingManager(ReportingProtocol):
     def setup(self):
         self._usage_registries.clear()
         self._usage_registries[SpecialPipelineId.UNTITLED] = UsageRegistry()
+        self._saved_usage_registries.clear()
+        self._saved_usage_registries[SpecialPipelineId.UNTITLED] = UsageRegistry()
 
     @override
     def teardown(self):
         self._usage_registries.clear()
+        self._saved_usage_registries.clear()
 
     ############################################################
     # Private methods
@@ -82,6 +87,7 @@ class ReportingManager(ReportingProtocol):
             msg = f"Registry for pipeline '{pipeline_run_id}' already exists"
             raise ReportingManagerError(msg)
         self._usage_registries[pipeline_run_id] = UsageRegistry()
+        self._saved_usage_registries[pipeline_run_id] = UsageRegistry()
 
     @override
     def report_inference_job(self, inference_job: InferenceJobAbstract):
@@ -93,6 +99,14 @@ class ReportingManager(ReportingProtocol):
         llm_job: LLMJob = inference_job
         self._report_llm_job(llm_job=llm_job)
 
+    @override
+    def report_cached_llm_usage(self, llm_tokens_usage: LLMTokensUsage):
+        pipeline_run_id = llm_tokens_usage.job_metadata.pipeline_run_id
+        if pipeline_run_id not in self._saved_usage_registries:
+            msg = f"Registry for pipeline '{pipeline_run_id}' does not exist"
+            raise ReportingManagerError(msg)
+        self._saved_usage_registries[pipeline_run_id].add_tokens_usage(llm_tokens_usage)
+
     @override
     def generate_report(self, pipeline_run_id: str | None = None):
         cost_report_file_path: str | None = None
@@ -117,7 +131,14 @@ class ReportingManager(ReportingProtocol):
                 unit_scale=self._reporting_config.cost_report_unit_scale,
                 cost_report_file_path=cost_report_file_path,
             )
+            if saved_usage_registry := self._saved_usage_registries.get(run_id):
+                CostRegistry.log_savings(
+                    pipeline_run_id=run_id,
+                    saved_llm_tokens_usages=saved_usage_registry.get_current_tokens_usage(),
+                    unit_scale=self._reporting_config.cost_report_unit_scale,
+                )
 
     @override
     def close_registry(self, pipeline_run_id: str):
         self._usage_registries.pop(pipeline_run_id)
+        self._saved_usage_registries.pop(pipeline_run_id, None)
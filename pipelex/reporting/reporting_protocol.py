@@ -3,6 +3,7 @@ from typing import Protocol
 from typing_extensions import override
 
 from pipelex.cogt.inference.inference_job_abstract import InferenceJobAbstract
+from pipelex.cogt.llm.llm_report import LLMTokensUsage
 
 
 class ReportingProtocol(Protocol):
@@ -10,6 +11,8 @@ class ReportingProtocol(Protocol):
 
     def report_inference_job(self, inference_job: InferenceJobAbstract): ...
 
+    def report_cached_llm_usage(self, llm_tokens_usage: LLMTokensUsage): ...
+
     def generate_report(self, pipeline_run_id: str | None = None): ...
 
     def close_registry(self, pipeline_run_id: str): ...
@@ -28,6 +31,10 @@ class ReportingNoOp(ReportingProtocol):
     def report_inference_job(self, inference_job: InferenceJobAbstract):
         pass
 
+    @override
+    def report_cached_llm_usage(self, llm_tokens_usage: LLMTokensUsage):
+        pass
+
     @override
     def generate_report(self, pipeline_run_id: str | None = None):
         pass
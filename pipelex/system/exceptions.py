@@ -13,6 +13,10 @@ class NestedKeyConflictError(ToolException):
     """Raised when attempting to create nested keys under a non-dict value."""
 
 
+class ConcurrencyLimitError(ToolException):
+    """Raised when a concurrency limit is not a positive number."""
+
+
 class CredentialsError(RootException):
     pass
 
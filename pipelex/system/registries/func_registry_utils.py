@@ -116,15 +116,7 @@ class FuncRegistryUtils:
             if module is None:
                 return
 
-            # Find functions that match criteria
-            functions_to_register = cls._find_functions_in_module(module)
-
-            for func in functions_to_register:
-                func_name = cls._get_function_registration_name(func)
-                func_registry.register_function(
-                    func=func,
-                    name=func_name,
-                )
+            cls.register_funcs_in_module(module=module)
         except ModuleFileError:
             # Expected: file validation issues (directories with .py extension, etc.)
             # log.verbose(f"Skipping file {file_path}: {e}")
@@ -137,6 +129,27 @@ class FuncRegistryUtils:
             # Potentially problematic: invalid Python syntax may indicate broken code
             log.warning(f"Syntax error in {file_path}: {exc}")
 
+    @classmethod
+    def register_funcs_in_module(cls, module: Any) -> int:
+        """Registers the @pipe_func decorated functions defined in an imported module.
+
+        Args:
+            module: The module to register the functions from
+
+        Returns:
+            Number of functions registered
+
+        """
+        functions_to_register = cls._find_functions_in_module(module)
+
+        for func in functions_to_register:
+            func_name = cls._get_function_registration_name(func)
+            func_registry.register_function(
+                func=func,
+                name=func_name,
+            )
+        return len(functions_to_register)
+
     @classmethod
     def _find_functions_in_module(
         cls,
@@ -1,3 +1,5 @@
+from functools import cache
+
 from jinja2 import BaseLoader, Environment, PackageLoader
 
 from pipelex.cogt.templating.template_category import TemplateCategory
@@ -69,3 +71,13 @@ def make_jinja2_env_without_loader(
     for filter_name, filter_function in filters.items():
         jinja2_env.filters[filter_name] = filter_function  # pyright: ignore[reportArgumentType]
     return jinja2_env
+
+
+@cache
+def get_shared_jinja2_env(template_category: TemplateCategory) -> Environment:
+    """Get the process-wide Jinja2 environment of a template category, without loader.
+
+    Building an environment is costly, and its settings only depend on the template category,
+    so one environment is shared by all the templates of the same category. It must not be mutated.
+    """
+    return make_jinja2_env_without_loader(template_category=template_category)
@@ -1,7 +1,7 @@
 import jinja2
 
 from pipelex.cogt.templating.template_category import TemplateCategory
-from pipelex.tools.jinja2.jinja2_environment import make_jinja2_env_without_loader
+from pipelex.tools.jinja2.jinja2_environment import get_shared_jinja2_env
 from pipelex.tools.jinja2.jinja2_errors import Jinja2TemplateSyntaxError
 
 
@@ -9,7 +9,7 @@ def check_jinja2_parsing(
     template_source: str,
     template_category: TemplateCategory = TemplateCategory.LLM_PROMPT,
 ):
-    jinja2_env = make_jinja2_env_without_loader(template_category=template_category)
+    jinja2_env = get_shared_jinja2_env(template_category=template_category)
     try:
         jinja2_env.parse(template_source)
     except jinja2.exceptions.TemplateSyntaxError as exc:
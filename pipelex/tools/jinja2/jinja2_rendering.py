@@ -1,5 +1,6 @@
 from typing import Any
 
+from jinja2 import Template
 from jinja2.exceptions import (
     TemplateAssertionError,
     TemplateSyntaxError,
@@ -8,13 +9,13 @@ from jinja2.exceptions import (
 
 from pipelex.cogt.templating.template_category import TemplateCategory
 from pipelex.cogt.templating.templating_style import TemplatingStyle
-from pipelex.tools.jinja2.jinja2_environment import make_jinja2_env_without_loader
 from pipelex.tools.jinja2.jinja2_errors import (
     Jinja2ContextError,
     Jinja2StuffError,
     Jinja2TemplateRenderError,
 )
 from pipelex.tools.jinja2.jinja2_models import Jinja2ContextKey
+from pipelex.tools.jinja2.jinja2_template_cache import jinja2_template_cache
 
 
 def _add_to_templating_context(temlating_context: dict[str, Any], jinja2_context_key: Jinja2ContextKey, value: Any) -> None:
@@ -24,21 +25,22 @@ def _add_to_templating_context(temlating_context: dict[str, Any], jinja2_context
     temlating_context[jinja2_context_key] = value
 
 
+def get_compiled_jinja2_template(template_source: str, template_category: TemplateCategory) -> Template:
+    """Get the compiled template from the process-wide template cache, compiling it on the first call."""
+    try:
+        return jinja2_template_cache.get_template(template_source=template_source, template_category=template_category)
+    except TemplateAssertionError as exc:
+        msg = f"Jinja2 render error: '{exc}', template_source:\n{template_source}"
+        raise Jinja2TemplateRenderError(msg) from exc
+
+
 async def render_jinja2(
     template_source: str,
     template_category: TemplateCategory,
     temlating_context: dict[str, Any],
     templating_style: TemplatingStyle | None = None,
 ) -> str:
-    jinja2_env = make_jinja2_env_without_loader(
-        template_category=template_category,
-    )
-
-    try:
-        template = jinja2_env.from_string(template_source)
-    except TemplateAssertionError as exc:
-        msg = f"Jinja2 render error: '{exc}', template_source:\n{template_source}"
-        raise Jinja2TemplateRenderError(msg) from exc
+    template = get_compiled_jinja2_template(template_source=template_source, template_category=template_category)
 
     # Create a copy to avoid mutating the caller's original dictionary
     temlating_context = temlating_context.copy()
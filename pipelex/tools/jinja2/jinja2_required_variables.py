@@ -5,7 +5,7 @@ from jinja2.exceptions import (
 )
 
 from pipelex.cogt.templating.template_category import TemplateCategory
-from pipelex.tools.jinja2.jinja2_environment import make_jinja2_env_without_loader
+from pipelex.tools.jinja2.jinja2_environment import get_shared_jinja2_env
 from pipelex.tools.jinja2.jinja2_errors import Jinja2DetectVariablesError, Jinja2StuffError
 
 
@@ -26,7 +26,7 @@ def detect_jinja2_required_variables(
         Jinja2DetectVariablesError: If there is an error parsing the template
 
     """
-    jinja2_env = make_jinja2_env_without_loader(
+    jinja2_env = get_shared_jinja2_env(
         template_category=template_category,
     )
 
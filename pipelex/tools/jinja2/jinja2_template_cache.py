@@ -0,0 +1,127 @@
+import threading
+from collections import OrderedDict
+
+from jinja2 import Template
+from pydantic import BaseModel
+
+from pipelex import log
+from pipelex.cogt.templating.template_category import TemplateCategory
+from pipelex.tools.jinja2.jinja2_environment import get_shared_jinja2_env
+from pipelex.tools.jinja2.jinja2_required_variables import detect_jinja2_required_variables
+
+DEFAULT_TEMPLATE_CACHE_MAX_SIZE = 1024
+
+TemplateCacheKey = tuple[TemplateCategory, str]
+
+
+class Jinja2TemplateCacheStats(BaseModel):
+    hits: int
+    misses: int
+    size: int
+    max_size: int
+
+    @property
+    def hit_rate(self) -> float:
+        nb_lookups = self.hits + self.misses
+        if nb_lookups == 0:
+            return 0.0
+        return self.hits / nb_lookups
+
+    @property
+    def desc(self) -> str:
+        return f"{self.hits} hits, {self.misses} misses ({self.hit_rate:.0%} hit rate), {self.size}/{self.max_size} templates"
+
+
+class Jinja2TemplateCache:
+    """Process-wide LRU cache of compiled Jinja2 templates.
+
+    Templates are compiled with the shared environment of their category, and keyed by their category
+    and their source (hashed by the dict lookup), so the same template is parsed and compiled only once,
+    however many times it is rendered. The variables required by the templates are kept the same way.
+    """
+
+    def __init__(self, max_size: int = DEFAULT_TEMPLATE_CACHE_MAX_SIZE):
+        self._max_size = max_size
+        self._templates: OrderedDict[TemplateCacheKey, Template] = OrderedDict()
+        self._required_variables: OrderedDict[TemplateCacheKey, frozenset[str]] = OrderedDict()
+        self._lock = threading.Lock()
+        self._hits = 0
+        self._misses = 0
+
+    def setup(self, max_size: int):
+        with self._lock:
+            self._max_size = max_size
+            self._evict_overflow()
+
+    def teardown(self):
+        if self._hits or self._misses:
+            log.verbose(f"Jinja2 template cache: {self.stats.desc}")
+        with self._lock:
+            self._templates.clear()
+            self._required_variables.clear()
+            self._hits = 0
+            self._misses = 0
+
+    @property
+    def stats(self) -> Jinja2TemplateCacheStats:
+        return Jinja2TemplateCacheStats(
+            hits=self._hits,
+            misses=self._misses,
+            size=len(self._templates),
+            max_size=self._max_size,
+        )
+
+    def get_template(self, template_source: str, template_category: TemplateCategory) -> Template:
+        """Get the compiled template, compiling and caching it on the first call.
+
+        Raises:
+            TemplateSyntaxError: If the template source can't be parsed
+            TemplateAssertionError: If the template source can't be compiled
+
+        """
+        cache_key: TemplateCacheKey = (template_category, template_source)
+        with self._lock:
+            template = self._templates.get(cache_key)
+            if template is not None:
+                self._templates.move_to_end(cache_key)
+                self._hits += 1
+                return template
+            self._misses += 1
+
+        # compile outside of the lock: at worst, two concurrent misses compile the same template twice
+        template = get_shared_jinja2_env(template_category=template_category).from_string(template_source)
+        with self._lock:
+            self._templates[cache_key] = template
+            self._templates.move_to_end(cache_key)
+            self._evict_overflow()
+        return template
+
+    def get_required_variables(self, template_source: str, template_category: TemplateCategory) -> frozenset[str]:
+        """Get the variables required by the template, detecting and caching them on the first call.
+
+        Raises:
+            Jinja2DetectVariablesError: If the template source can't be parsed
+
+        """
+        cache_key: TemplateCacheKey = (template_category, template_source)
+        with self._lock:
+            required_variables = self._required_variables.get(cache_key)
+            if required_variables is not None:
+                self._required_variables.move_to_end(cache_key)
+                return required_variables
+
+        required_variables = frozenset(detect_jinja2_required_variables(template_category=template_category, template_source=template_source))
+        with self._lock:
+            self._required_variables[cache_key] = required_variables
+            self._required_variables.move_to_end(cache_key)
+            self._evict_overflow()
+        return required_variables
+
+    def _evict_overflow(self):
+        while len(self._templates) > self._max_size:
+            self._templates.popitem(last=False)
+        while len(self._required_variables) > self._max_size:
+            self._required_variables.popitem(last=False)
+
+
+jinja2_template_cache = Jinja2TemplateCache()
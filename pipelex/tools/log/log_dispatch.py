@@ -246,35 +246,29 @@ class LogDispatch:
                 logger = logging.getLogger(self._log_config.generic_poor_logger)
                 logger.log(level=severity, msg=message, stacklevel=6)
 
-        stack = inspect.stack()
+        # walk the frames lazily from the caller: inspect.stack() would read the source context of every frame of the stack
+        frame = inspect.currentframe()
         try:
             logging_module_path = Path(__file__).absolute()
             log_origin_name = "unknown"
 
-            for frame_info in stack[1:]:
-                try:
-                    frame = frame_info.frame
-                    module = inspect.getmodule(frame)
-
-                    if module is None:
-                        continue
-
-                    if hasattr(module, "__file__") and module.__file__ is not None:
-                        module_file = os.path.abspath(module.__file__)
-                    else:
-                        continue
-
-                    if module_file == logging_module_path or module_file.endswith("/log.py"):
-                        continue
-                    if module.__name__ == "__main__":
-                        log_origin_name = "Unknown"
-                    else:
-                        log_origin_name = module.__name__.split(sep=".", maxsplit=1)[0]
-                    break
-                finally:
-                    del frame_info
+            caller_frame = frame.f_back if frame else None
+            while caller_frame is not None:
+                module_name = caller_frame.f_globals.get("__name__")
+                module_file_path = caller_frame.f_globals.get("__file__")
+                caller_frame = caller_frame.f_back
+                if module_name is None or module_file_path is None:
+                    continue
+                module_file = os.path.abspath(module_file_path)
+
+                if module_file == logging_module_path or module_file.endswith("/log.py"):
+                    continue
+                if module_name == "__main__":
+                    log_origin_name = "Unknown"
+                else:
+                    log_origin_name = module_name.split(sep=".", maxsplit=1)[0]
+                break
             logger = logging.getLogger(log_origin_name)
             logger.log(level=severity, msg=message, stacklevel=5)
         finally:
-            if stack:
-                del stack
+            del frame
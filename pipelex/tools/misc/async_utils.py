@@ -0,0 +1,51 @@
+"""Asyncio helpers for running coroutines with bounded concurrency."""
+
+import asyncio
+from collections.abc import Coroutine, Sequence
+from typing import Any, TypeVar, cast
+
+from pipelex.system.exceptions import ConcurrencyLimitError
+
+T = TypeVar("T")
+
+
+async def gather_with_max_concurrency(coroutines: Sequence[Coroutine[Any, Any, T]], max_concurrency: int | None = None) -> list[T]:
+    """Await coroutines like asyncio.gather, but with at most max_concurrency of them running at a time.
+
+    A pool of max_concurrency workers pulls the coroutines in order, so each coroutine only starts
+    when a slot frees up. The results are returned in the same order as the coroutines.
+    If max_concurrency is None or covers all the coroutines, this is a plain asyncio.gather.
+
+    Args:
+        coroutines: The coroutines to await
+        max_concurrency: The maximum number of coroutines running at the same time, None for no limit
+
+    Returns:
+        The results of the coroutines, in order
+
+    """
+    if max_concurrency is None or max_concurrency >= len(coroutines):
+        return list(await asyncio.gather(*coroutines))
+    if max_concurrency < 1:
+        msg = f"max_concurrency must be at least 1, got {max_concurrency}"
+        raise ConcurrencyLimitError(msg)
+
+    results: list[T | None] = [None] * len(coroutines)
+    pending_indexes = iter(range(len(coroutines)))
+
+    async def worker() -> None:
+        for index in pending_indexes:
+            results[index] = await coroutines[index]
+
+    worker_tasks = [asyncio.create_task(worker()) for _ in range(max_concurrency)]
+    try:
+        await asyncio.gather(*worker_tasks)
+    finally:
+        # if a worker failed, cancel the other workers along with the coroutines they are running
+        for worker_task in worker_tasks:
+            worker_task.cancel()
+        await asyncio.gather(*worker_tasks, return_exceptions=True)
+        # and close the coroutines which never started to avoid "never awaited" warnings
+        for index in pending_indexes:
+            coroutines[index].close()
+    return cast("list[T]", results)
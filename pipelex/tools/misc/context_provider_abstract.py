@@ -1,6 +1,9 @@
 from abc import ABC, abstractmethod
+from collections.abc import Callable, Iterable, Iterator, Mapping
 from typing import Any
 
+from typing_extensions import override
+
 from pipelex.system.exceptions import ToolException
 
 
@@ -10,6 +13,53 @@ class ContextProviderException(ToolException):
         self.variable_name = variable_name
 
 
+class LazyContext(Mapping[str, Any]):
+    """Context whose values are only made when first looked up, then memoized.
+
+    Aliases resolve to the value of their target, so an alias and its target share the same object.
+    """
+
+    def __init__(self, value_makers: dict[str, Callable[[], Any]], aliases: dict[str, str] | None = None):
+        self._value_makers = value_makers
+        self._aliases = aliases or {}
+        self._values: dict[str, Any] = {}
+
+    @override
+    def __getitem__(self, key: str) -> Any:
+        name = self._aliases.get(key, key)
+        if name in self._values:
+            return self._values[name]
+        value_maker = self._value_makers.get(name)
+        if value_maker is None:
+            raise KeyError(key)
+        value = value_maker()
+        self._values[name] = value
+        return value
+
+    @override
+    def __contains__(self, key: object) -> bool:
+        if not isinstance(key, str):
+            return False
+        return self._aliases.get(key, key) in self._value_makers
+
+    @override
+    def __iter__(self) -> Iterator[str]:
+        yield from self._value_makers
+        yield from self._aliases
+
+    @override
+    def __len__(self) -> int:
+        return len(self._value_makers) + len(self._aliases)
+
+    @property
+    def nb_made_values(self) -> int:
+        return len(self._values)
+
+    def materialize(self, names: Iterable[str]) -> dict[str, Any]:
+        """Make a plain dict with the values of the names present in the context, the others are ignored."""
+        return {name: self[name] for name in names if name in self}
+
+
 class ContextProviderAbstract(ABC):
     """A ContextProvider provides context to templating engine. This interface is implemented by WorkingMemory.
     It exists to make these features available to lower level classes.
@@ -22,3 +72,7 @@ class ContextProviderAbstract(ABC):
     @abstractmethod
     def generate_context(self) -> dict[str, Any]:
         pass
+
+    @abstractmethod
+    def make_lazy_context(self) -> LazyContext:
+        """Make a context which only makes the values of the templates' variables when they are looked up."""
@@ -0,0 +1,272 @@
+import asyncio
+import hashlib
+import os
+import threading
+import time
+from collections import OrderedDict
+from collections.abc import Awaitable, Callable
+
+from pydantic import BaseModel, Field, ValidationError
+
+from pipelex import log
+from pipelex.system.configuration.config_model import ConfigModel
+from pipelex.system.exceptions import ToolException
+from pipelex.tools.misc.file_utils import save_bytes_atomically
+
+
+class FetchCacheError(ToolException):
+    pass
+
+
+class FetchCacheConfig(ConfigModel):
+    is_enabled: bool
+    max_memory_bytes: int = Field(ge=0)
+    max_memory_entries: int = Field(ge=1)
+    revalidate_after_seconds: float = Field(ge=0)
+    is_disk_cache_enabled: bool
+    disk_cache_dir_path: str
+    max_disk_bytes: int = Field(ge=0)
+
+
+class FetchValidators(BaseModel):
+    """The HTTP validators of a fetched resource, used to revalidate it with a conditional request."""
+
+    etag: str | None = None
+    last_modified: str | None = None
+
+
+class FetchedResource(BaseModel):
+    """The result of a (possibly conditional) fetch: content is empty when the server answered 304 Not Modified."""
+
+    content: bytes
+    validators: FetchValidators
+    is_not_modified: bool = False
+
+
+class FetchCacheEntry(BaseModel):
+    url: str
+    digest: str
+    validators: FetchValidators
+    validated_at: float
+
+
+FetchFunction = Callable[[str, FetchValidators | None], Awaitable[FetchedResource]]
+
+
+class FetchCacheStats(BaseModel):
+    hits: int
+    revalidations: int
+    downloads: int
+    memory_bytes: int
+    # the running total of the blobs on disk, None until the first write to disk
+    disk_bytes: int | None = None
+
+    @property
+    def desc(self) -> str:
+        return f"{self.hits} hits, {self.revalidations} revalidations, {self.downloads} downloads, {self.memory_bytes:,} bytes in memory"
+
+
+class FetchCache:
+    """Content-addressed cache of the files fetched from URLs.
+
+    The fetched bytes are stored once per content digest, in memory within a byte budget with LRU eviction,
+    and optionally on disk. Each URL points to the digest of its content along with its ETag/Last-Modified validators:
+    a URL validated less than revalidate_after_seconds ago is served from the cache, otherwise it's revalidated
+    with a conditional request, so unchanged content is not downloaded again. Concurrent fetches of the same URL
+    share a single request. At most max_memory_entries URLs are indexed in memory, evicting the least recently used.
+    The errors of the disk layer, such as a full disk or a corrupt entry file, are logged and treated as cache misses.
+    """
+
+    def __init__(self, config: FetchCacheConfig):
+        self.config = config
+        self._entries: OrderedDict[str, FetchCacheEntry] = OrderedDict()
+        self._blobs: OrderedDict[str, bytes] = OrderedDict()
+        self._memory_bytes = 0
+        # running total of the blobs on disk, counted on the first write, the disk blobs being written from worker threads
+        self._disk_bytes: int | None = None
+        self._disk_lock = threading.Lock()
+        self._in_flight: dict[tuple[asyncio.AbstractEventLoop, str], asyncio.Task[bytes]] = {}
+        self._hits = 0
+        self._revalidations = 0
+        self._downloads = 0
+
+    @property
+    def stats(self) -> FetchCacheStats:
+        return FetchCacheStats(
+            hits=self._hits,
+            revalidations=self._revalidations,
+            downloads=self._downloads,
+            memory_bytes=self._memory_bytes,
+            disk_bytes=self._disk_bytes,
+        )
+
+    def clear(self):
+        self._entries.clear()
+        self._blobs.clear()
+        self._memory_bytes = 0
+
+    async def fetch(self, url: str, fetch_function: FetchFunction) -> bytes:
+        """Get the content at the url from the cache, or with fetch_function if it's missing or must be revalidated."""
+        if (entry := await self._get_entry(url=url)) and time.time() - entry.validated_at < self.config.revalidate_after_seconds:
+            if (blob := await self._get_blob(digest=entry.digest)) is not None:
+                self._hits += 1
+                return blob
+
+        in_flight_key = (asyncio.get_running_loop(), url)
+        fetch_task = self._in_flight.get(in_flight_key)
+        if fetch_task is None:
+            fetch_task = asyncio.create_task(self._fetch_and_store(url=url, entry=entry, fetch_function=fetch_function))
+            self._in_flight[in_flight_key] = fetch_task
+            fetch_task.add_done_callback(lambda _: self._in_flight.pop(in_flight_key, None))
+        # shielded so that a cancelled caller doesn't cancel the fetch shared with the other callers
+        return await asyncio.shield(fetch_task)
+
+    async def _fetch_and_store(self, url: str, entry: FetchCacheEntry | None, fetch_function: FetchFunction) -> bytes:
+        cached_blob: bytes | None = None
+        if entry:
+            cached_blob = await self._get_blob(digest=entry.digest)
+        validators = entry.validators if entry and cached_blob is not None else None
+        fetched_resource = await fetch_function(url, validators)
+
+        if fetched_resource.is_not_modified:
+            if entry is None or cached_blob is None:
+                msg = f"Got a 'Not Modified' response for '{url}' without a cached content to revalidate"
+                raise FetchCacheError(msg)
+            self._revalidations += 1
+            entry.validated_at = time.time()
+            await self._set_entry(entry=entry)
+            return cached_blob
+
+        self._downloads += 1
+        content = fetched_resource.content
+        digest = hashlib.sha256(content).hexdigest()
+        await self._set_blob(digest=digest, blob=content)
+        await self._set_entry(
+            entry=FetchCacheEntry(url=url, digest=digest, validators=fetched_resource.validators, validated_at=time.time()),
+        )
+        return content
+
+    ############################################################
+    # Entries: url -> digest and validators
+    ############################################################
+
+    def _entry_path(self, url: str) -> str:
+        url_digest = hashlib.sha256(url.encode()).hexdigest()
+        return os.path.join(self.config.disk_cache_dir_path, "urls", f"{url_digest}.json")
+
+    async def _get_entry(self, url: str) -> FetchCacheEntry | None:
+        if entry := self._entries.get(url):
+            self._entries.move_to_end(url)
+            return entry
+        if not self.config.is_disk_cache_enabled:
+            return None
+        entry_path = self._entry_path(url=url)
+        try:
+            entry_json = await asyncio.to_thread(_read_file_if_exists, entry_path)
+            if entry_json is None:
+                return None
+            entry = FetchCacheEntry.model_validate_json(entry_json)
+        except (OSError, ValidationError) as exc:
+            log.verbose(f"Could not read the fetch cache entry of '{url}': {exc}")
+            return None
+        self._set_memory_entry(entry=entry)
+        return entry
+
+    async def _set_entry(self, entry: FetchCacheEntry):
+        self._set_memory_entry(entry=entry)
+        if self.config.is_disk_cache_enabled:
+            try:
+                await asyncio.to_thread(save_bytes_atomically, self._entry_path(url=entry.url), entry.model_dump_json().encode())
+            except OSError as exc:
+                log.verbose(f"Could not write the fetch cache entry of '{entry.url}': {exc}")
+
+    def _set_memory_entry(self, entry: FetchCacheEntry):
+        self._entries[entry.url] = entry
+        self._entries.move_to_end(entry.url)
+        while len(self._entries) > self.config.max_memory_entries:
+            self._entries.popitem(last=False)
+
+    ############################################################
+    # Blobs: digest -> content
+    ############################################################
+
+    def _blob_path(self, digest: str) -> str:
+        return os.path.join(self.config.disk_cache_dir_path, "blobs", digest)
+
+    async def _get_blob(self, digest: str) -> bytes | None:
+        if (blob := self._blobs.get(digest)) is not None:
+            self._blobs.move_to_end(digest)
+            return blob
+        if not self.config.is_disk_cache_enabled:
+            return None
+        try:
+            blob = await asyncio.to_thread(_read_file_if_exists, self._blob_path(digest=digest))
+        except OSError as exc:
+            log.verbose(f"Could not read the fetch cache blob '{digest}': {exc}")
+            return None
+        if blob is not None:
+            self._set_memory_blob(digest=digest, blob=blob)
+        return blob
+
+    async def _set_blob(self, digest: str, blob: bytes):
+        self._set_memory_blob(digest=digest, blob=blob)
+        if self.config.is_disk_cache_enabled:
+            try:
+                await asyncio.to_thread(self._write_disk_blob, digest, blob)
+            except OSError as exc:
+                log.verbose(f"Could not write the fetch cache blob '{digest}': {exc}")
+
+    def _set_memory_blob(self, digest: str, blob: bytes):
+        if len(blob) > self.config.max_memory_bytes:
+            return
+        if digest not in self._blobs:
+            self._blobs[digest] = blob
+            self._memory_bytes += len(blob)
+        self._blobs.move_to_end(digest)
+        while self._memory_bytes > self.config.max_memory_bytes:
+            _, evicted_blob = self._blobs.popitem(last=False)
+            self._memory_bytes -= len(evicted_blob)
+
+    def _write_disk_blob(self, digest: str, blob: bytes):
+        blob_path = self._blob_path(digest=digest)
+        # the check and the write are made under the lock, so that concurrent writes of a digest count it once
+        with self._disk_lock:
+            if os.path.exists(blob_path):
+                # touch it so that it counts as recently used
+                os.utime(blob_path)
+                return
+            save_bytes_atomically(blob_path, blob)
+            if self._disk_bytes is None:
+                # the first write counts the blobs already on disk, including the one just written
+                self._disk_bytes = sum(blob_file.stat().st_size for blob_file in self._scan_disk_blobs())
+            else:
+                self._disk_bytes += len(blob)
+            if self._disk_bytes > self.config.max_disk_bytes:
+                self._disk_bytes = self._evict_disk_blobs()
+
+    def _scan_disk_blobs(self) -> list[os.DirEntry[str]]:
+        # the temporary files of the blobs being written are left out
+        return [blob_file for blob_file in os.scandir(os.path.join(self.config.disk_cache_dir_path, "blobs")) if not blob_file.name.startswith(".")]
+
+    def _evict_disk_blobs(self) -> int:
+        """Evict the least recently used blobs beyond the disk budget, and return the bytes left on disk.
+
+        The blobs are scanned again, so that the total also accounts for the blobs written by other processes.
+        """
+        blob_files = sorted(self._scan_disk_blobs(), key=lambda blob_file: blob_file.stat().st_mtime)
+        disk_bytes = sum(blob_file.stat().st_size for blob_file in blob_files)
+        for blob_file in blob_files:
+            if disk_bytes <= self.config.max_disk_bytes:
+                break
+            disk_bytes -= blob_file.stat().st_size
+            os.remove(blob_file.path)
+            log.verbose(f"Evicted '{blob_file.name}' from the fetch cache on disk")
+        return disk_bytes
+
+
+def _read_file_if_exists(path: str) -> bytes | None:
+    try:
+        with open(path, "rb") as file:
+            return file.read()
+    except FileNotFoundError:
+        return None
@@ -1,6 +1,7 @@
 import httpx
 from httpx import Response
 
+from pipelex.hub import get_optional_http_client_manager
 from pipelex.tools.misc.http_utils import get_user_agent
 
 
@@ -8,15 +9,24 @@ async def fetch_file_from_url_httpx_async(
     url: str,
     request_timeout: int | None = None,
 ) -> bytes:
-    user_agent = get_user_agent()
-    async with httpx.AsyncClient(headers={"User-Agent": user_agent}) as client:
+    """Fetch a file with the shared async HTTP client, reusing its keep-alive connections.
+
+    Outside of a Pipelex setup, where there is no shared HTTP client, the file is fetched with a one-off client.
+
+    Raises:
+        httpx.HTTPError: If the request fails or returns a 4XX/5XX status code
+
+    """
+    if http_client_manager := get_optional_http_client_manager():
+        return await http_client_manager.fetch_bytes(url=url, request_timeout=request_timeout)
+
+    async with httpx.AsyncClient(headers={"User-Agent": get_user_agent()}) as client:
         response: Response = await client.get(
             url,
             timeout=request_timeout,
             follow_redirects=True,
         )
         response.raise_for_status()  # Raise exception for 4XX/5XX status codes
-
         return response.content
 
 
@@ -24,14 +34,22 @@ def fetch_file_from_url_httpx(
     url: str,
     request_timeout: int | None = None,
 ) -> bytes:
-    user_agent = get_user_agent()
-    with httpx.Client(headers={"User-Agent": user_agent}) as client:
+    """Fetch a file with the shared sync HTTP client, reusing its keep-alive connections.
+
+    Outside of a Pipelex setup, where there is no shared HTTP client, the file is fetched with a one-off client.
+
+    Raises:
+        httpx.HTTPError: If the request fails or returns a 4XX/5XX status code
+
+    """
+    if http_client_manager := get_optional_http_client_manager():
+        return http_client_manager.fetch_bytes_sync(url=url, request_timeout=request_timeout)
+
+    with httpx.Client(headers={"User-Agent": get_user_agent()}) as client:
         response: Response = client.get(
             url,
             timeout=request_timeout,
             follow_redirects=True,
         )
         response.raise_for_status()  # Raise exception for 4XX/5XX status codes
-
-        bytes_content: bytes = response.content
-        return bytes_content
+        return response.content
@@ -1,6 +1,7 @@
 import importlib.resources
 import os
 import shutil
+import tempfile
 from pathlib import Path
 
 ########################################################
@@ -55,6 +56,32 @@ def save_text_to_path(text: str, path: str, create_directory: bool = False):
         file.write(text)
 
 
+def save_bytes_atomically(path: str | Path, byte_data: bytes) -> None:
+    """Write binary data to a file through a uniquely named temporary file in the same directory, then rename it.
+
+    A concurrent reader never sees a partial file, and concurrent writers of the same path, in threads or processes,
+    never share a temporary file: the last rename wins. The directory is created if it doesn't exist.
+
+    Args:
+        path (str | Path): Path where the binary data will be saved
+        byte_data (bytes): Binary data to be written
+
+    Raises:
+        OSError: If the file cannot be written, in which case the temporary file is removed.
+
+    """
+    directory_path = os.path.dirname(path) or "."
+    ensure_directory_exists(directory_path)
+    file_descriptor, temp_path = tempfile.mkstemp(dir=directory_path, prefix=f".{os.path.basename(path)}.", suffix=".tmp")
+    try:
+        with os.fdopen(file_descriptor, "wb") as temp_file:
+            temp_file.write(byte_data)
+        Path(temp_path).replace(path)
+    except BaseException:
+        Path(temp_path).unlink(missing_ok=True)
+        raise
+
+
 def load_text_from_path(path: str) -> str:
     """Reads and returns the entire contents of a text file.
 
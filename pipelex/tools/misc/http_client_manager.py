@@ -0,0 +1,182 @@
+import asyncio
+import importlib.util
+from collections.abc import AsyncGenerator
+from contextlib import asynccontextmanager
+from http import HTTPStatus
+
+import httpx
+from pydantic import Field
+
+from pipelex import log
+from pipelex.system.configuration.config_model import ConfigModel
+from pipelex.tools.misc.fetch_cache import FetchCache, FetchCacheConfig, FetchedResource, FetchValidators
+from pipelex.tools.misc.http_utils import get_user_agent
+
+
+class HttpClientConfig(ConfigModel):
+    is_http2_enabled: bool
+    max_connections: int = Field(ge=1)
+    max_connections_per_host: int = Field(ge=1)
+    max_keepalive_connections: int = Field(ge=0)
+    keepalive_expiry: float = Field(ge=0)
+    connect_timeout: float = Field(gt=0)
+    read_timeout: float = Field(gt=0)
+    write_timeout: float = Field(gt=0)
+    pool_timeout: float = Field(gt=0)
+    fetch_cache_config: FetchCacheConfig
+
+    def make_timeout(self) -> httpx.Timeout:
+        return httpx.Timeout(
+            connect=self.connect_timeout,
+            read=self.read_timeout,
+            write=self.write_timeout,
+            pool=self.pool_timeout,
+        )
+
+    def make_limits(self) -> httpx.Limits:
+        return httpx.Limits(
+            max_connections=self.max_connections,
+            max_keepalive_connections=self.max_keepalive_connections,
+            keepalive_expiry=self.keepalive_expiry,
+        )
+
+
+class HttpClientManager:
+    """Shared HTTP clients for all the URL fetching, so that their connections are kept alive and reused.
+
+    The async client and its connection pool are bound to the event loop they were created in,
+    so there is one async client per event loop, created on first use. The requests to a same host
+    are limited to max_connections_per_host at a time. The async fetches go through the fetch cache, if it's enabled.
+    """
+
+    def __init__(self, config: HttpClientConfig):
+        self.config = config
+        self.is_http2 = config.is_http2_enabled and importlib.util.find_spec("h2") is not None
+        if config.is_http2_enabled and not self.is_http2:
+            log.verbose("HTTP/2 is enabled but the 'h2' package is not installed (pip install 'httpx[http2]'), falling back to HTTP/1.1")
+        self._async_clients: dict[asyncio.AbstractEventLoop, httpx.AsyncClient] = {}
+        self._host_semaphores: dict[tuple[asyncio.AbstractEventLoop, str], asyncio.Semaphore] = {}
+        self._sync_client: httpx.Client | None = None
+        self.fetch_cache = FetchCache(config=config.fetch_cache_config)
+
+    def get_async_client(self) -> httpx.AsyncClient:
+        event_loop = asyncio.get_running_loop()
+        if async_client := self._async_clients.get(event_loop):
+            return async_client
+
+        # the clients of closed event loops can't be used anymore, nor closed properly
+        for closed_event_loop in [client_loop for client_loop in self._async_clients if client_loop.is_closed()]:
+            del self._async_clients[closed_event_loop]
+        self._host_semaphores = {key: semaphore for key, semaphore in self._host_semaphores.items() if not key[0].is_closed()}
+
+        async_client = httpx.AsyncClient(
+            headers={"User-Agent": get_user_agent()},
+            http2=self.is_http2,
+            limits=self.config.make_limits(),
+            timeout=self.config.make_timeout(),
+            follow_redirects=True,
+        )
+        self._async_clients[event_loop] = async_client
+        return async_client
+
+    def get_sync_client(self) -> httpx.Client:
+        if self._sync_client is None:
+            self._sync_client = httpx.Client(
+                headers={"User-Agent": get_user_agent()},
+                http2=self.is_http2,
+                limits=self.config.make_limits(),
+                timeout=self.config.make_timeout(),
+                follow_redirects=True,
+            )
+        return self._sync_client
+
+    @asynccontextmanager
+    async def host_slot(self, url: str) -> AsyncGenerator[None, None]:
+        """Hold one of the max_connections_per_host slots of the url's host."""
+        semaphore_key = (asyncio.get_running_loop(), httpx.URL(url).host)
+        semaphore = self._host_semaphores.get(semaphore_key)
+        if semaphore is None:
+            semaphore = asyncio.Semaphore(self.config.max_connections_per_host)
+            self._host_semaphores[semaphore_key] = semaphore
+        async with semaphore:
+            yield
+
+    async def fetch_bytes(self, url: str, request_timeout: float | None = None) -> bytes:
+        """Fetch the content at the url with the shared async client, through the fetch cache if it's enabled.
+
+        Raises:
+            httpx.HTTPError: If the request fails or returns a 4XX/5XX status code
+
+        """
+        if not self.config.fetch_cache_config.is_enabled:
+            fetched_resource = await self.fetch_resource(url=url, request_timeout=request_timeout)
+            return fetched_resource.content
+
+        async def fetch_function(url: str, validators: FetchValidators | None) -> FetchedResource:
+            return await self.fetch_resource(url=url, validators=validators, request_timeout=request_timeout)
+
+        return await self.fetch_cache.fetch(url=url, fetch_function=fetch_function)
+
+    async def fetch_resource(
+        self,
+        url: str,
+        validators: FetchValidators | None = None,
+        request_timeout: float | None = None,
+    ) -> FetchedResource:
+        """Fetch the resource at the url with the shared async client, conditionally if validators are provided.
+
+        Raises:
+            httpx.HTTPError: If the request fails or returns a 4XX/5XX status code
+
+        """
+        async_client = self.get_async_client()
+        timeout = httpx.Timeout(request_timeout) if request_timeout else httpx.USE_CLIENT_DEFAULT
+        headers: dict[str, str] = {}
+        if validators:
+            if validators.etag:
+                headers["If-None-Match"] = validators.etag
+            if validators.last_modified:
+                headers["If-Modified-Since"] = validators.last_modified
+        async with self.host_slot(url=url):
+            response = await async_client.get(url, headers=headers, timeout=timeout)
+        response_validators = FetchValidators(
+            etag=response.headers.get("ETag"),
+            last_modified=response.headers.get("Last-Modified"),
+        )
+        if response.status_code == HTTPStatus.NOT_MODIFIED and headers:
+            return FetchedResource(content=b"", validators=response_validators, is_not_modified=True)
+        response.raise_for_status()
+        return FetchedResource(content=response.content, validators=response_validators)
+
+    def fetch_bytes_sync(self, url: str, request_timeout: float | None = None) -> bytes:
+        """Fetch the content at the url with the shared sync client.
+
+        Raises:
+            httpx.HTTPError: If the request fails or returns a 4XX/5XX status code
+
+        """
+        timeout = httpx.Timeout(request_timeout) if request_timeout else httpx.USE_CLIENT_DEFAULT
+        response = self.get_sync_client().get(url, timeout=timeout)
+        response.raise_for_status()
+        return response.content
+
+    async def aclose(self):
+        """Close the async client of the running event loop, if any."""
+        if async_client := self._async_clients.pop(asyncio.get_running_loop(), None):
+            await async_client.aclose()
+
+    def teardown(self):
+        """Close the clients, as far as their event loops allow it."""
+        if self._sync_client is not None:
+            self._sync_client.close()
+            self._sync_client = None
+        for event_loop, async_client in self._async_clients.items():
+            if event_loop.is_closed():
+                continue
+            if event_loop.is_running():
+                event_loop.create_task(async_client.aclose())
+            else:
+                event_loop.run_until_complete(async_client.aclose())
+        self._async_clients.clear()
+        self._host_semaphores.clear()
+        self.fetch_cache.clear()
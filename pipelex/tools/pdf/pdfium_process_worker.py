@@ -0,0 +1,68 @@
+"""Functions run in the worker processes of the PyPdfium2Renderer process pool.
+
+PDFium is not thread-safe, but each worker process has its own copy of it, so the pages of a PDF can be rendered
+in parallel across processes. Each worker keeps its most recently used documents open, so that rendering a document
+chunk by chunk doesn't parse it again for every chunk. Documents whose file was removed, like the temporary files
+of PDFs rendered from bytes, are closed at the next call rather than kept open until they are evicted.
+Pages are returned as RGB images, their alpha channel being always opaque, so that a quarter less of pixel data
+is sent back to the parent process.
+"""
+
+from __future__ import annotations
+
+import os
+from collections import OrderedDict
+from typing import TYPE_CHECKING
+
+import pypdfium2 as pdfium
+from pypdfium2.raw import FPDFBitmap_BGR
+
+if TYPE_CHECKING:
+    from PIL import Image
+
+# the open documents by key, with the path of their file
+_open_documents: OrderedDict[str, tuple[str, pdfium.PdfDocument]] = OrderedDict()
+_max_open_documents = 4
+
+
+def init_worker(max_open_documents: int):
+    global _max_open_documents  # noqa: PLW0603
+    _max_open_documents = max_open_documents
+
+
+def _close_document(document_key: str):
+    _, pdf_doc = _open_documents.pop(document_key)
+    pdf_doc.close()
+
+
+def _get_document(pdf_path: str, document_key: str) -> pdfium.PdfDocument:
+    for open_document_key, (open_pdf_path, _) in list(_open_documents.items()):
+        if not os.path.exists(open_pdf_path):
+            _close_document(document_key=open_document_key)
+    if open_document := _open_documents.get(document_key):
+        _open_documents.move_to_end(document_key)
+        return open_document[1]
+    pdf_doc = pdfium.PdfDocument(pdf_path)
+    _open_documents[document_key] = (pdf_path, pdf_doc)
+    while len(_open_documents) > _max_open_documents:
+        _close_document(document_key=next(iter(_open_documents)))
+    return pdf_doc
+
+
+def count_pages(pdf_path: str, document_key: str) -> int:
+    return len(_get_document(pdf_path=pdf_path, document_key=document_key))
+
+
+def render_pages(pdf_path: str, document_key: str, page_indexes: list[int], scale: float) -> list[Image.Image]:
+    pdf_doc = _get_document(pdf_path=pdf_path, document_key=document_key)
+    images: list[Image.Image] = []
+    for page_index in page_indexes:
+        page = pdf_doc[page_index]
+        pil_img: Image.Image = page.render(  # pyright: ignore[reportUnknownMemberType, reportUnknownVariableType]
+            scale=scale,  # pyright: ignore[reportArgumentType]
+            force_bitmap_format=FPDFBitmap_BGR,  # 3-channel, the page is filled opaque
+            rev_byteorder=True,  # so we get RGB
+        ).to_pil()
+        images.append(pil_img)  # pyright: ignore[reportUnknownArgumentType]
+        page.close()
+    return images
@@ -1,17 +1,30 @@
 from __future__ import annotations
 
 import asyncio
+import multiprocessing
+import os
 import pathlib
+import tempfile
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+from contextlib import asynccontextmanager
 from typing import TYPE_CHECKING
 
 import pypdfium2 as pdfium
+from pydantic import Field
 from pypdfium2.raw import FPDFBitmap_BGRA
 
+from pipelex import log
+from pipelex.system.configuration.config_model import ConfigModel
 from pipelex.system.exceptions import ToolException
 from pipelex.tools.misc.file_fetch_utils import fetch_file_from_url_httpx_async
 from pipelex.tools.misc.path_utils import clarify_path_or_url
+from pipelex.tools.pdf import pdfium_process_worker
+from pipelex.types import StrEnum
 
 if TYPE_CHECKING:
+    from collections.abc import AsyncGenerator, AsyncIterator
+
     from PIL import Image
 PDFIUM2_REFERENCE_DPI = 72
 
@@ -20,42 +33,89 @@ class PyPdfium2RendererError(ToolException):
     pass
 
 
+class PdfRenderEngine(StrEnum):
+    THREAD = "thread"
+    PROCESS_POOL = "process_pool"
+
+
+class PdfRenderConfig(ConfigModel):
+    engine: PdfRenderEngine = Field(strict=False)
+    max_workers: int = Field(ge=0)
+    pages_per_task: int = Field(ge=1)
+    max_open_documents_per_worker: int = Field(ge=1)
+
+
 PdfInput = str | pathlib.Path | bytes
 
 
 class PyPdfium2Renderer:
-    """Thread-safe PDF page renderer built on pypdfium2.
+    """PDF page renderer built on pypdfium2, which is not thread-safe.
 
-    • All entry into the native PDFium library is protected by a single
-      asyncio.Lock, so the enclosing *process* is safe even if other
-      libraries spin up worker threads.
+    • With the "process_pool" engine, pages are rendered in a pool of worker
+      processes, each with its own PDFium and its own open documents, so that
+      several PDFs, and the pages of a same PDF, render in parallel. Pages are
+      yielded in order as soon as they are rendered. Like any use of
+      multiprocessing, it requires the scripts calling Pipelex.make() to be
+      guarded by `if __name__ == "__main__":`.
 
-    • Heavy work runs inside `asyncio.to_thread`, keeping the event-loop
-      responsive for the rest of your application.
+    • With the "thread" engine (and until setup), all entry into PDFium is
+      protected by a single asyncio.Lock and runs inside `asyncio.to_thread`,
+      so only one page renders at a time in the process. The lock is taken
+      for each page, so pages are also yielded as soon as they are rendered,
+      and the pages of several PDFs render in turn.
     """
 
     _pdfium_lock: asyncio.Lock = asyncio.Lock()  # shared per process
 
-    # ---- internal blocking helper ------------------------------------
-    # TODO: Needs UT
+    def __init__(self):
+        self._config: PdfRenderConfig | None = None
+        self._process_pool: ProcessPoolExecutor | None = None
+        self._nb_workers = 1
+
+    def setup(self, config: PdfRenderConfig):
+        self._config = config
+
+    def teardown(self):
+        if self._process_pool is not None:
+            self._process_pool.shutdown(wait=False, cancel_futures=True)
+            self._process_pool = None
+        self._config = None
+
+    def _get_process_pool(self) -> ProcessPoolExecutor | None:
+        if self._config is None or self._config.engine != PdfRenderEngine.PROCESS_POOL:
+            return None
+        if self._process_pool is None:
+            self._nb_workers = self._config.max_workers or os.cpu_count() or 1
+            self._process_pool = ProcessPoolExecutor(
+                max_workers=self._nb_workers,
+                # forking a process that runs threads (and PDFium) is unsafe
+                mp_context=multiprocessing.get_context("spawn"),
+                initializer=pdfium_process_worker.init_worker,
+                initargs=(self._config.max_open_documents_per_worker,),
+            )
+        return self._process_pool
+
+    # ---- internal blocking helpers -----------------------------------
     @staticmethod
-    def _render_pdf_pages_sync(pdf_input: PdfInput, scale: float) -> list[Image.Image]:
+    def _open_pdf_document_sync(pdf_input: PdfInput, page_range: range | None) -> tuple[pdfium.PdfDocument, list[int]]:
         pdf_doc = pdfium.PdfDocument(pdf_input)
-        images: list[Image.Image] = []
-        for index in range(len(pdf_doc)):
-            # page = doc.get_page(index)
-            page = pdf_doc[index]
-
-            pil_img: Image.Image = page.render(  # pyright: ignore[reportUnknownMemberType, reportUnknownVariableType]
-                scale=scale,  # pyright: ignore[reportArgumentType]
-                force_bitmap_format=FPDFBitmap_BGRA,  # always 4-channel
-                rev_byteorder=True,  # so we get RGBA
-            ).to_pil()
+        try:
+            page_indexes = _make_page_indexes(page_range=page_range, nb_pages=len(pdf_doc))
+        except PyPdfium2RendererError:
+            pdf_doc.close()
+            raise
+        return pdf_doc, page_indexes
 
-            images.append(pil_img)  # pyright: ignore[reportUnknownArgumentType]
-            page.close()
-        pdf_doc.close()
-        return images
+    @staticmethod
+    def _render_pdf_page_sync(pdf_doc: pdfium.PdfDocument, page_index: int, scale: float) -> Image.Image:
+        page = pdf_doc[page_index]
+        pil_img: Image.Image = page.render(  # pyright: ignore[reportUnknownMemberType, reportUnknownVariableType]
+            scale=scale,  # pyright: ignore[reportArgumentType]
+            force_bitmap_format=FPDFBitmap_BGRA,  # always 4-channel
+            rev_byteorder=True,  # so we get RGBA
+        ).to_pil()
+        page.close()
+        return pil_img  # pyright: ignore[reportUnknownVariableType]
 
     # TODO: Needs UT
     @staticmethod
@@ -71,26 +131,89 @@ class PyPdfium2Renderer:
         return texts
 
     # ---- public async façade -----------------------------------------
-    async def render_pdf_pages(self, pdf_input: PdfInput, dpi: int) -> list[Image.Image]:
+    async def iter_pdf_pages(self, pdf_input: PdfInput, dpi: int, page_range: range | None = None) -> AsyncIterator[Image.Image]:
+        """Render the pages of a PDF, yielding them in order as soon as they are rendered.
+
+        Args:
+            pdf_input: The PDF, as a path or bytes
+            dpi: The resolution of the rendered pages
+            page_range: The zero-based indexes of the pages to render, all pages if None
+
+        Raises:
+            PyPdfium2RendererError: If the page range is out of the document's pages
+
+        """
         scale = dpi / PDFIUM2_REFERENCE_DPI
-        """Render *one* page and return PNG bytes."""
-        async with self._pdfium_lock:
-            return await asyncio.to_thread(self._render_pdf_pages_sync, pdf_input, scale)
+        process_pool = self._get_process_pool()
+        if process_pool is None or self._config is None:
+            # the lock is held per page, not per document, so that the first pages are yielded before the last ones render
+            async with self._pdfium_lock:
+                pdf_doc, page_indexes = await asyncio.to_thread(self._open_pdf_document_sync, pdf_input, page_range)
+            try:
+                for page_index in page_indexes:
+                    async with self._pdfium_lock:
+                        image = await asyncio.to_thread(self._render_pdf_page_sync, pdf_doc, page_index, scale)
+                    yield image
+            finally:
+                async with self._pdfium_lock:
+                    await asyncio.to_thread(pdf_doc.close)
+            return
+
+        event_loop = asyncio.get_running_loop()
+        async with _pdf_file(pdf_input=pdf_input) as (pdf_path, document_key):
+            nb_pages = await event_loop.run_in_executor(process_pool, pdfium_process_worker.count_pages, pdf_path, document_key)
+            page_indexes = _make_page_indexes(page_range=page_range, nb_pages=nb_pages)
+            pages_per_task = self._config.pages_per_task
+            # bound the rendered pages waiting to be consumed
+            max_pending_tasks = 2 * self._nb_workers
+            pending_tasks: deque[asyncio.Future[list[Image.Image]]] = deque()
+            try:
+                for chunk_start in range(0, len(page_indexes), pages_per_task):
+                    pending_tasks.append(
+                        event_loop.run_in_executor(
+                            process_pool,
+                            pdfium_process_worker.render_pages,
+                            pdf_path,
+                            document_key,
+                            page_indexes[chunk_start : chunk_start + pages_per_task],
+                            scale,
+                        )
+                    )
+                    if len(pending_tasks) >= max_pending_tasks:
+                        for image in await asyncio.to_thread(_convert_images_to_rgba, await pending_tasks.popleft()):
+                            yield image
+                while pending_tasks:
+                    for image in await asyncio.to_thread(_convert_images_to_rgba, await pending_tasks.popleft()):
+                        yield image
+            finally:
+                for pending_task in pending_tasks:
+                    pending_task.cancel()
+
+    async def render_pdf_pages(self, pdf_input: PdfInput, dpi: int, page_range: range | None = None) -> list[Image.Image]:
+        """Render the pages of a PDF."""
+        return [image async for image in self.iter_pdf_pages(pdf_input=pdf_input, dpi=dpi, page_range=page_range)]
 
     async def get_text_from_pdf_pages(self, pdf_input: PdfInput) -> list[str]:
         """Extract text from all pages of a PDF."""
         async with self._pdfium_lock:
             return await asyncio.to_thread(self._get_text_from_pdf_pages_sync, pdf_input)
 
-    async def render_pdf_pages_from_uri(self, pdf_uri: str, dpi: int) -> list[Image.Image]:
+    async def iter_pdf_pages_from_uri(self, pdf_uri: str, dpi: int, page_range: range | None = None) -> AsyncIterator[Image.Image]:
+        """Render the pages of a PDF from URI, yielding them in order as soon as they are rendered."""
         pdf_path, pdf_url = clarify_path_or_url(path_or_uri=pdf_uri)
+        pdf_input: PdfInput
         if pdf_url:
-            pdf_bytes = await fetch_file_from_url_httpx_async(url=pdf_url)
-            return await self.render_pdf_pages(pdf_input=pdf_bytes, dpi=dpi)
-        if pdf_path:
-            return await self.render_pdf_pages(pdf_input=pdf_path, dpi=dpi)
-        msg = f"Invalid PDF URI: {pdf_uri}"
-        raise PyPdfium2RendererError(msg)
+            pdf_input = await fetch_file_from_url_httpx_async(url=pdf_url)
+        elif pdf_path:
+            pdf_input = pdf_path
+        else:
+            msg = f"Invalid PDF URI: {pdf_uri}"
+            raise PyPdfium2RendererError(msg)
+        async for image in self.iter_pdf_pages(pdf_input=pdf_input, dpi=dpi, page_range=page_range):
+            yield image
+
+    async def render_pdf_pages_from_uri(self, pdf_uri: str, dpi: int, page_range: range | None = None) -> list[Image.Image]:
+        return [image async for image in self.iter_pdf_pages_from_uri(pdf_uri=pdf_uri, dpi=dpi, page_range=page_range)]
 
     async def get_text_from_pdf_pages_from_uri(self, pdf_uri: str) -> list[str]:
         """Extract text from all pages of a PDF from URI."""
@@ -104,4 +227,60 @@ class PyPdfium2Renderer:
         raise PyPdfium2RendererError(msg)
 
 
+def _make_page_indexes(page_range: range | None, nb_pages: int) -> list[int]:
+    if page_range is None:
+        return list(range(nb_pages))
+    page_indexes = list(page_range)
+    if any(not 0 <= page_index < nb_pages for page_index in page_indexes):
+        msg = f"Page range {page_range} is out of the {nb_pages} pages of the PDF"
+        raise PyPdfium2RendererError(msg)
+    return page_indexes
+
+
+def _convert_images_to_rgba(images: list[Image.Image]) -> list[Image.Image]:
+    """Give the RGB pages rendered by the worker processes the same RGBA mode as the pages rendered in a thread."""
+    return [image.convert("RGBA") for image in images]
+
+
+@asynccontextmanager
+async def _pdf_file(pdf_input: PdfInput) -> AsyncGenerator[tuple[str, str], None]:
+    """Provide the PDF as a file that the worker processes can open, and a key identifying its content."""
+    if not isinstance(pdf_input, bytes):
+        pdf_path = str(pdf_input)
+        document_key = await asyncio.to_thread(_make_document_key, pdf_path)
+        yield pdf_path, document_key
+        return
+
+    # bytes are spilled to a temporary file once, rather than sent to the workers for every chunk of pages
+    temp_path = await asyncio.to_thread(_write_temp_pdf_file, pdf_input)
+    try:
+        yield temp_path, temp_path
+    finally:
+        await asyncio.to_thread(_remove_temp_pdf_file, temp_path)
+
+
+def _make_document_key(pdf_path: str) -> str:
+    """Identify the file's content by its path, modification time and size, so that a modified file is opened again."""
+    path = pathlib.Path(pdf_path)
+    try:
+        pdf_stat = path.stat()
+    except OSError as exc:
+        msg = f"Could not read PDF file '{pdf_path}': {exc}"
+        raise PyPdfium2RendererError(msg) from exc
+    return f"{path.resolve()}:{pdf_stat.st_mtime_ns}:{pdf_stat.st_size}"
+
+
+def _remove_temp_pdf_file(temp_path: str):
+    try:
+        pathlib.Path(temp_path).unlink(missing_ok=True)
+    except OSError as exc:
+        log.warning(f"Could not remove temporary PDF file '{temp_path}': {exc}")
+
+
+def _write_temp_pdf_file(pdf_bytes: bytes) -> str:
+    with tempfile.NamedTemporaryFile(suffix=".pdf", delete=False) as temp_file:
+        temp_file.write(pdf_bytes)
+        return temp_file.name
+
+
 pypdfium2_renderer = PyPdfium2Renderer()
@@ -119,6 +119,11 @@ def find_class_names_in_file(file_path: str, base_class_names: list[str] | None
         ModuleFileError: If the file cannot be read or parsed
 
     """
+    tree = _parse_python_file(file_path)
+    return _find_class_names_in_tree(tree=tree, base_class_names=base_class_names)
+
+
+def _parse_python_file(file_path: str) -> ast.Module:
     # Validate that the file is a Python file
     if not file_path.endswith(".py"):
         msg = f"File {file_path} is not a Python file (must end with .py)"
@@ -134,11 +139,13 @@ def find_class_names_in_file(file_path: str, base_class_names: list[str] | None
         # Read and parse the file
         with open(file_path, encoding="utf-8") as f:
             source = f.read()
-        tree = ast.parse(source, filename=file_path)
+        return ast.parse(source, filename=file_path)
     except Exception as e:
         msg = f"Failed to parse {file_path}: {e}"
         raise ModuleFileError(msg) from e
 
+
+def _find_class_names_in_tree(tree: ast.Module, base_class_names: list[str] | None) -> list[str]:
     class_names: list[str] = []
 
     # Walk through the AST to find class definitions
@@ -183,26 +190,11 @@ def find_decorated_function_names_in_file(
         ModuleFileError: If the file cannot be read or parsed
 
     """
-    # Validate that the file is a Python file
-    if not file_path.endswith(".py"):
-        msg = f"File {file_path} is not a Python file (must end with .py)"
-        raise ModuleFileError(msg)
+    tree = _parse_python_file(file_path)
+    return _find_decorated_function_names_in_tree(tree=tree, decorator_names=decorator_names)
 
-    # Validate that the path exists and is a file
-    path = Path(file_path)
-    if not path.exists() or not path.is_file():
-        msg = f"Path {file_path} does not exist or is not a file"
-        raise ModuleFileError(msg)
-
-    try:
-        # Read and parse the file
-        with open(file_path, encoding="utf-8") as f:
-            source = f.read()
-        tree = ast.parse(source, filename=file_path)
-    except Exception as e:
-        msg = f"Failed to parse {file_path}: {e}"
-        raise ModuleFileError(msg) from e
 
+def _find_decorated_function_names_in_tree(tree: ast.Module, decorator_names: list[str]) -> list[str]:
     function_names: list[str] = []
 
     # Walk through the AST to find function definitions with decorators
@@ -230,6 +222,32 @@ def find_decorated_function_names_in_file(
     return function_names
 
 
+def find_class_and_decorated_function_names_in_file(
+    file_path: str,
+    base_class_names: list[str] | None,
+    decorator_names: list[str],
+) -> tuple[list[str], list[str]]:
+    """Find both the class names and the decorated function names in a Python file, parsing it only once.
+
+    Args:
+        file_path: Path to the Python file to analyze
+        base_class_names: Optional list of base class names to filter the classes by, see find_class_names_in_file
+        decorator_names: List of decorator names to look for, see find_decorated_function_names_in_file
+
+    Returns:
+        Tuple of (class names, decorated function names)
+
+    Raises:
+        ModuleFileError: If the file cannot be read or parsed
+
+    """
+    tree = _parse_python_file(file_path)
+    return (
+        _find_class_names_in_tree(tree=tree, base_class_names=base_class_names),
+        _find_decorated_function_names_in_tree(tree=tree, decorator_names=decorator_names),
+    )
+
+
 def import_module_from_file_if_has_decorated_functions(
     file_path: str,
     decorator_names: list[str],
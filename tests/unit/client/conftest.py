@@ -0,0 +1,47 @@
+import pytest
+
+from pipelex.core.concepts.concept_factory import ConceptFactory
+from pipelex.core.concepts.concept_native import NativeConceptCode
+from pipelex.core.memory.working_memory import WorkingMemory
+from pipelex.core.memory.working_memory_factory import WorkingMemoryFactory
+from pipelex.core.stuffs.image_content import ImageContent
+from pipelex.core.stuffs.list_content import ListContent
+from pipelex.core.stuffs.page_content import PageContent
+from pipelex.core.stuffs.stuff_factory import StuffFactory
+from pipelex.core.stuffs.text_and_images_content import TextAndImagesContent
+from pipelex.core.stuffs.text_content import TextContent
+
+
+@pytest.fixture(
+    params=[
+        10,
+        100,
+        500,
+    ],
+)
+def nb_pages(request: pytest.FixtureRequest) -> int:
+    assert isinstance(request.param, int)
+    return request.param
+
+
+@pytest.fixture
+def pages_memory(nb_pages: int) -> WorkingMemory:
+    """Create a working memory holding extracted pages, each with its text, 3 images and a page view."""
+    pages = ListContent[PageContent](
+        items=[
+            PageContent(
+                text_and_images=TextAndImagesContent(
+                    text=TextContent(text=f"Page {page_index}: " + "extracted text " * 200),
+                    images=[ImageContent(url=f"https://example.com/pages/{page_index}/image_{image_index}.png") for image_index in range(3)],
+                ),
+                page_view=ImageContent(url=f"https://example.com/pages/{page_index}/view.png"),
+            )
+            for page_index in range(nb_pages)
+        ]
+    )
+    stuff = StuffFactory.make_stuff(
+        concept=ConceptFactory.make_native_concept(native_concept_code=NativeConceptCode.PAGE),
+        content=pages,
+        name="pages",
+    )
+    return WorkingMemoryFactory.make_from_single_stuff(stuff=stuff)
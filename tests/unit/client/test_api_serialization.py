@@ -1,7 +1,8 @@
 import json
-from datetime import datetime
+from datetime import datetime, timedelta, timezone
 from decimal import Decimal
 from enum import Enum
+from pathlib import Path
 from typing import Any
 
 import pytest
@@ -12,7 +13,9 @@ from pipelex.core.concepts.concept_factory import ConceptFactory
 from pipelex.core.concepts.concept_native import NativeConceptCode
 from pipelex.core.memory.working_memory import WorkingMemory
 from pipelex.core.memory.working_memory_factory import WorkingMemoryFactory
+from pipelex.core.stuffs.list_content import ListContent
 from pipelex.core.stuffs.number_content import NumberContent
+from pipelex.core.stuffs.structured_content import StructuredContent
 from pipelex.core.stuffs.stuff_factory import StuffFactory
 from pipelex.core.stuffs.text_content import TextContent
 from tests.test_pipelines.concepts.datetime import DateTimeEvent
@@ -48,6 +51,23 @@ class Project(BaseModel):
     settings: dict[str, Any]
 
 
+class ProjectContent(StructuredContent):
+    project: Project
+    archive_path: Path
+
+
+class InnerContent(StructuredContent):
+    name: str
+
+
+class InnerDatedContent(InnerContent):
+    when: datetime
+
+
+class OuterContent(StructuredContent):
+    inner: InnerContent
+
+
 class TestApiSerialization:
     @pytest.fixture
     def datetime_content_memory(self) -> WorkingMemory:
@@ -89,6 +109,36 @@ class TestApiSerialization:
         )
         return WorkingMemoryFactory.make_from_single_stuff(stuff=stuff)
 
+    @pytest.fixture
+    def project_content_memory(self) -> WorkingMemory:
+        project = Project(
+            name="Website redesign",
+            created_at=datetime(2024, 1, 1, 9, 0, 0, 250000, tzinfo=timezone(timedelta(hours=2))),
+            tasks=[
+                ComplexTask(
+                    task_id="task-1",
+                    title="Draft the mockups",
+                    priority=Priority.HIGH,
+                    status=TaskStatus(is_complete=True, completion_date=datetime(2024, 1, 10, 17, 0, 0), notes=["approved"]),
+                    due_dates=[datetime(2024, 1, 12, 12, 0, 0)],
+                    metadata={"owner": "design", "priority_hint": Priority.LOW},
+                    score=Decimal("4.5"),
+                ),
+            ],
+            settings={"is_public": False},
+        )
+        stuff = StuffFactory.make_stuff(
+            concept=ConceptFactory.make(
+                concept_code="ProjectContent",
+                domain="project",
+                description="project.ProjectContent",
+                structure_class_name="ProjectContent",
+            ),
+            name="project",
+            content=ProjectContent(project=project, archive_path=Path("archives/website.zip")),
+        )
+        return WorkingMemoryFactory.make_from_single_stuff(stuff=stuff)
+
     def test_serialize_working_memory_with_datetime(self, datetime_content_memory: WorkingMemory):
         pipeline_inputs = ApiSerializer.serialize_working_memory_for_api(datetime_content_memory)
 
@@ -154,3 +204,40 @@ class TestApiSerialization:
         number_dict_stuff = pipeline_inputs["pi_value"]
         assert number_dict_stuff["concept"] == "Number"
         assert number_dict_stuff["content"] == {"number": 3.14159}
+
+    def test_serialize_nested_content_with_the_api_shape(self, project_content_memory: WorkingMemory):
+        pipeline_inputs = ApiSerializer.serialize_working_memory_for_api(project_content_memory)
+
+        content = pipeline_inputs["project"]["content"]
+        assert content["archive_path"] == str(Path("archives/website.zip"))
+        project = content["project"]
+        assert project["created_at"] == "2024-01-01T09:00:00"
+        task = project["tasks"][0]
+        assert task["priority"] == "high"
+        assert task["status"]["completion_date"] == "2024-01-10T17:00:00"
+        assert task["due_dates"] == ["2024-01-12T12:00:00"]
+        assert task["metadata"] == {"owner": "design", "priority_hint": "low"}
+        assert task["score"] == 4.5
+        assert json.loads(json.dumps(pipeline_inputs)) == pipeline_inputs
+
+    def test_serialize_list_of_contents_with_the_api_shape(self):
+        events = ListContent[DateTimeEvent](
+            items=[
+                DateTimeEvent(
+                    event_name="Launch",
+                    start_time=datetime(2024, 3, 1, 8, 30, 0, 125000, tzinfo=timezone(timedelta(hours=-5))),
+                    end_time=datetime(2024, 3, 1, 9, 0, 0),
+                    created_at=datetime(2024, 2, 1, 12, 0, 0),
+                )
+            ]
+        )
+
+        content = ApiSerializer.serialize_content_for_api(content=events)
+        assert content["items"][0]["start_time"] == "2024-03-01T08:30:00"
+        assert content["items"][0]["end_time"] == "2024-03-01T09:00:00"
+
+    def test_serialize_subclass_of_a_content_field_with_the_api_shape(self):
+        outer = OuterContent(inner=InnerDatedContent(name="Kickoff", when=datetime(2024, 1, 2, 3, 4, 5, 678)))
+
+        content = ApiSerializer.serialize_content_for_api(content=outer)
+        assert content["inner"] == {"name": "Kickoff", "when": "2024-01-02T03:04:05"}
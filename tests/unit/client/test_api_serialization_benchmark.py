@@ -0,0 +1,79 @@
+import time
+from collections.abc import Callable
+from datetime import datetime
+from decimal import Decimal
+from enum import Enum
+from pathlib import Path
+from typing import Any, cast
+
+import pytest
+from rich import box
+from rich.console import Console
+from rich.table import Table
+
+from pipelex.client.api_serializer import ApiSerializer
+from pipelex.client.pipeline_response_factory import PipelineResponseFactory
+from pipelex.core.memory.working_memory import WorkingMemory
+from pipelex.core.pipes.pipe_output import PipeOutput
+
+NB_ROUNDS = 5
+
+
+def clean_python_dump(content: Any) -> Any:
+    """The former two-pass serialization: a python dump of the content, walked again in python to make it JSON-ready."""
+    if isinstance(content, dict):
+        content_dict = cast("dict[str, Any]", content)
+        return {key: clean_python_dump(value) for key, value in content_dict.items() if key not in ("__class__", "__module__")}
+    if isinstance(content, list):
+        return [clean_python_dump(item) for item in cast("list[Any]", content)]
+    if isinstance(content, datetime):
+        return content.strftime("%Y-%m-%dT%H:%M:%S")
+    if isinstance(content, Enum):
+        return content.value
+    if isinstance(content, Decimal):
+        return float(content)
+    if isinstance(content, Path):
+        return str(content)
+    return content
+
+
+def serialize_in_two_passes(working_memory: WorkingMemory) -> dict[str, dict[str, Any]]:
+    return {
+        stuff_name: {"concept": stuff.concept.code, "content": clean_python_dump(stuff.content.model_dump(serialize_as_any=True))}
+        for stuff_name, stuff in working_memory.root.items()
+    }
+
+
+def measure_seconds(serialize: Callable[[], Any]) -> float:
+    durations: list[float] = []
+    for _ in range(NB_ROUNDS):
+        started_at = time.perf_counter()
+        serialize()
+        durations.append(time.perf_counter() - started_at)
+    return min(durations)
+
+
+class TestApiSerializationBenchmark:
+    def test_single_pass_matches_the_two_pass_shape(self, pages_memory: WorkingMemory):
+        assert ApiSerializer.serialize_working_memory_for_api(pages_memory) == serialize_in_two_passes(pages_memory)
+
+    # pytest -m benchmark -k test_api_serialization_speed -s -vv
+    @pytest.mark.benchmark
+    def test_api_serialization_speed(self, pytestconfig: pytest.Config, nb_pages: int, pages_memory: WorkingMemory):
+        """Benchmark the serialization of a working memory holding extracted pages, for the API requests and responses."""
+        pipe_output = PipeOutput(working_memory=pages_memory)
+        two_passes_seconds = measure_seconds(lambda: serialize_in_two_passes(pages_memory))
+        single_pass_seconds = measure_seconds(lambda: ApiSerializer.serialize_working_memory_for_api(pages_memory))
+        pipeline_response_seconds = measure_seconds(lambda: PipelineResponseFactory.make_from_pipe_output(pipe_output=pipe_output, status="success"))
+
+        if pytestconfig.get_verbosity() >= 2:
+            table = Table(title=f"API serialization of {nb_pages} extracted pages", box=box.SQUARE_DOUBLE_HEAD)
+            table.add_column("Two passes (ms)", justify="right", style="yellow")
+            table.add_column("Single pass (ms)", justify="right", style="yellow")
+            table.add_column("Pipeline response (ms)", justify="right", style="yellow")
+            table.add_row(
+                f"{two_passes_seconds * 1000:.2f}",
+                f"{single_pass_seconds * 1000:.2f}",
+                f"{pipeline_response_seconds * 1000:.2f}",
+            )
+            Console().print(table)
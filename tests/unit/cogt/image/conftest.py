@@ -0,0 +1,21 @@
+from collections.abc import Iterator
+
+import pytest
+
+from pipelex.cogt.config_cogt import PromptImageCacheConfig
+from pipelex.cogt.image.prompt_image_cache import PromptImageCache
+
+
+@pytest.fixture
+def prompt_image_cache_config() -> PromptImageCacheConfig:
+    """Create an enabled prompt image cache config with a 64 MB memory budget."""
+    return PromptImageCacheConfig(is_enabled=True, max_memory_bytes=64 * 1024 * 1024)
+
+
+@pytest.fixture
+def prompt_image_cache(prompt_image_cache_config: PromptImageCacheConfig) -> Iterator[PromptImageCache]:
+    """Create a prompt image cache with the test prompt image cache config."""
+    prompt_image_cache = PromptImageCache()
+    prompt_image_cache.setup(config=prompt_image_cache_config)
+    yield prompt_image_cache
+    prompt_image_cache.teardown()
@@ -0,0 +1,168 @@
+import asyncio
+import base64
+import gc
+from io import BytesIO
+
+import pytest
+from PIL import Image
+from pytest_mock import MockerFixture
+
+from pipelex.cogt.config_cogt import PromptImageCacheConfig
+from pipelex.cogt.exceptions import PromptImageFormatError
+from pipelex.cogt.image import prompt_image_cache as prompt_image_cache_module
+from pipelex.cogt.image.prompt_image import (
+    PromptImageBase64,
+    PromptImageBinary,
+    PromptImagePath,
+    PromptImageTypedBase64,
+    PromptImageTypedBinary,
+    PromptImageUrl,
+)
+from pipelex.cogt.image.prompt_image_cache import PromptImageCache
+from pipelex.cogt.model_backends.prompt_image_policy import PromptImagePolicy, PromptImageRecompressFormat
+
+IMAGE_PATH = "tests/data/images/eiffel_tower.png"
+LARGE_IMAGE_PATH = "tests/data/images/diagram.png"
+
+
+@pytest.mark.asyncio(loop_scope="class")
+class TestPromptImageCache:
+    async def test_concurrent_requests_share_one_encoding(self, mocker: MockerFixture, prompt_image_cache: PromptImageCache):
+        make_payload_spy = mocker.spy(prompt_image_cache_module, "_make_payload")
+
+        data_urls = await asyncio.gather(*[prompt_image_cache.get_data_url(prompt_image=PromptImagePath(file_path=IMAGE_PATH)) for _ in range(100)])
+        assert data_urls[0].startswith("data:image/png;base64,")
+        assert all(data_url is data_urls[0] for data_url in data_urls)
+        assert await prompt_image_cache.get_data_url(prompt_image=PromptImagePath(file_path=IMAGE_PATH)) is data_urls[0]
+        assert make_payload_spy.call_count == 1
+        assert prompt_image_cache.stats.encodings == 1
+
+    async def test_payloads_are_shared_across_sources_of_the_same_content(self, prompt_image_cache: PromptImageCache):
+        with open(IMAGE_PATH, "rb") as image_file:
+            raw_bytes = image_file.read()
+
+        typed_base64 = await prompt_image_cache.get_typed_base64(prompt_image=PromptImagePath(file_path=IMAGE_PATH))
+        assert isinstance(typed_base64, PromptImageTypedBase64)
+        assert typed_base64.base_64 == base64.b64encode(raw_bytes)
+        assert typed_base64.file_type.mime == "image/png"
+
+        assert await prompt_image_cache.get_typed_base64(prompt_image=PromptImageBase64(base_64=base64.b64encode(raw_bytes))) is typed_base64
+        assert await prompt_image_cache.get_typed_base64(prompt_image=PromptImageBinary(binary=raw_bytes)) is typed_base64
+        assert prompt_image_cache.stats.encodings == 1
+        assert prompt_image_cache.stats.hits == 2
+
+        typed_binary = await prompt_image_cache.get_typed_binary(prompt_image=PromptImageBase64(base_64=base64.b64encode(raw_bytes)))
+        assert isinstance(typed_binary, PromptImageTypedBinary)
+        assert typed_binary.binary == raw_bytes
+        assert prompt_image_cache.stats.encodings == 2
+
+    async def test_in_memory_images_are_digested_once(self, mocker: MockerFixture, prompt_image_cache: PromptImageCache):
+        digest_spy = mocker.spy(prompt_image_cache_module, "_digest")
+        with open(IMAGE_PATH, "rb") as image_file:
+            prompt_image = PromptImageBinary(binary=image_file.read())
+
+        for _ in range(3):
+            await prompt_image_cache.get_data_url(prompt_image=prompt_image)
+        assert digest_spy.call_count == 1
+        assert prompt_image_cache.stats.hits == 2
+
+        assert prompt_image_cache.stats.nb_digests == 1
+        del prompt_image
+        gc.collect()
+        assert prompt_image_cache.stats.nb_digests == 0
+
+    async def test_path_digests_are_bounded(self, mocker: MockerFixture, prompt_image_cache: PromptImageCache):
+        mocker.patch.object(prompt_image_cache_module, "MAX_NB_PATH_DIGESTS", 1)
+        await prompt_image_cache.get_data_url(prompt_image=PromptImagePath(file_path=IMAGE_PATH))
+        await prompt_image_cache.get_data_url(prompt_image=PromptImagePath(file_path="tests/data/images/eiffel_tower.jpg"))
+        assert prompt_image_cache.stats.nb_digests == 1
+
+    async def test_disabled_cache_encodes_every_time(self, prompt_image_cache: PromptImageCache, prompt_image_cache_config: PromptImageCacheConfig):
+        prompt_image_cache.setup(config=prompt_image_cache_config.model_copy(update={"is_enabled": False}))
+        for _ in range(3):
+            await prompt_image_cache.get_data_url(prompt_image=PromptImagePath(file_path=IMAGE_PATH))
+        assert prompt_image_cache.stats.encodings == 3
+        assert prompt_image_cache.stats.memory_bytes == 0
+
+    async def test_least_recently_used_payloads_are_evicted(
+        self, prompt_image_cache: PromptImageCache, prompt_image_cache_config: PromptImageCacheConfig
+    ):
+        image_path_size = len(await prompt_image_cache.get_data_url(prompt_image=PromptImagePath(file_path=IMAGE_PATH)))
+        bounded_cache = PromptImageCache()
+        bounded_cache.setup(config=prompt_image_cache_config.model_copy(update={"max_memory_bytes": image_path_size}))
+
+        await bounded_cache.get_data_url(prompt_image=PromptImagePath(file_path=IMAGE_PATH))
+        await bounded_cache.get_data_url(prompt_image=PromptImagePath(file_path="tests/data/images/eiffel_tower.jpg"))
+        await bounded_cache.get_data_url(prompt_image=PromptImagePath(file_path=IMAGE_PATH))
+        assert bounded_cache.stats.memory_bytes <= image_path_size
+        assert bounded_cache.stats.encodings == 3
+
+
+@pytest.mark.asyncio(loop_scope="class")
+class TestPromptImagePolicy:
+    async def test_large_image_is_downscaled_once(self, mocker: MockerFixture, prompt_image_cache: PromptImageCache):
+        make_payload_spy = mocker.spy(prompt_image_cache_module, "_make_payload")
+        image_policy = PromptImagePolicy(max_edge=1568)
+
+        prepared_images = await asyncio.gather(
+            *[
+                prompt_image_cache.apply_image_policy(prompt_image=PromptImagePath(file_path=LARGE_IMAGE_PATH), image_policy=image_policy)
+                for _ in range(10)
+            ]
+        )
+        prepared_image = prepared_images[0]
+        assert isinstance(prepared_image, PromptImageBinary)
+        assert all(other_image is prepared_image for other_image in prepared_images)
+        with Image.open(BytesIO(prepared_image.binary)) as image:
+            assert max(image.size) == 1568
+            assert image.format == "PNG"
+        assert make_payload_spy.call_count == 1
+
+        # the prepared image is then encoded for the provider like any other image
+        data_url = await prompt_image_cache.get_data_url(prompt_image=prepared_image)
+        assert data_url.startswith("data:image/png;base64,")
+
+    async def test_complying_image_is_kept(self, prompt_image_cache: PromptImageCache):
+        prompt_image = PromptImagePath(file_path=IMAGE_PATH)
+        image_policy = PromptImagePolicy(max_edge=2048, max_megapixels=4)
+        assert await prompt_image_cache.apply_image_policy(prompt_image=prompt_image, image_policy=image_policy) is prompt_image
+        assert await prompt_image_cache.apply_image_policy(prompt_image=prompt_image, image_policy=PromptImagePolicy()) is prompt_image
+
+    async def test_image_is_recompressed_within_max_bytes(self, prompt_image_cache: PromptImageCache):
+        image_policy = PromptImagePolicy(max_megapixels=1, max_bytes=50_000, recompress_format=PromptImageRecompressFormat.JPEG, quality=70)
+
+        prepared_image = await prompt_image_cache.apply_image_policy(
+            prompt_image=PromptImagePath(file_path=LARGE_IMAGE_PATH), image_policy=image_policy
+        )
+        assert isinstance(prepared_image, PromptImageBinary)
+        assert len(prepared_image.binary) <= 50_000
+        with Image.open(BytesIO(prepared_image.binary)) as image:
+            assert image.format == "JPEG"
+            assert image.width * image.height <= 1_000_000
+
+    async def test_image_urls_are_kept_unless_opted_in(self, mocker: MockerFixture, prompt_image_cache: PromptImageCache):
+        with open(IMAGE_PATH, "rb") as image_file:
+            raw_bytes = image_file.read()
+        fetch_mock = mocker.patch.object(prompt_image_cache_module, "fetch_file_from_url_httpx_async", return_value=raw_bytes)
+        prompt_image = PromptImageUrl(url="https://example.com/eiffel_tower.png")
+
+        assert await prompt_image_cache.apply_image_policy(prompt_image=prompt_image, image_policy=PromptImagePolicy(max_edge=256)) is prompt_image
+        assert fetch_mock.call_count == 0
+
+        prepared_image = await prompt_image_cache.apply_image_policy(
+            prompt_image=prompt_image, image_policy=PromptImagePolicy(max_edge=256, is_applied_to_urls=True)
+        )
+        assert isinstance(prepared_image, PromptImageBinary)
+        assert fetch_mock.call_count == 1
+
+    async def test_complying_image_keeps_its_format(self, prompt_image_cache: PromptImageCache):
+        buffer = BytesIO()
+        Image.new("RGB", (64, 64)).save(buffer, format="GIF")
+        prompt_image = PromptImageBinary(binary=buffer.getvalue())
+        assert await prompt_image_cache.apply_image_policy(prompt_image=prompt_image, image_policy=PromptImagePolicy(max_edge=256)) is prompt_image
+
+    async def test_unidentified_image_raises_a_format_error(self, prompt_image_cache: PromptImageCache):
+        with pytest.raises(PromptImageFormatError):
+            await prompt_image_cache.apply_image_policy(
+                prompt_image=PromptImageBinary(binary=b"not an image"), image_policy=PromptImagePolicy(max_edge=256)
+            )
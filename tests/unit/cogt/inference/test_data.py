@@ -0,0 +1,45 @@
+from pipelex.cogt.model_backends.model_spec import InferenceModelSpec
+from pipelex.cogt.model_backends.model_type import ModelType
+from pipelex.cogt.model_backends.rate_limits import InferenceRateLimits
+
+
+class InferenceGovernorTestCases:
+    BACKEND_RATE_LIMITS = InferenceRateLimits(requests_per_minute=100)
+
+    # models without their own rate limits, which share the limits of their backend
+    MODEL_A = InferenceModelSpec(
+        backend_name="backend",
+        name="model-a",
+        sdk="openai",
+        model_type=ModelType.LLM,
+        model_id="model-a",
+        costs={},
+        max_tokens=None,
+        max_prompt_images=None,
+        backend_rate_limits=BACKEND_RATE_LIMITS,
+    )
+    MODEL_B = InferenceModelSpec(
+        backend_name="backend",
+        name="model-b",
+        sdk="openai",
+        model_type=ModelType.LLM,
+        model_id="model-b",
+        costs={},
+        max_tokens=None,
+        max_prompt_images=None,
+        backend_rate_limits=BACKEND_RATE_LIMITS,
+    )
+
+    # model with its own rate limits
+    MODEL_C = InferenceModelSpec(
+        backend_name="backend",
+        name="model-c",
+        sdk="openai",
+        model_type=ModelType.LLM,
+        model_id="model-c",
+        costs={},
+        max_tokens=None,
+        max_prompt_images=None,
+        rate_limits=InferenceRateLimits(requests_per_minute=10),
+        backend_rate_limits=BACKEND_RATE_LIMITS,
+    )
@@ -0,0 +1,92 @@
+import asyncio
+import time
+
+import pytest
+
+from pipelex.cogt.inference.inference_governor import InferenceGovernor, TokenBucket
+from pipelex.cogt.model_backends.rate_limits import InferenceRateLimits
+from tests.unit.cogt.inference.test_data import InferenceGovernorTestCases
+
+
+class TestInferenceGovernor:
+    @pytest.mark.asyncio
+    async def test_token_bucket_waits_for_refill(self):
+        """Test that acquisitions beyond the capacity wait for the bucket to refill."""
+        token_bucket = TokenBucket(capacity=2, refill_per_second=50)
+        started_at = time.monotonic()
+        for _ in range(4):
+            await token_bucket.acquire()
+        elapsed = time.monotonic() - started_at
+        # 2 tokens were available right away, the 2 others needed 2 / 50 = 0.04s of refill
+        assert elapsed >= 0.035
+
+    @pytest.mark.asyncio
+    async def test_token_bucket_lets_oversized_request_through(self):
+        token_bucket = TokenBucket(capacity=10, refill_per_second=1000)
+        await token_bucket.acquire(25)
+        assert token_bucket.level < 0
+
+    def test_token_bucket_adjust(self):
+        token_bucket = TokenBucket(capacity=100, refill_per_second=0.001)
+        token_bucket.adjust(-60)
+        assert abs(token_bucket.level - 40) < 0.1
+        token_bucket.adjust(1000)
+        assert token_bucket.level == 100
+
+    @pytest.mark.asyncio
+    async def test_governor_limits_in_flight_requests(self):
+        """Test that no more than max_in_flight requests run at the same time."""
+        inference_governor = InferenceGovernor(key="backend/model", rate_limits=InferenceRateLimits(max_in_flight=2))
+        nb_running = 0
+        max_running = 0
+
+        async def request():
+            nonlocal nb_running, max_running
+            async with inference_governor.governed():
+                nb_running += 1
+                max_running = max(max_running, nb_running)
+                await asyncio.sleep(0.005)
+                nb_running -= 1
+
+        await asyncio.gather(*(request() for _ in range(6)))
+        assert max_running == 2
+
+    @pytest.mark.asyncio
+    async def test_governor_reconciles_tokens(self):
+        inference_governor = InferenceGovernor(key="backend/model", rate_limits=InferenceRateLimits(tokens_per_minute=6000))
+        async with inference_governor.governed(nb_tokens=5000):
+            pass
+        inference_governor.record_tokens_used(nb_tokens_estimated=5000, nb_tokens_used=1000)
+        started_at = time.monotonic()
+        # 5000 tokens are available again thanks to the reconciliation, so this does not wait
+        async with inference_governor.governed(nb_tokens=4500):
+            pass
+        assert time.monotonic() - started_at < 1
+
+    def test_governor_works_across_event_loops(self):
+        """Test that the same governor can be used by successive event loops, as with successive asyncio.run() calls."""
+        inference_governor = InferenceGovernor(
+            key="backend",
+            rate_limits=InferenceRateLimits(max_in_flight=1, requests_per_minute=6000),
+        )
+
+        async def requests():
+            async def request():
+                async with inference_governor.governed():
+                    await asyncio.sleep(0.001)
+
+            await asyncio.gather(*(request() for _ in range(3)))
+
+        asyncio.run(requests())
+        asyncio.run(requests())
+
+    def test_make_key_shares_backend_limits(self):
+        """Test that the models without their own rate limits share the governor of their backend."""
+        model_a_key = InferenceGovernor.make_key(inference_model=InferenceGovernorTestCases.MODEL_A)
+        model_b_key = InferenceGovernor.make_key(inference_model=InferenceGovernorTestCases.MODEL_B)
+        assert model_a_key == model_b_key == "backend"
+        assert InferenceGovernor.make_key(inference_model=InferenceGovernorTestCases.MODEL_C) == "backend/model-c"
+
+    def test_rate_limits_is_limited(self):
+        assert not InferenceRateLimits().is_limited
+        assert InferenceRateLimits(requests_per_minute=10).is_limited
@@ -0,0 +1,52 @@
+from collections.abc import Iterator
+from pathlib import Path
+
+import pytest
+
+from pipelex.cogt.config_cogt import LLMResponseCacheConfig
+from pipelex.cogt.llm.llm_job import LLMJob
+from pipelex.cogt.llm.llm_job_components import LLMJobConfig, LLMJobParams
+from pipelex.cogt.llm.llm_job_factory import LLMJobFactory
+from pipelex.cogt.llm.llm_prompt import LLMPrompt
+from pipelex.cogt.llm.llm_response_cache import LLMResponseCache
+
+
+@pytest.fixture
+def llm_job() -> LLMJob:
+    """Create an LLM job with streaming disabled."""
+    return LLMJobFactory.make_llm_job(
+        llm_prompt=LLMPrompt(user_text="Say hello"),
+        llm_job_params=LLMJobParams(temperature=0.5, max_tokens=None, seed=None),
+        llm_job_config=LLMJobConfig(is_streaming_enabled=False, max_retries=1),
+    )
+
+
+@pytest.fixture
+def streaming_llm_job() -> LLMJob:
+    """Create an LLM job with streaming enabled."""
+    return LLMJobFactory.make_llm_job(
+        llm_prompt=LLMPrompt(user_text="Say hello"),
+        llm_job_params=LLMJobParams(temperature=0.5, max_tokens=None, seed=None),
+        llm_job_config=LLMJobConfig(is_streaming_enabled=True, max_retries=1),
+    )
+
+
+@pytest.fixture
+def llm_response_cache_config(tmp_path: Path) -> LLMResponseCacheConfig:
+    """Create an enabled LLM response cache config, storing the cache in the test's temporary directory."""
+    return LLMResponseCacheConfig(
+        is_enabled=True,
+        db_path=str(tmp_path / "cache" / "llm_response_cache.sqlite"),
+        ttl_seconds=0,
+        max_entries=100,
+        max_bytes=1_000_000,
+    )
+
+
+@pytest.fixture
+def llm_response_cache(llm_response_cache_config: LLMResponseCacheConfig) -> Iterator[LLMResponseCache]:
+    """Create an LLM response cache set up with the enabled config, torn down afterwards."""
+    response_cache = LLMResponseCache()
+    response_cache.setup(config=llm_response_cache_config)
+    yield response_cache
+    response_cache.teardown()
@@ -0,0 +1,30 @@
+from typing import Any, ClassVar
+
+from pydantic import BaseModel
+
+from pipelex.cogt.image.prompt_image import PromptImageBinary
+from pipelex.cogt.llm.llm_job_components import LLMJobParams
+from pipelex.cogt.llm.llm_prompt import LLMPrompt
+from pipelex.cogt.llm.llm_response_cache import LLMResponseKind
+
+
+class Answer(BaseModel):
+    answer: str
+
+
+class LLMResponseCacheTestCases:
+    # keyword arguments of make_llm_response_cache_key()
+    REFERENCE_KEY_INPUTS: ClassVar[dict[str, Any]] = {
+        "kind": LLMResponseKind.TEXT,
+        "llm_handle": "gpt-4o-mini",
+        "llm_job_params": LLMJobParams(temperature=0.5, max_tokens=None, seed=None),
+        "llm_prompt": LLMPrompt(user_text="Say hello", user_images=[PromptImageBinary(binary=b"image-1")]),
+        "schema": None,
+    }
+    # each case changes one of the reference key inputs
+    KEY_INPUT_CHANGES: ClassVar[list[tuple[str, dict[str, Any]]]] = [
+        ("temperature", {"llm_job_params": LLMJobParams(temperature=0.7, max_tokens=None, seed=None)}),
+        ("user_text", {"llm_prompt": LLMPrompt(user_text="Say goodbye", user_images=[PromptImageBinary(binary=b"image-1")])}),
+        ("user_image", {"llm_prompt": LLMPrompt(user_text="Say hello", user_images=[PromptImageBinary(binary=b"image-2")])}),
+        ("schema", {"kind": LLMResponseKind.OBJECT, "schema": Answer}),
+    ]
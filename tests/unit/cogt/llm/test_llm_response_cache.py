@@ -0,0 +1,168 @@
+import sqlite3
+import time
+from pathlib import Path
+from typing import Any
+
+import pytest
+from pytest_mock import MockerFixture
+
+from pipelex.cogt.config_cogt import LLMResponseCacheConfig
+from pipelex.cogt.image.prompt_image import PromptImageUrl
+from pipelex.cogt.llm.llm_report import LLMTokensUsage
+from pipelex.cogt.llm.llm_response_cache import (
+    LLMCachedResponse,
+    LLMResponseCache,
+    digest_prompt_image,
+    llm_response_cache_scope,
+    make_llm_response_cache_key,
+)
+from pipelex.cogt.usage.token_category import TokenCategory
+from pipelex.pipeline.job_metadata import JobMetadata
+from tests.unit.cogt.llm.test_data import LLMResponseCacheTestCases
+
+
+class TestLLMResponseCache:
+    @pytest.mark.asyncio
+    async def test_key_is_stable(self):
+        reference_key = await make_llm_response_cache_key(**LLMResponseCacheTestCases.REFERENCE_KEY_INPUTS)
+        assert await make_llm_response_cache_key(**LLMResponseCacheTestCases.REFERENCE_KEY_INPUTS) == reference_key
+
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize(("topic", "key_input_changes"), LLMResponseCacheTestCases.KEY_INPUT_CHANGES)
+    async def test_key_depends_on_everything_that_can_change_the_response(self, topic: str, key_input_changes: dict[str, Any]):
+        reference_key = await make_llm_response_cache_key(**LLMResponseCacheTestCases.REFERENCE_KEY_INPUTS)
+        changed_key = await make_llm_response_cache_key(**{**LLMResponseCacheTestCases.REFERENCE_KEY_INPUTS, **key_input_changes})
+        assert changed_key != reference_key, f"Changing the {topic} did not change the key"
+
+    @pytest.mark.asyncio
+    async def test_url_image_is_digested_by_its_content(self, mocker: MockerFixture):
+        """Test that new content behind the same URL changes the key."""
+        mocked_fetch = mocker.patch(
+            "pipelex.cogt.llm.llm_response_cache.fetch_file_from_url_httpx_async",
+            return_value=b"image-1",
+        )
+        prompt_image = PromptImageUrl(url="https://example.com/image.png")
+        first_digest = await digest_prompt_image(prompt_image=prompt_image)
+        mocked_fetch.return_value = b"image-2"
+        assert await digest_prompt_image(prompt_image=prompt_image) != first_digest
+
+    @pytest.mark.asyncio
+    async def test_response_round_trip_reattributes_tokens_usage(self, llm_response_cache: LLMResponseCache):
+        llm_tokens_usage = LLMTokensUsage(
+            job_metadata=JobMetadata(pipeline_run_id="first_run"),
+            inference_model_name="gpt-4o-mini",
+            unit_costs={},
+            inference_model_id="gpt-4o-mini",
+            nb_tokens_by_category={TokenCategory.INPUT: 10, TokenCategory.OUTPUT: 5},
+        )
+        cache_key = await make_llm_response_cache_key(**LLMResponseCacheTestCases.REFERENCE_KEY_INPUTS)
+
+        assert await llm_response_cache.get(cache_key=cache_key, job_metadata=JobMetadata()) is None
+        await llm_response_cache.set(cache_key=cache_key, cached_response=LLMCachedResponse(response="Hello", llm_tokens_usage=llm_tokens_usage))
+        cached_response = await llm_response_cache.get(cache_key=cache_key, job_metadata=JobMetadata(pipeline_run_id="second_run"))
+
+        assert cached_response is not None
+        assert cached_response.response == "Hello"
+        assert cached_response.llm_tokens_usage is not None
+        assert cached_response.llm_tokens_usage.job_metadata.pipeline_run_id == "second_run"
+        assert cached_response.llm_tokens_usage.nb_tokens_total == 15
+        assert (llm_response_cache.stats.hits, llm_response_cache.stats.misses) == (1, 1)
+
+    @pytest.mark.asyncio
+    async def test_entries_expire_after_ttl(
+        self,
+        llm_response_cache: LLMResponseCache,
+        llm_response_cache_config: LLMResponseCacheConfig,
+        mocker: MockerFixture,
+    ):
+        llm_response_cache.setup(config=llm_response_cache_config.model_copy(update={"ttl_seconds": 60}))
+        mocked_time = mocker.patch("pipelex.cogt.llm.llm_response_cache.time.time", return_value=1000.0)
+        await llm_response_cache.set(cache_key="key", cached_response=LLMCachedResponse(response="Hello"))
+
+        mocked_time.return_value = 1059.0
+        assert await llm_response_cache.get(cache_key="key", job_metadata=JobMetadata()) is not None
+        mocked_time.return_value = 1061.0
+        assert await llm_response_cache.get(cache_key="key", job_metadata=JobMetadata()) is None
+
+    @pytest.mark.asyncio
+    async def test_least_recently_used_entries_are_evicted(
+        self,
+        llm_response_cache: LLMResponseCache,
+        llm_response_cache_config: LLMResponseCacheConfig,
+        mocker: MockerFixture,
+    ):
+        llm_response_cache.setup(config=llm_response_cache_config.model_copy(update={"max_entries": 2}))
+        mocked_time = mocker.patch("pipelex.cogt.llm.llm_response_cache.time.time", return_value=1000.0)
+        await llm_response_cache.set(cache_key="key_a", cached_response=LLMCachedResponse(response="A"))
+        mocked_time.return_value = 1001.0
+        await llm_response_cache.set(cache_key="key_b", cached_response=LLMCachedResponse(response="B"))
+        # touch A so that B becomes the least recently used
+        mocked_time.return_value = 1002.0
+        await llm_response_cache.get(cache_key="key_a", job_metadata=JobMetadata())
+        mocked_time.return_value = 1003.0
+        await llm_response_cache.set(cache_key="key_c", cached_response=LLMCachedResponse(response="C"))
+
+        assert await llm_response_cache.get(cache_key="key_a", job_metadata=JobMetadata()) is not None
+        assert await llm_response_cache.get(cache_key="key_b", job_metadata=JobMetadata()) is None
+        assert await llm_response_cache.get(cache_key="key_c", job_metadata=JobMetadata()) is not None
+
+    @pytest.mark.asyncio
+    async def test_least_recently_used_entries_are_evicted_beyond_max_bytes(
+        self,
+        llm_response_cache: LLMResponseCache,
+        llm_response_cache_config: LLMResponseCacheConfig,
+        mocker: MockerFixture,
+    ):
+        # each stored response is a bit over 1,000 bytes, so only two of them fit
+        llm_response_cache.setup(config=llm_response_cache_config.model_copy(update={"max_bytes": 2500}))
+        mocked_time = mocker.patch("pipelex.cogt.llm.llm_response_cache.time.time", return_value=1000.0)
+        await llm_response_cache.set(cache_key="key_a", cached_response=LLMCachedResponse(response="A" * 1000))
+        mocked_time.return_value = 1001.0
+        await llm_response_cache.set(cache_key="key_b", cached_response=LLMCachedResponse(response="B" * 1000))
+        # touch A so that B becomes the least recently used
+        mocked_time.return_value = 1002.0
+        await llm_response_cache.get(cache_key="key_a", job_metadata=JobMetadata())
+        mocked_time.return_value = 1003.0
+        await llm_response_cache.set(cache_key="key_c", cached_response=LLMCachedResponse(response="C" * 1000))
+
+        assert await llm_response_cache.get(cache_key="key_a", job_metadata=JobMetadata()) is not None
+        assert await llm_response_cache.get(cache_key="key_b", job_metadata=JobMetadata()) is None
+        assert await llm_response_cache.get(cache_key="key_c", job_metadata=JobMetadata()) is not None
+
+    @pytest.mark.asyncio
+    async def test_database_without_response_sizes_is_migrated(
+        self,
+        llm_response_cache: LLMResponseCache,
+        llm_response_cache_config: LLMResponseCacheConfig,
+    ):
+        Path(llm_response_cache_config.db_path).parent.mkdir(parents=True, exist_ok=True)
+        connection = sqlite3.connect(llm_response_cache_config.db_path)
+        connection.execute(
+            "CREATE TABLE llm_responses ("
+            "cache_key TEXT PRIMARY KEY, cached_response TEXT NOT NULL, created_at REAL NOT NULL, accessed_at REAL NOT NULL)"
+        )
+        connection.execute(
+            "INSERT INTO llm_responses VALUES (?, ?, ?, ?)",
+            ("key_a", LLMCachedResponse(response="A").model_dump_json(), time.time(), time.time()),
+        )
+        connection.commit()
+        connection.close()
+
+        cached_response = await llm_response_cache.get(cache_key="key_a", job_metadata=JobMetadata())
+        assert cached_response is not None
+        assert cached_response.response == "A"
+        await llm_response_cache.set(cache_key="key_b", cached_response=LLMCachedResponse(response="B"))
+        assert await llm_response_cache.get(cache_key="key_b", job_metadata=JobMetadata()) is not None
+
+    def test_scope_overrides_config(self, llm_response_cache: LLMResponseCache, llm_response_cache_config: LLMResponseCacheConfig):
+        llm_response_cache.setup(config=llm_response_cache_config.model_copy(update={"is_enabled": False}))
+        assert not llm_response_cache.is_enabled
+        with llm_response_cache_scope(is_enabled=True):
+            assert llm_response_cache.is_enabled
+            with llm_response_cache_scope(is_enabled=None):
+                assert llm_response_cache.is_enabled
+            with llm_response_cache_scope(is_enabled=False):
+                assert not llm_response_cache.is_enabled
+        assert not llm_response_cache.is_enabled
+        llm_response_cache.teardown()
+        assert not llm_response_cache.is_enabled
@@ -0,0 +1,55 @@
+from collections.abc import AsyncIterator
+
+import pytest
+from typing_extensions import override
+
+from pipelex.cogt.llm.llm_job import LLMJob
+from pipelex.cogt.llm.llm_worker_abstract import LLMWorkerAbstract
+from pipelex.tools.typing.pydantic_utils import BaseModelTypeVar
+
+TEXT_CHUNKS = ["Hello", ", ", "world", "!"]
+
+
+class MockLLMWorker(LLMWorkerAbstract):
+    @property
+    @override
+    def is_gen_object_supported(self) -> bool:
+        return False
+
+    @override
+    async def _gen_text(self, llm_job: LLMJob) -> str:
+        return "non-streamed text"
+
+    @override
+    async def _gen_object(self, llm_job: LLMJob, schema: type[BaseModelTypeVar]) -> BaseModelTypeVar:
+        raise NotImplementedError
+
+
+class MockStreamingLLMWorker(MockLLMWorker):
+    @override
+    async def _gen_text_stream(self, llm_job: LLMJob) -> AsyncIterator[str]:
+        for text_chunk in TEXT_CHUNKS:
+            yield text_chunk
+
+
+@pytest.mark.asyncio(loop_scope="class")
+class TestLLMWorkerTextStream:
+    async def test_gen_text_stream_yields_chunks(self, llm_job: LLMJob):
+        llm_worker = MockStreamingLLMWorker()
+        text_chunks = [text_chunk async for text_chunk in llm_worker.gen_text_stream(llm_job=llm_job)]
+        assert text_chunks == TEXT_CHUNKS
+
+    async def test_gen_text_stream_falls_back_to_single_chunk(self, llm_job: LLMJob):
+        llm_worker = MockLLMWorker()
+        text_chunks = [text_chunk async for text_chunk in llm_worker.gen_text_stream(llm_job=llm_job)]
+        assert text_chunks == ["non-streamed text"]
+
+    async def test_gen_text_streams_when_enabled(self, streaming_llm_job: LLMJob):
+        llm_worker = MockStreamingLLMWorker()
+        generated_text = await llm_worker.gen_text(llm_job=streaming_llm_job)
+        assert generated_text == "".join(TEXT_CHUNKS)
+
+    async def test_gen_text_does_not_stream_when_disabled(self, llm_job: LLMJob):
+        llm_worker = MockStreamingLLMWorker()
+        generated_text = await llm_worker.gen_text(llm_job=llm_job)
+        assert generated_text == "non-streamed text"
@@ -0,0 +1,71 @@
+from collections.abc import Iterator
+from pathlib import Path
+
+import pytest
+from pytest_mock import MockerFixture
+
+from pipelex.config import get_config
+from pipelex.core.concepts.concept_structure_blueprint import ConceptStructureBlueprint, ConceptStructureBlueprintFieldType
+from pipelex.core.concepts.structure_code_cache import StructureCodeCacheConfig, structure_code_cache
+from pipelex.core.concepts.structure_generator import StructureGenerator
+from pipelex.core.stuffs.structured_content import StructuredContent
+from pipelex.pipelex import PACKAGE_VERSION
+
+STRUCTURE_BLUEPRINT = {
+    "title": ConceptStructureBlueprint(type=ConceptStructureBlueprintFieldType.TEXT, description="The title", required=True),
+    "nb_pages": ConceptStructureBlueprint(type=ConceptStructureBlueprintFieldType.INTEGER, description="The number of pages"),
+}
+
+
+def setup_structure_code_cache(disk_cache_dir: Path):
+    structure_code_cache.teardown()
+    structure_code_cache.setup(
+        config=StructureCodeCacheConfig(is_enabled=True, max_memory_entries=16, is_disk_cache_enabled=True, disk_cache_dir_path=str(disk_cache_dir)),
+        package_version="test",
+    )
+
+
+@pytest.fixture
+def disk_cache_dir(tmp_path: Path) -> Iterator[Path]:
+    disk_cache_dir = tmp_path / "structures"
+    setup_structure_code_cache(disk_cache_dir=disk_cache_dir)
+    yield disk_cache_dir
+    structure_code_cache.teardown()
+    structure_code_cache.setup(config=get_config().pipelex.structure_config.code_cache_config, package_version=PACKAGE_VERSION)
+
+
+class TestStructureCodeCache:
+    def test_unchanged_structure_is_not_compiled_again(self, disk_cache_dir: Path, mocker: MockerFixture):
+        compile_spy = mocker.spy(StructureGenerator, "_compile_generated_code")
+        cold_code, cold_class = StructureGenerator().generate_from_structure_blueprint(class_name="Book", structure_blueprint=STRUCTURE_BLUEPRINT)
+        assert compile_spy.call_count == 1
+        assert len(list(disk_cache_dir.iterdir())) == 1
+
+        # a new process only has the disk cache
+        setup_structure_code_cache(disk_cache_dir=disk_cache_dir)
+        warm_code, warm_class = StructureGenerator().generate_from_structure_blueprint(class_name="Book", structure_blueprint=STRUCTURE_BLUEPRINT)
+        assert compile_spy.call_count == 1
+        assert structure_code_cache.stats.disk_hits == 1
+        assert warm_code == cold_code
+        assert warm_class is not cold_class
+        assert issubclass(warm_class, StructuredContent)
+        assert list(warm_class.model_fields) == ["title", "nb_pages"]
+
+    def test_changed_structure_is_generated_again(self, disk_cache_dir: Path):
+        StructureGenerator().generate_from_structure_blueprint(class_name="Book", structure_blueprint=STRUCTURE_BLUEPRINT)
+        author_blueprint = ConceptStructureBlueprint(type=ConceptStructureBlueprintFieldType.TEXT, description="The author")
+        changed_blueprint = {**STRUCTURE_BLUEPRINT, "author": author_blueprint}
+        generated_code, _ = StructureGenerator().generate_from_structure_blueprint(class_name="Book", structure_blueprint=changed_blueprint)
+        assert "author" in generated_code
+        assert structure_code_cache.stats.misses == 2
+        assert len(list(disk_cache_dir.iterdir())) == 2
+
+    def test_corrupted_entry_is_generated_again(self, disk_cache_dir: Path):
+        StructureGenerator().generate_from_structure_blueprint(class_name="Book", structure_blueprint=STRUCTURE_BLUEPRINT)
+        for entry_path in disk_cache_dir.iterdir():
+            entry_path.write_bytes(b"not marshalled code")
+        setup_structure_code_cache(disk_cache_dir=disk_cache_dir)
+        _, generated_class = StructureGenerator().generate_from_structure_blueprint(class_name="Book", structure_blueprint=STRUCTURE_BLUEPRINT)
+        assert structure_code_cache.stats.misses == 1
+        assert issubclass(generated_class, StructuredContent)
+        assert list(generated_class.model_fields) == ["title", "nb_pages"]
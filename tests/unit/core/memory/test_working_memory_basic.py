@@ -40,3 +40,17 @@ class TestWorkingMemoryBasic:
         empty_memory = WorkingMemoryFactory.make_empty()
         assert len(empty_memory.root) == 0
         assert len(empty_memory.aliases) == 0
+
+    def test_working_memory_branch_copy(self, memory_with_aliases: WorkingMemory):
+        """Test that a branch copy shares the stuffs but not the mappings."""
+        branch_memory = memory_with_aliases.make_branch_copy()
+        assert branch_memory.root == memory_with_aliases.root
+        assert branch_memory.aliases == memory_with_aliases.aliases
+        assert branch_memory.get_stuff("primary_text") is memory_with_aliases.get_stuff("primary_text")
+
+        new_stuff = WorkingMemoryFactory.make_from_text(text="branch text", name="branch_text").get_stuff("branch_text")
+        branch_memory.set_new_main_stuff(stuff=new_stuff, name="branch_text")
+        assert "branch_text" in branch_memory.root
+        assert "branch_text" not in memory_with_aliases.root
+        assert memory_with_aliases.get_main_stuff() != new_stuff
+        assert branch_memory.get_main_stuff() == new_stuff
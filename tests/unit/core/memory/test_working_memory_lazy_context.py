@@ -0,0 +1,49 @@
+import pytest
+from pytest_mock import MockerFixture
+
+from pipelex.cogt.templating.template_blueprint import TemplateBlueprint
+from pipelex.cogt.templating.template_category import TemplateCategory
+from pipelex.core.memory.working_memory import MAIN_STUFF_NAME, WorkingMemory
+from pipelex.core.stuffs.stuff import Stuff
+from pipelex.pipe_operators.llm.llm_prompt_blueprint import LLMPromptBlueprint
+
+
+class TestWorkingMemoryLazyContext:
+    def test_artefacts_are_made_on_lookup_and_memoized(self, multiple_stuff_memory: WorkingMemory):
+        lazy_context = multiple_stuff_memory.make_lazy_context()
+        assert set(lazy_context) == set(multiple_stuff_memory.generate_context())
+        assert lazy_context.nb_made_values == 0
+
+        question_artefact = lazy_context["question"]
+        assert lazy_context["question"] is question_artefact
+        assert lazy_context.nb_made_values == 1
+
+    def test_aliases_share_the_artefact_of_their_target(self, memory_with_aliases: WorkingMemory):
+        lazy_context = memory_with_aliases.make_lazy_context()
+        assert lazy_context["main_text"] is lazy_context["primary_text"]
+        assert lazy_context[MAIN_STUFF_NAME] is lazy_context["primary_text"]
+        assert lazy_context.nb_made_values == 1
+
+    def test_materialize_ignores_unknown_names(self, multiple_stuff_memory: WorkingMemory):
+        lazy_context = multiple_stuff_memory.make_lazy_context()
+        context = lazy_context.materialize(names=["question", "not_in_memory"])
+        assert list(context) == ["question"]
+        with pytest.raises(KeyError):
+            lazy_context["not_in_memory"]
+
+
+@pytest.mark.asyncio(loop_scope="class")
+class TestLLMPromptLazyContext:
+    async def test_only_the_prompt_variables_are_made(self, mocker: MockerFixture, multiple_stuff_memory: WorkingMemory):
+        make_artefact_spy = mocker.spy(Stuff, "make_artefact")
+        llm_prompt_blueprint = LLMPromptBlueprint(
+            system_prompt_blueprint=TemplateBlueprint(template="Answer the $question.", category=TemplateCategory.LLM_PROMPT),
+            prompt_blueprint=TemplateBlueprint(template="Answer the $question about the topic.", category=TemplateCategory.LLM_PROMPT),
+        )
+
+        llm_prompt = await llm_prompt_blueprint.make_llm_prompt(output_concept_string="native.Text", context_provider=multiple_stuff_memory)
+
+        assert llm_prompt.user_text
+        assert "What are the aerodynamic features?" in llm_prompt.user_text
+        # the document and the diagram are not in the prompts, and the question is made once for both prompts
+        assert make_artefact_spy.call_count == 1
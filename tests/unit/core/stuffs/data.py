@@ -1,4 +1,6 @@
-from pydantic import Field
+from typing import Any
+
+from pydantic import BaseModel, Field
 
 from pipelex.client.protocol import StuffContentOrData
 from pipelex.core.concepts.concept_factory import ConceptFactory
@@ -26,6 +28,26 @@ class AnotherConcept(StructuredContent):
     value: int = Field(description="Value field")
 
 
+class MyConceptList(BaseModel):
+    """A plain pydantic list of MyConcept, dumped by pydantic itself, to compare with ListContent."""
+
+    items: list[MyConcept]
+
+
+# Test cases format: (description, exclude)
+LIST_CONTENT_EXCLUDE_TEST_CASES: list[tuple[str, Any]] = [
+    ("no-exclude", None),
+    ("all-items", {"items"}),
+    ("all-items-dict", {"items": True}),
+    ("field-of-all-items", {"items": {"__all__": {"arg2"}}}),
+    ("nested-field-of-all-items", {"items": {"__all__": {"arg3": {"arg4"}}}}),
+    ("items-by-index", {"items": {0}}),
+    ("item-by-index-dict", {"items": {1: True}}),
+    ("field-of-one-item", {"items": {1: {"arg1"}}}),
+    ("fields-of-all-items-and-one-item", {"items": {"__all__": {"arg3": {"arg4"}}, 1: {"arg1", "arg3"}}}),
+]
+
+
 TEST_CASES: list[tuple[str, StuffContentOrData, str | None, str, Stuff]] = [
     # Case 1.1: Content is a string
     (
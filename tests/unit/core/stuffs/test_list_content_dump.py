@@ -0,0 +1,17 @@
+from typing import Any
+
+import pytest
+
+from pipelex.core.stuffs.list_content import ListContent
+from tests.unit.core.stuffs.data import LIST_CONTENT_EXCLUDE_TEST_CASES, MyConcept, MyConceptList, MySubClass
+
+
+class TestListContentDump:
+    @pytest.mark.parametrize(("description", "exclude"), LIST_CONTENT_EXCLUDE_TEST_CASES)
+    def test_exclude_applies_to_the_items_like_pydantic(self, description: str, exclude: Any):
+        items = [
+            MyConcept(arg1="first", arg2=1, arg3=MySubClass(arg4="first sub")),
+            MyConcept(arg1="second", arg2=2, arg3=MySubClass(arg4="second sub")),
+        ]
+        list_content = ListContent[MyConcept](items=items)
+        assert list_content.model_dump(exclude=exclude) == MyConceptList(items=items).model_dump(exclude=exclude), description
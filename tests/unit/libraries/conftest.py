@@ -0,0 +1,25 @@
+from pathlib import Path
+
+import pytest
+
+from pipelex.config import LibraryIndexConfig
+from pipelex.libraries.library_index import LibraryIndex
+from tests.unit.libraries.test_data import LibraryIndexTestCases
+
+
+@pytest.fixture
+def library_index_config(tmp_path: Path) -> LibraryIndexConfig:
+    """Create an enabled library index config, with its manifest in a temporary directory."""
+    return LibraryIndexConfig(is_enabled=True, index_file_path=str(tmp_path / "cache" / "library_index.json"))
+
+
+@pytest.fixture
+def library_index(library_index_config: LibraryIndexConfig) -> LibraryIndex:
+    """Create a library index with the test library index config, loaded from its manifest."""
+    library_index = LibraryIndex(
+        config=library_index_config,
+        base_class_names=LibraryIndexTestCases.BASE_CLASS_NAMES,
+        decorator_names=LibraryIndexTestCases.DECORATOR_NAMES,
+    )
+    library_index.load()
+    return library_index
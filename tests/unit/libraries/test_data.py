@@ -0,0 +1,25 @@
+from typing import ClassVar
+
+
+class LibraryIndexTestCases:
+    BASE_CLASS_NAMES: ClassVar[list[str]] = ["StructuredContent"]
+    DECORATOR_NAMES: ClassVar[list[str]] = ["pipe_func"]
+
+    PYTHON_FILE_CONTENT = """
+from pipelex.core.stuffs.structured_content import StructuredContent
+
+
+class Greeting(StructuredContent):
+    text: str
+"""
+
+    PLX_FILE_CONTENT = """
+domain = "test_library_index"
+description = "Domain for testing the library index"
+
+[pipe.greet]
+type = "PipeLLM"
+description = "Write a greeting"
+output = "Text"
+prompt = "Write a short greeting."
+"""
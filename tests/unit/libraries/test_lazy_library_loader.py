@@ -0,0 +1,112 @@
+from collections.abc import Iterator
+from pathlib import Path
+
+import pytest
+
+from pipelex.hub import get_library_manager
+from pipelex.libraries.exceptions import PipeLibraryError
+from pipelex.libraries.library_loading_mode import LibraryLoadingMode
+from pipelex.libraries.library_manager import LibraryManager
+
+STORY_PLX_CONTENT = """
+domain = "test_lazy_story"
+description = "Domain for testing the lazy library loading"
+
+[concept]
+Story = "A short story"
+Unused = "A concept no pipe uses"
+
+[pipe.write_story]
+type = "PipeSequence"
+description = "Write a story and its title"
+inputs = { topic = "Text" }
+output = "Text"
+steps = [
+    { pipe = "draft_story", result = "story" },
+    { pipe = "write_title", result = "title" },
+]
+
+[pipe.draft_story]
+type = "PipeLLM"
+description = "Draft a story"
+inputs = { topic = "Text" }
+output = "Story"
+prompt = "Write a short story about $topic."
+
+[pipe.write_title]
+type = "PipeLLM"
+description = "Write a title"
+inputs = { story = "Story" }
+output = "Text"
+prompt = "Write a title for @story"
+"""
+
+POEM_PLX_CONTENT = """
+domain = "test_lazy_poem"
+description = "Domain for testing the lazy library loading"
+
+[concept]
+Poem = "A short poem"
+
+[pipe.write_poem]
+type = "PipeLLM"
+description = "Write a poem"
+output = "Poem"
+prompt = "Write a short poem."
+"""
+
+
+@pytest.fixture
+def library_manager() -> Iterator[LibraryManager]:
+    library_manager = get_library_manager()
+    assert isinstance(library_manager, LibraryManager)
+    library_manager.reset()
+    yield library_manager
+    # restore the libraries loaded for the other tests
+    library_manager.reset()
+    library_manager.load_libraries()
+
+
+def write_plx_files(tmp_path: Path, plx_contents: list[str]) -> list[Path]:
+    plx_file_paths: list[Path] = []
+    for index, plx_content in enumerate(plx_contents):
+        plx_file_path = tmp_path / f"bundle_{index}.plx"
+        plx_file_path.write_text(plx_content)
+        plx_file_paths.append(plx_file_path)
+    return plx_file_paths
+
+
+class TestLazyLibraryLoader:
+    def test_requested_pipe_loads_its_dependencies_only(self, tmp_path: Path, library_manager: LibraryManager):
+        plx_file_paths = write_plx_files(tmp_path=tmp_path, plx_contents=[STORY_PLX_CONTENT, POEM_PLX_CONTENT])
+        library_manager.load_libraries(library_file_paths=plx_file_paths, loading_mode=LibraryLoadingMode.LAZY)
+        assert library_manager.pipe_library.root == {}
+        assert library_manager.domain_library.get_domain(domain="test_lazy_poem") is not None
+
+        write_story = library_manager.pipe_library.get_required_pipe(pipe_code="write_story")
+        assert write_story.pipe_dependencies() == {"draft_story", "write_title"}
+        assert set(library_manager.pipe_library.root) == {"write_story", "draft_story", "write_title"}
+        loaded_concept_strings = set(library_manager.concept_library.root)
+        assert "test_lazy_story.Story" in loaded_concept_strings
+        assert "test_lazy_story.Unused" not in loaded_concept_strings
+        assert "test_lazy_poem.Poem" not in loaded_concept_strings
+
+        # listing the pipes loads everything
+        assert {pipe.code for pipe in library_manager.pipe_library.get_pipes()} == {"write_story", "draft_story", "write_title", "write_poem"}
+        assert "test_lazy_story.Unused" in library_manager.concept_library.root
+        library_manager.validate_libraries()
+
+    def test_duplicate_pipe_code_is_detected_at_load(self, tmp_path: Path, library_manager: LibraryManager):
+        plx_file_paths = write_plx_files(
+            tmp_path=tmp_path,
+            plx_contents=[POEM_PLX_CONTENT, POEM_PLX_CONTENT.replace('domain = "test_lazy_poem"', 'domain = "test_lazy_other_poem"')],
+        )
+        with pytest.raises(PipeLibraryError, match="write_poem"):
+            library_manager.load_libraries(library_file_paths=plx_file_paths, loading_mode=LibraryLoadingMode.LAZY)
+
+    def test_removed_blueprint_is_not_loaded(self, tmp_path: Path, library_manager: LibraryManager):
+        plx_file_paths = write_plx_files(tmp_path=tmp_path, plx_contents=[POEM_PLX_CONTENT])
+        library_manager.load_libraries(library_file_paths=plx_file_paths, loading_mode=LibraryLoadingMode.LAZY)
+        assert library_manager.lazy_loader is not None
+        library_manager.remove_from_blueprint(blueprint=library_manager.lazy_loader.pending_pipes["write_poem"])
+        assert library_manager.pipe_library.get_optional_pipe(pipe_code="write_poem") is None
@@ -0,0 +1,109 @@
+import os
+from pathlib import Path
+
+import pytest
+from pytest_mock import MockerFixture
+
+from pipelex.config import LibraryIndexConfig, LibraryLoadConfig, LibraryScanEngine
+from pipelex.libraries import library_index as library_index_module
+from pipelex.libraries.library_index import LibraryIndex
+from pipelex.libraries.library_loading_mode import LibraryLoadingMode
+from pipelex.tools.typing.module_inspector import ModuleFileError
+from tests.unit.libraries.test_data import LibraryIndexTestCases
+
+
+class TestLibraryIndex:
+    def test_warm_start_reuses_scans_and_blueprints(
+        self,
+        tmp_path: Path,
+        mocker: MockerFixture,
+        library_index_config: LibraryIndexConfig,
+        library_index: LibraryIndex,
+    ):
+        python_file = tmp_path / "greeting.py"
+        python_file.write_text(LibraryIndexTestCases.PYTHON_FILE_CONTENT)
+        plx_file = tmp_path / "greeting.plx"
+        plx_file.write_text(LibraryIndexTestCases.PLX_FILE_CONTENT)
+
+        cold_index = library_index
+        assert cold_index.scan_python_file(file_path=python_file).class_names == ["Greeting"]
+        assert cold_index.is_pipelex_file(file_path=plx_file)
+        cold_blueprint = cold_index.get_blueprint(file_path=plx_file)
+        cold_index.save()
+        assert (cold_index.nb_python_files_scanned, cold_index.nb_plx_files_parsed) == (1, 1)
+
+        scan_spy = mocker.spy(library_index_module, "find_class_and_decorated_function_names_in_file")
+        warm_index = LibraryIndex(
+            config=library_index_config,
+            base_class_names=LibraryIndexTestCases.BASE_CLASS_NAMES,
+            decorator_names=LibraryIndexTestCases.DECORATOR_NAMES,
+        )
+        warm_index.load()
+        assert warm_index.scan_python_file(file_path=python_file).class_names == ["Greeting"]
+        assert warm_index.is_pipelex_file(file_path=plx_file)
+        assert warm_index.get_blueprint(file_path=plx_file) == cold_blueprint
+        assert (warm_index.nb_python_files_scanned, warm_index.nb_plx_files_parsed) == (0, 0)
+        assert scan_spy.call_count == 0
+
+    def test_changed_file_is_scanned_again(self, tmp_path: Path, library_index_config: LibraryIndexConfig, library_index: LibraryIndex):
+        python_file = tmp_path / "greeting.py"
+        python_file.write_text(LibraryIndexTestCases.PYTHON_FILE_CONTENT)
+        library_index.scan_python_file(file_path=python_file)
+        library_index.save()
+
+        python_file.write_text(LibraryIndexTestCases.PYTHON_FILE_CONTENT + "\n\nclass Farewell(StructuredContent):\n    text: str\n")
+        file_stat = python_file.stat()
+        os.utime(python_file, ns=(file_stat.st_atime_ns, file_stat.st_mtime_ns + 1_000_000_000))
+
+        warm_index = LibraryIndex(
+            config=library_index_config,
+            base_class_names=LibraryIndexTestCases.BASE_CLASS_NAMES,
+            decorator_names=LibraryIndexTestCases.DECORATOR_NAMES,
+        )
+        warm_index.load()
+        assert warm_index.scan_python_file(file_path=python_file).class_names == ["Greeting", "Farewell"]
+        assert warm_index.nb_python_files_scanned == 1
+
+    def test_index_file_path_override(self, tmp_path: Path):
+        index_file_path = str(tmp_path / "other_library_index.json")
+        library_index = LibraryIndex.make_for_libraries(index_file_path=index_file_path)
+        assert library_index.config.index_file_path == index_file_path
+        assert LibraryIndex.make_for_libraries().config.index_file_path != index_file_path
+
+    def test_disabled_index_is_not_saved(self, tmp_path: Path, library_index_config: LibraryIndexConfig):
+        python_file = tmp_path / "greeting.py"
+        python_file.write_text(LibraryIndexTestCases.PYTHON_FILE_CONTENT)
+        library_index = LibraryIndex(
+            config=library_index_config.model_copy(update={"is_enabled": False}),
+            base_class_names=LibraryIndexTestCases.BASE_CLASS_NAMES,
+            decorator_names=LibraryIndexTestCases.DECORATOR_NAMES,
+        )
+        library_index.load()
+        library_index.scan_python_file(file_path=python_file)
+        library_index.save()
+        assert not Path(library_index_config.index_file_path).exists()
+
+    @pytest.mark.parametrize("scan_engine", [LibraryScanEngine.THREAD, LibraryScanEngine.PROCESS_POOL])
+    def test_scan_files_in_worker_pool(self, tmp_path: Path, scan_engine: LibraryScanEngine, library_index: LibraryIndex):
+        python_files = [tmp_path / f"greeting_{index}.py" for index in range(4)]
+        for python_file in python_files:
+            python_file.write_text(LibraryIndexTestCases.PYTHON_FILE_CONTENT)
+        broken_python_file = tmp_path / "broken.py"
+        broken_python_file.write_text("class Broken(StructuredContent:\n")
+        plx_file = tmp_path / "greeting.plx"
+        plx_file.write_text(LibraryIndexTestCases.PLX_FILE_CONTENT)
+
+        nb_workers = library_index.scan_files(
+            python_file_paths=[*python_files, broken_python_file],
+            plx_file_paths=[plx_file],
+            load_config=LibraryLoadConfig(
+                loading_mode=LibraryLoadingMode.EAGER, scan_engine=scan_engine, max_scan_workers=2, min_files_per_scan_worker=1
+            ),
+        )
+        assert nb_workers == 2
+        assert (library_index.nb_python_files_scanned, library_index.nb_plx_files_parsed) == (4, 1)
+        assert library_index.scan_python_file(file_path=python_files[0]).class_names == ["Greeting"]
+        assert library_index.get_blueprint(file_path=plx_file).domain == "test_library_index"
+        # the broken file is left to be scanned again, which raises the actual error
+        with pytest.raises(ModuleFileError):
+            library_index.scan_python_file(file_path=broken_python_file)
@@ -0,0 +1,38 @@
+from pathlib import Path
+
+from pipelex.libraries.library_utils import find_library_files_in_dirs
+
+
+class TestLibraryUtils:
+    def test_find_library_files_in_dirs_walks_once(self, tmp_path: Path):
+        project_dir = tmp_path / "project"
+        package_dir = project_dir / "package"
+        excluded_dir = project_dir / "__pycache__"
+        for dir_path in (package_dir, excluded_dir):
+            dir_path.mkdir(parents=True)
+        (project_dir / "main.py").write_text("")
+        (project_dir / "bundle.plx").write_text("")
+        (package_dir / "module.py").write_text("")
+        (package_dir / "package_bundle.plx").write_text("")
+        (excluded_dir / "cached.py").write_text("")
+
+        library_files = find_library_files_in_dirs(
+            dir_paths=[project_dir, package_dir, tmp_path / "missing"],
+            package_dir_path=package_dir,
+        )
+        assert library_files.python_file_paths == [project_dir / "main.py"]
+        assert library_files.package_python_file_paths == [package_dir / "module.py"]
+        assert sorted(library_files.plx_file_paths) == [project_dir / "bundle.plx", package_dir / "package_bundle.plx"]
+
+    def test_find_library_files_in_dirs_walks_package_in_excluded_dir(self, tmp_path: Path):
+        project_dir = tmp_path / "venv" / "project"
+        package_dir = project_dir / ".venv" / "lib" / "site-packages" / "package"
+        package_dir.mkdir(parents=True)
+        (project_dir / "main.py").write_text("")
+        (package_dir / "module.py").write_text("")
+        (package_dir / "package_bundle.plx").write_text("")
+
+        library_files = find_library_files_in_dirs(dir_paths=[project_dir], package_dir_path=package_dir)
+        assert library_files.python_file_paths == [project_dir / "main.py"]
+        assert library_files.package_python_file_paths == [package_dir / "module.py"]
+        assert library_files.plx_file_paths == [package_dir / "package_bundle.plx"]
@@ -0,0 +1,41 @@
+import pytest
+from pytest_mock import MockerFixture
+
+from pipelex.core.concepts.concept_native import NativeConceptCode
+from pipelex.hub import get_required_concept
+from pipelex.pipe_operators.llm import output_structure_prompt_cache as output_structure_prompt_cache_module
+from pipelex.pipe_operators.llm.output_structure_prompt_cache import OutputStructurePromptCache
+from pipelex.tools.typing.structure_printer import StructurePrinter
+
+CONCEPT_STRING = f"native.{NativeConceptCode.IMAGE}"
+
+
+@pytest.mark.asyncio(loop_scope="class")
+class TestOutputStructurePromptCache:
+    async def test_structure_is_walked_once_per_concept(self, mocker: MockerFixture):
+        get_type_structure_spy = mocker.spy(StructurePrinter, "get_type_structure")
+        cache = OutputStructurePromptCache()
+
+        first_prompt = await cache.get_output_structure_prompt(concept_string=CONCEPT_STRING, is_with_preliminary_text=False)
+        assert first_prompt
+        assert "ImageContent" in first_prompt
+        nb_walks = get_type_structure_spy.call_count
+
+        assert await cache.get_output_structure_prompt(concept_string=CONCEPT_STRING, is_with_preliminary_text=False) == first_prompt
+        # the other template reuses the class structure
+        assert await cache.get_output_structure_prompt(concept_string=CONCEPT_STRING, is_with_preliminary_text=True)
+        assert get_type_structure_spy.call_count == nb_walks
+        assert cache.stats.hits == 1
+        assert cache.stats.misses == 2
+
+    async def test_registered_again_concept_is_made_again(self, mocker: MockerFixture):
+        cache = OutputStructurePromptCache()
+        concept = get_required_concept(concept_string=CONCEPT_STRING)
+        cache.get_class_structure_str(concept=concept)
+        await cache.get_output_structure_prompt(concept_string=CONCEPT_STRING, is_with_preliminary_text=False)
+
+        get_type_structure_spy = mocker.spy(StructurePrinter, "get_type_structure")
+        mocker.patch.object(output_structure_prompt_cache_module, "get_required_concept", return_value=concept.model_copy())
+        assert await cache.get_output_structure_prompt(concept_string=CONCEPT_STRING, is_with_preliminary_text=False)
+        assert get_type_structure_spy.call_count >= 1
+        assert cache.stats.misses == 2
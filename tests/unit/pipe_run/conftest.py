@@ -0,0 +1,52 @@
+import pytest
+
+from pipelex.core.concepts.concept_factory import ConceptFactory
+from pipelex.core.concepts.concept_native import NativeConceptCode
+from pipelex.core.pipes.input_requirements import TypedNamedInputRequirement
+from pipelex.core.stuffs.list_content import ListContent
+from pipelex.core.stuffs.stuff import Stuff
+from pipelex.core.stuffs.stuff_factory import StuffFactory
+from pipelex.core.stuffs.text_content import TextContent
+from tests.unit.pipe_run.data import OutputVerbosityTestCases
+
+
+@pytest.fixture
+def topic_requirement() -> TypedNamedInputRequirement:
+    """Create the requirement of a Text input named 'topic'."""
+    return TypedNamedInputRequirement(
+        variable_name="topic",
+        concept=ConceptFactory.make_native_concept(native_concept_code=NativeConceptCode.TEXT),
+        structure_class=TextContent,
+    )
+
+
+@pytest.fixture
+def story_requirement() -> TypedNamedInputRequirement:
+    """Create the requirement of a Text input named 'story'."""
+    return TypedNamedInputRequirement(
+        variable_name="story",
+        concept=ConceptFactory.make_native_concept(native_concept_code=NativeConceptCode.TEXT),
+        structure_class=TextContent,
+    )
+
+
+@pytest.fixture
+def topics_stuff() -> Stuff:
+    """Create a list of Text topics named 'topics'."""
+    return StuffFactory.make_stuff(
+        concept=ConceptFactory.make_native_concept(native_concept_code=NativeConceptCode.TEXT),
+        content=ListContent[TextContent](items=[TextContent(text=f"topic {item_index}") for item_index in range(OutputVerbosityTestCases.NB_ITEMS)]),
+        name="topics",
+    )
+
+
+@pytest.fixture
+def benchmark_topics_stuff(topics_stuff: Stuff) -> Stuff:
+    """Create a list of Text topics named 'topics', long enough to benchmark a batch."""
+    return topics_stuff.model_copy(
+        update={
+            "content": ListContent[TextContent](
+                items=[TextContent(text=f"topic {item_index}") for item_index in range(OutputVerbosityTestCases.NB_BENCHMARK_ITEMS)]
+            )
+        }
+    )
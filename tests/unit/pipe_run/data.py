@@ -169,3 +169,30 @@ OUTPUT_MULTIPLICITY_TO_APPLY_TEST_CASES: list[
         "base=100, override=999",
     ),
 ]
+
+
+class OutputVerbosityTestCases:
+    NB_ITEMS = 4
+    NB_BENCHMARK_ITEMS = 1000
+
+    SHOUT_TOPICS_PLX_CONTENT = """
+domain = "test_output_verbosity"
+description = "Domain for testing the output verbosity"
+main_pipe = "shout_topics"
+
+[pipe.shout_topics]
+type = "PipeBatch"
+description = "Shout each topic"
+inputs = { topics = "Text[]" }
+output = "Text[]"
+branch_pipe_code = "shout_topic"
+input_list_name = "topics"
+input_item_name = "topic"
+
+[pipe.shout_topic]
+type = "PipeFunc"
+description = "Shout a topic"
+inputs = { topic = "Text" }
+output = "Text"
+function_name = "shout_topic"
+"""
@@ -0,0 +1,165 @@
+from collections.abc import Iterator
+from pathlib import Path
+
+import pytest
+from pytest_mock import MockerFixture
+
+from pipelex.config import DryRunCacheConfig, get_config
+from pipelex.core.interpreter import PipelexInterpreter
+from pipelex.core.memory.working_memory import WorkingMemory
+from pipelex.core.stuffs.text_content import TextContent
+from pipelex.hub import get_library_manager
+from pipelex.pipe_run.dry_run import dry_run_pipes
+from pipelex.pipe_run.dry_run_cache import DryRunCache, dry_run_cache
+from pipelex.pipelex import PACKAGE_VERSION
+from pipelex.system.registries.func_registry import func_registry
+
+PLX_CONTENT = """
+domain = "test_dry_run_cache"
+description = "Domain for testing the incremental validation"
+
+[concept]
+Story = "A short story"
+
+[pipe.write_story]
+type = "PipeSequence"
+description = "Write a story and its title"
+inputs = { topic = "Text" }
+output = "Text"
+steps = [
+    { pipe = "draft_story", result = "story" },
+    { pipe = "write_title", result = "title" },
+]
+
+[pipe.draft_story]
+type = "PipeLLM"
+description = "Draft a story"
+inputs = { topic = "Text" }
+output = "Story"
+prompt = "Write a short story about $topic."
+
+[pipe.write_title]
+type = "PipeLLM"
+description = "Write a title"
+inputs = { story = "Story" }
+output = "Text"
+prompt = "Write a title for @story"
+"""
+
+FUNC_PLX_CONTENT = """
+domain = "test_dry_run_cache_func"
+description = "Domain for testing the incremental validation of PipeFunc"
+
+[pipe.make_slogan]
+type = "PipeFunc"
+description = "Make a slogan"
+inputs = { topic = "Text" }
+output = "Text"
+function_name = "make_slogan"
+"""
+
+
+async def make_slogan(working_memory: WorkingMemory) -> TextContent:
+    topic = working_memory.get_stuff_as_str("topic")
+    return TextContent(text=f"{topic}!")
+
+
+async def make_shouted_slogan(working_memory: WorkingMemory) -> TextContent:
+    topic = working_memory.get_stuff_as_str("topic")
+    return TextContent(text=f"{topic.upper()}!")
+
+
+def setup_dry_run_cache(disk_cache_dir: Path, max_disk_entries: int = 100):
+    dry_run_cache.teardown()
+    dry_run_cache.setup(
+        config=DryRunCacheConfig(
+            is_enabled=True,
+            max_memory_entries=16,
+            is_disk_cache_enabled=True,
+            disk_cache_dir_path=str(disk_cache_dir),
+            max_disk_entries=max_disk_entries,
+        ),
+        package_version="test",
+        dry_run_settings={},
+    )
+
+
+@pytest.fixture
+def disk_cache_dir(tmp_path: Path) -> Iterator[Path]:
+    disk_cache_dir = tmp_path / "dry_runs"
+    setup_dry_run_cache(disk_cache_dir=disk_cache_dir)
+    yield disk_cache_dir
+    dry_run_cache.teardown()
+    dry_run_config = get_config().pipelex.dry_run_config
+    dry_run_cache.setup(
+        config=dry_run_config.cache_config,
+        package_version=PACKAGE_VERSION,
+        dry_run_settings=dry_run_config.model_dump(mode="json", exclude={"cache_config", "max_concurrency"}),
+    )
+
+
+def count_disk_entries(disk_cache_dir: Path) -> int:
+    return len(list(disk_cache_dir.iterdir()))
+
+
+async def dry_run_plx_content(plx_content: str) -> dict[str, bool]:
+    """Load the PLX content, dry run its pipes incrementally and tell which pipe outputs came from the cache."""
+    blueprint = PipelexInterpreter(file_content=plx_content).make_pipelex_bundle_blueprint()
+    library_manager = get_library_manager()
+    pipes = library_manager.load_from_blueprint(blueprint=blueprint)
+    try:
+        dry_run_outputs = await dry_run_pipes(pipes=pipes, raise_on_failure=True, is_incremental=True)
+    finally:
+        library_manager.remove_from_blueprint(blueprint=blueprint)
+    return {pipe_code: dry_run_output.is_from_cache for pipe_code, dry_run_output in dry_run_outputs.items()}
+
+
+@pytest.mark.asyncio(loop_scope="class")
+class TestDryRunCache:
+    async def test_unchanged_pipes_are_not_dry_run_again(self, disk_cache_dir: Path):
+        first_outputs = await dry_run_plx_content(plx_content=PLX_CONTENT)
+        assert first_outputs == {"write_story": False, "draft_story": False, "write_title": False}
+        assert count_disk_entries(disk_cache_dir=disk_cache_dir) == 3
+
+        # a new process only has the disk cache
+        setup_dry_run_cache(disk_cache_dir=disk_cache_dir)
+        second_outputs = await dry_run_plx_content(plx_content=PLX_CONTENT)
+        assert second_outputs == {"write_story": True, "draft_story": True, "write_title": True}
+
+    @pytest.mark.usefixtures("disk_cache_dir")
+    async def test_changed_pipe_and_its_dependents_are_dry_run_again(self):
+        await dry_run_plx_content(plx_content=PLX_CONTENT)
+        changed_plx_content = PLX_CONTENT.replace("Write a title for @story", "Write a catchy title for @story")
+        outputs = await dry_run_plx_content(plx_content=changed_plx_content)
+        assert outputs == {"write_story": False, "draft_story": True, "write_title": False}
+
+    @pytest.mark.usefixtures("disk_cache_dir")
+    async def test_changed_concept_invalidates_the_pipes_using_it(self):
+        await dry_run_plx_content(plx_content=PLX_CONTENT)
+        changed_plx_content = PLX_CONTENT.replace('Story = "A short story"', 'Story = "A long story"')
+        outputs = await dry_run_plx_content(plx_content=changed_plx_content)
+        assert outputs == {"write_story": False, "draft_story": False, "write_title": False}
+        assert dry_run_cache.stats.hits == 0
+
+    @pytest.mark.usefixtures("disk_cache_dir")
+    async def test_changed_models_invalidate_all_pipes(self, mocker: MockerFixture):
+        await dry_run_plx_content(plx_content=PLX_CONTENT)
+        mocker.patch.object(DryRunCache, "_make_models_digest", return_value="changed model deck")
+        outputs = await dry_run_plx_content(plx_content=PLX_CONTENT)
+        assert outputs == {"write_story": False, "draft_story": False, "write_title": False}
+
+    @pytest.mark.usefixtures("disk_cache_dir")
+    async def test_changed_function_invalidates_its_pipe_func(self):
+        func_registry.register_function(func=make_slogan, name="make_slogan")
+        try:
+            await dry_run_plx_content(plx_content=FUNC_PLX_CONTENT)
+            assert await dry_run_plx_content(plx_content=FUNC_PLX_CONTENT) == {"make_slogan": True}
+            func_registry.register_function(func=make_shouted_slogan, name="make_slogan")
+            assert await dry_run_plx_content(plx_content=FUNC_PLX_CONTENT) == {"make_slogan": False}
+        finally:
+            func_registry.unregister_function_by_name(name="make_slogan")
+
+    async def test_least_recently_used_disk_entries_are_evicted(self, disk_cache_dir: Path):
+        setup_dry_run_cache(disk_cache_dir=disk_cache_dir, max_disk_entries=2)
+        await dry_run_plx_content(plx_content=PLX_CONTENT)
+        assert count_disk_entries(disk_cache_dir=disk_cache_dir) == 2
@@ -0,0 +1,36 @@
+from pipelex.core.concepts.concept_factory import ConceptFactory
+from pipelex.core.concepts.concept_native import NativeConceptCode
+from pipelex.core.pipes.input_requirements import TypedNamedInputRequirement
+from pipelex.core.stuffs.stuff_factory import StuffFactory
+from pipelex.core.stuffs.text_content import TextContent
+from pipelex.pipe_run.dry_run import DryRunWorkingMemories
+
+
+class TestDryRunWorkingMemories:
+    def test_same_needed_inputs_share_mock_stuffs(
+        self,
+        topic_requirement: TypedNamedInputRequirement,
+        story_requirement: TypedNamedInputRequirement,
+    ):
+        working_memories = DryRunWorkingMemories()
+        first_memory = working_memories.get_working_memory(needed_inputs=[topic_requirement])
+        second_memory = working_memories.get_working_memory(needed_inputs=[topic_requirement.model_copy()])
+        assert first_memory is not second_memory
+        assert first_memory.get_stuff("topic") is second_memory.get_stuff("topic")
+
+        other_memory = working_memories.get_working_memory(needed_inputs=[story_requirement])
+        assert "story" in other_memory.root
+        assert "topic" not in other_memory.root
+
+    def test_outputs_are_not_shared_between_dry_runs(self, topic_requirement: TypedNamedInputRequirement):
+        working_memories = DryRunWorkingMemories()
+        first_memory = working_memories.get_working_memory(needed_inputs=[topic_requirement])
+        first_memory.add_new_stuff(
+            name="title",
+            stuff=StuffFactory.make_stuff(
+                concept=ConceptFactory.make_native_concept(native_concept_code=NativeConceptCode.TEXT),
+                content=TextContent(text="A title"),
+            ),
+        )
+        second_memory = working_memories.get_working_memory(needed_inputs=[topic_requirement])
+        assert "title" not in second_memory.root
@@ -0,0 +1,76 @@
+import time
+
+import pytest
+from pytest_mock import MockerFixture
+from rich import box
+from rich.console import Console
+from rich.table import Table
+
+from pipelex.core.memory.working_memory import WorkingMemory
+from pipelex.core.memory.working_memory_factory import WorkingMemoryFactory
+from pipelex.core.stuffs.stuff import Stuff
+from pipelex.core.stuffs.text_content import TextContent
+from pipelex.pipe_run.output_verbosity import OutputVerbosity
+from pipelex.pipeline.execute import execute_pipeline
+from pipelex.system.registries.func_registry import pipe_func
+from tests.unit.pipe_run.data import OutputVerbosityTestCases
+
+
+@pipe_func(name="shout_topic")
+async def shout_topic(working_memory: WorkingMemory) -> TextContent:
+    topic = working_memory.get_stuff_as_str("topic")
+    return TextContent(text=f"{topic.upper()}!\n" * 20)
+
+
+async def run_batch(topics_stuff: Stuff, output_verbosity: OutputVerbosity) -> float:
+    started_at = time.perf_counter()
+    pipe_output = await execute_pipeline(
+        plx_content=OutputVerbosityTestCases.SHOUT_TOPICS_PLX_CONTENT,
+        inputs=WorkingMemoryFactory.make_from_single_stuff(stuff=topics_stuff),
+        output_verbosity=output_verbosity,
+    )
+    assert len(pipe_output.main_stuff.as_list_content().items) == len(topics_stuff.as_list_content().items)  # pyright: ignore[reportUnknownMemberType, reportUnknownArgumentType]
+    return time.perf_counter() - started_at
+
+
+@pytest.mark.asyncio(loop_scope="class")
+class TestOutputVerbosity:
+    @pytest.mark.parametrize(
+        ("output_verbosity", "expected_nb_printed_outputs"),
+        [
+            (OutputVerbosity.SILENT, 0),
+            (OutputVerbosity.SUMMARY, 0),
+            (OutputVerbosity.FULL, 4),
+        ],
+    )
+    async def test_outputs_are_only_rendered_in_full_verbosity(
+        self,
+        mocker: MockerFixture,
+        output_verbosity: OutputVerbosity,
+        expected_nb_printed_outputs: int,
+        topics_stuff: Stuff,
+    ):
+        pretty_print_spy = mocker.spy(Stuff, "pretty_print_stuff")
+        await run_batch(topics_stuff=topics_stuff, output_verbosity=output_verbosity)
+        assert pretty_print_spy.call_count == expected_nb_printed_outputs
+
+    # pytest -m benchmark -k test_output_verbosity_overhead -s -vv
+    @pytest.mark.benchmark
+    async def test_output_verbosity_overhead(self, pytestconfig: pytest.Config, benchmark_topics_stuff: Stuff):
+        """Benchmark a batch of NB_BENCHMARK_ITEMS pipe operators with each output verbosity.
+
+        The branches run a PipeFunc, so that the time not spent in the pipe itself is the overhead of the run, including printing.
+        """
+        await run_batch(topics_stuff=benchmark_topics_stuff, output_verbosity=OutputVerbosity.SILENT)
+        durations = {
+            output_verbosity: await run_batch(topics_stuff=benchmark_topics_stuff, output_verbosity=output_verbosity)
+            for output_verbosity in OutputVerbosity
+        }
+
+        if pytestconfig.get_verbosity() >= 2:
+            table = Table(title=f"Batch of {OutputVerbosityTestCases.NB_BENCHMARK_ITEMS} pipe operators", box=box.SQUARE_DOUBLE_HEAD)
+            table.add_column("Output verbosity", style="green")
+            table.add_column("Duration (ms)", justify="right", style="yellow")
+            for output_verbosity, duration in durations.items():
+                table.add_row(output_verbosity, f"{duration * 1000:.0f}")
+            Console().print(table)
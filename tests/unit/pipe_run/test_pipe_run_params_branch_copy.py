@@ -0,0 +1,18 @@
+from pipelex.pipe_run.pipe_run_params import PipeRunParams
+
+
+class TestPipeRunParamsBranchCopy:
+    """Test cases for PipeRunParams.make_branch_copy."""
+
+    def test_branch_copy_isolates_mutable_containers(self):
+        pipe_run_params = PipeRunParams(pipe_stack_limit=10, pipe_stack=["parent"], pipe_layers=["parent"], params={"_key": "value"})
+        branch_run_params = pipe_run_params.make_branch_copy(final_stuff_code="branch-0")
+        assert branch_run_params.final_stuff_code == "branch-0"
+        assert branch_run_params.params == pipe_run_params.params
+
+        branch_run_params.push_pipe_to_stack("child")
+        branch_run_params.push_pipe_layer("child")
+        branch_run_params.params["_other"] = 1
+        assert pipe_run_params.pipe_stack == ["parent"]
+        assert pipe_run_params.pipe_layers == ["parent"]
+        assert "_other" not in pipe_run_params.params
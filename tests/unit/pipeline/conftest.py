@@ -0,0 +1,48 @@
+from collections.abc import Iterator
+
+import pytest
+
+from pipelex.config import CompiledBundleCacheConfig, get_config
+from pipelex.pipeline.bundle_cache import CompiledBundleCache, compiled_bundle_cache
+from pipelex.pipeline.track.pipeline_tracker import PipelineTracker
+from pipelex.pipeline.track.tracker_config import TrackerConfig, TrackingMode
+
+
+@pytest.fixture
+def bundle_cache() -> Iterator[CompiledBundleCache]:
+    """Create an enabled compiled bundle cache, removing its bundles from the libraries afterwards."""
+    cache = CompiledBundleCache()
+    cache.setup(config=CompiledBundleCacheConfig(is_enabled=True, max_size=4))
+    yield cache
+    cache.clear()
+
+
+@pytest.fixture
+def enabled_compiled_bundle_cache() -> Iterator[CompiledBundleCache]:
+    """Enable the compiled bundle cache used by execute_pipeline, restoring its configuration afterwards."""
+    compiled_bundle_cache.setup(config=CompiledBundleCacheConfig(is_enabled=True, max_size=4))
+    yield compiled_bundle_cache
+    compiled_bundle_cache.clear()
+    compiled_bundle_cache.setup(config=get_config().pipelex.compiled_bundle_cache_config)
+
+
+@pytest.fixture
+def tracker_config() -> TrackerConfig:
+    """Create a tracker config tracking all the runs, keeping the last closed one."""
+    return get_config().pipelex.tracker_config.model_copy(
+        update={
+            "max_nodes_per_run": 100,
+            "nb_closed_runs_kept": 1,
+            "tracking_mode": TrackingMode.FULL,
+            "sampling_percentage": 10,
+        },
+    )
+
+
+@pytest.fixture
+def pipeline_tracker(tracker_config: TrackerConfig) -> Iterator[PipelineTracker]:
+    """Create a pipeline tracker with the test tracker config."""
+    pipeline_tracker = PipelineTracker(tracker_config=tracker_config)
+    pipeline_tracker.setup()
+    yield pipeline_tracker
+    pipeline_tracker.teardown()
@@ -0,0 +1,75 @@
+import pytest
+from pytest_mock import MockerFixture
+
+from pipelex.config import CompiledBundleCacheConfig
+from pipelex.hub import get_optional_pipe
+from pipelex.pipe_run.pipe_run_mode import PipeRunMode
+from pipelex.pipeline import bundle_cache as bundle_cache_module
+from pipelex.pipeline.bundle_cache import CompiledBundleCache, compiled_bundle_cache
+from pipelex.pipeline.exceptions import CompiledBundleCacheError
+from pipelex.pipeline.execute import execute_pipeline
+from tests.unit.pipeline.test_data import BundleCacheTestCases
+
+
+@pytest.mark.asyncio(loop_scope="class")
+class TestCompiledBundleCache:
+    async def test_same_content_is_compiled_once(self, mocker: MockerFixture, bundle_cache: CompiledBundleCache):
+        validate_spy = mocker.spy(bundle_cache_module, "validate_bundle_blueprint")
+        plx_content = BundleCacheTestCases.GREET_ONCE_PLX_CONTENT
+
+        first_bundle = await bundle_cache.acquire(plx_content=plx_content)
+        second_bundle = await bundle_cache.acquire(plx_content=plx_content)
+        assert second_bundle is first_bundle
+        assert first_bundle.ref_count == 2
+        bundle_cache.release(compiled_bundle=first_bundle)
+        bundle_cache.release(compiled_bundle=second_bundle)
+
+        assert await bundle_cache.acquire(plx_content=plx_content) is first_bundle
+        assert validate_spy.call_count == 1
+        assert bundle_cache.stats.hits == 2
+        bundle_cache.release(compiled_bundle=first_bundle)
+
+        bundle_cache.clear()
+        assert get_optional_pipe(pipe_code="greet_once") is None
+
+    async def test_new_version_replaces_idle_bundle(self, bundle_cache: CompiledBundleCache):
+        first_plx_content, second_plx_content = BundleCacheTestCases.GREET_VERSION_PLX_CONTENTS
+        first_bundle = await bundle_cache.acquire(plx_content=first_plx_content)
+
+        with pytest.raises(CompiledBundleCacheError):
+            await bundle_cache.acquire(plx_content=second_plx_content)
+
+        bundle_cache.release(compiled_bundle=first_bundle)
+        second_bundle = await bundle_cache.acquire(plx_content=second_plx_content)
+        assert get_optional_pipe(pipe_code="greet_version") is second_bundle.pipes[0]
+        assert bundle_cache.stats.size == 1
+        bundle_cache.release(compiled_bundle=second_bundle)
+
+    async def test_idle_bundles_are_evicted_beyond_max_size(self, bundle_cache: CompiledBundleCache):
+        bundle_cache.setup(config=CompiledBundleCacheConfig(is_enabled=True, max_size=1))
+        first_plx_content, second_plx_content = BundleCacheTestCases.GREET_LRU_PLX_CONTENTS
+        first_bundle = await bundle_cache.acquire(plx_content=first_plx_content)
+        second_bundle = await bundle_cache.acquire(plx_content=second_plx_content)
+
+        bundle_cache.release(compiled_bundle=first_bundle)
+        assert get_optional_pipe(pipe_code="greet_lru_1") is None
+        assert get_optional_pipe(pipe_code="greet_lru_2") is not None
+        bundle_cache.release(compiled_bundle=second_bundle)
+        assert bundle_cache.stats.size == 1
+
+    async def test_execute_pipeline_removes_bundle_by_default(self):
+        pipe_output = await execute_pipeline(plx_content=BundleCacheTestCases.GREET_DEFAULT_PLX_CONTENT, pipe_run_mode=PipeRunMode.DRY)
+        assert pipe_output.main_stuff_as_str
+        assert not compiled_bundle_cache.is_enabled
+        assert get_optional_pipe(pipe_code="greet_default") is None
+
+    async def test_execute_pipeline_reuses_compiled_bundle(self, enabled_compiled_bundle_cache: CompiledBundleCache):
+        hits_before = enabled_compiled_bundle_cache.stats.hits
+
+        for _ in range(2):
+            pipe_output = await execute_pipeline(plx_content=BundleCacheTestCases.GREET_EXECUTE_PLX_CONTENT, pipe_run_mode=PipeRunMode.DRY)
+            assert pipe_output.main_stuff_as_str
+
+        assert enabled_compiled_bundle_cache.stats.hits == hits_before + 1
+        # the bundle stays loaded in the libraries after its runs
+        assert get_optional_pipe(pipe_code="greet_execute") is not None
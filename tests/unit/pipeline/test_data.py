@@ -0,0 +1,89 @@
+from typing import ClassVar
+
+
+class BundleCacheTestCases:
+    GREET_ONCE_PLX_CONTENT = """
+domain = "test_bundle_cache_once"
+description = "Domain for testing the compiled bundle cache"
+main_pipe = "greet_once"
+
+[pipe.greet_once]
+type = "PipeLLM"
+description = "Write a greeting"
+output = "Text"
+prompt = "Write a short greeting."
+"""
+
+    GREET_VERSION_PLX_CONTENTS: ClassVar[list[str]] = [
+        """
+domain = "test_bundle_cache_versions"
+description = "Domain for testing the compiled bundle cache"
+main_pipe = "greet_version"
+
+[pipe.greet_version]
+type = "PipeLLM"
+description = "Write a greeting"
+output = "Text"
+prompt = "Write a short greeting."
+""",
+        """
+domain = "test_bundle_cache_versions"
+description = "Domain for testing the compiled bundle cache"
+main_pipe = "greet_version"
+
+[pipe.greet_version]
+type = "PipeLLM"
+description = "Write a greeting"
+output = "Text"
+prompt = "Say hello."
+""",
+    ]
+
+    GREET_LRU_PLX_CONTENTS: ClassVar[list[str]] = [
+        """
+domain = "test_bundle_cache_lru_1"
+description = "Domain for testing the compiled bundle cache"
+main_pipe = "greet_lru_1"
+
+[pipe.greet_lru_1]
+type = "PipeLLM"
+description = "Write a greeting"
+output = "Text"
+prompt = "Write a short greeting."
+""",
+        """
+domain = "test_bundle_cache_lru_2"
+description = "Domain for testing the compiled bundle cache"
+main_pipe = "greet_lru_2"
+
+[pipe.greet_lru_2]
+type = "PipeLLM"
+description = "Write a greeting"
+output = "Text"
+prompt = "Write a short greeting."
+""",
+    ]
+
+    GREET_DEFAULT_PLX_CONTENT = """
+domain = "test_bundle_cache_default"
+description = "Domain for testing the compiled bundle cache"
+main_pipe = "greet_default"
+
+[pipe.greet_default]
+type = "PipeLLM"
+description = "Write a greeting"
+output = "Text"
+prompt = "Write a short greeting."
+"""
+
+    GREET_EXECUTE_PLX_CONTENT = """
+domain = "test_bundle_cache_execute"
+description = "Domain for testing the compiled bundle cache"
+main_pipe = "greet_execute"
+
+[pipe.greet_execute]
+type = "PipeLLM"
+description = "Write a greeting"
+output = "Text"
+prompt = "Write a short greeting."
+"""
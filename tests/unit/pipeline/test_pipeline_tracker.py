@@ -0,0 +1,131 @@
+# pyright: reportUnknownMemberType=false
+# pyright: reportUnknownArgumentType=false
+import gc
+
+from pytest_mock import MockerFixture
+
+from pipelex.core.concepts.concept_factory import ConceptFactory
+from pipelex.core.concepts.concept_native import NativeConceptCode
+from pipelex.core.stuffs.stuff import Stuff
+from pipelex.core.stuffs.stuff_factory import StuffFactory
+from pipelex.core.stuffs.text_content import TextContent
+from pipelex.pipeline.pipeline_models import SpecialPipelineId
+from pipelex.pipeline.track.pipeline_tracker import PipelineTracker
+from pipelex.pipeline.track.tracker_config import TrackerConfig, TrackingMode
+
+
+def add_step(pipeline_tracker: PipelineTracker, pipeline_run_id: str, from_name: str, to_name: str) -> tuple[Stuff, Stuff]:
+    from_stuff, to_stuff = (
+        StuffFactory.make_stuff(
+            concept=ConceptFactory.make_native_concept(native_concept_code=NativeConceptCode.TEXT),
+            content=TextContent(text=f"The {name}"),
+            name=name,
+        )
+        for name in (from_name, to_name)
+    )
+    pipeline_tracker.add_pipe_step(
+        pipeline_run_id=pipeline_run_id,
+        from_stuff=from_stuff,
+        to_stuff=to_stuff,
+        pipe_code="test_pipe",
+        comment="test",
+        pipe_layer=["test_pipe"],
+    )
+    return from_stuff, to_stuff
+
+
+class TestPipelineTracker:
+    def test_runs_have_separate_graphs(self, pipeline_tracker: PipelineTracker):
+        add_step(pipeline_tracker=pipeline_tracker, pipeline_run_id="run_1", from_name="topic", to_name="story")
+        add_step(pipeline_tracker=pipeline_tracker, pipeline_run_id="run_2", from_name="story", to_name="title")
+
+        run_graph_1 = pipeline_tracker.get_optional_run_graph(pipeline_run_id="run_1")
+        run_graph_2 = pipeline_tracker.get_optional_run_graph(pipeline_run_id="run_2")
+        assert run_graph_1 is not None
+        assert run_graph_2 is not None
+        assert run_graph_1.nx_graph.number_of_nodes() == 2
+        assert run_graph_2.nx_graph.number_of_nodes() == 2
+        assert not set(run_graph_1.nx_graph.nodes) & set(run_graph_2.nx_graph.nodes)
+
+    def test_closed_runs_are_released(self, pipeline_tracker: PipelineTracker):
+        for run_index in range(3):
+            add_step(pipeline_tracker=pipeline_tracker, pipeline_run_id=f"run_{run_index}", from_name="topic", to_name="story")
+            pipeline_tracker.close_pipeline_run(pipeline_run_id=f"run_{run_index}")
+
+        assert pipeline_tracker.get_optional_run_graph(pipeline_run_id="run_0") is None
+        assert pipeline_tracker.get_optional_run_graph(pipeline_run_id="run_1") is None
+        # the last closed run is kept for its flowchart
+        assert pipeline_tracker.get_optional_run_graph(pipeline_run_id="run_2") is not None
+
+    def test_nodes_per_run_are_capped(self, tracker_config: TrackerConfig):
+        pipeline_tracker = PipelineTracker(tracker_config=tracker_config.model_copy(update={"max_nodes_per_run": 3}))
+        pipeline_tracker.setup()
+        for step_index in range(4):
+            add_step(pipeline_tracker=pipeline_tracker, pipeline_run_id="run", from_name=f"input_{step_index}", to_name=f"output_{step_index}")
+
+        run_graph = pipeline_tracker.get_optional_run_graph(pipeline_run_id="run")
+        assert run_graph is not None
+        assert run_graph.nx_graph.number_of_nodes() == 3
+        assert run_graph.nx_graph.number_of_edges() == 1
+        assert run_graph.nb_dropped_nodes == 5
+
+    def test_stuff_contents_are_rendered_for_the_flowchart_only(self, mocker: MockerFixture, pipeline_tracker: PipelineTracker):
+        rendered_plain_spy = mocker.spy(TextContent, "rendered_plain")
+        stuffs = add_step(pipeline_tracker=pipeline_tracker, pipeline_run_id="run", from_name="topic", to_name="story")
+        assert rendered_plain_spy.call_count == 0
+
+        mocker.patch("pipelex.pipeline.track.pipeline_tracker.print_mermaid_url")
+        url = pipeline_tracker.output_flowchart(pipeline_run_id="run")
+        assert url
+        assert rendered_plain_spy.call_count == 2
+        assert len(stuffs) == 2
+
+    def test_stuff_contents_are_not_kept_alive(self, mocker: MockerFixture, pipeline_tracker: PipelineTracker):
+        rendered_plain_spy = mocker.spy(TextContent, "rendered_plain")
+        add_step(pipeline_tracker=pipeline_tracker, pipeline_run_id="run", from_name="topic", to_name="story")
+        gc.collect()
+
+        mocker.patch("pipelex.pipeline.track.pipeline_tracker.print_mermaid_url")
+        url = pipeline_tracker.output_flowchart(pipeline_run_id="run")
+        assert url
+        assert rendered_plain_spy.call_count == 0
+
+    def test_untitled_runs_are_not_tracked(self, pipeline_tracker: PipelineTracker):
+        assert not pipeline_tracker.is_tracking(pipeline_run_id=SpecialPipelineId.UNTITLED)
+        add_step(pipeline_tracker=pipeline_tracker, pipeline_run_id=SpecialPipelineId.UNTITLED, from_name="topic", to_name="story")
+        assert pipeline_tracker.get_optional_run_graph(pipeline_run_id=SpecialPipelineId.UNTITLED) is None
+
+    def test_off_mode_tracks_nothing(self, tracker_config: TrackerConfig):
+        pipeline_tracker = PipelineTracker(tracker_config=tracker_config.model_copy(update={"tracking_mode": TrackingMode.OFF}))
+        pipeline_tracker.setup()
+        assert not pipeline_tracker.is_tracking(pipeline_run_id="run")
+        add_step(pipeline_tracker=pipeline_tracker, pipeline_run_id="run", from_name="topic", to_name="story")
+        assert pipeline_tracker.get_optional_run_graph(pipeline_run_id="run") is None
+
+    def test_sampled_mode_tracks_whole_runs(self, tracker_config: TrackerConfig):
+        pipeline_tracker = PipelineTracker(
+            tracker_config=tracker_config.model_copy(update={"tracking_mode": TrackingMode.SAMPLED, "sampling_percentage": 50}),
+        )
+        pipeline_tracker.setup()
+        pipeline_run_ids = [f"run_{run_index}" for run_index in range(200)]
+        tracked_run_ids = [pipeline_run_id for pipeline_run_id in pipeline_run_ids if pipeline_tracker.is_tracking(pipeline_run_id=pipeline_run_id)]
+        assert 50 < len(tracked_run_ids) < 150
+        # the draw is stable for a given run, so all its steps are tracked or none
+        assert all(pipeline_tracker.is_tracking(pipeline_run_id=pipeline_run_id) for pipeline_run_id in tracked_run_ids)
+
+        untracked_run_id = next(pipeline_run_id for pipeline_run_id in pipeline_run_ids if pipeline_run_id not in tracked_run_ids)
+        add_step(pipeline_tracker=pipeline_tracker, pipeline_run_id=untracked_run_id, from_name="topic", to_name="story")
+        assert pipeline_tracker.get_optional_run_graph(pipeline_run_id=untracked_run_id) is None
+
+    def test_sampling_bounds(self, tracker_config: TrackerConfig):
+        never_tracker = PipelineTracker(
+            tracker_config=tracker_config.model_copy(update={"tracking_mode": TrackingMode.SAMPLED, "sampling_percentage": 0}),
+        )
+        always_tracker = PipelineTracker(
+            tracker_config=tracker_config.model_copy(update={"tracking_mode": TrackingMode.SAMPLED, "sampling_percentage": 100}),
+        )
+        never_tracker.setup()
+        always_tracker.setup()
+        for run_index in range(50):
+            assert not never_tracker.is_tracking(pipeline_run_id=f"run_{run_index}")
+            assert always_tracker.is_tracking(pipeline_run_id=f"run_{run_index}")
@@ -0,0 +1,31 @@
+import pytest
+
+from pipelex.pipe_run.pipe_run_mode import PipeRunMode
+from pipelex.pipeline.exceptions import PipelineStreamError
+from pipelex.pipeline.stream import stream_pipeline
+
+PLX_CONTENT = """
+domain = "test_stream_pipeline"
+description = "Domain for testing stream_pipeline"
+main_pipe = "write_greeting"
+
+[pipe.write_greeting]
+type = "PipeLLM"
+description = "Write a greeting"
+output = "Text"
+prompt = "Write a short greeting."
+"""
+
+
+@pytest.mark.asyncio(loop_scope="class")
+class TestStreamPipeline:
+    async def test_stream_pipeline_dry_run(self):
+        pipeline_stream = stream_pipeline(plx_content=PLX_CONTENT, pipe_run_mode=PipeRunMode.DRY)
+        with pytest.raises(PipelineStreamError):
+            _ = pipeline_stream.pipe_output
+
+        text_chunks = [text_chunk async for text_chunk in pipeline_stream]
+
+        assert text_chunks
+        assert {text_chunk.pipe_code for text_chunk in text_chunks} == {"write_greeting"}
+        assert pipeline_stream.pipe_output.main_stuff_as_str == "".join(text_chunk.text for text_chunk in text_chunks)
@@ -0,0 +1,58 @@
+import time
+
+import aioboto3
+import pytest
+from rich import box
+from rich.console import Console
+from rich.table import Table
+
+from pipelex.plugins.bedrock.bedrock_client_aioboto3 import BedrockClientAioboto3
+
+AWS_REGION = "us-east-1"
+NB_CALLS = 10
+
+
+@pytest.mark.asyncio(loop_scope="class")
+class TestBedrockClientAioboto3:
+    async def test_runtime_client_is_reused_until_closed(self):
+        bedrock_client = BedrockClientAioboto3(aws_region=AWS_REGION, max_pool_connections=5, keepalive_timeout=10)
+
+        runtime_client = await bedrock_client.get_runtime_client()
+        assert await bedrock_client.get_runtime_client() is runtime_client
+
+        await bedrock_client.aclose()
+        assert await bedrock_client.get_runtime_client() is not runtime_client
+        await bedrock_client.aclose()
+
+    # pytest -m benchmark -k test_per_call_client_overhead -s -vv
+    @pytest.mark.benchmark
+    async def test_per_call_client_overhead(self, pytestconfig: pytest.Config):
+        """Benchmark the client overhead paid by each call, before (a new client per call) and after (a pooled client).
+
+        No request is sent, so this only measures building the client: the TLS handshakes saved by the pool come on top.
+        Both variants are warmed up first, so that loading the service model once doesn't count.
+        """
+        session = aioboto3.Session()
+        async with session.client("bedrock-runtime", region_name=AWS_REGION):  # pyright: ignore[reportUnknownMemberType]
+            pass
+        started_at = time.perf_counter()
+        for _ in range(NB_CALLS):
+            async with session.client("bedrock-runtime", region_name=AWS_REGION):  # pyright: ignore[reportUnknownMemberType]
+                pass
+        per_call_client_seconds = (time.perf_counter() - started_at) / NB_CALLS
+
+        bedrock_client = BedrockClientAioboto3(aws_region=AWS_REGION)
+        await bedrock_client.get_runtime_client()
+        started_at = time.perf_counter()
+        for _ in range(NB_CALLS):
+            await bedrock_client.get_runtime_client()
+        pooled_client_seconds = (time.perf_counter() - started_at) / NB_CALLS
+        await bedrock_client.aclose()
+
+        if pytestconfig.get_verbosity() >= 2:
+            table = Table(title=f"Bedrock client overhead per call (mean over {NB_CALLS} calls)", box=box.SQUARE_DOUBLE_HEAD)
+            table.add_column("Client", style="green")
+            table.add_column("Overhead (ms)", justify="right", style="yellow")
+            table.add_row("New client per call", f"{per_call_client_seconds * 1000:.2f}")
+            table.add_row("Pooled client", f"{pooled_client_seconds * 1000:.2f}")
+            Console().print(table)
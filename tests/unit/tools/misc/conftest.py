@@ -0,0 +1,55 @@
+from pathlib import Path
+
+import pytest
+
+from pipelex.tools.misc.fetch_cache import FetchCache, FetchCacheConfig
+from pipelex.tools.misc.http_client_manager import HttpClientConfig, HttpClientManager
+
+
+@pytest.fixture
+def fetch_cache_config() -> FetchCacheConfig:
+    """Create an enabled fetch cache config, in memory only."""
+    return FetchCacheConfig(
+        is_enabled=True,
+        max_memory_bytes=1_000_000,
+        max_memory_entries=100,
+        revalidate_after_seconds=300.0,
+        is_disk_cache_enabled=False,
+        disk_cache_dir_path="cache/fetch",
+        max_disk_bytes=10_000_000,
+    )
+
+
+@pytest.fixture
+def disk_fetch_cache_config(fetch_cache_config: FetchCacheConfig, tmp_path: Path) -> FetchCacheConfig:
+    """Create an enabled fetch cache config, persisted on disk in a temporary directory."""
+    return fetch_cache_config.model_copy(update={"is_disk_cache_enabled": True, "disk_cache_dir_path": str(tmp_path)})
+
+
+@pytest.fixture
+def fetch_cache(fetch_cache_config: FetchCacheConfig) -> FetchCache:
+    """Create a fetch cache with the in-memory test fetch cache config."""
+    return FetchCache(config=fetch_cache_config)
+
+
+@pytest.fixture
+def http_client_config(fetch_cache_config: FetchCacheConfig) -> HttpClientConfig:
+    """Create an HTTP client config without HTTP/2 nor fetch cache."""
+    return HttpClientConfig(
+        is_http2_enabled=False,
+        max_connections=100,
+        max_connections_per_host=20,
+        max_keepalive_connections=20,
+        keepalive_expiry=30.0,
+        connect_timeout=10.0,
+        read_timeout=60.0,
+        write_timeout=60.0,
+        pool_timeout=60.0,
+        fetch_cache_config=fetch_cache_config.model_copy(update={"is_enabled": False}),
+    )
+
+
+@pytest.fixture
+def http_client_manager(http_client_config: HttpClientConfig) -> HttpClientManager:
+    """Create an HTTP client manager with the test HTTP client config."""
+    return HttpClientManager(config=http_client_config)
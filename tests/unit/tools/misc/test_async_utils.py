@@ -0,0 +1,91 @@
+import asyncio
+import inspect
+
+import pytest
+
+from pipelex.system.exceptions import ConcurrencyLimitError
+from pipelex.tools.misc.async_utils import gather_with_max_concurrency
+
+
+class TestAsyncUtils:
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize(
+        ("nb_coroutines", "max_concurrency", "expected_max_running"),
+        [
+            (10, 3, 3),
+            (10, 1, 1),
+            (4, 10, 4),
+            (5, None, 5),
+        ],
+    )
+    async def test_gather_with_max_concurrency(self, nb_coroutines: int, max_concurrency: int | None, expected_max_running: int):
+        """Test that results keep their order and that no more than max_concurrency coroutines run at once."""
+        nb_running = 0
+        max_running = 0
+
+        async def job(index: int) -> int:
+            nonlocal nb_running, max_running
+            nb_running += 1
+            max_running = max(max_running, nb_running)
+            # finish in reverse order to check that the results are still returned in order
+            await asyncio.sleep(0.001 * (nb_coroutines - index))
+            nb_running -= 1
+            return index * 2
+
+        results = await gather_with_max_concurrency([job(index) for index in range(nb_coroutines)], max_concurrency=max_concurrency)
+
+        assert results == [index * 2 for index in range(nb_coroutines)]
+        assert max_running == expected_max_running
+
+    @pytest.mark.asyncio
+    async def test_gather_with_max_concurrency_failure_closes_pending_coroutines(self):
+        """Test that a failure is propagated and that the coroutines which never started are closed."""
+        started: list[int] = []
+
+        async def job(index: int) -> int:
+            started.append(index)
+            if index == 0:
+                msg = "branch failed"
+                raise RuntimeError(msg)
+            await asyncio.sleep(0)
+            return index
+
+        coroutines = [job(index) for index in range(5)]
+        with pytest.raises(RuntimeError, match="branch failed"):
+            await gather_with_max_concurrency(coroutines, max_concurrency=2)
+
+        assert 4 not in started
+        assert inspect.getcoroutinestate(coroutines[4]) == inspect.CORO_CLOSED
+
+    @pytest.mark.asyncio
+    async def test_gather_with_max_concurrency_failure_cancels_running_coroutines(self):
+        """Test that the coroutines still running in the other workers are cancelled when one fails."""
+        cancelled: list[int] = []
+
+        async def job(index: int) -> int:
+            if index == 0:
+                await asyncio.sleep(0)
+                msg = "branch failed"
+                raise RuntimeError(msg)
+            try:
+                await asyncio.sleep(10)
+            except asyncio.CancelledError:
+                cancelled.append(index)
+                raise
+            return index
+
+        with pytest.raises(RuntimeError, match="branch failed"):
+            await gather_with_max_concurrency([job(index) for index in range(3)], max_concurrency=2)
+
+        assert cancelled == [1]
+
+    @pytest.mark.asyncio
+    async def test_gather_with_max_concurrency_rejects_invalid_limit(self):
+        async def job() -> int:
+            return 1
+
+        coroutines = [job(), job()]
+        with pytest.raises(ConcurrencyLimitError):
+            await gather_with_max_concurrency(coroutines, max_concurrency=0)
+        for coroutine in coroutines:
+            coroutine.close()
@@ -0,0 +1,143 @@
+import asyncio
+from pathlib import Path
+
+import pytest
+
+from pipelex.tools.misc.fetch_cache import FetchCache, FetchCacheConfig, FetchedResource, FetchValidators
+
+IMAGE_URL = "https://example.com/image.png"
+
+
+class FakeServer:
+    def __init__(self, content: bytes = b"image-bytes", etag: str = '"v1"', is_url_appended: bool = True):
+        self.content = content
+        self.etag = etag
+        self.is_url_appended = is_url_appended
+        self.requests: list[FetchValidators | None] = []
+
+    async def fetch(self, url: str, validators: FetchValidators | None) -> FetchedResource:
+        self.requests.append(validators)
+        await asyncio.sleep(0.001)
+        response_validators = FetchValidators(etag=self.etag)
+        if validators and validators.etag == self.etag:
+            return FetchedResource(content=b"", validators=response_validators, is_not_modified=True)
+        content = self.content + url.encode() if self.is_url_appended else self.content
+        return FetchedResource(content=content, validators=response_validators)
+
+
+class TestFetchCache:
+    @pytest.mark.asyncio
+    async def test_fresh_url_is_served_from_memory(self, fetch_cache: FetchCache):
+        fake_server = FakeServer()
+
+        first_content = await fetch_cache.fetch(url=IMAGE_URL, fetch_function=fake_server.fetch)
+        assert await fetch_cache.fetch(url=IMAGE_URL, fetch_function=fake_server.fetch) == first_content
+        assert fake_server.requests == [None]
+        assert fetch_cache.stats.hits == 1
+
+    @pytest.mark.asyncio
+    async def test_stale_url_is_revalidated_with_its_etag(self, fetch_cache_config: FetchCacheConfig):
+        fetch_cache = FetchCache(config=fetch_cache_config.model_copy(update={"revalidate_after_seconds": 0}))
+        fake_server = FakeServer()
+
+        first_content = await fetch_cache.fetch(url=IMAGE_URL, fetch_function=fake_server.fetch)
+        assert await fetch_cache.fetch(url=IMAGE_URL, fetch_function=fake_server.fetch) == first_content
+        assert fake_server.requests == [None, FetchValidators(etag='"v1"')]
+        assert fetch_cache.stats.revalidations == 1
+
+        fake_server.content = b"new-image-bytes"
+        fake_server.etag = '"v2"'
+        assert await fetch_cache.fetch(url=IMAGE_URL, fetch_function=fake_server.fetch) != first_content
+        assert fetch_cache.stats.downloads == 2
+
+    @pytest.mark.asyncio
+    async def test_concurrent_fetches_share_one_request(self, fetch_cache: FetchCache):
+        fake_server = FakeServer()
+
+        contents = await asyncio.gather(*[fetch_cache.fetch(url=IMAGE_URL, fetch_function=fake_server.fetch) for _ in range(10)])
+
+        assert len(set(contents)) == 1
+        assert len(fake_server.requests) == 1
+
+    @pytest.mark.asyncio
+    async def test_memory_budget_evicts_least_recently_used(self, fetch_cache_config: FetchCacheConfig):
+        fake_server = FakeServer(content=b"x" * 100)
+        fetch_cache = FetchCache(config=fetch_cache_config.model_copy(update={"max_memory_bytes": 250}))
+
+        for url in ["https://example.com/1", "https://example.com/2", "https://example.com/1", "https://example.com/3"]:
+            await fetch_cache.fetch(url=url, fetch_function=fake_server.fetch)
+
+        assert fetch_cache.stats.memory_bytes <= 250
+        assert len(fake_server.requests) == 3
+        await fetch_cache.fetch(url="https://example.com/1", fetch_function=fake_server.fetch)
+        assert len(fake_server.requests) == 3
+        await fetch_cache.fetch(url="https://example.com/2", fetch_function=fake_server.fetch)
+        assert len(fake_server.requests) == 4
+
+    @pytest.mark.asyncio
+    async def test_disk_cache_is_shared_across_instances(self, disk_fetch_cache_config: FetchCacheConfig):
+        fake_server = FakeServer()
+        first_content = await FetchCache(config=disk_fetch_cache_config).fetch(url=IMAGE_URL, fetch_function=fake_server.fetch)
+
+        other_fetch_cache = FetchCache(config=disk_fetch_cache_config)
+        assert await other_fetch_cache.fetch(url=IMAGE_URL, fetch_function=fake_server.fetch) == first_content
+        assert fake_server.requests == [None]
+
+    @pytest.mark.asyncio
+    async def test_memory_entries_evict_least_recently_used(self, fetch_cache_config: FetchCacheConfig):
+        fake_server = FakeServer()
+        fetch_cache = FetchCache(config=fetch_cache_config.model_copy(update={"max_memory_entries": 2}))
+
+        for url in ["https://example.com/1", "https://example.com/2", "https://example.com/1", "https://example.com/3"]:
+            await fetch_cache.fetch(url=url, fetch_function=fake_server.fetch)
+
+        assert len(fake_server.requests) == 3
+        await fetch_cache.fetch(url="https://example.com/1", fetch_function=fake_server.fetch)
+        assert len(fake_server.requests) == 3
+        await fetch_cache.fetch(url="https://example.com/2", fetch_function=fake_server.fetch)
+        assert len(fake_server.requests) == 4
+
+    @pytest.mark.asyncio
+    async def test_disk_budget_evicts_least_recently_used(self, disk_fetch_cache_config: FetchCacheConfig, tmp_path: Path):
+        fake_server = FakeServer(content=b"x" * 100)
+        fetch_cache = FetchCache(config=disk_fetch_cache_config.model_copy(update={"max_disk_bytes": 250}))
+
+        for url in ["https://example.com/1", "https://example.com/2", "https://example.com/3"]:
+            await fetch_cache.fetch(url=url, fetch_function=fake_server.fetch)
+
+        blob_sizes = [blob_path.stat().st_size for blob_path in (tmp_path / "blobs").iterdir()]
+        assert len(blob_sizes) == 2
+        assert sum(blob_sizes) <= 250
+
+    @pytest.mark.asyncio
+    async def test_identical_contents_are_stored_once_on_disk(self, disk_fetch_cache_config: FetchCacheConfig, tmp_path: Path):
+        fake_server = FakeServer(content=b"x" * 100, is_url_appended=False)
+        fetch_cache = FetchCache(config=disk_fetch_cache_config)
+
+        await asyncio.gather(*[fetch_cache.fetch(url=f"https://example.com/{url_index}", fetch_function=fake_server.fetch) for url_index in range(8)])
+
+        assert [blob_path.stat().st_size for blob_path in (tmp_path / "blobs").iterdir()] == [100]
+        assert fetch_cache.stats.disk_bytes == 100
+
+    @pytest.mark.asyncio
+    async def test_corrupt_disk_entry_is_a_miss(self, disk_fetch_cache_config: FetchCacheConfig, tmp_path: Path):
+        fake_server = FakeServer()
+        first_content = await FetchCache(config=disk_fetch_cache_config).fetch(url=IMAGE_URL, fetch_function=fake_server.fetch)
+        for entry_path in (tmp_path / "urls").iterdir():
+            entry_path.write_text('{"url": ')
+
+        other_fetch_cache = FetchCache(config=disk_fetch_cache_config)
+        assert await other_fetch_cache.fetch(url=IMAGE_URL, fetch_function=fake_server.fetch) == first_content
+        assert fake_server.requests == [None, None]
+
+    @pytest.mark.asyncio
+    async def test_unwritable_disk_cache_does_not_fail_the_fetch(self, disk_fetch_cache_config: FetchCacheConfig, tmp_path: Path):
+        not_a_dir_path = tmp_path / "not_a_dir"
+        not_a_dir_path.write_text("")
+        fetch_cache = FetchCache(config=disk_fetch_cache_config.model_copy(update={"disk_cache_dir_path": str(not_a_dir_path)}))
+        fake_server = FakeServer()
+
+        first_content = await fetch_cache.fetch(url=IMAGE_URL, fetch_function=fake_server.fetch)
+        assert first_content == b"image-bytes" + IMAGE_URL.encode()
+        assert await fetch_cache.fetch(url=IMAGE_URL, fetch_function=fake_server.fetch) == first_content
+        assert fake_server.requests == [None]
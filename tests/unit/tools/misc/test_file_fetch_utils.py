@@ -0,0 +1,27 @@
+from functools import partial
+
+import httpx
+import pytest
+from pytest_mock import MockerFixture
+
+from pipelex.hub import PipelexHub
+from pipelex.tools.misc.file_fetch_utils import fetch_file_from_url_httpx, fetch_file_from_url_httpx_async
+
+
+class TestFileFetchUtils:
+    @pytest.mark.asyncio
+    async def test_fetch_without_pipelex_hub(self, mocker: MockerFixture):
+        def handler(request: httpx.Request) -> httpx.Response:
+            if request.url.path == "/missing.png":
+                return httpx.Response(404)
+            return httpx.Response(200, content=b"image-bytes")
+
+        mocker.patch.object(PipelexHub, "_instance", None)
+        transport = httpx.MockTransport(handler)
+        mocker.patch.object(httpx, "AsyncClient", partial(httpx.AsyncClient, transport=transport))
+        mocker.patch.object(httpx, "Client", partial(httpx.Client, transport=transport))
+
+        assert await fetch_file_from_url_httpx_async(url="https://example.com/image.png") == b"image-bytes"
+        assert fetch_file_from_url_httpx(url="https://example.com/image.png") == b"image-bytes"
+        with pytest.raises(httpx.HTTPStatusError):
+            fetch_file_from_url_httpx(url="https://example.com/missing.png")
@@ -0,0 +1,23 @@
+from concurrent.futures import ThreadPoolExecutor
+from functools import partial
+from pathlib import Path
+
+from pipelex.tools.misc.file_utils import save_bytes_atomically
+
+
+class TestSaveBytesAtomically:
+    def test_creates_the_directory(self, tmp_path: Path):
+        file_path = tmp_path / "sub_dir" / "file.bin"
+        save_bytes_atomically(file_path, b"content")
+        assert file_path.read_bytes() == b"content"
+
+    def test_concurrent_writes_of_the_same_path(self, tmp_path: Path):
+        file_path = tmp_path / "file.bin"
+        contents = [bytes([thread_index]) * 10_000 for thread_index in range(8)]
+        with ThreadPoolExecutor(max_workers=8) as executor:
+            for _ in range(50):
+                # raises if two writers shared a temporary file
+                list(executor.map(partial(save_bytes_atomically, file_path), contents))
+
+        assert file_path.read_bytes() in contents
+        assert [path.name for path in tmp_path.iterdir()] == ["file.bin"]
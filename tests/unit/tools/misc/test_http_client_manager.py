@@ -0,0 +1,77 @@
+import asyncio
+
+import httpx
+import pytest
+from pytest_mock import MockerFixture
+
+from pipelex.tools.misc.http_client_manager import HttpClientConfig, HttpClientManager
+
+
+class TestHttpClientManager:
+    @pytest.mark.asyncio
+    async def test_async_client_is_shared_until_closed(self, http_client_manager: HttpClientManager):
+        async_client = http_client_manager.get_async_client()
+        assert http_client_manager.get_async_client() is async_client
+        assert async_client.follow_redirects
+
+        await http_client_manager.aclose()
+        assert async_client.is_closed
+        assert http_client_manager.get_async_client() is not async_client
+        await http_client_manager.aclose()
+
+    @pytest.mark.asyncio
+    async def test_fetch_bytes_uses_shared_client(self, mocker: MockerFixture, http_client_manager: HttpClientManager):
+        requested_urls: list[str] = []
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            requested_urls.append(str(request.url))
+            if request.url.path == "/missing.png":
+                return httpx.Response(404)
+            return httpx.Response(200, content=b"image-bytes")
+
+        mocked_client = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+        mocker.patch.object(http_client_manager, "get_async_client", return_value=mocked_client)
+
+        assert await http_client_manager.fetch_bytes(url="https://example.com/image.png") == b"image-bytes"
+        with pytest.raises(httpx.HTTPStatusError):
+            await http_client_manager.fetch_bytes(url="https://example.com/missing.png")
+        assert requested_urls == ["https://example.com/image.png", "https://example.com/missing.png"]
+        await mocked_client.aclose()
+
+    @pytest.mark.asyncio
+    async def test_host_slot_limits_requests_per_host(self, http_client_config: HttpClientConfig):
+        http_client_manager = HttpClientManager(config=http_client_config.model_copy(update={"max_connections_per_host": 2}))
+        nb_running_by_host: dict[str, int] = {"a.example.com": 0, "b.example.com": 0}
+        max_running_by_host: dict[str, int] = {"a.example.com": 0, "b.example.com": 0}
+
+        async def fetch(host: str):
+            async with http_client_manager.host_slot(url=f"https://{host}/file"):
+                nb_running_by_host[host] += 1
+                max_running_by_host[host] = max(max_running_by_host[host], nb_running_by_host[host])
+                await asyncio.sleep(0.001)
+                nb_running_by_host[host] -= 1
+
+        await asyncio.gather(*[fetch(host) for host in ["a.example.com", "b.example.com"] * 5])
+
+        assert max_running_by_host == {"a.example.com": 2, "b.example.com": 2}
+
+    @pytest.mark.asyncio
+    async def test_fetch_resource_sends_validators(self, mocker: MockerFixture, http_client_manager: HttpClientManager):
+        def handler(request: httpx.Request) -> httpx.Response:
+            if request.headers.get("If-None-Match") == '"v1"':
+                return httpx.Response(304, headers={"ETag": '"v1"'})
+            return httpx.Response(200, content=b"image-bytes", headers={"ETag": '"v1"'})
+
+        mocked_client = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+        mocker.patch.object(http_client_manager, "get_async_client", return_value=mocked_client)
+
+        fetched_resource = await http_client_manager.fetch_resource(url="https://example.com/image.png")
+        assert fetched_resource.content == b"image-bytes"
+        assert not fetched_resource.is_not_modified
+
+        revalidated_resource = await http_client_manager.fetch_resource(
+            url="https://example.com/image.png",
+            validators=fetched_resource.validators,
+        )
+        assert revalidated_resource.is_not_modified
+        await mocked_client.aclose()
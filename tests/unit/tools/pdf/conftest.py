@@ -0,0 +1,64 @@
+from collections.abc import Iterator
+from io import BytesIO
+
+import pypdfium2 as pdfium
+import pytest
+
+from pipelex.tools.pdf.pypdfium2_renderer import PdfRenderConfig, PdfRenderEngine, PyPdfium2Renderer
+from tests.cases import PDFTestCases
+
+
+@pytest.fixture
+def pdf_render_config() -> PdfRenderConfig:
+    """Create a PDF render config with small worker limits, rendering in threads."""
+    return PdfRenderConfig(
+        engine=PdfRenderEngine.THREAD,
+        max_workers=2,
+        pages_per_task=1,
+        max_open_documents_per_worker=2,
+    )
+
+
+@pytest.fixture
+def thread_pdf_renderer(pdf_render_config: PdfRenderConfig) -> Iterator[PyPdfium2Renderer]:
+    """Create a PDF renderer rendering in threads."""
+    renderer = PyPdfium2Renderer()
+    renderer.setup(config=pdf_render_config)
+    yield renderer
+    renderer.teardown()
+
+
+@pytest.fixture
+def process_pool_pdf_renderer(pdf_render_config: PdfRenderConfig) -> Iterator[PyPdfium2Renderer]:
+    """Create a PDF renderer rendering in a pool of worker processes, shut down after the test."""
+    renderer = PyPdfium2Renderer()
+    renderer.setup(config=pdf_render_config.model_copy(update={"engine": PdfRenderEngine.PROCESS_POOL}))
+    yield renderer
+    renderer.teardown()
+
+
+@pytest.fixture(
+    params=[
+        PdfRenderEngine.THREAD,
+        PdfRenderEngine.PROCESS_POOL,
+    ],
+)
+def pdf_renderer(request: pytest.FixtureRequest, pdf_render_config: PdfRenderConfig) -> Iterator[PyPdfium2Renderer]:
+    """Create a PDF renderer for each render engine."""
+    assert isinstance(request.param, PdfRenderEngine)
+    renderer = PyPdfium2Renderer()
+    renderer.setup(config=pdf_render_config.model_copy(update={"engine": request.param}))
+    yield renderer
+    renderer.teardown()
+
+
+@pytest.fixture
+def multi_page_pdf_bytes() -> bytes:
+    """Create a 12-page PDF, repeating the first page of the test PDF."""
+    source_doc = pdfium.PdfDocument(PDFTestCases.PDF_FILE_PATH_1)
+    pdf_doc = pdfium.PdfDocument.new()
+    for _ in range(12):
+        pdf_doc.import_pages(source_doc, pages=[0])  # pyright: ignore[reportUnknownMemberType]
+    buffer = BytesIO()
+    pdf_doc.save(buffer)  # pyright: ignore[reportUnknownMemberType]
+    return buffer.getvalue()
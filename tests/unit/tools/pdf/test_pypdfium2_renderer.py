@@ -0,0 +1,87 @@
+import time
+from typing import TYPE_CHECKING
+
+import pytest
+from pytest_mock import MockerFixture
+from rich import box
+from rich.console import Console
+from rich.table import Table
+
+from pipelex.tools.pdf.pypdfium2_renderer import PyPdfium2Renderer, PyPdfium2RendererError
+from tests.cases import PDFTestCases
+
+if TYPE_CHECKING:
+    from collections.abc import AsyncIterator
+
+    from PIL import Image
+
+PDF_FILE_PATH = PDFTestCases.PDF_FILE_PATH_1
+
+
+class TestPyPdfium2Renderer:
+    @pytest.mark.asyncio
+    async def test_engines_render_the_same_pages(self, thread_pdf_renderer: PyPdfium2Renderer, process_pool_pdf_renderer: PyPdfium2Renderer):
+        thread_images = await thread_pdf_renderer.render_pdf_pages(pdf_input=PDF_FILE_PATH, dpi=36)
+        process_pool_images = await process_pool_pdf_renderer.render_pdf_pages(pdf_input=PDF_FILE_PATH, dpi=36)
+
+        assert len(process_pool_images) == len(thread_images) > 0
+        for thread_image, process_pool_image in zip(thread_images, process_pool_images, strict=True):
+            assert process_pool_image.tobytes() == thread_image.tobytes()
+
+    @pytest.mark.asyncio
+    async def test_page_range_from_bytes(self, pdf_renderer: PyPdfium2Renderer, multi_page_pdf_bytes: bytes):
+        images = await pdf_renderer.render_pdf_pages(pdf_input=multi_page_pdf_bytes, dpi=36, page_range=range(1, 4))
+        assert len(images) == 3
+        with pytest.raises(PyPdfium2RendererError):
+            await pdf_renderer.render_pdf_pages(pdf_input=multi_page_pdf_bytes, dpi=36, page_range=range(10, 13))
+
+    @pytest.mark.asyncio
+    async def test_thread_engine_yields_each_page_once_rendered(
+        self,
+        mocker: MockerFixture,
+        thread_pdf_renderer: PyPdfium2Renderer,
+        multi_page_pdf_bytes: bytes,
+    ):
+        render_page_spy = mocker.spy(PyPdfium2Renderer, "_render_pdf_page_sync")
+        page_iterator: AsyncIterator[Image.Image] = thread_pdf_renderer.iter_pdf_pages(pdf_input=multi_page_pdf_bytes, dpi=36)
+        await anext(page_iterator)
+        assert render_page_spy.call_count == 1
+
+        # the lock is released between pages, so another PDF can render before the first one is done
+        texts = await thread_pdf_renderer.get_text_from_pdf_pages(pdf_input=PDF_FILE_PATH)
+        assert texts
+
+        nb_remaining_pages = len([image async for image in page_iterator])
+        assert nb_remaining_pages == 11
+        assert render_page_spy.call_count == 12
+
+    # pytest -m benchmark -k test_first_page_latency -s -vv
+    @pytest.mark.benchmark
+    @pytest.mark.asyncio
+    async def test_first_page_latency(
+        self,
+        pytestconfig: pytest.Config,
+        process_pool_pdf_renderer: PyPdfium2Renderer,
+        multi_page_pdf_bytes: bytes,
+    ):
+        """Benchmark how soon the first page is yielded when iterating over the pages, compared to rendering them all."""
+        pdf_bytes = multi_page_pdf_bytes
+        # warm up the worker processes
+        await process_pool_pdf_renderer.render_pdf_pages(pdf_input=pdf_bytes, dpi=36, page_range=range(2))
+
+        started_at = time.perf_counter()
+        page_iterator: AsyncIterator[Image.Image] = process_pool_pdf_renderer.iter_pdf_pages(pdf_input=pdf_bytes, dpi=150)
+        await anext(page_iterator)
+        first_page_seconds = time.perf_counter() - started_at
+        nb_remaining_pages = len([image async for image in page_iterator])
+        all_pages_seconds = time.perf_counter() - started_at
+
+        if pytestconfig.get_verbosity() >= 2:
+            table = Table(title="Iterating over the pages of a 12-page PDF at 150 dpi", box=box.SQUARE_DOUBLE_HEAD)
+            table.add_column("Pages", style="green")
+            table.add_column("Duration (ms)", justify="right", style="yellow")
+            table.add_row("First page", f"{first_page_seconds * 1000:.0f}")
+            table.add_row("All pages", f"{all_pages_seconds * 1000:.0f}")
+            Console().print(table)
+
+        assert nb_remaining_pages == 11
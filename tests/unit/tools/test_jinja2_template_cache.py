@@ -0,0 +1,56 @@
+import pytest
+
+from pipelex.cogt.templating.template_category import TemplateCategory
+from pipelex.tools.jinja2.jinja2_environment import get_shared_jinja2_env
+from pipelex.tools.jinja2.jinja2_template_cache import Jinja2TemplateCache
+
+
+class TestJinja2TemplateCache:
+    def test_template_compiled_once_per_category_and_source(self):
+        template_cache = Jinja2TemplateCache(max_size=10)
+
+        first_template = template_cache.get_template(template_source="Hello {{ name }}", template_category=TemplateCategory.BASIC)
+        second_template = template_cache.get_template(template_source="Hello {{ name }}", template_category=TemplateCategory.BASIC)
+        other_category_template = template_cache.get_template(template_source="Hello {{ name }}", template_category=TemplateCategory.MARKDOWN)
+
+        assert second_template is first_template
+        assert other_category_template is not first_template
+        assert first_template.environment is get_shared_jinja2_env(template_category=TemplateCategory.BASIC)
+        stats = template_cache.stats
+        assert (stats.hits, stats.misses, stats.size) == (1, 2, 2)
+        assert abs(stats.hit_rate - 1 / 3) < 0.0001
+
+    def test_least_recently_used_template_is_evicted(self):
+        template_cache = Jinja2TemplateCache(max_size=2)
+
+        template_a = template_cache.get_template(template_source="A {{ x }}", template_category=TemplateCategory.BASIC)
+        template_cache.get_template(template_source="B {{ x }}", template_category=TemplateCategory.BASIC)
+        # touch A so that B becomes the least recently used
+        template_cache.get_template(template_source="A {{ x }}", template_category=TemplateCategory.BASIC)
+        template_cache.get_template(template_source="C {{ x }}", template_category=TemplateCategory.BASIC)
+
+        assert template_cache.stats.size == 2
+        assert template_cache.get_template(template_source="A {{ x }}", template_category=TemplateCategory.BASIC) is template_a
+        misses_before = template_cache.stats.misses
+        template_cache.get_template(template_source="B {{ x }}", template_category=TemplateCategory.BASIC)
+        assert template_cache.stats.misses == misses_before + 1
+
+    def test_setup_shrinks_and_teardown_clears(self):
+        template_cache = Jinja2TemplateCache(max_size=10)
+        for index in range(5):
+            template_cache.get_template(template_source=f"{index} {{{{ x }}}}", template_category=TemplateCategory.BASIC)
+
+        template_cache.setup(max_size=3)
+        assert template_cache.stats.size == 3
+
+        template_cache.teardown()
+        stats = template_cache.stats
+        assert (stats.hits, stats.misses, stats.size, stats.max_size) == (0, 0, 0, 3)
+
+    @pytest.mark.asyncio
+    async def test_cached_template_renders(self):
+        template_cache = Jinja2TemplateCache()
+        template = template_cache.get_template(template_source="Hello {{ name }}", template_category=TemplateCategory.BASIC)
+
+        assert await template.render_async(name="world") == "Hello world"
+        assert await template.render_async(name="again") == "Hello again"